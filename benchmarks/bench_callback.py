@@ -0,0 +1,133 @@
+"""
+钉钉事件回调压测
+
+    python benchmarks/bench_callback.py [--events N] [--concurrency C] [--workers W]
+
+在本地启动 src/main.py 的应用(uvicorn)，用伪造的钉钉推送方并发发送加密的通讯录变更事件，
+统计应答延迟、吞吐，以及事件全部写入事件队列所需的时间。需要安装 uvicorn 与 httpx
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "src")]
+
+EVENT_TYPES = ["user_add_org", "user_modify_org", "user_leave_org", "org_dept_modify"]
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def fake_event(i):
+    event_type = random.choice(EVENT_TYPES)
+    payload = {"EventType": event_type, "TimeStamp": str(int(time.time() * 1000))}
+    if event_type.startswith("user"):
+        payload["UserId"] = ["user%d" % i]
+    else:
+        payload["DeptId"] = [i]
+    return payload
+
+
+async def send(args, port, crypto):
+    import httpx
+
+    latencies = []
+    statuses = {}
+    counter = iter(range(args.events))
+    url = "http://127.0.0.1:%d/provider/dingtalk/register/" % port
+
+    async def sender(client):
+        for i in counter:
+            encrypt = crypto.encrypt(json.dumps(fake_event(i)))
+            timestamp, nonce = str(int(time.time() * 1000)), "nonce%d" % i
+            params = {
+                "signature": crypto.signature(timestamp, nonce, encrypt),
+                "timestamp": timestamp,
+                "nonce": nonce,
+            }
+            start = time.perf_counter()
+            response = await client.post(url, params=params, json={"encrypt": encrypt})
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 200:
+                crypto.decrypt(response.json()["encrypt"])
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(sender(client) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+    return latencies, statuses, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--buffer", type=int, default=10000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    aes_key = base64.b64encode(os.urandom(32)).decode()[:43]
+    os.environ.update(
+        {
+            "LOG_LEVEL": "warning",
+            "DINGDING_CALLBACK_TOKEN": "bench",
+            "DINGDING_CALLBACK_AES_KEY": aes_key,
+            "EVENT_QUEUE_PATH": os.path.join(workdir, "events.db"),
+            "EVENT_WORKERS": str(args.workers),
+            "EVENT_BUFFER_SIZE": str(args.buffer),
+        }
+    )
+    for name in ("LDAP_SERVER", "LDAP_ADMIN", "LDAP_ADMIN_PASSWD"):
+        os.environ.setdefault(name, "unused")
+
+    import uvicorn
+
+    import main as app_module
+
+    server = uvicorn.Server(
+        uvicorn.Config(app_module.app, host="127.0.0.1", port=0, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    latencies, statuses, elapsed = asyncio.run(send(args, port, app_module.crypto))
+    start = time.perf_counter()
+    while app_module.dispatcher.pending() or app_module.events.stats()["pending"] < statuses.get(200, 0):
+        time.sleep(0.01)
+    drain = time.perf_counter() - start
+    server.should_exit = True
+    thread.join()
+
+    print("events       %d in %.2fs, %.0f events/s" % (args.events, elapsed, args.events / elapsed))
+    print("statuses     %s" % statuses)
+    print(
+        "latency      p50 %.1fms  p95 %.1fms  p99 %.1fms  max %.1fms"
+        % tuple(v * 1000 for v in (
+            percentile(latencies, 0.5),
+            percentile(latencies, 0.95),
+            percentile(latencies, 0.99),
+            max(latencies),
+        ))
+    )
+    print("dispatcher   %s" % app_module.dispatcher.stats)
+    print("queue        %s, drained %.2fs after last response" % (app_module.events.stats(), drain))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+dingtalk.api 启动开销基准: 导入时间与常驻内存 (RSS)
+
+    python benchmarks/bench_import.py [--runs N]
+
+eager 模拟原先一次性导入全部请求类的行为，lazy 只访问同步用到的几个接口。
+测量前先编译字节码，与部署环境一致；每次测量都在新的子进程中进行。
+
+本地(Python 3.11，--runs 9)的中位数约为 eager 50-75 ms / 23.1 MiB、lazy 31-48 ms / 21.0 MiB。
+请求类还分散在 1183 个生成的模块中时约为 eager 240 ms / 27.3 MiB、lazy 43-48 ms / 20.4 MiB；
+改为由 rest/endpoints.py 的接口表生成请求类之后，eager 不再需要导入上千个模块，差距随之缩小。
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SYNC_ENDPOINTS = [
+    "OapiGettokenRequest",
+    "OapiV2DepartmentListsubRequest",
+    "OapiV2DepartmentGetRequest",
+    "OapiUserListidRequest",
+    "OapiV2UserListRequest",
+    "OapiV2UserGetRequest",
+]
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+from dingtalk import api
+if sys.argv[1] == "eager":
+    for name in api.rest.__all__:
+        getattr(api, name)
+else:
+    for name in sys.argv[2:]:
+        getattr(api, name)
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure(mode, runs):
+    times, rss = [], []
+    for _ in range(runs):
+        out = subprocess.check_output(
+            [sys.executable, "-c", PROBE, mode] + SYNC_ENDPOINTS, cwd=ROOT
+        )
+        elapsed, maxrss = out.split()
+        times.append(float(elapsed))
+        rss.append(int(maxrss))
+    return statistics.median(times), statistics.median(rss)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # 在子进程中编译，避免父进程的内存峰值被子进程的 maxrss 继承
+    subprocess.check_call([sys.executable, "-m", "compileall", "-q", "dingtalk"], cwd=ROOT)
+
+    results = {mode: measure(mode, args.runs) for mode in ("eager", "lazy")}
+    print("{:<8}{:>14}{:>14}".format("mode", "import (ms)", "maxrss (KiB)"))
+    for mode, (elapsed, maxrss) in results.items():
+        print("{:<8}{:>14.1f}{:>14}".format(mode, elapsed * 1000, maxrss))
+    eager, lazy = results["eager"], results["lazy"]
+    print(
+        "lazy import is {:.1f}x faster and uses {} KiB less RSS".format(
+            eager[0] / lazy[0], eager[1] - lazy[1]
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
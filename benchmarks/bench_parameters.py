@@ -0,0 +1,83 @@
+"""
+RestApi.getApplicationParameters 微基准
+
+    python benchmarks/bench_parameters.py [--number N]
+
+reflect 复现原先每次调用都遍历全部字段、逐个判断前缀并反复调用
+getMultipartParas()/getTranslateParas() 的实现，plan 为按类缓存参数计划后的实现。
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_import import SYNC_ENDPOINTS  # noqa: E402
+from dingtalk import api  # noqa: E402
+
+SAMPLE_VALUES = {
+    "appkey": "dingxxxxxxxx",
+    "appsecret": "secret",
+    "dept_id": 1,
+    "cursor": 0,
+    "size": 100,
+    "userid": "manager4220",
+}
+
+
+def reflect_parameters(request):
+    application_parameter = {}
+    fields = [
+        (key, getattr(request, key, None))
+        for cls in type(request).__mro__
+        for key in cls.__dict__.get("__slots__", ())
+        if not key.startswith("__")
+    ]
+    for key, value in fields:
+        if (
+            not key.startswith("__")
+            and key not in request.getMultipartParas()
+            and not key.startswith("_RestApi__")
+            and value is not None
+        ):
+            if key.startswith("_"):
+                application_parameter[key[1:]] = value
+            else:
+                application_parameter[key] = value
+    translate_parameter = request.getTranslateParas()
+    for key, value in list(application_parameter.items()):
+        if key in translate_parameter:
+            application_parameter[translate_parameter[key]] = application_parameter[key]
+            del application_parameter[key]
+    return application_parameter
+
+
+def build_request(name):
+    request = getattr(api, name)("https://oapi.dingtalk.com/")
+    for key, value in SAMPLE_VALUES.items():
+        if key in request._fields:
+            setattr(request, key, value)
+    return request
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    print("{:<34}{:>14}{:>14}{:>10}".format("endpoint", "reflect (ns)", "plan (ns)", "speedup"))
+    for name in SYNC_ENDPOINTS:
+        request = build_request(name)
+        assert reflect_parameters(request) == request.getApplicationParameters()
+        reflect = timeit.timeit(lambda: reflect_parameters(request), number=args.number)
+        plan = timeit.timeit(request.getApplicationParameters, number=args.number)
+        print(
+            "{:<34}{:>14.0f}{:>14.0f}{:>9.1f}x".format(
+                name, reflect / args.number * 1e9, plan / args.number * 1e9, reflect / plan
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
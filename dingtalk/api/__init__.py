@@ -1,2 +1,14 @@
-from dingtalk.api.rest import *
-from dingtalk.api.base import FileItem
+from dingtalk.api import rest
+from dingtalk.api.base import FileItem
+
+__all__ = ["FileItem"] + rest.__all__
+
+
+def __getattr__(name):
+    if name in rest._index:
+        return getattr(rest, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | rest._index)
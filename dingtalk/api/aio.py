@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+'''
+RestApi.getResponseAsync 使用的 asyncio 传输层，基于 httpx.AsyncClient
+
+httpx 为可选依赖，只有调用异步接口时才会导入
+'''
+
+import asyncio
+import weakref
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP2 = False
+
+'''
+每个事件循环共享一个 AsyncClient，连接只能在创建它的事件循环内复用
+'''
+_clients = weakref.WeakKeyDictionary()
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("httpx is required for async and HTTP/2 requests, install it with `poetry install -E async` or `-E http2`")
+    return httpx
+
+
+def getDefaultAsyncClient():
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        httpx = _import_httpx()
+        client = httpx.AsyncClient(
+            http2=HTTP2,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+def setDefaultAsyncClient(client):
+    _clients[asyncio.get_running_loop()] = client
+
+
+async def closeDefaultAsyncClient():
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _iterAsync(chunks):
+    #===========================================================================
+    # 把 multipart 之类分块生成的请求体转换为 httpx 需要的异步迭代器
+    #===========================================================================
+    for chunk in chunks:
+        yield bytes(chunk)
+
+
+def transportError(httpx, url, error):
+    #===========================================================================
+    # 把 httpx 的网络异常转换为 RequestException，连接没有建立时标记 request_sent=False
+    #===========================================================================
+    from dingtalk.api.base import RequestException
+
+    exception = RequestException("request %s failed: %r" % (url.split("?")[0], error))
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        exception.request_sent = False
+    return exception
+
+
+async def request(method, url, body, headers, timeout):
+    #===========================================================================
+    # 发送请求并读取完整响应，网络异常统一转换为 RequestException
+    #===========================================================================
+    httpx = _import_httpx()
+    client = getDefaultAsyncClient()
+    if body is not None and not isinstance(body, (str, bytes)):
+        body = _iterAsync(body)
+    try:
+        return await client.request(method, url, content=body, headers=headers, timeout=timeout)
+    except httpx.TransportError as e:
+        raise transportError(httpx, url, e)
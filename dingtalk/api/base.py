@@ -8,15 +8,21 @@ Created on 2018-9-17
 try: import http.client
 except ImportError:
     import http.client as httplib
-import urllib.request, urllib.parse, urllib.error
+import urllib.parse
 import time
 import hashlib
 import json
 import dingtalk
-import itertools
+import io
 import mimetypes
+import os
+import uuid
 import hmac
 import base64
+import logging
+from dingtalk.api import codec, hooks
+from dingtalk.api.pool import getDefaultConnectionPool
+from dingtalk.api.throttle import getDefaultRateLimiter, getDefaultRetryPolicy
 
 '''
 定义一些系统变量
@@ -69,12 +75,18 @@ class FileItem(object):
         self.content = content
 
 class MultiPartForm(object):
-    """Accumulate the data to be used when posting a form."""
+    """Accumulate the data to be used when posting a form.
+
+    The encoded body is produced as a stream of bytes chunks, so file
+    contents are never loaded into memory as a whole.
+    """
+
+    chunk_size = 65536
 
     def __init__(self):
         self.form_fields = []
         self.files = []
-        self.boundary = "PYTHON_SDK_BOUNDARY"
+        self.boundary = "PYTHON_SDK_BOUNDARY_" + uuid.uuid4().hex
         return
     
     def get_content_type(self):
@@ -86,52 +98,94 @@ class MultiPartForm(object):
         return
 
     def add_file(self, fieldname, filename, fileHandle, mimetype=None):
-        """Add a file to be uploaded."""
-        body = fileHandle.read()
+        """Add a file to be uploaded.
+
+        fileHandle may be a readable file object, a str or a bytes-like
+        object (bytes, bytearray, memoryview). Seekable binary files are
+        read lazily while sending; text-mode and non-seekable files are
+        read here, as their encoded size is not known in advance.
+        """
         if mimetype is None:
             mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
-        self.files.append((mixStr(fieldname), mixStr(filename), mixStr(mimetype), mixStr(body)))
+        seekable = getattr(fileHandle, "seekable", None)
+        if hasattr(fileHandle, "read") and not isinstance(fileHandle, io.TextIOBase) \
+                and seekable is not None and seekable():
+            content = (fileHandle, fileHandle.tell())
+        elif hasattr(fileHandle, "read"):
+            data = fileHandle.read()
+            content = memoryview(data.encode("utf-8") if isinstance(data, str) else data).cast("B")
+        elif isinstance(fileHandle, str):
+            content = memoryview(fileHandle.encode("utf-8"))
+        else:
+            content = memoryview(fileHandle).cast("B")
+        self.files.append((mixStr(fieldname), mixStr(filename), mixStr(mimetype), content))
         return
-    
-    def __str__(self):
-        """Return a string representing the form data, including attached files."""
-        # Build a list of lists, each containing "lines" of the
-        # request.  Each part is separated by a boundary string.
-        # Once the list is built, return a string where each
-        # line is separated by '\r\n'.  
-        parts = []
+
+    def _iter_parts(self):
+        """Yield the encoded headers of every part followed by its content."""
         part_boundary = '--' + self.boundary
-        
-        # Add the form fields
-        parts.extend(
-            [ part_boundary,
-              'Content-Disposition: form-data; name="%s"' % name,
-              'Content-Type: text/plain; charset=UTF-8',
-              '',
-              value,
-            ]
-            for name, value in self.form_fields
-            )
-        
-        # Add the files to upload
-        parts.extend(
-            [ part_boundary,
-              'Content-Disposition: form-data; name="%s"; filename="%s"' % \
-                 (field_name, filename),
-              'Content-Type: %s' % content_type,
-              'Content-Transfer-Encoding: binary',
-              '',
-              body,
-            ]
-            for field_name, filename, content_type, body in self.files
-            )
-        
-        # Flatten the list and add closing boundary marker,
-        # then return CR+LF separated data
-        flattened = list(itertools.chain(*parts))
-        flattened.append('--' + self.boundary + '--')
-        flattened.append('')
-        return '\r\n'.join(flattened)
+        for name, value in self.form_fields:
+            yield ('%s\r\n'
+                   'Content-Disposition: form-data; name="%s"\r\n'
+                   'Content-Type: text/plain; charset=UTF-8\r\n'
+                   '\r\n' % (part_boundary, name)).encode("utf-8"), memoryview(value.encode("utf-8"))
+        for field_name, filename, content_type, content in self.files:
+            yield ('%s\r\n'
+                   'Content-Disposition: form-data; name="%s"; filename="%s"\r\n'
+                   'Content-Type: %s\r\n'
+                   'Content-Transfer-Encoding: binary\r\n'
+                   '\r\n' % (part_boundary, field_name, filename, content_type)).encode("utf-8"), content
+
+    def _closing(self):
+        return ('--' + self.boundary + '--\r\n').encode("utf-8")
+
+    @staticmethod
+    def _content_length(content):
+        if isinstance(content, memoryview):
+            return content.nbytes
+        fileHandle, start = content
+        try:
+            return os.fstat(fileHandle.fileno()).st_size - start
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            end = fileHandle.seek(0, io.SEEK_END)
+            fileHandle.seek(start)
+            return end - start
+
+    def get_content_length(self):
+        """Return the size in bytes of the encoded body."""
+        length = len(self._closing())
+        for header, content in self._iter_parts():
+            length += len(header) + self._content_length(content) + 2
+        return length
+
+    def __iter__(self):
+        """Yield the encoded body as bytes chunks.
+
+        Seekable files are rewound first, so the body can be sent again
+        when a request is retried.
+        """
+        for header, content in self._iter_parts():
+            yield header
+            if isinstance(content, memoryview):
+                for offset in range(0, content.nbytes, self.chunk_size):
+                    yield content[offset:offset + self.chunk_size]
+            else:
+                fileHandle, start = content
+                fileHandle.seek(start)
+                while True:
+                    chunk = fileHandle.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+            yield b'\r\n'
+        yield self._closing()
+
+    def __bytes__(self):
+        return b''.join(self)
+
+    def __str__(self):
+        """Return the form data as a latin-1 string, byte for byte."""
+        return bytes(self).decode("latin-1")
 
 class TopException(Exception):
     #===========================================================================
@@ -156,10 +210,73 @@ class RequestException(Exception):
     #===========================================================================
     pass
 
+def checkErrcode(jsonobj, getheader):
+    #===========================================================================
+    # 业务错误码不为 0 时抛出 TopException
+    #===========================================================================
+    if P_CODE in jsonobj and jsonobj[P_CODE] != 0:
+        error = TopException()
+        error.errcode = jsonobj[P_CODE]
+        error.errmsg = jsonobj[P_MSG]
+        error.application_host = getheader("Application-Host", "")
+        error.service_host = getheader("Location-Host", "")
+        raise error
+
+
+class ResponseStream(object):
+    #===========================================================================
+    # RestApi.getResponseStream 的返回值
+    # 迭代得到列表元素，迭代结束后检查错误码并提供 envelope
+    #===========================================================================
+
+    def __init__(self, response, path, chunk_size, context=None):
+        self._response = response
+        self._chunk_size = chunk_size
+        self._context = context
+        self._decoder = codec.JsonListDecoder(self._iterChunks(), path)
+        self.envelope = None
+
+    def _iterChunks(self):
+        while True:
+            chunk = self._response.read(self._chunk_size)
+            if not chunk:
+                return
+            if self._context is not None:
+                self._context.response_bytes += len(chunk)
+            yield chunk
+
+    def __iter__(self):
+        try:
+            for item in self._decoder:
+                yield item
+            self.envelope = self._decoder.envelope
+            checkErrcode(self.envelope, self._response.getheader)
+        except Exception as e:
+            self._finish(e)
+            raise
+        finally:
+            self.close()
+
+    def _finish(self, error=None):
+        if self._context is not None:
+            hooks.finish(self._context, error)
+
+    def close(self):
+        self._response.release()
+        self._finish()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 class RestApi(object):
     #===========================================================================
     # Rest api的基类
     #===========================================================================
+    __slots__ = ("__port", "__domain", "__path", "__rateLimiter", "__retryPolicy", "__idempotent")
     
     def __init__(self, url=None):
         #=======================================================================
@@ -167,6 +284,9 @@ class RestApi(object):
         # Args @param domain: 请求的域名或者ip
         #      @param port: 请求的端口
         #=======================================================================
+        self.__rateLimiter = None
+        self.__retryPolicy = None
+        self.__idempotent = None
         if(url == None):
             raise RequestException("domain must not be empty.")
         if(url.find('http://') >= 0):
@@ -209,15 +329,147 @@ class RestApi(object):
     
     def _check_requst(self):
         pass
+
+    def getConnectionPool(self):
+        return getDefaultConnectionPool()
+
+    def getRateLimiter(self):
+        return self.__rateLimiter or getDefaultRateLimiter()
+
+    def setRateLimiter(self, limiter):
+        #=======================================================================
+        # 本请求使用的限流器，None 时使用进程默认的限流器
+        #=======================================================================
+        self.__rateLimiter = limiter
+
+    def getRetryPolicy(self):
+        return self.__retryPolicy or getDefaultRetryPolicy()
+
+    def setRetryPolicy(self, policy):
+        self.__retryPolicy = policy
+
+    def isIdempotent(self):
+        #=======================================================================
+        # 请求是否可以重复执行，决定读超时等请求可能已生效的失败是否重试
+        # 默认只有 GET 请求是幂等的，只读的 POST 接口可以用 setIdempotent(True) 声明
+        #=======================================================================
+        if self.__idempotent is None:
+            return self.getHttpMethod() == "GET"
+        return self.__idempotent
+
+    def setIdempotent(self, idempotent):
+        self.__idempotent = idempotent
     
-    def getResponse(self, authrize='',accessKey='',accessSecret='',suiteTicket='',corpId='', timeout=30):
+    def getResponse(self, authrize='',accessKey='',accessSecret='',suiteTicket='',corpId='', timeout=30, app=None):
         #=======================================================================
         # 获取response结果
+        # Args @param app: 限流使用的应用标识，一般为 appkey
+        #=======================================================================
+        def handler(response, context):
+            result = response.read()
+            context.response_bytes = len(result)
+            jsonobj = self._parseResponse(response.status, result, response.getheader)
+            hooks.finish(context)
+            return jsonobj
+        return self._send(handler, authrize, accessKey, accessSecret, suiteTicket, corpId, timeout, app)
+
+    def getResponseStream(self, authrize='',accessKey='',accessSecret='',suiteTicket='',corpId='', timeout=30, app=None,
+                          path=("result", "list"), chunk_size=65536):
+        #=======================================================================
+        # 以流的方式获取列表接口的结果，返回 ResponseStream
+        # 迭代时边读取边解析 path 指向的数组元素，迭代结束后 envelope 为其余响应内容
+        #=======================================================================
+        def handler(response, context):
+            if response.status != 200:
+                self._parseResponse(response.status, response.read(), response.getheader)
+            # 流读完或关闭时才结束本次调用的统计
+            return ResponseStream(response, path, chunk_size, context)
+        return self._send(handler, authrize, accessKey, accessSecret, suiteTicket, corpId, timeout, app)
+
+    def _send(self, handler, authrize, accessKey, accessSecret, suiteTicket, corpId, timeout, app):
+        #=======================================================================
+        # 限流、发送请求并按重试策略重试，handler 负责处理响应并结束统计
+        #=======================================================================
+        method, fullPath, body, header = self._buildRequest(authrize, accessKey, accessSecret, suiteTicket, corpId)
+        pool = self.getConnectionPool()
+        limiter = self.getRateLimiter()
+        policy = self.getRetryPolicy()
+        context = self._newContext(method, fullPath, body)
+        attempt = 0
+        while True:
+            if limiter is not None:
+                wait = limiter.reserve(app or accessKey or None, self.getapiname())
+                if wait > 0:
+                    time.sleep(wait)
+            try:
+                response = pool.urlopen((self.__domain, self.__port), method, fullPath, body=body, headers=header, timeout=timeout)
+                context.status = response.status
+                return handler(response, context)
+            except Exception as e:
+                delay = policy.backoff(self.getapiname(), e, attempt, self.isIdempotent()) if policy is not None else None
+                if delay is None:
+                    hooks.finish(context, e)
+                    raise
+                attempt += 1
+                context.retries = attempt
+                time.sleep(delay)
+
+    async def getResponseAsync(self, authrize='',accessKey='',accessSecret='',suiteTicket='',corpId='', timeout=30, app=None):
+        #=======================================================================
+        # getResponse 的 asyncio 版本，参数、限流重试与异常语义保持一致
         #=======================================================================
-        if(self.__port == 443):
-            connection = http.client.HTTPSConnection(self.__domain, self.__port, None, None, timeout)
+        import asyncio
+        from dingtalk.api import aio
+
+        method, fullPath, body, header = self._buildRequest(authrize, accessKey, accessSecret, suiteTicket, corpId)
+        limiter = self.getRateLimiter()
+        policy = self.getRetryPolicy()
+        context = self._newContext(method, fullPath, body)
+        attempt = 0
+        while True:
+            if limiter is not None:
+                wait = limiter.reserve(app or accessKey or None, self.getapiname())
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                response = await aio.request(method, self.getBaseUrl() + fullPath, body, header, timeout)
+                context.status = response.status_code
+                context.response_bytes = len(response.content)
+                jsonobj = self._parseResponse(response.status_code, response.content, response.headers.get)
+                hooks.finish(context)
+                return jsonobj
+            except Exception as e:
+                delay = policy.backoff(self.getapiname(), e, attempt, self.isIdempotent()) if policy is not None else None
+                if delay is None:
+                    hooks.finish(context, e)
+                    raise
+                attempt += 1
+                context.retries = attempt
+                await asyncio.sleep(delay)
+
+    def _newContext(self, method, fullPath, body):
+        #=======================================================================
+        # 创建本次调用的 RequestContext 并通知钩子，path 不含查询串(其中有 access_token)
+        #=======================================================================
+        if body is None:
+            size = 0
+        elif isinstance(body, MultiPartForm):
+            size = body.get_content_length()
+        elif isinstance(body, str):
+            size = len(body.encode("utf-8"))
         else:
-            connection = http.client.HTTPConnection(self.__domain, self.__port, timeout)
+            size = len(body)
+        context = hooks.RequestContext(self.getapiname(), method, fullPath.split("?")[0], size)
+        hooks.beforeRequest(context)
+        return context
+
+    def getBaseUrl(self):
+        return ('https://' if self.__port == 443 else 'http://') + self.__domain
+
+    def _buildRequest(self, authrize, accessKey, accessSecret, suiteTicket, corpId):
+        #=======================================================================
+        # 组装请求，返回 (method, fullPath, body, header)
+        #=======================================================================
         sys_parameters = {
             P_PARTNER_ID: SYSTEM_GENERATE_VERSION,
         }
@@ -236,19 +488,17 @@ class RestApi(object):
                 fileitem = getattr(self,key)
                 if(fileitem and isinstance(fileitem,FileItem)):
                     form.add_file(key,fileitem.filename,fileitem.content)
-            body = str(form)
+            body = form
             header['Content-type'] = form.get_content_type()
+            header['Content-Length'] = str(form.get_content_length())
         else:
             body = urllib.parse.urlencode(application_parameter)
         
         if(accessKey != ''):
             timestamp = str(int(round(time.time()))) + '000'
-            print(("timestamp:" + timestamp))
             canonicalString = self.getCanonicalStringForIsv(timestamp, suiteTicket)
-            print(("canonicalString:" + canonicalString))
-            print(("accessSecret:" + accessSecret))
             signature = self.computeSignature(accessSecret, canonicalString)
-            print(("signature:" + signature))
+            logging.debug("isv signature: accessKey=%s timestamp=%s", accessKey, timestamp)
             ps = {}
             ps["accessKey"] = accessKey
             ps["signature"] = signature
@@ -262,7 +512,6 @@ class RestApi(object):
                 fullPath = self.__path + "&" + queryStr
             else:
                 fullPath = self.__path + "?" + queryStr
-            print(("fullPath:" + fullPath))
         else:
             if (self.__path.find("?") > 0):
                 fullPath = (self.__path + "&access_token=" + str(authrize)) if len(str(authrize)) > 0 else self.__path
@@ -274,26 +523,26 @@ class RestApi(object):
                 fullPath = fullPath + "&" + body;
             else:
                 fullPath = fullPath + "?" + body
-            connection.request(self.getHttpMethod(), fullPath, headers=header)
+            body = None
         else:
             if (self.getMultipartParas()):
                 body = body
             else:
                 body = json.dumps(application_parameter)
-            connection.request(self.getHttpMethod(), fullPath, body=body, headers=header)
-        response = connection.getresponse();
-        if response.status is not 200:
-            raise RequestException('invalid http status ' + str(response.status) + ',detail body:' + response.read())
-        result = response.read()
-        # print("result:" + result)
-        jsonobj = json.loads(result)
-        if P_CODE in jsonobj and jsonobj[P_CODE] != 0:
-            error = TopException()
-            error.errcode = jsonobj[P_CODE]
-            error.errmsg = jsonobj[P_MSG]
-            error.application_host = response.getheader("Application-Host", "")
-            error.service_host = response.getheader("Location-Host", "")
+        return self.getHttpMethod(), fullPath, body, header
+
+    def _parseResponse(self, status, result, getheader):
+        #=======================================================================
+        # 解析响应，http 状态异常抛出 RequestException，业务错误码抛出 TopException
+        #=======================================================================
+        if status != 200:
+            detail = result.decode("utf-8", "replace")
+            error = RequestException('invalid http status ' + str(status) + ',detail body:' + detail)
+            error.status = status
             raise error
+        # print("result:" + result)
+        jsonobj = codec.loads(result)
+        checkErrcode(jsonobj, getheader)
         return jsonobj
     
     def getCanonicalStringForIsv(self, timestamp, suiteTicket):
@@ -308,17 +557,56 @@ class RestApi(object):
         return str(base64.b64encode(hmac.new(sec, message, digestmod=hashlib.sha256).digest()))
     
     def getApplicationParameters(self):
+        #=======================================================================
+        # 按类缓存的参数计划直接收集请求参数，值为 None 的字段不发送
+        #=======================================================================
+        plan = _parameter_plans.get(type(self))
+        if plan is None:
+            plan = _parameter_plans[type(self)] = ParameterPlan(self)
         application_parameter = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith("__") and not key in self.getMultipartParas() and not key.startswith("_RestApi__") and value is not None :
-                if(key.startswith("_")):
-                    application_parameter[key[1:]] = value
-                else:
-                    application_parameter[key] = value
-        #查询翻译字典来规避一些关键字属性
-        translate_parameter = self.getTranslateParas()
-        for key, value in application_parameter.items():
-            if key in translate_parameter:
-                application_parameter[translate_parameter[key]] = application_parameter[key]
-                del application_parameter[key]
+        for key, name in plan.slots:
+            value = getattr(self, key, None)
+            if value is not None:
+                application_parameter[name] = value
+        for key, value in getattr(self, "__dict__", {}).items():
+            if value is not None:
+                name = plan.resolve(key)
+                if name is not None:
+                    application_parameter[name] = value
         return application_parameter
+
+
+class ParameterPlan(object):
+    #===========================================================================
+    # 请求类的字段 -> 请求参数名映射，每个类只计算一次
+    # 去掉字段名的 "_" 前缀，查询翻译字典来规避一些关键字属性，跳过 multipart 字段
+    #===========================================================================
+    __slots__ = ("slots", "names", "multipart", "translate")
+
+    def __init__(self, request):
+        self.multipart = frozenset(request.getMultipartParas())
+        self.translate = dict(request.getTranslateParas())
+        self.names = {}
+        self.slots = tuple(
+            (key, name)
+            for cls in reversed(type(request).__mro__)
+            for key in cls.__dict__.get("__slots__", ())
+            for name in (self.resolve(key),)
+            if name is not None
+        )
+
+    def resolve(self, key):
+        try:
+            return self.names[key]
+        except KeyError:
+            pass
+        if key.startswith("__") or key.startswith("_RestApi__") or key in self.multipart:
+            name = None
+        else:
+            name = key[1:] if key.startswith("_") else key
+            name = self.translate.get(name, name)
+        self.names[key] = name
+        return name
+
+
+_parameter_plans = {}
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+'''
+响应 JSON 解码
+
+loads 优先使用已安装的 orjson / ujson(poetry install -E orjson)，否则使用标准库 json；
+JsonListDecoder 从分块到达的响应中逐个解析列表元素，内存占用与单页条数无关
+'''
+
+import codecs
+import json
+import re
+
+try:
+    import orjson
+
+    def _fast_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    try:
+        import ujson
+
+        def _fast_loads(data):
+            return ujson.loads(data)
+    except ImportError:
+        _fast_loads = json.loads
+
+_loads = _fast_loads
+
+
+def loads(data):
+    return _loads(data)
+
+
+def getDefaultDecoder():
+    return _loads
+
+
+def setDefaultDecoder(decoder):
+    #===========================================================================
+    # 设置解码函数，参数为 bytes 或 str，返回解析后的对象
+    #===========================================================================
+    global _loads
+    _loads = decoder
+
+
+_SKIP = re.compile(r"[\s,]*")
+_DELIMITERS = frozenset(" \t\r\n,]")
+
+
+class JsonListDecoder(object):
+    #===========================================================================
+    # 流式解析 path 指向的数组，例如 ("result", "list")
+    # 数组元素逐个 yield，数组之外的内容(errcode、has_more、next_cursor 等)
+    # 在迭代结束后以 envelope 提供，其中该数组为空列表
+    #===========================================================================
+
+    def __init__(self, chunks, path=("result", "list")):
+        self._chunks = chunks
+        self._path = list(path)
+        self.envelope = None
+
+    def __iter__(self):
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        item_decoder = json.JSONDecoder()
+        skeleton = []
+        # 每层容器: [是否对象, 当前 key, 是否等待 key]
+        stack = []
+        in_string = escape = in_list = False
+        key_chars = None
+        buf = ""
+        chunks = iter(self._chunks)
+        final = False
+        while not final:
+            chunk = next(chunks, None)
+            if chunk is None:
+                final = True
+                buf += text_decoder.decode(b"", final=True)
+            else:
+                buf += text_decoder.decode(chunk)
+            pos, size = 0, len(buf)
+            while pos < size:
+                if in_list:
+                    pos = _SKIP.match(buf, pos).end()
+                    if pos >= size:
+                        break
+                    if buf[pos] == "]":
+                        skeleton.append("]")
+                        pos += 1
+                        in_list = False
+                        continue
+                    try:
+                        item, end = item_decoder.raw_decode(buf, pos)
+                    except ValueError:
+                        if final:
+                            raise
+                        break
+                    # 元素后面不是分隔符时可能还没读完(例如被截断的数字)，等下一块数据
+                    if not final and (end >= size or buf[end] not in _DELIMITERS):
+                        break
+                    pos = end
+                    yield item
+                    continue
+
+                c = buf[pos]
+                pos += 1
+                skeleton.append(c)
+                if in_string:
+                    if escape:
+                        escape = False
+                    elif c == "\\":
+                        escape = True
+                    elif c == '"':
+                        in_string = False
+                        if key_chars is not None:
+                            stack[-1][1] = json.loads('"' + "".join(key_chars) + '"')
+                            key_chars = None
+                            continue
+                    if key_chars is not None:
+                        key_chars.append(c)
+                elif c == '"':
+                    in_string = True
+                    if stack and stack[-1][0] and stack[-1][2]:
+                        key_chars = []
+                elif c == "{":
+                    stack.append([True, None, True])
+                elif c == "[":
+                    if all(frame[0] for frame in stack) and [frame[1] for frame in stack] == self._path:
+                        in_list = True
+                    else:
+                        stack.append([False, None, False])
+                elif c in "}]":
+                    stack.pop()
+                elif c == ":":
+                    stack[-1][2] = False
+                elif c == "," and stack[-1][0]:
+                    stack[-1][2] = True
+            buf = buf[pos:]
+        self.envelope = json.loads("".join(skeleton))
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+'''
+请求钩子
+
+每次 getResponse/getResponseStream/getResponseAsync 调用都会依次通知已注册的钩子:
+发送前 beforeRequest，成功后 afterResponse，最终失败时 onError。
+MetricsHook 按接口统计耗时直方图、收发字节数、重试次数与错误码，并可导出为 Prometheus 文本格式；
+指标只在发出请求的进程中，writeTextfile() 供 node_exporter 的 textfile collector 采集
+'''
+
+import collections
+import logging
+import os
+import tempfile
+import threading
+import time
+
+_hooks = []
+_lock = threading.Lock()
+
+
+class RequestContext(object):
+    #===========================================================================
+    # 一次接口调用的信息，重试不会产生新的 context
+    #===========================================================================
+    __slots__ = ("api", "method", "path", "start", "elapsed", "request_bytes",
+                 "response_bytes", "status", "errcode", "retries", "error")
+
+    def __init__(self, api, method, path, request_bytes):
+        self.api = api
+        self.method = method
+        self.path = path
+        self.start = time.monotonic()
+        self.elapsed = None
+        self.request_bytes = request_bytes
+        self.response_bytes = 0
+        self.status = None
+        self.errcode = None
+        self.retries = 0
+        self.error = None
+
+
+class RequestHook(object):
+    #===========================================================================
+    # 钩子基类，按需覆盖下面的方法；钩子抛出的异常不会影响请求本身
+    #===========================================================================
+
+    def beforeRequest(self, context):
+        pass
+
+    def afterResponse(self, context):
+        pass
+
+    def onError(self, context):
+        pass
+
+
+def addRequestHook(hook):
+    with _lock:
+        _hooks.append(hook)
+    return hook
+
+
+def removeRequestHook(hook):
+    with _lock:
+        _hooks.remove(hook)
+
+
+def getRequestHooks():
+    return tuple(_hooks)
+
+
+def _notify(method, context):
+    for hook in _hooks:
+        try:
+            getattr(hook, method)(context)
+        except Exception:
+            logging.exception("dingtalk request hook %r failed", hook)
+
+
+def beforeRequest(context):
+    _notify("beforeRequest", context)
+
+
+def finish(context, error=None):
+    #===========================================================================
+    # 结束一次调用并通知钩子
+    #===========================================================================
+    if context.elapsed is not None:
+        return
+    context.elapsed = time.monotonic() - context.start
+    context.error = error
+    if error is not None and context.errcode is None:
+        context.errcode = getattr(error, "errcode", None)
+    _notify("onError" if error is not None else "afterResponse", context)
+
+
+'''
+耗时直方图的默认分桶(秒)
+'''
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MetricsHook(RequestHook):
+    #===========================================================================
+    # 按接口统计请求指标，exposition() 导出 Prometheus 文本格式
+    # Args @param limiter: RateLimiter，一并导出其限流统计
+    #      @param retryPolicy: RetryPolicy，一并导出其重试统计
+    #===========================================================================
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix="dingtalk", limiter=None, retryPolicy=None):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.limiter = limiter
+        self.retryPolicy = retryPolicy
+        self._lock = threading.Lock()
+        self._apis = {}
+        self._errors = collections.Counter()
+
+    def _record(self, context):
+        with self._lock:
+            stats = self._apis.get(context.api)
+            if stats is None:
+                stats = self._apis[context.api] = {
+                    "requests": 0,
+                    "seconds": 0.0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                    "retries": 0,
+                    "errors": 0,
+                    "buckets": [0] * len(self.buckets),
+                }
+            stats["requests"] += 1
+            stats["seconds"] += context.elapsed
+            stats["request_bytes"] += context.request_bytes
+            stats["response_bytes"] += context.response_bytes
+            stats["retries"] += context.retries
+            for i, bound in enumerate(self.buckets):
+                if context.elapsed <= bound:
+                    stats["buckets"][i] += 1
+            if context.error is not None:
+                stats["errors"] += 1
+                code = context.errcode if context.errcode is not None else (
+                    "http_%s" % context.status if context.status is not None else type(context.error).__name__
+                )
+                self._errors[(context.api, str(code))] += 1
+
+    afterResponse = _record
+    onError = _record
+
+    def getStats(self):
+        #=======================================================================
+        # 按接口统计，按累计耗时从高到低排序
+        #=======================================================================
+        with self._lock:
+            stats = {api: dict(item, buckets=list(item["buckets"])) for api, item in self._apis.items()}
+        return dict(sorted(stats.items(), key=lambda item: item[1]["seconds"], reverse=True))
+
+    def exposition(self):
+        #=======================================================================
+        # Prometheus 文本格式
+        #=======================================================================
+        with self._lock:
+            apis = {api: dict(item, buckets=list(item["buckets"])) for api, item in self._apis.items()}
+            errors = dict(self._errors)
+        name = self.prefix + "_request_duration_seconds"
+        lines = [
+            "# HELP %s DingTalk API call latency including retries." % name,
+            "# TYPE %s histogram" % name,
+        ]
+        for api, stats in sorted(apis.items()):
+            label = 'api="%s"' % _escape(api)
+            for bound, count in zip(self.buckets, stats["buckets"]):
+                lines.append('%s_bucket{%s,le="%s"} %d' % (name, label, _formatFloat(bound), count))
+            lines.append('%s_bucket{%s,le="+Inf"} %d' % (name, label, stats["requests"]))
+            lines.append("%s_sum{%s} %s" % (name, label, _formatFloat(stats["seconds"])))
+            lines.append("%s_count{%s} %d" % (name, label, stats["requests"]))
+        for metric, key, help_text in (
+            ("request_bytes_total", "request_bytes", "Bytes sent in DingTalk API request bodies."),
+            ("response_bytes_total", "response_bytes", "Bytes received in DingTalk API response bodies."),
+            ("request_retries_total", "retries", "Retries of DingTalk API calls."),
+        ):
+            metric = "%s_%s" % (self.prefix, metric)
+            lines.append("# HELP %s %s" % (metric, help_text))
+            lines.append("# TYPE %s counter" % metric)
+            for api, stats in sorted(apis.items()):
+                lines.append('%s{api="%s"} %d' % (metric, _escape(api), stats[key]))
+        metric = self.prefix + "_request_errors_total"
+        lines.append("# HELP %s Failed DingTalk API calls by errcode." % metric)
+        lines.append("# TYPE %s counter" % metric)
+        for (api, code), count in sorted(errors.items()):
+            lines.append('%s{api="%s",errcode="%s"} %d' % (metric, _escape(api), _escape(code), count))
+        if self.limiter is not None:
+            self._counters(lines, self.limiter.getStats(), (
+                ("throttled_requests_total", "throttled", "DingTalk API calls delayed by the rate limiter."),
+                ("throttle_wait_seconds_total", "wait_seconds", "Seconds spent waiting for the rate limiter."),
+            ))
+        if self.retryPolicy is not None:
+            self._counters(lines, self.retryPolicy.getStats(), (
+                ("retry_throttle_errors_total", "throttle_errors", "Throttling errors seen by the retry policy."),
+                ("retry_transient_errors_total", "transient_errors", "Transient errors seen by the retry policy."),
+                ("retry_gave_up_total", "gave_up", "DingTalk API calls that ran out of retries."),
+            ))
+        return "\n".join(lines) + "\n"
+
+    def _counters(self, lines, stats, metrics):
+        #=======================================================================
+        # 把 getStats() 返回的按接口统计导出为 counter
+        #=======================================================================
+        for metric, key, help_text in metrics:
+            metric = "%s_%s" % (self.prefix, metric)
+            lines.append("# HELP %s %s" % (metric, help_text))
+            lines.append("# TYPE %s counter" % metric)
+            for api, item in sorted(stats.items()):
+                lines.append('%s{api="%s"} %s' % (metric, _escape(api), _formatFloat(item.get(key, 0))))
+
+    def writeTextfile(self, path):
+        #=======================================================================
+        # 把 exposition() 原子地写入 path，供 node_exporter 的 textfile collector 采集
+        #=======================================================================
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.exposition())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _formatFloat(value):
+    return repr(float(value))
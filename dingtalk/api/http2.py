@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+'''
+HTTP/2 传输，基于 httpx 与 h2(poetry install -E http2)
+
+同一主机的并发请求复用一条 HTTP/2 连接多路传输，通过 enableHttp2() 按进程启用：
+同步的 getResponse/getResponseStream 与异步的 getResponseAsync 都会切换到 HTTP/2
+'''
+
+import collections
+import threading
+
+from dingtalk.api import aio
+from dingtalk.api.pool import setDefaultConnectionPool
+
+'''
+HTTP/2 禁止携带的逐跳请求头
+'''
+HOP_BY_HOP_HEADERS = frozenset(["connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"])
+
+
+class Http2Response(object):
+    #===========================================================================
+    # 包装 httpx.Response，提供与 PooledResponse 相同的读取接口
+    # 读取 body 时的网络异常与发送时一样转换为 RequestException
+    #===========================================================================
+
+    def __init__(self, response, httpx, url):
+        self._response = response
+        self._httpx = httpx
+        self._url = url
+        self._chunks = response.iter_bytes()
+        self._buffer = bytearray()
+        self._exhausted = False
+
+    @property
+    def status(self):
+        return self._response.status_code
+
+    def getheader(self, name, default=None):
+        return self._response.headers.get(name, default)
+
+    def read(self, amt=None):
+        while amt is None or len(self._buffer) < amt:
+            try:
+                chunk = next(self._chunks, None)
+            except self._httpx.TransportError as e:
+                self.release()
+                raise aio.transportError(self._httpx, self._url, e)
+            if chunk is None:
+                self._exhausted = True
+                break
+            self._buffer.extend(chunk)
+        if amt is None:
+            amt = len(self._buffer)
+        data = bytes(self._buffer[:amt])
+        del self._buffer[:amt]
+        if self._exhausted and not self._buffer:
+            self.release()
+        return data
+
+    def release(self):
+        self._response.close()
+
+    close = release
+
+
+class Http2ConnectionPool(object):
+    #===========================================================================
+    # 与 ConnectionPool 接口一致的 HTTP/2 传输，所有线程共享一个 httpx.Client
+    # Args @param max_connections: 每个进程最多的连接数
+    #===========================================================================
+
+    def __init__(self, max_connections=10):
+        httpx = aio._import_httpx()
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+        self._lock = threading.Lock()
+        self._stats = collections.Counter()
+
+    def urlopen(self, key, method, url, body=None, headers=None, timeout=30):
+        domain, port = key
+        scheme = "https" if port == 443 else "http"
+        headers = {k: v for k, v in (headers or {}).items() if k.lower() not in HOP_BY_HOP_HEADERS}
+        if body is not None and not isinstance(body, (str, bytes)):
+            body = (bytes(chunk) for chunk in body)
+        request = self._client.build_request(
+            method, "%s://%s%s" % (scheme, domain, url), content=body, headers=headers, timeout=timeout
+        )
+        try:
+            response = self._client.send(request, stream=True)
+        except self._httpx.TransportError as e:
+            raise aio.transportError(self._httpx, url, e)
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats[response.http_version] += 1
+        return Http2Response(response, self._httpx, url)
+
+    def getStats(self):
+        #=======================================================================
+        # 请求数以及按协议版本(HTTP/2、HTTP/1.1)统计的响应数
+        #=======================================================================
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self):
+        self._client.close()
+
+
+def enableHttp2(max_connections=10):
+    #===========================================================================
+    # 当前进程的所有请求改用 HTTP/2
+    #===========================================================================
+    pool = Http2ConnectionPool(max_connections)
+    setDefaultConnectionPool(pool)
+    aio.HTTP2 = True
+    return pool
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+'''
+按主机复用的 keep-alive HTTP(S) 连接池
+'''
+
+import collections
+import http.client
+import threading
+import time
+
+'''
+复用的空闲连接被服务端关闭时会抛出的异常；只有请求没有发完，或者没有收到任何响应
+就断开(RemoteDisconnected)时，请求一定没有被处理，才换一个新连接重试
+'''
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+class PooledResponse(object):
+    #===========================================================================
+    # 包装 http.client.HTTPResponse，body 读完后自动把连接归还连接池
+    #===========================================================================
+
+    def __init__(self, pool, key, connection, response):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._response = response
+
+    @property
+    def status(self):
+        return self._response.status
+
+    def getheader(self, name, default=None):
+        return self._response.getheader(name, default)
+
+    def read(self, amt=None):
+        data = self._response.read(amt)
+        if self._response.isclosed():
+            self.release()
+        return data
+
+    def release(self):
+        #=======================================================================
+        # 归还连接；body 未读完或服务端要求关闭时直接关闭连接
+        #=======================================================================
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool.putConnection(self._key, connection)
+        else:
+            connection.close()
+
+    close = release
+
+
+class ConnectionPool(object):
+    #===========================================================================
+    # 线程安全的连接池
+    # Args @param maxsize: 每个主机最多保留的空闲连接数，不限制同时打开的连接数，
+    #                      超过时多出的连接用完即关闭
+    #      @param idle_timeout: 空闲超过该秒数的连接不再复用
+    #      @param retries: 复用连接失效时换新连接重试的次数
+    #===========================================================================
+
+    def __init__(self, maxsize=10, idle_timeout=60, retries=1):
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.retries = retries
+        self._lock = threading.Lock()
+        self._idle = collections.defaultdict(collections.deque)
+        self._stats = collections.Counter()
+
+    def _newConnection(self, key, timeout):
+        domain, port = key
+        if ":" in domain:
+            # 域名中自带端口时交给 http.client 解析
+            port = None
+        if key[1] == 443:
+            return http.client.HTTPSConnection(domain, port, timeout=timeout)
+        return http.client.HTTPConnection(domain, port, timeout=timeout)
+
+    def getConnection(self, key, timeout=30):
+        #=======================================================================
+        # 取出最近使用的空闲连接，没有可用连接时新建
+        # 返回 (connection, reused)
+        #=======================================================================
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle[key]
+            while idle:
+                connection, last_used = idle.pop()
+                if connection.sock is None or now - last_used > self.idle_timeout:
+                    connection.close()
+                    self._stats["evicted"] += 1
+                    continue
+                self._stats["hits"] += 1
+                break
+            else:
+                connection = None
+                self._stats["misses"] += 1
+        if connection is None:
+            return self._newConnection(key, timeout), False
+        connection.timeout = timeout
+        connection.sock.settimeout(timeout)
+        return connection, True
+
+    def putConnection(self, key, connection):
+        with self._lock:
+            idle = self._idle[key]
+            if connection.sock is not None and len(idle) < self.maxsize:
+                idle.append((connection, time.monotonic()))
+                return
+            self._stats["discarded"] += 1
+        connection.close()
+
+    def urlopen(self, key, method, url, body=None, headers=None, timeout=30):
+        #=======================================================================
+        # 发送请求并返回 PooledResponse，调用方读完 body 后连接自动归还
+        # Args @param key: (domain, port)
+        #=======================================================================
+        attempts = 0
+        connection, reused = self.getConnection(key, timeout)
+        while True:
+            if connection.sock is None:
+                try:
+                    connection.connect()
+                except Exception as e:
+                    # 连接没有建立，请求一定没有发出，可以安全重试
+                    connection.close()
+                    e.request_sent = False
+                    raise
+            sent = False
+            try:
+                connection.request(method, url, body=body, headers=headers or {})
+                sent = True
+                response = connection.getresponse()
+                return PooledResponse(self, key, connection, response)
+            except STALE_CONNECTION_ERRORS as e:
+                connection.close()
+                # 读取响应时连接被重置，请求可能已经被处理，交给调用方按接口是否幂等决定
+                if sent and not isinstance(e, http.client.RemoteDisconnected):
+                    raise
+                if not reused or attempts >= self.retries:
+                    raise
+                attempts += 1
+                with self._lock:
+                    self._stats["retries"] += 1
+                connection, reused = self._newConnection(key, timeout), False
+            except Exception:
+                connection.close()
+                raise
+
+    def getStats(self):
+        #=======================================================================
+        # 连接池统计: hits/misses/evicted/discarded/retries 以及当前空闲连接数
+        #=======================================================================
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = sum(len(idle) for idle in self._idle.values())
+        for name in ("hits", "misses", "evicted", "discarded", "retries"):
+            stats.setdefault(name, 0)
+        return stats
+
+    def clear(self):
+        with self._lock:
+            idle_list, self._idle = self._idle, collections.defaultdict(collections.deque)
+        for idle in idle_list.values():
+            for connection, _ in idle:
+                connection.close()
+
+
+_default_pool = ConnectionPool()
+
+
+def getDefaultConnectionPool():
+    return _default_pool
+
+
+def setDefaultConnectionPool(pool):
+    global _default_pool
+    _default_pool = pool
@@ -1,14 +0,0 @@
-'''
-Created by auto_sdk on 2020.08.17
-'''
-from dingtalk.api.base import RestApi
-class CorpChatbotInstallRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.chatbot_vo = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.corp.chatbot.install'
@@ -1,16 +0,0 @@
-'''
-Created by auto_sdk on 2018.07.25
-'''
-from dingtalk.api.base import RestApi
-class CorpChatbotUpdateorgbotRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.chatbot_id = None
-		self.icon = None
-		self.name = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.corp.chatbot.updateorgbot'
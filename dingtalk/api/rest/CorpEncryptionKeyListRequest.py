@@ -1,13 +0,0 @@
-'''
-Created by auto_sdk on 2018.07.25
-'''
-from dingtalk.api.base import RestApi
-class CorpEncryptionKeyListRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.corp.encryption.key.list'
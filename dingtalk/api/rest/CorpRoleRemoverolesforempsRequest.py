@@ -1,15 +0,0 @@
-'''
-Created by auto_sdk on 2019.07.03
-'''
-from dingtalk.api.base import RestApi
-class CorpRoleRemoverolesforempsRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.roleid_list = None
-		self.userid_list = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.corp.role.removerolesforemps'
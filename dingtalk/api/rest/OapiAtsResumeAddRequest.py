@@ -1,15 +0,0 @@
-'''
-Created by auto_sdk on 2021.04.26
-'''
-from dingtalk.api.base import RestApi
-class OapiAtsResumeAddRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.biz_code = None
-		self.param = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.ats.resume.add'
@@ -1,16 +0,0 @@
-'''
-Created by auto_sdk on 2019.08.21
-'''
-from dingtalk.api.base import RestApi
-class OapiAttendanceGroupMemberListRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.cursor = None
-		self.group_id = None
-		self.op_user_id = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.attendance.group.member.list'
@@ -1,13 +0,0 @@
-'''
-Created by auto_sdk on 2020.01.03
-'''
-from dingtalk.api.base import RestApi
-class OapiCrmAuthGroupListRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.crm.auth.group.list'
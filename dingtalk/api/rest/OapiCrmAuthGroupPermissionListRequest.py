@@ -1,14 +0,0 @@
-'''
-Created by auto_sdk on 2020.01.03
-'''
-from dingtalk.api.base import RestApi
-class OapiCrmAuthGroupPermissionListRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.role_id = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.crm.auth.group.permission.list'
@@ -1,15 +0,0 @@
-'''
-Created by auto_sdk on 2020.10.09
-'''
-from dingtalk.api.base import RestApi
-class OapiCrmObjectdataContactDeleteRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.data_id = None
-		self.operator_userid = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.crm.objectdata.contact.delete'
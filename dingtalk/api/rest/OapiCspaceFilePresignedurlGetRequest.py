@@ -1,17 +0,0 @@
-'''
-Created by auto_sdk on 2020.11.18
-'''
-from dingtalk.api.base import RestApi
-class OapiCspaceFilePresignedurlGetRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.dentryid = None
-		self.expire_seconds = None
-		self.inner_invoke = None
-		self.spaceid = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.cspace.file.presignedurl.get'
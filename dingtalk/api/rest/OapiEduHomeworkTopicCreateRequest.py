@@ -1,14 +0,0 @@
-'''
-Created by auto_sdk on 2021.04.27
-'''
-from dingtalk.api.base import RestApi
-class OapiEduHomeworkTopicCreateRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.topic_items = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.edu.homework.topic.create'
@@ -1,14 +0,0 @@
-'''
-Created by auto_sdk on 2021.02.03
-'''
-from dingtalk.api.base import RestApi
-class OapiHireAuthRoleGetbyuserRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.userid = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.hire.auth.role.getbyuser'
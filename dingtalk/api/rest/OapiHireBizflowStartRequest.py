@@ -1,16 +0,0 @@
-'''
-Created by auto_sdk on 2020.09.21
-'''
-from dingtalk.api.base import RestApi
-class OapiHireBizflowStartRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.job_id = None
-		self.op_userid = None
-		self.resume_id = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.hire.bizflow.start'
@@ -1,17 +0,0 @@
-'''
-Created by auto_sdk on 2020.09.16
-'''
-from dingtalk.api.base import RestApi
-class OapiIndustryUserListRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.cursor = None
-		self.dept_id = None
-		self.role = None
-		self.size = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.industry.user.list'
@@ -1,14 +0,0 @@
-'''
-Created by auto_sdk on 2020.02.05
-'''
-from dingtalk.api.base import RestApi
-class OapiProcessGetByNameRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.name = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.process.get_by_name'
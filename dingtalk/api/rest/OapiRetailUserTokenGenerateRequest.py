@@ -1,15 +0,0 @@
-'''
-Created by auto_sdk on 2020.03.09
-'''
-from dingtalk.api.base import RestApi
-class OapiRetailUserTokenGenerateRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.channel = None
-		self.request = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.retail.user.token.generate'
@@ -1,15 +0,0 @@
-'''
-Created by auto_sdk on 2019.07.01
-'''
-from dingtalk.api.base import RestApi
-class OapiSnsSendMsgRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.code = None
-		self.msg = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.sns.send_msg'
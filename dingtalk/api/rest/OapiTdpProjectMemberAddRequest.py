@@ -1,17 +0,0 @@
-'''
-Created by auto_sdk on 2020.12.23
-'''
-from dingtalk.api.base import RestApi
-class OapiTdpProjectMemberAddRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.microapp_agent_id = None
-		self.operator_userid = None
-		self.project_id = None
-		self.userid = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.tdp.project.member.add'
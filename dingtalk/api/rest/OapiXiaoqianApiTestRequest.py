@@ -1,14 +0,0 @@
-'''
-Created by auto_sdk on 2021.06.16
-'''
-from dingtalk.api.base import RestApi
-class OapiXiaoqianApiTestRequest(RestApi):
-	def __init__(self,url=None):
-		RestApi.__init__(self,url)
-		self.id = None
-
-	def getHttpMethod(self):
-		return 'POST'
-
-	def getapiname(self):
-		return 'dingtalk.oapi.xiaoqian.api.test'
@@ -0,0 +1,1191 @@
+'''
+钉钉开放平台接口声明表，由 auto_sdk 生成的请求类整理而来
+
+请求类名 -> (api 名称, http 方法, 请求参数字段, multipart 上传字段)
+'''
+
+ENDPOINTS = {
+    "CcoserviceServicegroupAddmemberRequest": ("dingtalk.ccoservice.servicegroup.addmember", "POST", ("open_group_id", "userid"), ()),
+    "CcoserviceServicegroupGetRequest": ("dingtalk.ccoservice.servicegroup.get", "POST", ("open_group_id",), ()),
+    "CorpBlazersGetbinddataRequest": ("dingtalk.corp.blazers.getbinddata", "POST", (), ()),
+    "CorpBlazersGetbizidRequest": ("dingtalk.corp.blazers.getbizid", "POST", (), ()),
+    "CorpBlazersRemovemappingRequest": ("dingtalk.corp.blazers.removemapping", "POST", ("biz_id",), ()),
+    "CorpBlazersUnbindRequest": ("dingtalk.corp.blazers.unbind", "POST", (), ()),
+    "CorpCalendarCreateRequest": ("dingtalk.corp.calendar.create", "POST", ("create_vo",), ()),
+    "CorpChatbotAddchatbotinstanceRequest": ("dingtalk.corp.chatbot.addchatbotinstance", "POST", ("chatbot_id", "icon_media_id", "name", "open_conversation_id"), ()),
+    "CorpChatbotCreateorgbotRequest": ("dingtalk.corp.chatbot.createorgbot", "POST", ("create_chat_bot_model",), ()),
+    "CorpChatbotInstallRequest": ("dingtalk.corp.chatbot.install", "POST", ("chatbot_vo",), ()),
+    "CorpChatbotListbychatbotidsRequest": ("dingtalk.corp.chatbot.listbychatbotids", "POST", ("chatbot_ids",), ()),
+    "CorpChatbotListorgbotRequest": ("dingtalk.corp.chatbot.listorgbot", "POST", ("agent_id", "type"), ()),
+    "CorpChatbotListorgbotbytypeandbottypeRequest": ("dingtalk.corp.chatbot.listorgbotbytypeandbottype", "POST", ("bot_type", "type"), ()),
+    "CorpChatbotUpdatebychatbotidRequest": ("dingtalk.corp.chatbot.updatebychatbotid", "POST", ("breif", "chatbot_id", "description", "icon", "name", "preview_media_id", "update_type"), ()),
+    "CorpChatbotUpdateorgbotRequest": ("dingtalk.corp.chatbot.updateorgbot", "POST", ("chatbot_id", "icon", "name"), ()),
+    "CorpConversationCorpconversionGetconversationRequest": ("dingtalk.corp.conversation.corpconversion.getconversation", "POST", ("open_conversation_id",), ()),
+    "CorpConversationCorpconversionListmemberRequest": ("dingtalk.corp.conversation.corpconversion.listmember", "POST", ("count", "offset", "open_conversation_id"), ()),
+    "CorpDeptgroupSyncuserRequest": ("dingtalk.corp.deptgroup.syncuser", "POST", ("dept_id", "userid"), ()),
+    "CorpDeviceManageGetRequest": ("dingtalk.corp.device.manage.get", "POST", ("device_id", "device_service_id"), ()),
+    "CorpDeviceManageHasbinddeviceRequest": ("dingtalk.corp.device.manage.hasbinddevice", "POST", ("device_service_id",), ()),
+    "CorpDeviceManageQuerylistRequest": ("dingtalk.corp.device.manage.querylist", "POST", ("cursor", "device_service_id", "size"), ()),
+    "CorpDeviceManageUnbindRequest": ("dingtalk.corp.device.manage.unbind", "POST", ("device_id", "device_service_id"), ()),
+    "CorpDeviceNickUpdateRequest": ("dingtalk.corp.device.nick.update", "POST", ("device_id", "device_service_id", "new_nick"), ()),
+    "CorpDingCreateRequest": ("dingtalk.corp.ding.create", "POST", ("attachment", "creator_userid", "receiver_userids", "remind_time", "remind_type", "text_content"), ()),
+    "CorpDingReceiverstatusListRequest": ("dingtalk.corp.ding.receiverstatus.list", "POST", ("confirmed_status", "ding_id", "page_no", "page_size"), ()),
+    "CorpDingTaskCreateRequest": ("dingtalk.corp.ding.task.create", "POST", ("task_send_v_o",), ()),
+    "CorpEmpSearchRequest": ("dingtalk.corp.emp.search", "POST", ("keyword", "offset", "size"), ()),
+    "CorpEncryptionKeyListRequest": ("dingtalk.corp.encryption.key.list", "POST", (), ()),
+    "CorpExtAddRequest": ("dingtalk.corp.ext.add", "POST", ("contact",), ()),
+    "CorpExtListRequest": ("dingtalk.corp.ext.list", "POST", ("offset", "size"), ()),
+    "CorpExtListlabelgroupsRequest": ("dingtalk.corp.ext.listlabelgroups", "POST", ("offset", "size"), ()),
+    "CorpExtUpdateRequest": ("dingtalk.corp.ext.update", "POST", ("contact",), ()),
+    "CorpExtcontactCreateRequest": ("dingtalk.corp.extcontact.create", "POST", ("contact",), ()),
+    "CorpExtcontactDeleteRequest": ("dingtalk.corp.extcontact.delete", "POST", ("userid",), ()),
+    "CorpExtcontactGetRequest": ("dingtalk.corp.extcontact.get", "POST", ("user_id",), ()),
+    "CorpExtcontactListRequest": ("dingtalk.corp.extcontact.list", "POST", ("offset", "size"), ()),
+    "CorpExtcontactListlabelgroupsRequest": ("dingtalk.corp.extcontact.listlabelgroups", "POST", ("offset", "size"), ()),
+    "CorpExtcontactUpdateRequest": ("dingtalk.corp.extcontact.update", "POST", ("contact",), ()),
+    "CorpHealthStepinfoGetuserstatusRequest": ("dingtalk.corp.health.stepinfo.getuserstatus", "POST", ("userid",), ()),
+    "CorpHealthStepinfoListRequest": ("dingtalk.corp.health.stepinfo.list", "POST", ("object_id", "stat_dates", "type"), ()),
+    "CorpHealthStepinfoListbyuseridRequest": ("dingtalk.corp.health.stepinfo.listbyuserid", "POST", ("stat_date", "userids"), ()),
+    "CorpHrmEmployeeAddresumerecordRequest": ("dingtalk.corp.hrm.employee.addresumerecord", "POST", ("content", "k_v_content", "pc_url", "phone_url", "record_time_stamp", "title", "userid", "web_url"), ()),
+    "CorpHrmEmployeeDelemployeedismissionandhandoverRequest": ("dingtalk.corp.hrm.employee.delemployeedismissionandhandover", "POST", ("dismission_info_with_hand_over", "op_userid"), ()),
+    "CorpHrmEmployeeGetRequest": ("dingtalk.corp.hrm.employee.get", "POST", ("userid",), ()),
+    "CorpHrmEmployeeGetdismissionlistRequest": ("dingtalk.corp.hrm.employee.getdismissionlist", "POST", ("current", "op_userid", "page_size"), ()),
+    "CorpHrmEmployeeModjobinfoRequest": ("dingtalk.corp.hrm.employee.modjobinfo", "POST", ("hrm_api_job_model", "op_userid"), ()),
+    "CorpHrmEmployeeSetuserworkdataRequest": ("dingtalk.corp.hrm.employee.setuserworkdata", "POST", ("hrm_api_user_data_model", "op_userid"), ()),
+    "CorpInvoiceGettitleRequest": ("dingtalk.corp.invoice.gettitle", "POST", (), ()),
+    "CorpLivenessGetRequest": ("dingtalk.corp.liveness.get", "POST", (), ()),
+    "CorpMessageCorpconversationAsyncsendRequest": ("dingtalk.corp.message.corpconversation.asyncsend", "POST", ("agent_id", "dept_id_list", "msgcontent", "msgtype", "to_all_user", "userid_list"), ()),
+    "CorpMessageCorpconversationAsyncsendbycodeRequest": ("dingtalk.corp.message.corpconversation.asyncsendbycode", "POST", ("agent_id", "code", "dept_id_list", "msgcontent", "msgtype", "to_all_user", "user_id_list"), ()),
+    "CorpMessageCorpconversationGetsendprogressRequest": ("dingtalk.corp.message.corpconversation.getsendprogress", "POST", ("agent_id", "task_id"), ()),
+    "CorpMessageCorpconversationGetsendresultRequest": ("dingtalk.corp.message.corpconversation.getsendresult", "POST", ("agent_id", "task_id"), ()),
+    "CorpMessageCorpconversationSendmockRequest": ("dingtalk.corp.message.corpconversation.sendmock", "POST", ("message", "message_type", "microapp_agent_id", "to_party", "to_user"), ()),
+    "CorpReportListRequest": ("dingtalk.corp.report.list", "POST", ("cursor", "end_time", "size", "start_time", "template_name", "userid"), ()),
+    "CorpRoleAddrolesforempsRequest": ("dingtalk.corp.role.addrolesforemps", "POST", ("rolelid_list", "userid_list"), ()),
+    "CorpRoleDeleteroleRequest": ("dingtalk.corp.role.deleterole", "POST", ("role_id",), ()),
+    "CorpRoleGetrolegroupRequest": ("dingtalk.corp.role.getrolegroup", "POST", ("group_id",), ()),
+    "CorpRoleListRequest": ("dingtalk.corp.role.list", "POST", ("offset", "size"), ()),
+    "CorpRoleRemoverolesforempsRequest": ("dingtalk.corp.role.removerolesforemps", "POST", ("roleid_list", "userid_list"), ()),
+    "CorpRoleSimplelistRequest": ("dingtalk.corp.role.simplelist", "POST", ("offset", "role_id", "size"), ()),
+    "CorpSearchCorpcontactBaseinfoRequest": ("dingtalk.corp.search.corpcontact.baseinfo", "POST", ("offset", "query", "size"), ()),
+    "CorpSmartdeviceAddfaceRequest": ("dingtalk.corp.smartdevice.addface", "POST", ("face_vo",), ()),
+    "CorpSmartdeviceGetfaceRequest": ("dingtalk.corp.smartdevice.getface", "POST", ("userid",), ()),
+    "CorpSmartdeviceHasfaceRequest": ("dingtalk.corp.smartdevice.hasface", "POST", ("userid_list",), ()),
+    "CorpSmartdeviceReceptionistPushinfoRequest": ("dingtalk.corp.smartdevice.receptionist.pushinfo", "POST", ("desc_content", "desc_template", "microapp_agent_id"), ()),
+    "CorpUserPersonainfoGetRequest": ("dingtalk.corp.user.personainfo.get", "POST", ("userid",), ()),
+    "IsvBlazersGeneratecodeRequest": ("dingtalk.isv.blazers.generatecode", "POST", ("biz_id", "ext"), ()),
+    "IsvCallCalluserRequest": ("dingtalk.isv.call.calluser", "POST", ("authed_corp_id", "authed_staff_id", "staff_id"), ()),
+    "IsvCallGetuserlistRequest": ("dingtalk.isv.call.getuserlist", "POST", ("offset", "start"), ()),
+    "IsvCallRemoveuserlistRequest": ("dingtalk.isv.call.removeuserlist", "POST", ("staff_id_list",), ()),
+    "IsvCallSetuserlistRequest": ("dingtalk.isv.call.setuserlist", "POST", ("staff_id_list",), ()),
+    "OapiAiMtTranslateRequest": ("dingtalk.oapi.ai.mt.translate", "POST", ("query", "source_language", "target_language"), ()),
+    "OapiAlitripBtripAddressGetRequest": ("dingtalk.oapi.alitrip.btrip.address.get", "POST", ("request",), ()),
+    "OapiAlitripBtripApplyGetRequest": ("dingtalk.oapi.alitrip.btrip.apply.get", "POST", ("rq",), ()),
+    "OapiAlitripBtripApplySearchRequest": ("dingtalk.oapi.alitrip.btrip.apply.search", "POST", ("rq",), ()),
+    "OapiAlitripBtripApprovalModifyRequest": ("dingtalk.oapi.alitrip.btrip.approval.modify", "POST", ("rq",), ()),
+    "OapiAlitripBtripApprovalNewRequest": ("dingtalk.oapi.alitrip.btrip.approval.new", "POST", ("rq",), ()),
+    "OapiAlitripBtripApprovalUpdateRequest": ("dingtalk.oapi.alitrip.btrip.approval.update", "POST", ("rq",), ()),
+    "OapiAlitripBtripBindTaobaoGetRequest": ("dingtalk.oapi.alitrip.btrip.bind.taobao.get", "POST", ("request",), ()),
+    "OapiAlitripBtripCategoryAddressGetRequest": ("dingtalk.oapi.alitrip.btrip.category.address.get", "POST", ("rq",), ()),
+    "OapiAlitripBtripCostCenterDeleteRequest": ("dingtalk.oapi.alitrip.btrip.cost.center.delete", "POST", ("rq",), ()),
+    "OapiAlitripBtripCostCenterEntityAddRequest": ("dingtalk.oapi.alitrip.btrip.cost.center.entity.add", "POST", ("rq",), ()),
+    "OapiAlitripBtripCostCenterEntityDeleteRequest": ("dingtalk.oapi.alitrip.btrip.cost.center.entity.delete", "POST", ("rq",), ()),
+    "OapiAlitripBtripCostCenterEntitySetRequest": ("dingtalk.oapi.alitrip.btrip.cost.center.entity.set", "POST", ("rq",), ()),
+    "OapiAlitripBtripCostCenterModifyRequest": ("dingtalk.oapi.alitrip.btrip.cost.center.modify", "POST", ("rq",), ()),
+    "OapiAlitripBtripCostCenterNewRequest": ("dingtalk.oapi.alitrip.btrip.cost.center.new", "POST", ("rq",), ()),
+    "OapiAlitripBtripCostCenterQueryRequest": ("dingtalk.oapi.alitrip.btrip.cost.center.query", "POST", ("rq",), ()),
+    "OapiAlitripBtripCostCenterTransferRequest": ("dingtalk.oapi.alitrip.btrip.cost.center.transfer", "POST", ("rq",), ()),
+    "OapiAlitripBtripFlightCitySuggestRequest": ("dingtalk.oapi.alitrip.btrip.flight.city.suggest", "POST", ("rq",), ()),
+    "OapiAlitripBtripFlightOrderSearchRequest": ("dingtalk.oapi.alitrip.btrip.flight.order.search", "POST", ("rq",), ()),
+    "OapiAlitripBtripHotelOrderSearchRequest": ("dingtalk.oapi.alitrip.btrip.hotel.order.search", "POST", ("rq",), ()),
+    "OapiAlitripBtripInvoiceSearchRequest": ("dingtalk.oapi.alitrip.btrip.invoice.search", "POST", ("rq",), ()),
+    "OapiAlitripBtripInvoiceSettingAddRequest": ("dingtalk.oapi.alitrip.btrip.invoice.setting.add", "POST", ("rq",), ()),
+    "OapiAlitripBtripInvoiceSettingDeleteRequest": ("dingtalk.oapi.alitrip.btrip.invoice.setting.delete", "POST", ("request",), ()),
+    "OapiAlitripBtripInvoiceSettingModifyRequest": ("dingtalk.oapi.alitrip.btrip.invoice.setting.modify", "POST", ("request",), ()),
+    "OapiAlitripBtripInvoiceSettingRuleRequest": ("dingtalk.oapi.alitrip.btrip.invoice.setting.rule", "POST", ("request",), ()),
+    "OapiAlitripBtripMonthbillUrlGetRequest": ("dingtalk.oapi.alitrip.btrip.monthbill.url.get", "POST", ("request",), ()),
+    "OapiAlitripBtripPriceQueryRequest": ("dingtalk.oapi.alitrip.btrip.price.query", "POST", ("req",), ()),
+    "OapiAlitripBtripProjectAddRequest": ("dingtalk.oapi.alitrip.btrip.project.add", "POST", ("request",), ()),
+    "OapiAlitripBtripProjectDeleteRequest": ("dingtalk.oapi.alitrip.btrip.project.delete", "POST", ("corpid", "third_part_id"), ()),
+    "OapiAlitripBtripProjectModifyRequest": ("dingtalk.oapi.alitrip.btrip.project.modify", "POST", ("request",), ()),
+    "OapiAlitripBtripReimbursementAppstatusSyncRequest": ("dingtalk.oapi.alitrip.btrip.reimbursement.appstatus.sync", "POST", ("rq",), ()),
+    "OapiAlitripBtripReimbursementGetRequest": ("dingtalk.oapi.alitrip.btrip.reimbursement.get", "POST", ("corpid", "thirdparty_flow_id"), ()),
+    "OapiAlitripBtripReimbursementInitRequest": ("dingtalk.oapi.alitrip.btrip.reimbursement.init", "POST", ("rq",), ()),
+    "OapiAlitripBtripReimbursementUpdateRequest": ("dingtalk.oapi.alitrip.btrip.reimbursement.update", "POST", ("rq",), ()),
+    "OapiAlitripBtripTrainCitySuggestRequest": ("dingtalk.oapi.alitrip.btrip.train.city.suggest", "POST", ("rq",), ()),
+    "OapiAlitripBtripTrainOrderSearchRequest": ("dingtalk.oapi.alitrip.btrip.train.order.search", "POST", ("rq",), ()),
+    "OapiAlitripBtripUnbindTaobaoRequest": ("dingtalk.oapi.alitrip.btrip.unbind.taobao", "POST", ("request",), ()),
+    "OapiAlitripBtripVehicleOrderSearchRequest": ("dingtalk.oapi.alitrip.btrip.vehicle.order.search", "POST", ("rq",), ()),
+    "OapiAppstoreGoodsQueryRequest": ("dingtalk.oapi.appstore.goods.query", "POST", ("goods_code",), ()),
+    "OapiAppstoreInternalOrderConsumeRequest": ("dingtalk.oapi.appstore.internal.order.consume", "POST", ("biz_order_id", "quantity", "request_id", "userid"), ()),
+    "OapiAppstoreInternalOrderFinishRequest": ("dingtalk.oapi.appstore.internal.order.finish", "POST", ("biz_order_id",), ()),
+    "OapiAppstoreInternalOrderGetRequest": ("dingtalk.oapi.appstore.internal.order.get", "POST", ("biz_order_id",), ()),
+    "OapiAppstoreInternalRemindRequest": ("dingtalk.oapi.appstore.internal.remind", "POST", ("goods_code", "process_instance_id"), ()),
+    "OapiAppstoreInternalSkupageGetRequest": ("dingtalk.oapi.appstore.internal.skupage.get", "POST", ("callback_page", "extend_param", "goods_code", "item_code"), ()),
+    "OapiAppstoreInternalUnfinishedorderListRequest": ("dingtalk.oapi.appstore.internal.unfinishedorder.list", "POST", ("item_code", "page", "page_size"), ()),
+    "OapiAppstoreOrdersInquiryRequest": ("dingtalk.oapi.appstore.orders.inquiry", "POST", ("corpid", "cyc_num", "cyc_unit", "goods_code", "item_code", "mobile", "quantity"), ()),
+    "OapiAppstoreOrdersSpecialCanalCreateOrderRequest": ("dingtalk.oapi.appstore.orders.special_canal.create_order", "POST", ("corpid", "cyc_num", "cyc_unit", "goods_code", "item_code", "mobile", "order_center_id", "price", "quantity"), ()),
+    "OapiAppstoreOrdersSpecialCanalUpdateOrderRequest": ("dingtalk.oapi.appstore.orders.special_canal.update_order", "POST", ("ding_order_id", "status"), ()),
+    "OapiAsrVoiceTranslateRequest": ("dingtalk.oapi.asr.voice.translate", "POST", ("media_id",), ()),
+    "OapiAtsCandidateGetRequest": ("dingtalk.oapi.ats.candidate.get", "POST", ("biz_code", "candidate_id"), ()),
+    "OapiAtsChannelAccountAddRequest": ("dingtalk.oapi.ats.channel.account.add", "POST", ("biz_code", "channel_user_identify", "userid"), ()),
+    "OapiAtsChannelAccountDeleteRequest": ("dingtalk.oapi.ats.channel.account.delete", "POST", ("biz_code", "channel_user_identify", "userid"), ()),
+    "OapiAtsEvaluateJobmatchCancelRequest": ("dingtalk.oapi.ats.evaluate.jobmatch.cancel", "POST", ("biz_code", "ext_data", "outer_evaluate_id"), ()),
+    "OapiAtsEvaluateJobmatchFinishRequest": ("dingtalk.oapi.ats.evaluate.jobmatch.finish", "POST", ("biz_code", "conclusion", "ext_data", "outer_evaluate_id", "report_download_url", "result", "score"), ()),
+    "OapiAtsEvaluateJobmatchStartRequest": ("dingtalk.oapi.ats.evaluate.jobmatch.start", "POST", ("biz_code", "candidate_id", "category", "ext_data", "invite_url", "job_id", "outer_evaluate_id", "result_url"), ()),
+    "OapiAtsJobBatchaddRequest": ("dingtalk.oapi.ats.job.batchadd", "POST", ("biz_code", "jobs", "op_user_id"), ()),
+    "OapiAtsJobDeliverAddRequest": ("dingtalk.oapi.ats.job.deliver.add", "POST", ("biz_code", "deliver_channel", "deliver_msg", "deliver_outer_id", "deliver_status", "job_id"), ()),
+    "OapiAtsJobGetRequest": ("dingtalk.oapi.ats.job.get", "POST", ("biz_code", "job_id"), ()),
+    "OapiAtsJobQueryRequest": ("dingtalk.oapi.ats.job.query", "POST", ("biz_code", "cursor", "query_param", "size"), ()),
+    "OapiAtsMessageCorpSystemaccountSendRequest": ("dingtalk.oapi.ats.message.corp.systemaccount.send", "POST", ("biz_code", "param"), ()),
+    "OapiAtsMessageSystemaccountSendmessageRequest": ("dingtalk.oapi.ats.message.systemaccount.sendmessage", "POST", ("content", "message_biz_code", "openid"), ()),
+    "OapiAtsPluginDataDeleteRequest": ("dingtalk.oapi.ats.plugin.data.delete", "POST", ("biz_code", "header", "out_id"), ()),
+    "OapiAtsPluginDataPushRequest": ("dingtalk.oapi.ats.plugin.data.push", "POST", ("biz_code", "content", "header", "out_id"), ()),
+    "OapiAtsPluginStatisticsResumeListRequest": ("dingtalk.oapi.ats.plugin.statistics.resume.list", "POST", ("biz_code", "cursor", "size"), ()),
+    "OapiAtsResumeAddRequest": ("dingtalk.oapi.ats.resume.add", "POST", ("biz_code", "param"), ()),
+    "OapiAtsResumeCheckexistenceRequest": ("dingtalk.oapi.ats.resume.checkexistence", "POST", ("biz_code", "resume_detail_info"), ()),
+    "OapiAtsRpaResumeMailCollectRequest": ("dingtalk.oapi.ats.rpa.resume.mail.collect", "POST", ("biz_code", "param"), ()),
+    "OapiAtsStatisticsResumeListRequest": ("dingtalk.oapi.ats.statistics.resume.list", "POST", ("biz_code", "cursor", "size"), ()),
+    "OapiAttendanceAdvancedServiceBindRequest": ("dingtalk.oapi.attendance.advanced.service.bind", "POST", ("op_userid", "param"), ()),
+    "OapiAttendanceAdvancedServiceIsboundRequest": ("dingtalk.oapi.attendance.advanced.service.isbound", "POST", ("op_userid", "param"), ()),
+    "OapiAttendanceAdvancedServiceUnbindRequest": ("dingtalk.oapi.attendance.advanced.service.unbind", "POST", ("entity_id", "entity_type", "op_userid", "service_id"), ()),
+    "OapiAttendanceApproveCancelRequest": ("dingtalk.oapi.attendance.approve.cancel", "POST", ("approve_id", "dingtalk_approve_id", "sub_type", "tag_name", "userid"), ()),
+    "OapiAttendanceApproveCheckRequest": ("dingtalk.oapi.attendance.approve.check", "POST", ("approve_id", "jump_url", "punch_check_time", "punch_id", "tag_name", "user_check_time", "userid", "work_date"), ()),
+    "OapiAttendanceApproveDurationCalculateRequest": ("dingtalk.oapi.attendance.approve.duration.calculate", "POST", ("biz_type", "calculate_model", "duration_unit", "from_time", "to_time", "userid"), ()),
+    "OapiAttendanceApproveFinishRequest": ("dingtalk.oapi.attendance.approve.finish", "POST", ("approve_id", "biz_type", "calculate_model", "dingtalk_approve_id", "duration_unit", "from_time", "jump_url", "overtime_duration", "overtime_to_more", "sub_type", "tag_name", "to_time", "userid"), ()),
+    "OapiAttendanceApproveScheduleSwitchRequest": ("dingtalk.oapi.attendance.approve.schedule.switch", "POST", ("apply_shift_id", "apply_userid", "approve_id", "reback_apply_shift_id", "reback_date", "reback_target_shift_id", "switch_date", "target_shift_id", "target_userid", "userid"), ()),
+    "OapiAttendanceClassGetRequest": ("dingtalk.oapi.attendance.class.get", "POST", ("class_id",), ()),
+    "OapiAttendanceCorpConfirmRequest": ("dingtalk.oapi.attendance.corp.confirm", "POST", ("corp_id", "corp_list"), ()),
+    "OapiAttendanceCorpInviteactiveAddRequest": ("dingtalk.oapi.attendance.corp.inviteactive.add", "POST", ("admin_mobile", "invited_mobile"), ()),
+    "OapiAttendanceCorpInviteactiveOpenRequest": ("dingtalk.oapi.attendance.corp.inviteactive.open", "POST", ("admin_name", "admin_phone"), ()),
+    "OapiAttendanceFaceRecognitionRequest": ("dingtalk.oapi.attendance.face.recognition", "POST", ("media_id",), ()),
+    "OapiAttendanceGetAttendUpdateDataRequest": ("dingtalk.oapi.attendance.getAttendUpdateData", "POST", ("userid", "work_date"), ()),
+    "OapiAttendanceGetattcolumnsRequest": ("dingtalk.oapi.attendance.getattcolumns", "POST", (), ()),
+    "OapiAttendanceGetcolumnvalRequest": ("dingtalk.oapi.attendance.getcolumnval", "POST", ("column_id_list", "from_date", "to_date", "userid"), ()),
+    "OapiAttendanceGetleaveapprovedurationRequest": ("dingtalk.oapi.attendance.getleaveapproveduration", "POST", ("from_date", "to_date", "userid"), ()),
+    "OapiAttendanceGetleavestatusRequest": ("dingtalk.oapi.attendance.getleavestatus", "POST", ("end_time", "offset", "size", "start_time", "userid_list"), ()),
+    "OapiAttendanceGetleavetimebynamesRequest": ("dingtalk.oapi.attendance.getleavetimebynames", "POST", ("from_date", "leave_names", "to_date", "userid"), ()),
+    "OapiAttendanceGetsimplegroupsRequest": ("dingtalk.oapi.attendance.getsimplegroups", "POST", ("offset", "size"), ()),
+    "OapiAttendanceGetupdatedataRequest": ("dingtalk.oapi.attendance.getupdatedata", "POST", ("userid", "work_date"), ()),
+    "OapiAttendanceGetusergroupRequest": ("dingtalk.oapi.attendance.getusergroup", "POST", ("userid",), ()),
+    "OapiAttendanceGroupAddRequest": ("dingtalk.oapi.attendance.group.add", "POST", ("op_user_id", "top_group"), ()),
+    "OapiAttendanceGroupCreateRequest": ("dingtalk.oapi.attendance.group.create", "POST", ("group", "op_userid"), ()),
+    "OapiAttendanceGroupDeleteRequest": ("dingtalk.oapi.attendance.group.delete", "POST", ("group_key", "op_userid"), ()),
+    "OapiAttendanceGroupDeletebyidRequest": ("dingtalk.oapi.attendance.group.deletebyid", "POST", ("group_id", "op_user_id"), ()),
+    "OapiAttendanceGroupGetRequest": ("dingtalk.oapi.attendance.group.get", "POST", ("group_key", "op_userid"), ()),
+    "OapiAttendanceGroupMemberListRequest": ("dingtalk.oapi.attendance.group.member.list", "POST", ("cursor", "group_id", "op_user_id"), ()),
+    "OapiAttendanceGroupMemberListbyidsRequest": ("dingtalk.oapi.attendance.group.member.listbyids", "POST", ("group_id", "member_ids", "member_type", "op_user_id"), ()),
+    "OapiAttendanceGroupMemberUpdateRequest": ("dingtalk.oapi.attendance.group.member.update", "POST", ("group_id", "op_user_id", "schedule_flag", "update_param"), ()),
+    "OapiAttendanceGroupMemberusersListRequest": ("dingtalk.oapi.attendance.group.memberusers.list", "POST", ("cursor", "group_id", "op_user_id"), ()),
+    "OapiAttendanceGroupMinimalismListRequest": ("dingtalk.oapi.attendance.group.minimalism.list", "POST", ("cursor", "op_user_id"), ()),
+    "OapiAttendanceGroupModifyRequest": ("dingtalk.oapi.attendance.group.modify", "POST", ("op_user_id", "top_group"), ()),
+    "OapiAttendanceGroupPositionsAddRequest": ("dingtalk.oapi.attendance.group.positions.add", "POST", ("group_key", "op_userid", "position_list"), ()),
+    "OapiAttendanceGroupPositionsQueryRequest": ("dingtalk.oapi.attendance.group.positions.query", "POST", ("cursor", "group_key", "op_userid", "size"), ()),
+    "OapiAttendanceGroupPositionsRemoveRequest": ("dingtalk.oapi.attendance.group.positions.remove", "POST", ("group_key", "op_userid", "position_key_list"), ()),
+    "OapiAttendanceGroupQueryRequest": ("dingtalk.oapi.attendance.group.query", "POST", ("group_id", "op_user_id"), ()),
+    "OapiAttendanceGroupScheduleAsyncRequest": ("dingtalk.oapi.attendance.group.schedule.async", "POST", ("group_id", "op_user_id", "schedules"), ()),
+    "OapiAttendanceGroupScheduleClearRequest": ("dingtalk.oapi.attendance.group.schedule.clear", "POST", ("op_userid", "param"), ()),
+    "OapiAttendanceGroupSearchRequest": ("dingtalk.oapi.attendance.group.search", "POST", ("group_name", "op_user_id"), ()),
+    "OapiAttendanceGroupUpdateRequest": ("dingtalk.oapi.attendance.group.update", "POST", ("group", "op_userid"), ()),
+    "OapiAttendanceGroupUsersAddRequest": ("dingtalk.oapi.attendance.group.users.add", "POST", ("group_key", "op_userid", "user_id_list"), ()),
+    "OapiAttendanceGroupUsersQueryRequest": ("dingtalk.oapi.attendance.group.users.query", "POST", ("cursor", "group_key", "op_userid", "size"), ()),
+    "OapiAttendanceGroupUsersRemoveRequest": ("dingtalk.oapi.attendance.group.users.remove", "POST", ("group_key", "op_userid", "user_id_list"), ()),
+    "OapiAttendanceGroupWifisAddRequest": ("dingtalk.oapi.attendance.group.wifis.add", "POST", ("group_key", "op_userid", "wifi_list"), ()),
+    "OapiAttendanceGroupWifisQueryRequest": ("dingtalk.oapi.attendance.group.wifis.query", "POST", ("cursor", "group_key", "op_userid", "size"), ()),
+    "OapiAttendanceGroupWifisRemoveRequest": ("dingtalk.oapi.attendance.group.wifis.remove", "POST", ("group_key", "op_userid", "wifi_key_list"), ()),
+    "OapiAttendanceGroupsIdtokeyRequest": ("dingtalk.oapi.attendance.groups.idtokey", "POST", ("group_id", "op_user_id"), ()),
+    "OapiAttendanceGroupsKeytoidRequest": ("dingtalk.oapi.attendance.groups.keytoid", "POST", ("group_key", "op_user_id"), ()),
+    "OapiAttendanceGroupsQueryRequest": ("dingtalk.oapi.attendance.groups.query", "POST", ("cursor", "op_userid", "size"), ()),
+    "OapiAttendanceIsopensmartreportRequest": ("dingtalk.oapi.attendance.isopensmartreport", "POST", (), ()),
+    "OapiAttendanceListRecordRequest": ("dingtalk.oapi.attendance.listRecord", "POST", ("checkDateFrom", "checkDateTo", "isI18n", "userIds"), ()),
+    "OapiAttendanceListRequest": ("dingtalk.oapi.attendance.list", "POST", ("isI18n", "limit", "offset", "userIdList", "workDateFrom", "workDateTo"), ()),
+    "OapiAttendanceListscheduleRequest": ("dingtalk.oapi.attendance.listschedule", "POST", ("offset", "size", "workDate"), ()),
+    "OapiAttendanceRecordUploadRequest": ("dingtalk.oapi.attendance.record.upload", "POST", ("device_id", "device_name", "photo_url", "user_check_time", "userid"), ()),
+    "OapiAttendanceScheduleListbydayRequest": ("dingtalk.oapi.attendance.schedule.listbyday", "POST", ("date_time", "op_user_id", "user_id"), ()),
+    "OapiAttendanceScheduleListbyusersRequest": ("dingtalk.oapi.attendance.schedule.listbyusers", "POST", ("from_date_time", "op_user_id", "to_date_time", "userids"), ()),
+    "OapiAttendanceScheduleResultListbyidsRequest": ("dingtalk.oapi.attendance.schedule.result.listbyids", "POST", ("op_user_id", "schedule_ids"), ()),
+    "OapiAttendanceScheduleShiftListbydaysRequest": ("dingtalk.oapi.attendance.schedule.shift.listbydays", "POST", ("from_date_time", "op_user_id", "to_date_time", "userids"), ()),
+    "OapiAttendanceShiftAddRequest": ("dingtalk.oapi.attendance.shift.add", "POST", ("op_user_id", "shift"), ()),
+    "OapiAttendanceShiftDeleteRequest": ("dingtalk.oapi.attendance.shift.delete", "POST", ("op_user_id", "shift_id"), ()),
+    "OapiAttendanceShiftHistoryQueryRequest": ("dingtalk.oapi.attendance.shift.history.query", "POST", ("op_user_id", "shift_id", "version"), ()),
+    "OapiAttendanceShiftListRequest": ("dingtalk.oapi.attendance.shift.list", "POST", ("cursor", "op_user_id"), ()),
+    "OapiAttendanceShiftQueryRequest": ("dingtalk.oapi.attendance.shift.query", "POST", ("op_user_id", "shift_id"), ()),
+    "OapiAttendanceShiftSearchRequest": ("dingtalk.oapi.attendance.shift.search", "POST", ("op_user_id", "shift_name"), ()),
+    "OapiAttendanceShiftUpdatepunchesRequest": ("dingtalk.oapi.attendance.shift.updatepunches", "POST", ("op_user_id", "punches", "shift_id"), ()),
+    "OapiAttendanceTestGetclassRequest": ("dingtalk.oapi.attendance.test.getclass", "POST", ("classId",), ()),
+    "OapiAttendanceTokenGetRequest": ("dingtalk.oapi.attendance.token.get", "POST", ("op_userid", "userid"), ()),
+    "OapiAttendanceVacationQuotaInitRequest": ("dingtalk.oapi.attendance.vacation.quota.init", "POST", ("leave_quotas", "op_userid"), ()),
+    "OapiAttendanceVacationQuotaListRequest": ("dingtalk.oapi.attendance.vacation.quota.list", "POST", ("leave_code", "offset", "op_userid", "size", "userids"), ()),
+    "OapiAttendanceVacationQuotaUpdateRequest": ("dingtalk.oapi.attendance.vacation.quota.update", "POST", ("leave_quotas", "op_userid"), ()),
+    "OapiAttendanceVacationRecordListRequest": ("dingtalk.oapi.attendance.vacation.record.list", "POST", ("leave_code", "offset", "op_userid", "size", "userids"), ()),
+    "OapiAttendanceVacationTypeCreateRequest": ("dingtalk.oapi.attendance.vacation.type.create", "POST", ("biz_type", "extras", "freedom_leave", "hours_in_per_day", "leave_certificate", "leave_name", "leave_time_ceil", "leave_time_ceil_min_unit", "leave_view_unit", "max_leave_time", "min_leave_hour", "natural_day_leave", "op_userid", "paid_leave", "submit_time_rule", "visibility_rules", "when_can_leave"), ()),
+    "OapiAttendanceVacationTypeDeleteRequest": ("dingtalk.oapi.attendance.vacation.type.delete", "POST", ("leave_code", "op_userid"), ()),
+    "OapiAttendanceVacationTypeListRequest": ("dingtalk.oapi.attendance.vacation.type.list", "POST", ("op_userid", "vacation_source"), ()),
+    "OapiAttendanceVacationTypeUpdateRequest": ("dingtalk.oapi.attendance.vacation.type.update", "POST", ("biz_type", "extras", "hours_in_per_day", "leave_certificate", "leave_code", "leave_name", "leave_time_ceil", "leave_time_ceil_min_unit", "leave_view_unit", "max_leave_time", "min_leave_hour", "natural_day_leave", "op_userid", "paid_leave", "submit_time_rule", "visibility_rules", "when_can_leave"), ()),
+    "OapiAuthScopesRequest": ("dingtalk.oapi.auth.scopes", "GET", (), ()),
+    "OapiAuthorizationRbacPermissionGetRequest": ("dingtalk.oapi.authorization.rbac.permission.get", "POST", ("agent_id", "resource", "userid"), ()),
+    "OapiAuthorizationRbacRoleActionUpdateRequest": ("dingtalk.oapi.authorization.rbac.role.action.update", "POST", ("agent_id", "open_action", "open_role_id"), ()),
+    "OapiAuthorizationRbacRoleCreateRequest": ("dingtalk.oapi.authorization.rbac.role.create", "POST", ("agent_id", "open_role_create"), ()),
+    "OapiAuthorizationRbacRoleListRequest": ("dingtalk.oapi.authorization.rbac.role.list", "POST", ("agent_id", "cursor", "size"), ()),
+    "OapiAuthorizationRbacRoleMemberAddRequest": ("dingtalk.oapi.authorization.rbac.role.member.add", "POST", ("add_members", "agent_id", "open_role_id"), ()),
+    "OapiAuthorizationRbacRoleMemberListRequest": ("dingtalk.oapi.authorization.rbac.role.member.list", "POST", ("agent_id", "cursor", "open_role_id", "size"), ()),
+    "OapiAuthorizationRbacRoleMemberRemoveRequest": ("dingtalk.oapi.authorization.rbac.role.member.remove", "POST", ("agent_id", "open_role_id", "remove_members"), ()),
+    "OapiAuthorizationRbacRoleNameUpdateRequest": ("dingtalk.oapi.authorization.rbac.role.name.update", "POST", ("agent_id", "open_role_id", "role_name"), ()),
+    "OapiAuthorizationRbacRoleQueryRequest": ("dingtalk.oapi.authorization.rbac.role.query", "POST", ("agent_id", "open_role_ids"), ()),
+    "OapiAuthorizationRbacRoleRemoveRequest": ("dingtalk.oapi.authorization.rbac.role.remove", "POST", ("agent_id", "open_role_id"), ()),
+    "OapiAuthorizationRbacRoleResourceUpdateRequest": ("dingtalk.oapi.authorization.rbac.role.resource.update", "POST", ("agent_id", "open_resources", "open_role_id"), ()),
+    "OapiBipaasDiAgentRequest": ("dingtalk.oapi.bipaas.di.agent", "POST", ("request",), ()),
+    "OapiBipaasGenericRequest": ("dingtalk.oapi.bipaas.generic", "POST", ("request",), ()),
+    "OapiBipaasMenuListTreeRequest": ("dingtalk.oapi.bipaas.menu.list_tree", "POST", ("antcloud_tenant_id", "published"), ()),
+    "OapiBipaasNotifyGrouprobotRequest": ("dingtalk.oapi.bipaas.notify.grouprobot", "POST", ("robot_notify",), ()),
+    "OapiBlackboardCategoryListRequest": ("dingtalk.oapi.blackboard.category.list", "POST", ("operation_userid",), ()),
+    "OapiBlackboardCreateRequest": ("dingtalk.oapi.blackboard.create", "POST", ("create_request",), ()),
+    "OapiBlackboardDeleteRequest": ("dingtalk.oapi.blackboard.delete", "POST", ("blackboard_id", "operation_userid"), ()),
+    "OapiBlackboardGetRequest": ("dingtalk.oapi.blackboard.get", "POST", ("blackboard_id", "operation_userid"), ()),
+    "OapiBlackboardListidsRequest": ("dingtalk.oapi.blackboard.listids", "POST", ("query_request",), ()),
+    "OapiBlackboardListtoptenRequest": ("dingtalk.oapi.blackboard.listtopten", "POST", ("userid",), ()),
+    "OapiBlackboardUpdateRequest": ("dingtalk.oapi.blackboard.update", "POST", ("update_request",), ()),
+    "OapiCalendarCreateRequest": ("dingtalk.oapi.calendar.create", "POST", ("create_vo",), ()),
+    "OapiCalendarDeleteRequest": ("dingtalk.oapi.calendar.delete", "POST", ("calendar_id", "userid"), ()),
+    "OapiCalendarListRequest": ("dingtalk.oapi.calendar.list", "POST", ("calendar_folder_id", "max_results", "page_token", "single_events", "time_max", "time_min", "user_id"), ()),
+    "OapiCalendarV2AttendeeUpdateRequest": ("dingtalk.oapi.calendar.v2.attendee.update", "POST", ("agentid", "attendees", "calendar_id", "event_id"), ()),
+    "OapiCalendarV2EventCancelRequest": ("dingtalk.oapi.calendar.v2.event.cancel", "POST", ("agentid", "calendar_id", "event_id"), ()),
+    "OapiCalendarV2EventCreateRequest": ("dingtalk.oapi.calendar.v2.event.create", "POST", ("agentid", "event"), ()),
+    "OapiCalendarV2EventDetailRequest": ("dingtalk.oapi.calendar.v2.event.detail", "POST", ("agentid", "calendar_id", "event_id"), ()),
+    "OapiCalendarV2EventUpdateRequest": ("dingtalk.oapi.calendar.v2.event.update", "POST", ("agentid", "event"), ()),
+    "OapiCallBackDeleteCallBackRequest": ("dingtalk.oapi.call_back.delete_call_back", "GET", (), ()),
+    "OapiCallBackGetCallBackFailedResultRequest": ("dingtalk.oapi.call_back.get_call_back_failed_result", "GET", (), ()),
+    "OapiCallBackGetCallBackRequest": ("dingtalk.oapi.call_back.get_call_back", "GET", (), ()),
+    "OapiCallBackRegisterCallBackRequest": ("dingtalk.oapi.call_back.register_call_back", "POST", ("aes_key", "call_back_tag", "token", "url"), ()),
+    "OapiCallBackUpdateCallBackRequest": ("dingtalk.oapi.call_back.update_call_back", "POST", ("aes_key", "call_back_tag", "token", "url"), ()),
+    "OapiCallCalluserRequest": ("dingtalk.oapi.call.calluser", "POST", ("authed_corp_id", "authed_staff_id", "staff_id"), ()),
+    "OapiCallGetuserlistRequest": ("dingtalk.oapi.call.getuserlist", "POST", ("offset", "size"), ()),
+    "OapiCallRemoveuserlistRequest": ("dingtalk.oapi.call.removeuserlist", "POST", ("staff_id_list",), ()),
+    "OapiCallSetuserlistRequest": ("dingtalk.oapi.call.setuserlist", "POST", ("staff_id_list",), ()),
+    "OapiCallbackFailrecordConfirmRequest": ("dingtalk.oapi.callback.failrecord.confirm", "POST", ("id_list",), ()),
+    "OapiCallbackFailrecordListRequest": ("dingtalk.oapi.callback.failrecord.list", "POST", ("req",), ()),
+    "OapiCardIntelligentEmpgroupSendRequest": ("dingtalk.oapi.card.intelligent.empgroup.send", "POST", ("msg_key", "param_json", "receiver_list", "uuid"), ()),
+    "OapiCateringApplylistCorpidlistGetRequest": ("dingtalk.oapi.catering.applylist.corpidlist.get", "POST", ("shop_id_list",), ()),
+    "OapiCateringCooplistGetRequest": ("dingtalk.oapi.catering.cooplist.get", "POST", ("coop_status", "off_set", "pg_size", "shop_id"), ()),
+    "OapiCateringDeductCapacityRequest": ("dingtalk.oapi.catering.deduct.capacity", "POST", ("mea_time", "order_full_amount", "orderid", "userid"), ()),
+    "OapiCateringMealconfigGetRequest": ("dingtalk.oapi.catering.mealconfig.get", "POST", ("meal_day_offset",), ()),
+    "OapiCateringOpenOrderPushRequest": ("dingtalk.oapi.catering.open.order.push", "POST", ("actual_amount", "allowance_amount", "ext", "meal_plan_no", "meal_time", "order_details", "order_full_amount", "order_id", "order_time", "shop_id", "shop_name", "user_name", "userid"), ()),
+    "OapiCateringOrderPushRequest": ("dingtalk.oapi.catering.order.push", "POST", ("fee_actually_pay", "fee_after_discount", "fee_original", "fee_should_pay", "order_details", "order_id", "orderer_user_id", "payment_time", "shop_id", "shop_name"), ()),
+    "OapiCateringPredeductRequest": ("dingtalk.oapi.catering.prededuct", "POST", ("expiry_time", "meal_time", "order_full_amount", "orderid", "userid"), ()),
+    "OapiCcoserviceEntranceSendnotifyRequest": ("dingtalk.oapi.ccoservice.entrance.sendnotify", "POST", ("app_id", "content", "userid"), ()),
+    "OapiCcoserviceServicegroupGetRequest": ("dingtalk.oapi.ccoservice.servicegroup.get", "POST", ("open_group_id",), ()),
+    "OapiCcoserviceServicegroupIsignoreproblemcheckRequest": ("dingtalk.oapi.ccoservice.servicegroup.isignoreproblemcheck", "POST", ("dingtalk_id", "open_conversation_id"), ()),
+    "OapiCcoserviceServicegroupUpdateservicetimeRequest": ("dingtalk.oapi.ccoservice.servicegroup.updateservicetime", "POST", ("end_time", "open_conversation_id", "start_time", "time_type"), ()),
+    "OapiCertifyQueryinfoRequest": ("dingtalk.oapi.certify.queryinfo", "POST", ("userid",), ()),
+    "OapiChatBanwordsQueryRequest": ("dingtalk.oapi.chat.banwords.query", "POST", ("chatid", "userid"), ()),
+    "OapiChatChatidTransformqrcodeGetRequest": ("dingtalk.oapi.chat.chatid.transformqrcode.get", "POST", ("group_url",), ()),
+    "OapiChatCreateRequest": ("dingtalk.oapi.chat.create", "POST", ("chatBannedType", "conversationTag", "extidlist", "icon", "managementType", "mentionAllAuthority", "name", "owner", "ownerType", "searchable", "showHistoryType", "useridlist", "validationType"), ()),
+    "OapiChatGetCidRequest": ("dingtalk.oapi.chat.get.cid", "POST", ("chatid",), ()),
+    "OapiChatGetReadListRequest": ("dingtalk.oapi.chat.getReadList", "GET", ("cursor", "messageId", "size"), ()),
+    "OapiChatGetRequest": ("dingtalk.oapi.chat.get", "GET", ("chatid",), ()),
+    "OapiChatMemberFriendswitchUpdateRequest": ("dingtalk.oapi.chat.member.friendswitch.update", "POST", ("chatid", "is_prohibit"), ()),
+    "OapiChatMessageRecallRequest": ("dingtalk.oapi.chat.message.recall", "POST", ("chatid", "msgid"), ()),
+    "OapiChatNickBatchupdateRequest": ("dingtalk.oapi.chat.nick.batchupdate", "POST", ("chatid", "user_nick_model"), ()),
+    "OapiChatQrcodeGetRequest": ("dingtalk.oapi.chat.qrcode.get", "POST", ("chatid", "openConversationId", "userid"), ()),
+    "OapiChatSendRequest": ("dingtalk.oapi.chat.send", "POST", ("action_card", "chatid", "file", "image", "link", "markdown", "msg", "msgtype", "oa", "text", "voice"), ()),
+    "OapiChatSubadminUpdateRequest": ("dingtalk.oapi.chat.subadmin.update", "POST", ("chatid", "role", "userids"), ()),
+    "OapiChatTagDeleteRequest": ("dingtalk.oapi.chat.tag.delete", "POST", ("chatid", "group_tag"), ()),
+    "OapiChatTagSetRequest": ("dingtalk.oapi.chat.tag.set", "POST", ("chatid", "group_tag"), ()),
+    "OapiChatThemeUpdateRequest": ("dingtalk.oapi.chat.theme.update", "POST", ("chatid", "mediaid"), ()),
+    "OapiChatTransformRequest": ("dingtalk.oapi.chat.transform", "POST", ("open_conversation_id",), ()),
+    "OapiChatUpdateRequest": ("dingtalk.oapi.chat.update", "POST", ("add_extidlist", "add_useridlist", "chatBannedType", "chatid", "del_extidlist", "del_useridlist", "icon", "isBan", "managementType", "mentionAllAuthority", "name", "owner", "ownerType", "searchable", "showHistoryType", "validationType"), ()),
+    "OapiChatUpdatebanwordsRequest": ("dingtalk.oapi.chat.updatebanwords", "POST", ("ban_words_time", "chatid", "type", "userid_list"), ()),
+    "OapiChatUpdategroupnickRequest": ("dingtalk.oapi.chat.updategroupnick", "POST", ("chatid", "group_nick", "userid"), ()),
+    "OapiChatbotInstallRequest": ("dingtalk.oapi.chatbot.install", "POST", ("chatbot_vo",), ()),
+    "OapiChatbotMessageSendRequest": ("dingtalk.oapi.chatbot.message.send", "POST", ("chatbot_id", "message", "userid"), ()),
+    "OapiChatbotPictureurlGetRequest": ("dingtalk.oapi.chatbot.pictureurl.get", "POST", ("download_code",), ()),
+    "OapiChatbotUninstallRequest": ("dingtalk.oapi.chatbot.uninstall", "POST", ("chatbot_id",), ()),
+    "OapiCheckinRecordGetRequest": ("dingtalk.oapi.checkin.record.get", "POST", ("cursor", "end_time", "size", "start_time", "userid_list"), ()),
+    "OapiCheckinRecordRequest": ("dingtalk.oapi.checkin.record", "GET", ("department_id", "end_time", "offset", "order", "size", "start_time"), ()),
+    "OapiCircleEnworkUpdateRequest": ("dingtalk.oapi.circle.enwork.update", "POST", ("open_update_dto",), ()),
+    "OapiCollectionFormCreateRequest": ("dingtalk.oapi.collection.form.create", "POST", ("request",), ()),
+    "OapiCollectionFormDeleteRequest": ("dingtalk.oapi.collection.form.delete", "POST", ("request",), ()),
+    "OapiCollectionFormGetRequest": ("dingtalk.oapi.collection.form.get", "POST", ("action_date", "form_code"), ()),
+    "OapiCollectionFormListRequest": ("dingtalk.oapi.collection.form.list", "POST", ("biz_type", "creator", "offset", "size"), ()),
+    "OapiCollectionFormStopRequest": ("dingtalk.oapi.collection.form.stop", "POST", ("request",), ()),
+    "OapiCollectionInstanceGetRequest": ("dingtalk.oapi.collection.instance.get", "POST", ("biz_type", "formInstance_id"), ()),
+    "OapiCollectionInstanceListRequest": ("dingtalk.oapi.collection.instance.list", "POST", ("action_date", "biz_type", "form_code", "offset", "size"), ()),
+    "OapiCollectionSchemaCreateRequest": ("dingtalk.oapi.collection.schema.create", "POST", ("request",), ()),
+    "OapiConferenceGetRequest": ("dingtalk.oapi.conference.get", "POST", ("conference_id",), ()),
+    "OapiConferenceParticipantAddRequest": ("dingtalk.oapi.conference.participant.add", "POST", ("conference_id", "participant_userid_list", "userid"), ()),
+    "OapiConferenceParticipantDeleteRequest": ("dingtalk.oapi.conference.participant.delete", "POST", ("conference_id", "participant_userid_list", "userid"), ()),
+    "OapiConferenceParticipantSyncRequest": ("dingtalk.oapi.conference.participant.sync", "POST", ("batch_id", "batch_index", "conference_id", "is_finished", "participant_userid_list", "userid"), ()),
+    "OapiConferencePublishRequest": ("dingtalk.oapi.conference.publish", "POST", ("conference_id", "userid"), ()),
+    "OapiConferenceUnpublishRequest": ("dingtalk.oapi.conference.unpublish", "POST", ("conference_id", "userid"), ()),
+    "OapiConnectorOpenRequest": ("dingtalk.oapi.connector.open", "POST", ("connector_id", "corp_id", "creator_userid"), ()),
+    "OapiConnectorTriggerSendV2Request": ("dingtalk.oapi.connector.trigger.send_v2", "POST", ("trigger_msg_request",), ()),
+    "OapiContactRolevisibilityDeleteRequest": ("dingtalk.oapi.contact.rolevisibility.delete", "POST", ("role_id",), ()),
+    "OapiContactRolevisibilityGetRequest": ("dingtalk.oapi.contact.rolevisibility.get", "POST", ("role_id",), ()),
+    "OapiContactRolevisibilityUpdateRequest": ("dingtalk.oapi.contact.rolevisibility.update", "POST", ("permissions", "role_id"), ()),
+    "OapiCorpConversationMemberListRequest": ("dingtalk.oapi.corp.conversation.member.list", "POST", ("chat_id", "offset", "size"), ()),
+    "OapiCrmAppCreateRequest": ("dingtalk.oapi.crm.app.create", "POST", ("request",), ()),
+    "OapiCrmAppGetRequest": ("dingtalk.oapi.crm.app.get", "POST", ("biz_key",), ()),
+    "OapiCrmAppUpdateRequest": ("dingtalk.oapi.crm.app.update", "POST", ("request",), ()),
+    "OapiCrmAuthGroupListRequest": ("dingtalk.oapi.crm.auth.group.list", "POST", (), ()),
+    "OapiCrmAuthGroupMemberListRequest": ("dingtalk.oapi.crm.auth.group.member.list", "POST", ("role_id",), ()),
+    "OapiCrmAuthGroupPermissionListRequest": ("dingtalk.oapi.crm.auth.group.permission.list", "POST", ("role_id",), ()),
+    "OapiCrmContactCreateRequest": ("dingtalk.oapi.crm.contact.create", "POST", ("contact_name", "contact_phone", "contact_position_list", "creator_userid", "customer_instance_id", "provider_corpid"), ()),
+    "OapiCrmGroupCreateRequest": ("dingtalk.oapi.crm.group.create", "POST", ("colleague_userid_list", "contact_id_list", "customer_corpid", "customer_id", "group_owner"), ()),
+    "OapiCrmMenuGetRequest": ("dingtalk.oapi.crm.menu.get", "POST", ("client_type",), ()),
+    "OapiCrmObjectdataContactCreateRequest": ("dingtalk.oapi.crm.objectdata.contact.create", "POST", ("instance", "provider_corpid"), ()),
+    "OapiCrmObjectdataContactDeleteRequest": ("dingtalk.oapi.crm.objectdata.contact.delete", "POST", ("data_id", "operator_userid"), ()),
+    "OapiCrmObjectdataContactListRequest": ("dingtalk.oapi.crm.objectdata.contact.list", "POST", ("current_operator_userid", "data_id_list", "provider_corpid"), ()),
+    "OapiCrmObjectdataContactQueryRequest": ("dingtalk.oapi.crm.objectdata.contact.query", "POST", ("current_operator_userid", "cursor", "page_size", "provider_corpid", "query_dsl"), ()),
+    "OapiCrmObjectdataContactUpdateRequest": ("dingtalk.oapi.crm.objectdata.contact.update", "POST", ("instance",), ()),
+    "OapiCrmObjectdataCustomerCreateRequest": ("dingtalk.oapi.crm.objectdata.customer.create", "POST", ("instance",), ()),
+    "OapiCrmObjectdataCustomerDeleteRequest": ("dingtalk.oapi.crm.objectdata.customer.delete", "POST", ("data_id", "operator_userid"), ()),
+    "OapiCrmObjectdataCustomerListRequest": ("dingtalk.oapi.crm.objectdata.customer.list", "POST", ("current_operator_userid", "data_id_list"), ()),
+    "OapiCrmObjectdataCustomerQueryRequest": ("dingtalk.oapi.crm.objectdata.customer.query", "POST", ("current_operator_userid", "cursor", "page_size", "query_dsl"), ()),
+    "OapiCrmObjectdataCustomerUpdateRequest": ("dingtalk.oapi.crm.objectdata.customer.update", "POST", ("instance",), ()),
+    "OapiCrmObjectdataCustomobjectCreateRequest": ("dingtalk.oapi.crm.objectdata.customobject.create", "POST", ("instance",), ()),
+    "OapiCrmObjectdataCustomobjectUpdateRequest": ("dingtalk.oapi.crm.objectdata.customobject.update", "POST", ("instance",), ()),
+    "OapiCrmObjectdataFollowrecordListRequest": ("dingtalk.oapi.crm.objectdata.followrecord.list", "POST", ("current_operator_userid", "data_id_list"), ()),
+    "OapiCrmObjectdataFollowrecordQueryRequest": ("dingtalk.oapi.crm.objectdata.followrecord.query", "POST", ("current_operator_userid", "cursor", "page_size", "query_dsl"), ()),
+    "OapiCrmObjectdataListRequest": ("dingtalk.oapi.crm.objectdata.list", "POST", ("current_operator_userid", "data_id_list", "name"), ()),
+    "OapiCrmObjectdataQueryRequest": ("dingtalk.oapi.crm.objectdata.query", "POST", ("current_operator_userid", "cursor", "name", "page_size", "query_dsl"), ()),
+    "OapiCrmObjectmetaContactDescribeRequest": ("dingtalk.oapi.crm.objectmeta.contact.describe", "POST", (), ()),
+    "OapiCrmObjectmetaCustomerDescribeRequest": ("dingtalk.oapi.crm.objectmeta.customer.describe", "POST", (), ()),
+    "OapiCrmObjectmetaDescribeRequest": ("dingtalk.oapi.crm.objectmeta.describe", "POST", ("name",), ()),
+    "OapiCrmObjectmetaFollowrecordDescribeRequest": ("dingtalk.oapi.crm.objectmeta.followrecord.describe", "POST", (), ()),
+    "OapiCrmOrgVirtualcorpidGetRequest": ("dingtalk.oapi.crm.org.virtualcorpid.get", "POST", (), ()),
+    "OapiCspaceAddRequest": ("dingtalk.oapi.cspace.add", "GET", ("agent_id", "code", "folder_id", "media_id", "name", "overwrite", "space_id"), ()),
+    "OapiCspaceAddToSingleChatRequest": ("dingtalk.oapi.cspace.add_to_single_chat", "POST", ("agent_id", "file_name", "media_id", "userid"), ()),
+    "OapiCspaceAuditlogListRequest": ("dingtalk.oapi.cspace.auditlog.list", "POST", ("end_date", "load_more_biz_id", "load_more_gmt_create", "page_size", "start_date"), ()),
+    "OapiCspaceAuthCancelRequest": ("dingtalk.oapi.cspace.auth.cancel", "POST", ("agent_id", "isv_code"), ()),
+    "OapiCspaceAuthGenerateRequest": ("dingtalk.oapi.cspace.auth.generate", "POST", ("agent_id", "app_id", "duration", "file_ids", "path", "type"), ()),
+    "OapiCspaceAuthUpdateRequest": ("dingtalk.oapi.cspace.auth.update", "POST", ("agent_id", "duration", "isv_code"), ()),
+    "OapiCspaceFilePresignedurlGetRequest": ("dingtalk.oapi.cspace.file.presignedurl.get", "POST", ("dentryid", "expire_seconds", "inner_invoke", "spaceid"), ()),
+    "OapiCspaceGetCustomSpaceRequest": ("dingtalk.oapi.cspace.get_custom_space", "GET", ("agent_id", "domain"), ()),
+    "OapiCspaceGrantCustomSpaceRequest": ("dingtalk.oapi.cspace.grant_custom_space", "GET", ("agent_id", "domain", "duration", "fileids", "path", "type", "userid"), ()),
+    "OapiCustomerserviceActionQueryRequest": ("dingtalk.oapi.customerservice.action.query", "POST", ("ticket_action_page_query",), ()),
+    "OapiCustomerserviceActivityExecuteRequest": ("dingtalk.oapi.customerservice.activity.execute", "POST", ("ticket_activity",), ()),
+    "OapiCustomerserviceEventChangeRequest": ("dingtalk.oapi.customerservice.event.change", "POST", ("event_dto",), ()),
+    "OapiCustomerserviceMemberGetRequest": ("dingtalk.oapi.customerservice.member.get", "POST", ("ding_corp_id", "open_instance_id", "production_type", "third_tenant_id", "user_id", "user_source_id"), ()),
+    "OapiCustomerserviceMessageSendRequest": ("dingtalk.oapi.customerservice.message.send", "POST", ("message",), ()),
+    "OapiCustomerserviceSessionCloseRequest": ("dingtalk.oapi.customerservice.session.close", "POST", ("close_session",), ()),
+    "OapiCustomerserviceSessionCreateRequest": ("dingtalk.oapi.customerservice.session.create", "POST", ("create_session",), ()),
+    "OapiCustomerserviceStatusGetRequest": ("dingtalk.oapi.customerservice.status.get", "POST", (), ()),
+    "OapiCustomerserviceStatusUpdateRequest": ("dingtalk.oapi.customerservice.status.update", "POST", ("status_change",), ()),
+    "OapiCustomerserviceTicketCreateRequest": ("dingtalk.oapi.customerservice.ticket.create", "POST", ("ticket_create",), ()),
+    "OapiCustomerserviceTicketQueryRequest": ("dingtalk.oapi.customerservice.ticket.query", "POST", ("ticket_page_query_dto",), ()),
+    "OapiCustomizeConfigSetRequest": ("dingtalk.oapi.customize.config.set", "POST", ("active_id", "active_type", "biz", "rule_name", "type"), ()),
+    "OapiCustomizeConversationUpdateRequest": ("dingtalk.oapi.customize.conversation.update", "POST", ("chat_id", "extension_key", "extension_value", "userid"), ()),
+    "OapiDdpaasObjectdataListRequest": ("dingtalk.oapi.ddpaas.objectdata.list", "POST", ("app_uuid", "current_operator_userid", "data_id_list", "form_code"), ()),
+    "OapiDdpaasObjectdataQueryRequest": ("dingtalk.oapi.ddpaas.objectdata.query", "POST", ("app_uuid", "current_operator_userid", "cursor", "form_code", "query_dsl", "size"), ()),
+    "OapiDdpaasObjectmetaDescribeRequest": ("dingtalk.oapi.ddpaas.objectmeta.describe", "POST", ("app_uuid", "form_code"), ()),
+    "OapiDepartmentCreateRequest": ("dingtalk.oapi.department.create", "POST", ("createDeptGroup", "deptHiding", "deptPerimits", "deptPermits", "id", "name", "order", "outerDept", "outerDeptOnlySelf", "outerPermitDepts", "outerPermitUsers", "parentBalanceFirst", "parentid", "shareBalance", "sourceIdentifier", "userPerimits", "userPermits"), ()),
+    "OapiDepartmentDeleteRequest": ("dingtalk.oapi.department.delete", "GET", ("id",), ()),
+    "OapiDepartmentGetRequest": ("dingtalk.oapi.department.get", "GET", ("id", "lang"), ()),
+    "OapiDepartmentListIdsRequest": ("dingtalk.oapi.department.list_ids", "GET", ("id",), ()),
+    "OapiDepartmentListParentDeptsByDeptRequest": ("dingtalk.oapi.department.list_parent_depts_by_dept", "GET", ("id",), ()),
+    "OapiDepartmentListParentDeptsRequest": ("dingtalk.oapi.department.list_parent_depts", "GET", ("userId",), ()),
+    "OapiDepartmentListRequest": ("dingtalk.oapi.department.list", "GET", ("fetch_child", "id", "lang"), ()),
+    "OapiDepartmentUpdateRequest": ("dingtalk.oapi.department.update", "POST", ("autoAddUser", "createDeptGroup", "deptHiding", "deptManagerUseridList", "deptPerimits", "deptPermits", "groupContainHiddenDept", "groupContainOuterDept", "groupContainSubDept", "id", "lang", "name", "order", "orgDeptOwner", "outerDept", "outerDeptOnlySelf", "outerPermitDepts", "outerPermitUsers", "parentid", "sourceIdentifier", "userPerimits", "userPermits"), ()),
+    "OapiDingCreateRequest": ("dingtalk.oapi.ding.create", "POST", ("attachment", "creator_userid", "receiver_userids", "remind_time", "remind_type", "text_content"), ()),
+    "OapiDingSendRequest": ("dingtalk.oapi.ding.send", "POST", ("open_ding_send_vo",), ()),
+    "OapiDingTaskCreateRequest": ("dingtalk.oapi.ding.task.create", "POST", ("task_send_v_o",), ()),
+    "OapiDingTaskStatusUpdateRequest": ("dingtalk.oapi.ding.task.status.update", "POST", ("operator_userid", "task_id", "task_status"), ()),
+    "OapiDingmiCommonLoginAccesstokenRequest": ("dingtalk.oapi.dingmi.common.login.accesstoken", "POST", ("foreign_id", "nick", "source"), ()),
+    "OapiDingmiCommonO2oPushRequest": ("dingtalk.oapi.dingmi.common.o2o.push", "POST", ("chatbot_id", "msg_key", "msg_param", "staff_id"), ()),
+    "OapiDingmiCommonRobotAskRequest": ("dingtalk.oapi.dingmi.common.robot.ask", "POST", ("question", "robot_app_key", "session_uuid"), ()),
+    "OapiDingmiGroupGetRequest": ("dingtalk.oapi.dingmi.group.get", "POST", ("conversation_id", "date"), ()),
+    "OapiDingmiO2oSendRequest": ("dingtalk.oapi.dingmi.o2o.send", "POST", ("msg_key", "msg_param", "userid"), ()),
+    "OapiDingmiRobotGetRequest": ("dingtalk.oapi.dingmi.robot.get", "POST", ("type",), ()),
+    "OapiDingmiRobotPushRequest": ("dingtalk.oapi.dingmi.robot.push", "POST", ("conversation_id", "msg_key", "msg_param"), ()),
+    "OapiDingmiRobotUpdateRequest": ("dingtalk.oapi.dingmi.robot.update", "POST", ("type", "update_bot_model"), ()),
+    "OapiDingpayBillBatchqueryRequest": ("dingtalk.oapi.dingpay.bill.batchquery", "POST", ("apply_pay_operator_userid", "bill_category", "biz_code", "create_operator_userid", "extension", "gmt_apply_pay_begin_time", "gmt_apply_pay_end_time", "gmt_create_begin_time", "gmt_create_end_time", "gmt_pay_begin_time", "gmt_pay_end_time", "max_amount", "min_amount", "next_key", "page_num", "page_size", "pay_channel_list", "pay_channel_payer_real_uid", "payee_id", "payee_user_type", "payer_id", "payer_user_type", "receiptor_type_list", "size", "status_list", "termination_reason", "title"), ()),
+    "OapiDingpayBillBatchquerycountRequest": ("dingtalk.oapi.dingpay.bill.batchquerycount", "POST", ("apply_pay_operator_userid", "bill_category", "biz_code", "create_operator_userid", "extension", "gmt_apply_pay_begin_time", "gmt_apply_pay_end_time", "gmt_create_begin_time", "gmt_create_end_time", "gmt_pay_begin_time", "gmt_pay_end_time", "max_amount", "min_amount", "pay_channel_list", "pay_channel_payer_real_uid", "payee_id", "payee_user_type", "payer_id", "payer_user_type", "receiptor_type_list", "status_list", "termination_reason", "title"), ()),
+    "OapiDingpayBillQuerytagRequest": ("dingtalk.oapi.dingpay.bill.querytag", "POST", ("biz_code", "day_range", "source_app_id"), ()),
+    "OapiDingpayOrderApplypayRequest": ("dingtalk.oapi.dingpay.order.applypay", "POST", ("apply_pay_operator_userid", "extension", "order_nos", "pay_channel", "pay_channel_payer_real_uid"), ()),
+    "OapiDingpayOrderMarkotherpayRequest": ("dingtalk.oapi.dingpay.order.markotherpay", "POST", ("apply_pay_operator_userid", "extension", "order_nos", "pay_channel_payer_real_uid"), ()),
+    "OapiDingpayOrderSyncstatusRequest": ("dingtalk.oapi.dingpay.order.syncstatus", "POST", ("order_nos",), ()),
+    "OapiDingpayOrderTerminateRequest": ("dingtalk.oapi.dingpay.order.terminate", "POST", ("extension", "operator", "order_nos", "reason"), ()),
+    "OapiDingpayRedenvelopeGetRequest": ("dingtalk.oapi.dingpay.redenvelope.get", "POST", ("corp_biz_no",), ()),
+    "OapiDingpayRedenvelopeSendRequest": ("dingtalk.oapi.dingpay.redenvelope.send", "POST", ("chat_id", "corp_biz_no", "ext_params", "greetings", "open_conversation_id", "pay_method", "pay_sign", "receiver_id", "sender_id", "theme_id", "total_amount", "type"), ()),
+    "OapiDingpayVirtualaccountQueryRequest": ("dingtalk.oapi.dingpay.virtualaccount.query", "POST", ("extension",), ()),
+    "OapiDingtalkImpaasMessageCrossdomainReadRequest": ("dingtalk.oapi.dingtalk.impaas.message.crossdomain.read", "POST", ("message_read_model",), ()),
+    "OapiDingtalkImpaasMessageCrossdomainSendRequest": ("dingtalk.oapi.dingtalk.impaas.message.crossdomain.send", "POST", ("crossdomain_message_send_model",), ()),
+    "OapiDingtaxGroupdaudataGetRequest": ("dingtalk.oapi.dingtax.groupdaudata.get", "POST", ("open_conversation_id_list", "stat_date"), ()),
+    "OapiDingtaxUserPushRequest": ("dingtalk.oapi.dingtax.user.push", "POST", ("source_region", "user_info_list"), ()),
+    "OapiEduAlumniGetRequest": ("dingtalk.oapi.edu.alumni.get", "POST", (), ()),
+    "OapiEduCampusGetRequest": ("dingtalk.oapi.edu.campus.get", "POST", ("campus_id",), ()),
+    "OapiEduCampusListRequest": ("dingtalk.oapi.edu.campus.list", "POST", (), ()),
+    "OapiEduCardCreateRequest": ("dingtalk.oapi.edu.card.create", "POST", ("opencardcreateparam",), ()),
+    "OapiEduCardTaskSubmitRequest": ("dingtalk.oapi.edu.card.task.submit", "POST", ("card_type", "content", "metering_number", "user_card_task_id", "userid"), ()),
+    "OapiEduCardTaskTodayListRequest": ("dingtalk.oapi.edu.card.task.today.list", "POST", ("card_type", "userid"), ()),
+    "OapiEduCardUserPostUpdateRequest": ("dingtalk.oapi.edu.card.user.post.update", "POST", ("update_post_param",), ()),
+    "OapiEduCardUserTaskSubmitRequest": ("dingtalk.oapi.edu.card.user.task.submit", "POST", ("taskparam",), ()),
+    "OapiEduCertGetRequest": ("dingtalk.oapi.edu.cert.get", "POST", ("userid",), ()),
+    "OapiEduCirclePostListRequest": ("dingtalk.oapi.edu.circle.post.list", "POST", ("open_feed_query_param",), ()),
+    "OapiEduCircleTopiclistRequest": ("dingtalk.oapi.edu.circle.topiclist", "POST", ("biz_type", "class_id", "userid"), ()),
+    "OapiEduClassCreateRequest": ("dingtalk.oapi.edu.class.create", "POST", ("open_class", "operator", "super_id"), ()),
+    "OapiEduClassGetRequest": ("dingtalk.oapi.edu.class.get", "POST", ("class_id",), ()),
+    "OapiEduClassListRequest": ("dingtalk.oapi.edu.class.list", "POST", ("grade_id", "page_no", "page_size"), ()),
+    "OapiEduClassListbyteacherRequest": ("dingtalk.oapi.edu.class.listbyteacher", "POST", ("filter_param", "queryFromAllOrgs", "ret_ext_fields", "userid"), ()),
+    "OapiEduClassStudentBatchgetRequest": ("dingtalk.oapi.edu.class.student.batchget", "POST", ("request_param",), ()),
+    "OapiEduClassStudentGetRequest": ("dingtalk.oapi.edu.class.student.get", "POST", ("class_id", "student_param", "userid"), ()),
+    "OapiEduClassStudentListRequest": ("dingtalk.oapi.edu.class.student.list", "POST", ("class_id", "corp_id", "student_param", "userid"), ()),
+    "OapiEduClassStudentidGetRequest": ("dingtalk.oapi.edu.class.studentid.get", "POST", ("app_id", "class_id", "userid"), ()),
+    "OapiEduClassStudentinfoGetRequest": ("dingtalk.oapi.edu.class.studentinfo.get", "POST", ("app_id", "class_id", "userid"), ()),
+    "OapiEduClassconversationAsyncsendRequest": ("dingtalk.oapi.edu.classconversation.asyncsend", "POST", ("request",), ()),
+    "OapiEduCourseBatchcreateRequest": ("dingtalk.oapi.edu.course.batchcreate", "POST", ("course_infos", "op_userid"), ()),
+    "OapiEduCourseCancelRequest": ("dingtalk.oapi.edu.course.cancel", "POST", ("course_code", "op_userid"), ()),
+    "OapiEduCourseCreateRequest": ("dingtalk.oapi.edu.course.create", "POST", ("biz_key", "end_time", "introduce", "name", "op_userid", "option", "start_time", "teacher_corpid", "teacher_userid"), ()),
+    "OapiEduCourseDeleteRequest": ("dingtalk.oapi.edu.course.delete", "POST", ("course_code", "op_userid"), ()),
+    "OapiEduCourseDetaildataListRequest": ("dingtalk.oapi.edu.course.detaildata.list", "POST", ("category_code", "course_code", "cursor", "factor_codes", "op_userid", "size", "user_cropid", "user_ids"), ()),
+    "OapiEduCourseEndRequest": ("dingtalk.oapi.edu.course.end", "POST", ("course_code", "op_user_id"), ()),
+    "OapiEduCourseGetRequest": ("dingtalk.oapi.edu.course.get", "POST", ("course_code", "op_userid"), ()),
+    "OapiEduCourseJoinRequest": ("dingtalk.oapi.edu.course.join", "POST", ("course_code", "join_role", "op_user_id"), ()),
+    "OapiEduCourseListRequest": ("dingtalk.oapi.edu.course.list", "POST", ("course_codes", "cursor", "end_time", "name", "op_userid", "option", "participant_condition", "scene", "size", "start_time", "statuses", "suite_keys", "teacher_conditions"), ()),
+    "OapiEduCourseParticipantAddRequest": ("dingtalk.oapi.edu.course.participant.add", "POST", ("course_code", "op_userid", "option", "participant_corpid", "participant_id", "participant_type", "role"), ()),
+    "OapiEduCourseParticipantBatchaddRequest": ("dingtalk.oapi.edu.course.participant.batchadd", "POST", ("course_codes", "course_participants", "op_userid", "participant_corpid"), ()),
+    "OapiEduCourseParticipantListRequest": ("dingtalk.oapi.edu.course.participant.list", "POST", ("course_code", "cursor", "op_userid", "size"), ()),
+    "OapiEduCourseParticipantRemoveRequest": ("dingtalk.oapi.edu.course.participant.remove", "POST", ("course_code", "op_userid", "participant_corpid", "participant_id", "participant_type", "role"), ()),
+    "OapiEduCourseReplayRequest": ("dingtalk.oapi.edu.course.replay", "POST", ("course_code", "op_user_id", "target_id"), ()),
+    "OapiEduCourseStartRequest": ("dingtalk.oapi.edu.course.start", "POST", ("course_code", "op_user_id", "start_option"), ()),
+    "OapiEduCourseSummadataListRequest": ("dingtalk.oapi.edu.course.summadata.list", "POST", ("category_codes", "course_code", "cursor", "op_userid", "size"), ()),
+    "OapiEduCourseUpdateRequest": ("dingtalk.oapi.edu.course.update", "POST", ("course_code", "end_time", "introduce", "name", "op_userid", "start_time", "teacher_corpid", "teacher_userid"), ()),
+    "OapiEduDeptGetRequest": ("dingtalk.oapi.edu.dept.get", "POST", ("dept_id",), ()),
+    "OapiEduDeptListRequest": ("dingtalk.oapi.edu.dept.list", "POST", ("page_no", "page_size", "super_id"), ()),
+    "OapiEduFaceGetRequest": ("dingtalk.oapi.edu.face.get", "POST", ("class_id", "userid"), ()),
+    "OapiEduFaceSearchRequest": ("dingtalk.oapi.edu.face.search", "POST", ("class_id", "height", "synchronous", "url", "userid", "width"), ()),
+    "OapiEduFamilyChildGetRequest": ("dingtalk.oapi.edu.family.child.get", "POST", ("child_userid", "op_userid"), ()),
+    "OapiEduFeedSyncRequest": ("dingtalk.oapi.edu.feed.sync", "POST", ("album_id", "dept_id", "fee_type", "feed_medias", "future", "media_uid", "op_userId", "send_time", "send_uid"), ()),
+    "OapiEduGradeCreateRequest": ("dingtalk.oapi.edu.grade.create", "POST", ("open_grade", "operator", "super_id"), ()),
+    "OapiEduGradeGetRequest": ("dingtalk.oapi.edu.grade.get", "POST", ("grade_id",), ()),
+    "OapiEduGradeListRequest": ("dingtalk.oapi.edu.grade.list", "POST", ("period_id",), ()),
+    "OapiEduGradeQueryRequest": ("dingtalk.oapi.edu.grade.query", "POST", ("campus_id", "operator", "period_id"), ()),
+    "OapiEduGroupMsgSendRequest": ("dingtalk.oapi.edu.group.msg.send", "POST", ("agent_id", "biz_id", "class_id", "image_url", "receive_userid_list", "replace", "template_code", "userid"), ()),
+    "OapiEduGuardianCreateRequest": ("dingtalk.oapi.edu.guardian.create", "POST", ("biz_id", "class_id", "mobile", "operator", "relation", "stu_id"), ()),
+    "OapiEduGuardianGetRequest": ("dingtalk.oapi.edu.guardian.get", "POST", ("class_id", "guardian_userid"), ()),
+    "OapiEduGuardianListRequest": ("dingtalk.oapi.edu.guardian.list", "POST", ("class_id", "page_no", "page_size"), ()),
+    "OapiEduHomeworkCommentTipsCreateRequest": ("dingtalk.oapi.edu.homework.comment.tips.create", "POST", ("attributes", "audio", "biz_code", "content", "media", "photo", "sort_order", "userid"), ()),
+    "OapiEduHomeworkCommentTipsDeleteRequest": ("dingtalk.oapi.edu.homework.comment.tips.delete", "POST", ("biz_code", "tip_ids", "userid"), ()),
+    "OapiEduHomeworkCommentTipsQueryRequest": ("dingtalk.oapi.edu.homework.comment.tips.query", "POST", ("biz_code", "userid"), ()),
+    "OapiEduHomeworkCreateRequest": ("dingtalk.oapi.edu.homework.create", "POST", ("attributes", "biz_code", "course_name", "hw_content", "hw_deadline", "hw_deadline_open", "hw_media", "hw_photo", "hw_title", "hw_type", "hw_video", "identifier", "scheduled_release", "scheduled_time", "select_class", "select_stu", "status", "target_role", "teacher_name", "teacher_userid"), ()),
+    "OapiEduHomeworkGroupRoleGetRequest": ("dingtalk.oapi.edu.homework.group.role.get", "POST", ("biz_code", "userid"), ()),
+    "OapiEduHomeworkQueryRequest": ("dingtalk.oapi.edu.homework.query", "POST", ("biz_code", "hw_id"), ()),
+    "OapiEduHomeworkStudentCommentCreateRequest": ("dingtalk.oapi.edu.homework.student.comment.create", "POST", ("attributes", "biz_code", "class_id", "comment", "hw_id", "media", "photo", "student_id", "student_name", "teacher_userid", "video"), ()),
+    "OapiEduHomeworkStudentCommentDeleteRequest": ("dingtalk.oapi.edu.homework.student.comment.delete", "POST", ("biz_code", "class_id", "comment_id", "hw_id", "student_id", "teacher_userid"), ()),
+    "OapiEduHomeworkStudentCommentListRequest": ("dingtalk.oapi.edu.homework.student.comment.list", "POST", ("biz_code", "class_id", "hw_id", "student_id", "teacher_userid"), ()),
+    "OapiEduHomeworkStudentCommentUpdateRequest": ("dingtalk.oapi.edu.homework.student.comment.update", "POST", ("attributes", "biz_code", "class_id", "comment", "comment_id", "hw_id", "media", "photo", "student_id", "student_name", "teacher_userid", "video"), ()),
+    "OapiEduHomeworkStudentMarkTagRequest": ("dingtalk.oapi.edu.homework.student.mark.tag", "POST", ("biz_code", "class_id", "hw_id", "student_id", "student_name", "tag", "teacher_id", "text"), ()),
+    "OapiEduHomeworkStudentReportSubmitRequest": ("dingtalk.oapi.edu.homework.student.report.submit", "POST", ("attributes", "biz_code", "class_id", "hw_id", "hw_report", "hw_result", "student_id", "student_name"), ()),
+    "OapiEduHomeworkStudentSubmitRequest": ("dingtalk.oapi.edu.homework.student.submit", "POST", ("attributes", "biz_code", "class_id", "content", "hw_id", "media", "photo", "student_id", "student_name", "submitor_id", "title", "video"), ()),
+    "OapiEduHomeworkStudentTopicRecordRequest": ("dingtalk.oapi.edu.homework.student.topic.record", "POST", ("student_answer_details",), ()),
+    "OapiEduHomeworkTopicCreateRequest": ("dingtalk.oapi.edu.homework.topic.create", "POST", ("topic_items",), ()),
+    "OapiEduHomeworkUpdateRequest": ("dingtalk.oapi.edu.homework.update", "POST", ("biz_code", "hw_id", "identifier", "status", "teacher_userid"), ()),
+    "OapiEduHomeworkUserCourseQueryRequest": ("dingtalk.oapi.edu.homework.user.course.query", "POST", ("biz_code", "userid"), ()),
+    "OapiEduHomeworkUserRoleQueryRequest": ("dingtalk.oapi.edu.homework.user.role.query", "POST", ("biz_code", "class_id", "userid"), ()),
+    "OapiEduMainDataGetRequest": ("dingtalk.oapi.edu.main.data.get", "POST", ("stat_date",), ()),
+    "OapiEduPeriodCreateRequest": ("dingtalk.oapi.edu.period.create", "POST", ("open_period", "operator", "super_id"), ()),
+    "OapiEduPeriodGetRequest": ("dingtalk.oapi.edu.period.get", "POST", ("period_id",), ()),
+    "OapiEduPeriodListRequest": ("dingtalk.oapi.edu.period.list", "POST", ("campus_id",), ()),
+    "OapiEduPeriodMetadataListRequest": ("dingtalk.oapi.edu.period.metadata.list", "POST", ("area_code", "cursor", "data_order_type", "level", "operator_userid", "parent_id", "size", "sort_type"), ()),
+    "OapiEduRecommendCreateRequest": ("dingtalk.oapi.edu.recommend.create", "POST", ("class_id", "labelList", "out_content_id", "period_code", "return_url", "subject_code", "summary", "textbook_code", "thumbnail", "title", "totalTime", "type", "userid"), ()),
+    "OapiEduRecommendReturnRequest": ("dingtalk.oapi.edu.recommend.return", "POST", ("class_id", "labelList", "learnTime", "out_content_id", "out_tx_id", "result_type", "result_value", "return_url", "subject_code", "summary", "textbook_code", "thumbnail", "title", "totalTime", "type", "userid"), ()),
+    "OapiEduRolesGetRequest": ("dingtalk.oapi.edu.roles.get", "POST", ("userid",), ()),
+    "OapiEduSchoolInitRequest": ("dingtalk.oapi.edu.school.init", "POST", ("campus", "operator"), ()),
+    "OapiEduStudentAttendanceStatisticsGetRequest": ("dingtalk.oapi.edu.student.attendance.statistics.get", "POST", ("date", "op_userid", "school_corpid"), ()),
+    "OapiEduStudentCreateRequest": ("dingtalk.oapi.edu.student.create", "POST", ("biz_id", "class_id", "name", "operator", "student_no"), ()),
+    "OapiEduStudentGetRequest": ("dingtalk.oapi.edu.student.get", "POST", ("class_id", "student_userid"), ()),
+    "OapiEduStudentListRequest": ("dingtalk.oapi.edu.student.list", "POST", ("class_id", "page_no", "page_size"), ()),
+    "OapiEduSubDataGetRequest": ("dingtalk.oapi.edu.sub.data.get", "POST", ("orders", "page_num", "page_size", "stat_date"), ()),
+    "OapiEduSubjectCreateRequest": ("dingtalk.oapi.edu.subject.create", "POST", ("operator_userid", "period_code", "subject_code", "subject_name"), ()),
+    "OapiEduSubjectDeleteRequest": ("dingtalk.oapi.edu.subject.delete", "POST", ("operator_userid", "period_code", "subject_code", "subject_name"), ()),
+    "OapiEduSubjectGetRequest": ("dingtalk.oapi.edu.subject.get", "POST", ("operator_userid", "period_code", "subject_code", "subject_name"), ()),
+    "OapiEduSubjectListRequest": ("dingtalk.oapi.edu.subject.list", "POST", ("cursor", "data_order_type", "operator_userid", "period_code", "size", "sort_type", "subject_code_list"), ()),
+    "OapiEduSubjectMetadataListRequest": ("dingtalk.oapi.edu.subject.metadata.list", "POST", ("area_code", "cursor", "data_order_type", "level", "operator_userid", "parent_id", "period_code", "size", "sort_type"), ()),
+    "OapiEduSubjectUpdateRequest": ("dingtalk.oapi.edu.subject.update", "POST", ("operator_userid", "period_code", "subject_code", "subject_name"), ()),
+    "OapiEduTeacherCreateRequest": ("dingtalk.oapi.edu.teacher.create", "POST", ("adviser", "biz_id", "class_id", "operator", "userid"), ()),
+    "OapiEduTeacherGetRequest": ("dingtalk.oapi.edu.teacher.get", "POST", ("class_id", "teacher_userid"), ()),
+    "OapiEduTeacherListRequest": ("dingtalk.oapi.edu.teacher.list", "POST", ("class_id",), ()),
+    "OapiEduTextbookMetadataListRequest": ("dingtalk.oapi.edu.textbook.metadata.list", "POST", ("cursor", "data_order_type", "level", "op_user_id", "parent_id", "size", "sort_type", "subject_code"), ()),
+    "OapiEduTypeDataGetRequest": ("dingtalk.oapi.edu.type.data.get", "POST", ("orders", "page_num", "page_size", "stat_date"), ()),
+    "OapiEduUserAuthGetRequest": ("dingtalk.oapi.edu.user.auth.get", "POST", ("language", "userid"), ()),
+    "OapiEduUserBindSyncRequest": ("dingtalk.oapi.edu.user.bind.sync", "POST", ("user_id",), ()),
+    "OapiEduUserClassrolesGetRequest": ("dingtalk.oapi.edu.user.classroles.get", "POST", ("request",), ()),
+    "OapiEduUserGetRequest": ("dingtalk.oapi.edu.user.get", "POST", ("class_id", "role", "userid"), ()),
+    "OapiEduUserListRequest": ("dingtalk.oapi.edu.user.list", "POST", ("class_id", "page_no", "page_size", "role"), ()),
+    "OapiEduUserRelationGetRequest": ("dingtalk.oapi.edu.user.relation.get", "POST", ("class_id", "from_userid"), ()),
+    "OapiEduUserRelationListRequest": ("dingtalk.oapi.edu.user.relation.list", "POST", ("class_id", "page_no", "page_size"), ()),
+    "OapiEduUseridGetRequest": ("dingtalk.oapi.edu.userid.get", "POST", ("mobiles", "operator"), ()),
+    "OapiEnterpriseFamilydrListRequest": ("dingtalk.oapi.enterprise.familydr.list", "POST", ("corp_id", "order_by", "page_size", "page_start", "return_fields", "stat_date"), ()),
+    "OapiEnterpriseMainorgTotaldataStatRequest": ("dingtalk.oapi.enterprise.mainorg.totaldata.stat", "POST", ("corp_id", "order_by", "page_size", "page_start", "return_fields", "stat_date"), ()),
+    "OapiEnterpriseMicroappUsedataStatRequest": ("dingtalk.oapi.enterprise.microapp.usedata.stat", "POST", ("corp_id", "order_by", "page_size", "page_start", "return_fields", "stat_date"), ()),
+    "OapiEnterpriseSubareaTotaldataStatRequest": ("dingtalk.oapi.enterprise.subarea.totaldata.stat", "POST", ("corp_id", "order_by", "page_size", "page_start", "return_fields", "stat_date"), ()),
+    "OapiEnterpriseSuborgTotaldataStatRequest": ("dingtalk.oapi.enterprise.suborg.totaldata.stat", "POST", ("corp_id", "order_by", "page_size", "page_start", "return_fields", "stat_date"), ()),
+    "OapiExtcontactCreateRequest": ("dingtalk.oapi.extcontact.create", "POST", ("contact",), ()),
+    "OapiExtcontactDeleteRequest": ("dingtalk.oapi.extcontact.delete", "POST", ("user_id",), ()),
+    "OapiExtcontactGetRequest": ("dingtalk.oapi.extcontact.get", "POST", ("user_id",), ()),
+    "OapiExtcontactListRequest": ("dingtalk.oapi.extcontact.list", "POST", ("offset", "size"), ()),
+    "OapiExtcontactListlabelgroupsRequest": ("dingtalk.oapi.extcontact.listlabelgroups", "POST", ("offset", "size"), ()),
+    "OapiExtcontactUpdateRequest": ("dingtalk.oapi.extcontact.update", "POST", ("contact",), ()),
+    "OapiFaceauthGetRequest": ("dingtalk.oapi.faceauth.get", "POST", ("app_biz_id", "tmp_auth_code"), ()),
+    "OapiFileUploadChunkRequest": ("dingtalk.oapi.file.upload.chunk", "POST", ("agent_id", "chunk_sequence", "file", "upload_id"), ("file",)),
+    "OapiFileUploadSingleRequest": ("dingtalk.oapi.file.upload.single", "POST", ("agent_id", "file", "file_size"), ("file",)),
+    "OapiFileUploadTransactionRequest": ("dingtalk.oapi.file.upload.transaction", "GET", ("agent_id", "chunk_numbers", "file_size", "upload_id"), ()),
+    "OapiFinanceAlipayAccountGetbyuidRequest": ("dingtalk.oapi.finance.alipay.account.getbyuid", "POST", (), ()),
+    "OapiFinanceFaceVerificationInitRequest": ("dingtalk.oapi.finance.faceVerification.init", "POST", ("bio_info", "cert_name", "id_card_no", "scene", "user_mobile"), ()),
+    "OapiFinanceFaceVerificationQueryRequest": ("dingtalk.oapi.finance.faceVerification.query", "POST", ("business_id", "id_card_no", "request_code", "user_mobile"), ()),
+    "OapiFinanceFaceVerificationUpdateRequest": ("dingtalk.oapi.finance.faceVerification.update", "POST", ("business_id", "fail_reason", "id_card_no", "request_code", "result_code", "user_mobile", "verify_result"), ()),
+    "OapiFinanceIdCardOcrRequest": ("dingtalk.oapi.finance.IdCard.ocr", "POST", ("back_picture_url", "front_picture_url", "id_card_no", "request_id", "user_mobile"), ()),
+    "OapiFinanceLoanBankcardAddRequest": ("dingtalk.oapi.finance.loan.bankcard.add", "POST", ("bank_code", "bank_name", "bankcard_mobile", "bankcard_no", "id_card_no", "user_mobile"), ()),
+    "OapiFinanceLoanBankcardDeleteRequest": ("dingtalk.oapi.finance.loan.bankcard.delete", "POST", ("bank_code", "bank_name", "bankcard_id", "bankcard_mobile", "bankcard_no", "id_card_no", "user_mobile"), ()),
+    "OapiFinanceLoanBankcardListRequest": ("dingtalk.oapi.finance.loan.bankcard.list", "POST", ("id_card_no", "user_mobile"), ()),
+    "OapiFinanceLoanBankcardUpdateRequest": ("dingtalk.oapi.finance.loan.bankcard.update", "POST", ("bank_code", "bank_name", "bankcard_id", "bankcard_mobile", "bankcard_no", "id_card_no", "user_mobile"), ()),
+    "OapiFinanceLoanContactsAddRequest": ("dingtalk.oapi.finance.loan.contacts.add", "POST", ("contact_mobile", "id_card_no", "user_category", "user_mobile", "user_name", "user_relation"), ()),
+    "OapiFinanceLoanContactsDeleteRequest": ("dingtalk.oapi.finance.loan.contacts.delete", "POST", ("contact_id", "contact_mobile", "id_card_no", "user_category", "user_mobile", "user_name", "user_relation"), ()),
+    "OapiFinanceLoanContactsListRequest": ("dingtalk.oapi.finance.loan.contacts.list", "POST", ("id_card_no", "user_mobile"), ()),
+    "OapiFinanceLoanContactsUpdateRequest": ("dingtalk.oapi.finance.loan.contacts.update", "POST", ("contact_id", "contact_mobile", "id_card_no", "user_category", "user_mobile", "user_name", "user_relation"), ()),
+    "OapiFinanceLoanNotifyCreditRequest": ("dingtalk.oapi.finance.loan.notify.credit", "POST", ("amount", "available_amount", "change_amount", "complete_time", "credit_no", "credit_type", "daily_interest_rate", "extension", "id_card_no", "next_apply_day", "open_channel_name", "open_product_code", "open_product_name", "open_product_type", "refuse_code", "refuse_reason", "status", "submit_time", "user_mobile", "year_interest_rate"), ()),
+    "OapiFinanceLoanNotifyLendRequest": ("dingtalk.oapi.finance.loan.notify.lend", "POST", ("amount_update_time", "available_limit", "bank_name", "bankcard_no", "bill_date", "bill_info_list", "credit_amount", "daily_interest_rate", "discounts_id", "fail_reason", "fail_reason_to_user", "first_bill_date", "first_repay_date", "id_card_no", "last_repay_date", "loan_amount", "loan_effective_time", "loan_end_time", "loan_order_flow_no", "loan_order_no", "loan_submit_time", "loan_txn_time", "loan_usage", "open_channel_name", "open_product_code", "open_product_name", "open_product_type", "paid_interest", "paid_penalty", "paid_principal", "paid_total_amount", "payable_interest", "payable_penalty", "payable_principal", "payable_total_amount", "reduction_total_amount", "repay_date", "repay_type", "status", "total_term", "user_mobile", "year_loan_interest_rate"), ()),
+    "OapiFinanceLoanNotifyRepaymentNoticeRequest": ("dingtalk.oapi.finance.loan.notify.repayment.notice", "POST", ("id_card_no", "loan_order_no", "open_channel_name", "open_product_name", "ovd_terms", "paid_interest", "paid_penalty", "paid_principal", "paid_total_amount", "repay_real_date", "repayment_terms", "user_mobile"), ()),
+    "OapiFinanceLoanNotifyRepaymentOverdueRequest": ("dingtalk.oapi.finance.loan.notify.repayment.overdue", "POST", ("current_unpaid_interest", "current_unpaid_penalty", "current_unpaid_principal", "current_unpaid_total_amount", "id_card_no", "int_ovd_days", "loan_order_no", "open_channel_name", "open_product_name", "ovd_terms", "paid_interest", "paid_penalty", "paid_principal", "paid_total_amount", "payable_interest", "payable_penalty", "payable_principal", "payable_total_amount", "period_paid_interest", "period_paid_penalty", "period_paid_principal", "period_paid_total_amount", "period_payable_interest", "period_payable_penalty", "period_payable_principal", "period_payable_total_amount", "prin_ovd_days", "repay_real_date", "repayment_terms", "send_ding_ding_msg", "user_mobile"), ()),
+    "OapiFinanceLoanNotifyRepaymentRequest": ("dingtalk.oapi.finance.loan.notify.repayment", "POST", ("amount", "available_amount", "bank_name", "bankcard_no", "current_int_ovd_days", "current_ovd_terms", "current_paid_interest", "current_paid_penalty", "current_paid_principal", "current_paid_total_amount", "current_prin_ovd_days", "fail_reason", "fail_reason_to_user", "id_card_no", "loan_order_no", "open_channel_name", "open_product_code", "open_product_name", "open_product_type", "paid_interest", "paid_penalty", "paid_principal", "paid_total_amount", "payable_interest", "payable_penalty", "payable_principal", "payable_total_amount", "period_paid_all", "period_paid_interest", "period_paid_penalty", "period_paid_principal", "period_paid_total_amount", "period_payable_interest", "period_payable_penalty", "period_payable_principal", "period_payable_total_amount", "repay_real_date", "repay_type", "repayment_no", "repayment_terms", "status", "type", "user_mobile"), ()),
+    "OapiFinanceLoanQualificationGetRequest": ("dingtalk.oapi.finance.loan.qualification.get", "POST", ("code", "open_channel_type"), ()),
+    "OapiFinanceUserAuthInfoQueryRequest": ("dingtalk.oapi.finance.userAuthInfo.query", "POST", (), ()),
+    "OapiFugongHealthDataListRequest": ("dingtalk.oapi.fugong.health_data.list", "POST", ("action_date", "offset", "process_instance_id", "size"), ()),
+    "OapiFugongProcessCodeGetRequest": ("dingtalk.oapi.fugong.process_code.get", "POST", (), ()),
+    "OapiGetJsapiTicketRequest": ("dingtalk.oapi.get_jsapi_ticket", "GET", (), ()),
+    "OapiGettokenRequest": ("dingtalk.oapi.gettoken", "GET", ("appkey", "appsecret", "corpid", "corpsecret"), ()),
+    "OapiHealthStepinfoGetuserstatusRequest": ("dingtalk.oapi.health.stepinfo.getuserstatus", "POST", ("userid",), ()),
+    "OapiHealthStepinfoListRequest": ("dingtalk.oapi.health.stepinfo.list", "POST", ("object_id", "stat_dates", "type"), ()),
+    "OapiHealthStepinfoListbyuseridRequest": ("dingtalk.oapi.health.stepinfo.listbyuserid", "POST", ("stat_date", "userids"), ()),
+    "OapiHireAuthRoleGetbyuserRequest": ("dingtalk.oapi.hire.auth.role.getbyuser", "POST", ("userid",), ()),
+    "OapiHireBizflowStartRequest": ("dingtalk.oapi.hire.bizflow.start", "POST", ("job_id", "op_userid", "resume_id"), ()),
+    "OapiHireGuideBeginnertaskFinishRequest": ("dingtalk.oapi.hire.guide.beginnertask.finish", "POST", ("task_code", "task_type", "userid"), ()),
+    "OapiHireJobQueryjobidsRequest": ("dingtalk.oapi.hire.job.queryjobids", "POST", ("query_param", "userid"), ()),
+    "OapiHireNavigationGetRequest": ("dingtalk.oapi.hire.navigation.get", "POST", ("userid",), ()),
+    "OapiHirePluginStatisticsBizflowListRequest": ("dingtalk.oapi.hire.plugin.statistics.bizflow.list", "POST", ("cursor", "size"), ()),
+    "OapiHireStatisticsBizflowListRequest": ("dingtalk.oapi.hire.statistics.bizflow.list", "POST", ("cursor", "size"), ()),
+    "OapiHrmEmployeeAddresumerecordRequest": ("dingtalk.oapi.hrm.employee.addresumerecord", "POST", ("content", "k_v_content", "pc_url", "phone_url", "record_timestamp", "title", "userid", "web_url"), ()),
+    "OapiHrmEmployeeDelandhandoverRequest": ("dingtalk.oapi.hrm.employee.delandhandover", "POST", ("dismission_info_with_hand_over", "op_userid"), ()),
+    "OapiHrmEmployeeDelresumerecordRequest": ("dingtalk.oapi.hrm.employee.delresumerecord", "POST", ("resume_id", "userid"), ()),
+    "OapiHrmEmployeeGetRequest": ("dingtalk.oapi.hrm.employee.get", "POST", ("userid",), ()),
+    "OapiHrmEmployeeGetdismissionlistRequest": ("dingtalk.oapi.hrm.employee.getdismissionlist", "POST", ("current", "op_userid", "page_size"), ()),
+    "OapiHrmEmployeeModjobinfoRequest": ("dingtalk.oapi.hrm.employee.modjobinfo", "POST", ("hrm_api_job_model", "op_userid"), ()),
+    "OapiHrmEmployeeUpdateresumerecordRequest": ("dingtalk.oapi.hrm.employee.updateresumerecord", "POST", ("content", "k_v_content", "pc_url", "phone_url", "record_timestamp", "resume_id", "title", "userid", "web_url"), ()),
+    "OapiImChatCidConvertRequest": ("dingtalk.oapi.im.chat.cid.convert", "POST", ("chat_id",), ()),
+    "OapiImChatControlgroupCreateRequest": ("dingtalk.oapi.im.chat.controlgroup.create", "POST", ("authority_type", "group_type", "group_uniq_id", "member_userids", "owner_userid", "title"), ()),
+    "OapiImChatScencegroupFileDownloadurlGetRequest": ("dingtalk.oapi.im.chat.scencegroup.file.downloadurl.get", "POST", ("download_code",), ()),
+    "OapiImChatScencegroupInteractivecardCallbackRegisterRequest": ("dingtalk.oapi.im.chat.scencegroup.interactivecard.callback.register", "POST", ("api_secret", "callbackRouteKey", "callback_url", "forceUpdate"), ()),
+    "OapiImChatScencegroupInteractivecardSendRequest": ("dingtalk.oapi.im.chat.scencegroup.interactivecard.send", "POST", ("card_mediaid_param_map", "card_param_map", "card_template_id", "out_track_id", "receiver_userid_list", "robot_code", "target_open_conversation_id"), ()),
+    "OapiImChatScencegroupMessageQueryRequest": ("dingtalk.oapi.im.chat.scencegroup.message.query", "POST", ("open_conversation_id", "open_msg_id", "sender_union_id", "sender_userid"), ()),
+    "OapiImChatScencegroupMessageSendRequest": ("dingtalk.oapi.im.chat.scencegroup.message.send", "POST", ("at_mobiles", "is_at_all", "msg_media_id_param_map", "msg_param_map", "msg_template_id", "receiver_mobiles", "receiver_union_ids", "receiver_user_ids", "robot_code", "target_open_conversation_id"), ()),
+    "OapiImChatScencegroupMessageSendV2Request": ("dingtalk.oapi.im.chat.scencegroup.message.send_v2", "POST", ("at_mobiles", "at_users", "is_at_all", "msg_media_id_param_map", "msg_param_map", "msg_template_id", "receiver_mobiles", "receiver_union_ids", "receiver_user_ids", "robot_code", "target_open_conversation_id"), ()),
+    "OapiImChatScencegroupRobotQueryRequest": ("dingtalk.oapi.im.chat.scencegroup.robot.query", "POST", ("open_conversation_id", "robot_code"), ()),
+    "OapiImChatScenegroupCreateRequest": ("dingtalk.oapi.im.chat.scenegroup.create", "POST", ("chat_banned_type", "icon", "management_type", "mention_all_authority", "owner_user_id", "searchable", "show_history_type", "subadmin_ids", "template_id", "title", "user_ids", "uuid", "validation_type"), ()),
+    "OapiImChatScenegroupGetRequest": ("dingtalk.oapi.im.chat.scenegroup.get", "POST", ("open_conversation_id",), ()),
+    "OapiImChatScenegroupMemberAddRequest": ("dingtalk.oapi.im.chat.scenegroup.member.add", "POST", ("contact_staff_ids", "open_conversation_id", "user_ids"), ()),
+    "OapiImChatScenegroupMemberDeleteRequest": ("dingtalk.oapi.im.chat.scenegroup.member.delete", "POST", ("contact_staff_ids", "open_conversation_id", "user_ids"), ()),
+    "OapiImChatScenegroupMemberGetRequest": ("dingtalk.oapi.im.chat.scenegroup.member.get", "POST", ("cursor", "open_conversation_id", "size"), ()),
+    "OapiImChatScenegroupTemplateApplyRequest": ("dingtalk.oapi.im.chat.scenegroup.template.apply", "POST", ("apply_mode", "open_conversation_id", "owner_user_id", "template_id"), ()),
+    "OapiImChatScenegroupTemplateCloseRequest": ("dingtalk.oapi.im.chat.scenegroup.template.close", "POST", ("apply_mode", "open_conversation_id", "owner_user_id", "template_id"), ()),
+    "OapiImChatScenegroupUpdateRequest": ("dingtalk.oapi.im.chat.scenegroup.update", "POST", ("chat_banned_type", "icon", "management_type", "mention_all_authority", "open_conversation_id", "owner_user_id", "searchable", "show_history_type", "title", "validation_type"), ()),
+    "OapiImChatServicegroupCreateRequest": ("dingtalk.oapi.im.chat.servicegroup.create", "POST", ("group_uniq_id", "org_inner_group", "owner_userid", "title"), ()),
+    "OapiImChatServicegroupDisbandRequest": ("dingtalk.oapi.im.chat.servicegroup.disband", "POST", ("chat_id",), ()),
+    "OapiImChatServicegroupMemberQueryRequest": ("dingtalk.oapi.im.chat.servicegroup.member.query", "POST", ("chat_id", "include_owner", "page_num", "page_size"), ()),
+    "OapiImChatServicegroupMemberUpdateRequest": ("dingtalk.oapi.im.chat.servicegroup.member.update", "POST", ("action", "chat_id", "member_dingtalk_ids"), ()),
+    "OapiImChatServicegroupNoticeCreateRequest": ("dingtalk.oapi.im.chat.servicegroup.notice.create", "POST", ("chat_id", "send_ding", "sticky", "text_content", "title", "unique_key", "userid"), ()),
+    "OapiImChatServicegroupQueryRequest": ("dingtalk.oapi.im.chat.servicegroup.query", "POST", ("chat_id",), ()),
+    "OapiImChatServicegroupUpgradeRequest": ("dingtalk.oapi.im.chat.servicegroup.upgrade", "POST", ("chat_id",), ()),
+    "OapiImChatbotDeleteRequest": ("dingtalk.oapi.im.chatbot.delete", "POST", ("chatbot_user_id", "open_conversation_id"), ()),
+    "OapiImChatbotGetRequest": ("dingtalk.oapi.im.chatbot.get", "POST", ("open_conversation_id",), ()),
+    "OapiImGroupappSysmsgSendRequest": ("dingtalk.oapi.im.groupapp.sysmsg.send", "POST", ("msg_key", "msg_param", "open_conversation_id"), ()),
+    "OapiImIntelligentCardSendRequest": ("dingtalk.oapi.im.intelligent.card.send", "POST", ("biz_type", "open_conversation_id", "template_data"), ()),
+    "OapiImpaasConversaionChangegroupownerRequest": ("dingtalk.oapi.impaas.conversaion.changegroupowner", "POST", ("channel", "chatid", "userid"), ()),
+    "OapiImpaasConversationCreateRequest": ("dingtalk.oapi.impaas.conversation.create", "POST", ("channel", "name", "owner_userid", "userid_list"), ()),
+    "OapiImpaasConversationModifymemberRequest": ("dingtalk.oapi.impaas.conversation.modifymember", "POST", ("channel", "chatid", "memberid_list", "type"), ()),
+    "OapiImpaasConversationOpencidGetRequest": ("dingtalk.oapi.impaas.conversation.opencid.get", "POST", ("model",), ()),
+    "OapiImpaasConversationSendmessageRequest": ("dingtalk.oapi.impaas.conversation.sendmessage", "POST", ("chatid", "content", "type"), ()),
+    "OapiImpaasConversationUpdateentranceidRequest": ("dingtalk.oapi.impaas.conversation.updateentranceid", "POST", ("request",), ()),
+    "OapiImpaasConverstionCreateo2oRequest": ("dingtalk.oapi.impaas.converstion.createo2o", "POST", ("request",), ()),
+    "OapiImpaasGroupCreateRequest": ("dingtalk.oapi.impaas.group.create", "POST", ("request",), ()),
+    "OapiImpaasGroupDismissRequest": ("dingtalk.oapi.impaas.group.dismiss", "POST", ("request",), ()),
+    "OapiImpaasGroupGetbydeptidRequest": ("dingtalk.oapi.impaas.group.getbydeptid", "POST", ("dept_id",), ()),
+    "OapiImpaasGroupModifyRequest": ("dingtalk.oapi.impaas.group.modify", "POST", ("request",), ()),
+    "OapiImpaasGroupQueryRequest": ("dingtalk.oapi.impaas.group.query", "POST", ("request",), ()),
+    "OapiImpaasGroupmemberGetmemberlistRequest": ("dingtalk.oapi.impaas.groupmember.getmemberlist", "POST", ("request",), ()),
+    "OapiImpaasGroupmemberModifyRequest": ("dingtalk.oapi.impaas.groupmember.modify", "POST", ("request",), ()),
+    "OapiImpaasGroupmemberModifymemberinfoRequest": ("dingtalk.oapi.impaas.groupmember.modifymemberinfo", "POST", ("request",), ()),
+    "OapiImpaasMessageAsyncsendRequest": ("dingtalk.oapi.impaas.message.asyncsend", "POST", ("request",), ()),
+    "OapiImpaasMessageGetmessageRequest": ("dingtalk.oapi.impaas.message.getmessage", "POST", ("request",), ()),
+    "OapiImpaasMessageGetmessagestatusRequest": ("dingtalk.oapi.impaas.message.getmessagestatus", "POST", ("request",), ()),
+    "OapiImpaasNewretailSendstaffgroupmessageRequest": ("dingtalk.oapi.impaas.newretail.sendstaffgroupmessage", "POST", ("chat_id", "content", "msg_type", "sender"), ()),
+    "OapiImpaasNewretailSendstaffmessageRequest": ("dingtalk.oapi.impaas.newretail.sendstaffmessage", "POST", ("content", "msg_type", "sender", "userid_list"), ()),
+    "OapiImpaasOtoconversationCreateRequest": ("dingtalk.oapi.impaas.otoconversation.create", "POST", ("request",), ()),
+    "OapiImpaasRelationAddRequest": ("dingtalk.oapi.impaas.relation.add", "POST", ("request",), ()),
+    "OapiImpaasRelationDelRequest": ("dingtalk.oapi.impaas.relation.del", "POST", ("request",), ()),
+    "OapiImpaasRelationGetRequest": ("dingtalk.oapi.impaas.relation.get", "POST", ("request",), ()),
+    "OapiImpaasUserAddprofileRequest": ("dingtalk.oapi.impaas.user.addprofile", "POST", ("request",), ()),
+    "OapiImpaasUserGetlogintokenRequest": ("dingtalk.oapi.impaas.user.getlogintoken", "POST", ("request",), ()),
+    "OapiImpaasUserGetprofileRequest": ("dingtalk.oapi.impaas.user.getprofile", "POST", ("request",), ()),
+    "OapiImpaasUserModprofileRequest": ("dingtalk.oapi.impaas.user.modprofile", "POST", ("request",), ()),
+    "OapiImpaasUserSubaccountAddRequest": ("dingtalk.oapi.impaas.user.subaccount.add", "POST", ("request",), ()),
+    "OapiImpaasUserSubaccountDeleteRequest": ("dingtalk.oapi.impaas.user.subaccount.delete", "POST", ("request",), ()),
+    "OapiInactiveUserGetRequest": ("dingtalk.oapi.inactive.user.get", "POST", ("offset", "query_date", "size"), ()),
+    "OapiInactiveUserV2GetRequest": ("dingtalk.oapi.inactive.user.v2.get", "POST", ("dept_ids", "is_active", "offset", "query_date", "size"), ()),
+    "OapiIndustryDepartmentGetRequest": ("dingtalk.oapi.industry.department.get", "POST", ("dept_id",), ()),
+    "OapiIndustryDepartmentListRequest": ("dingtalk.oapi.industry.department.list", "POST", ("cursor", "dept_id", "size"), ()),
+    "OapiIndustryOrganizationGetRequest": ("dingtalk.oapi.industry.organization.get", "POST", (), ()),
+    "OapiIndustryPackGetRequest": ("dingtalk.oapi.industry.pack.get", "POST", (), ()),
+    "OapiIndustryStudentpoolBatchaddRequest": ("dingtalk.oapi.industry.studentpool.batchadd", "POST", ("biz_code", "student_list"), ()),
+    "OapiIndustryUserGetRequest": ("dingtalk.oapi.industry.user.get", "POST", ("dept_id", "userid"), ()),
+    "OapiIndustryUserListRequest": ("dingtalk.oapi.industry.user.list", "POST", ("cursor", "dept_id", "role", "size"), ()),
+    "OapiInspectFeedbackGetRequest": ("dingtalk.oapi.inspect.feedback.get", "POST", ("form_id", "task_id"), ()),
+    "OapiInspectTaskListRequest": ("dingtalk.oapi.inspect.task.list", "POST", ("param",), ()),
+    "OapiIsvOpenencryptAuthappcloseRequest": ("dingtalk.oapi.isv.openencrypt.authappclose", "POST", ("top_auth_micro_app_close",), ()),
+    "OapiIsvOpenencryptHeartbeatRequest": ("dingtalk.oapi.isv.openencrypt.heartbeat", "POST", ("top_kms_heartbeat",), ()),
+    "OapiIsvOpenencryptRegistekmsRequest": ("dingtalk.oapi.isv.openencrypt.registekms", "POST", ("top_kms_meta",), ()),
+    "OapiKacDatavAnnualReportGetRequest": ("dingtalk.oapi.kac.datav.annual_report.get", "POST", ("dept_id", "type", "user_id", "year"), ()),
+    "OapiKacDatavChatSummaryGetRequest": ("dingtalk.oapi.kac.datav.chat.summary.get", "POST", ("request",), ()),
+    "OapiKacDatavDauSummaryGetRequest": ("dingtalk.oapi.kac.datav.dau.summary.get", "POST", ("request",), ()),
+    "OapiKacDatavDeptChatSummaryListRequest": ("dingtalk.oapi.kac.datav.dept.chat.summary.list", "POST", ("request",), ()),
+    "OapiKacDatavDeptDauListRequest": ("dingtalk.oapi.kac.datav.dept.dau.list", "POST", ("request",), ()),
+    "OapiKacDatavDeptDingListRequest": ("dingtalk.oapi.kac.datav.dept.ding.list", "POST", ("request",), ()),
+    "OapiKacDatavDeptTelconfListRequest": ("dingtalk.oapi.kac.datav.dept.telconf.list", "POST", ("request",), ()),
+    "OapiKacDatavDeptVideoconfListRequest": ("dingtalk.oapi.kac.datav.dept.videoconf.list", "POST", ("request",), ()),
+    "OapiKacDatavDeptVideoliveListRequest": ("dingtalk.oapi.kac.datav.dept.videolive.list", "POST", ("request",), ()),
+    "OapiKacDatavDingGetRequest": ("dingtalk.oapi.kac.datav.ding.get", "POST", ("ding_usage_summary_request",), ()),
+    "OapiKacDatavGroupGetRequest": ("dingtalk.oapi.kac.datav.group.get", "POST", ("request",), ()),
+    "OapiKacDatavInactivatedUserListRequest": ("dingtalk.oapi.kac.datav.inactivated.user.list", "POST", ("request",), ()),
+    "OapiKacDatavMicroappDetailListRequest": ("dingtalk.oapi.kac.datav.microapp.detail.list", "POST", ("request",), ()),
+    "OapiKacDatavTelconfDetailListRequest": ("dingtalk.oapi.kac.datav.telconf.detail.list", "POST", ("request",), ()),
+    "OapiKacDatavTelconfGetRequest": ("dingtalk.oapi.kac.datav.telconf.get", "POST", ("request",), ()),
+    "OapiKacDatavVideoconfDetailListRequest": ("dingtalk.oapi.kac.datav.videoconf.detail.list", "POST", ("request",), ()),
+    "OapiKacDatavVideoconfGetRequest": ("dingtalk.oapi.kac.datav.videoconf.get", "POST", ("param_mcs_summary_request",), ()),
+    "OapiKacDatavVideoliveDetailListRequest": ("dingtalk.oapi.kac.datav.videolive.detail.list", "POST", ("request",), ()),
+    "OapiKacDatavVideoliveGetRequest": ("dingtalk.oapi.kac.datav.videolive.get", "POST", ("param_video_live_summary_request",), ()),
+    "OapiKacDatavVideoliveViewerListRequest": ("dingtalk.oapi.kac.datav.videolive.viewer.list", "POST", ("request",), ()),
+    "OapiKacOpenliveRecordListRequest": ("dingtalk.oapi.kac.openlive.record.list", "POST", ("author_user_id", "begin_time", "end_time", "page_size", "page_start", "status"), ()),
+    "OapiKacOpenliveWhiteUsersBatchAddRequest": ("dingtalk.oapi.kac.openlive.white_users.batch_add", "POST", ("live_id", "user_ids"), ()),
+    "OapiKacOpenliveWhiteUsersBatchDeleteRequest": ("dingtalk.oapi.kac.openlive.white_users.batch_delete", "POST", ("live_id", "user_ids"), ()),
+    "OapiKacOpenliveWhiteUsersListRequest": ("dingtalk.oapi.kac.openlive.white_users.list", "POST", ("live_id", "page_size", "page_start"), ()),
+    "OapiKacV2DatavVideoconfGetRequest": ("dingtalk.oapi.kac.v2.datav.videoconf.get", "POST", ("request",), ()),
+    "OapiKefuSendmessageRequest": ("dingtalk.oapi.kefu.sendmessage", "POST", ("content", "customerid", "msgtype", "serviceid", "token", "userid"), ()),
+    "OapiLiveCreateRequest": ("dingtalk.oapi.live.create", "POST", ("request",), ()),
+    "OapiLiveGroupliveDetailGetRequest": ("dingtalk.oapi.live.grouplive.detail.get", "POST", ("req",), ()),
+    "OapiLiveGroupliveListRequest": ("dingtalk.oapi.live.grouplive.list", "POST", ("cid", "from_time", "open_id", "to_time"), ()),
+    "OapiLiveGroupliveListbytimeRequest": ("dingtalk.oapi.live.grouplive.listbytime", "POST", ("req",), ()),
+    "OapiLiveGroupliveSharelistRequest": ("dingtalk.oapi.live.grouplive.sharelist", "POST", ("cid", "live_uuid"), ()),
+    "OapiLiveGroupliveStatisticsRequest": ("dingtalk.oapi.live.grouplive.statistics", "POST", ("cid", "live_uuid", "open_id"), ()),
+    "OapiLiveGroupliveViewrecordRequest": ("dingtalk.oapi.live.grouplive.viewrecord", "POST", ("dept_id", "live_uuid", "page_index", "page_size"), ()),
+    "OapiLivePlaybackRequest": ("dingtalk.oapi.live.playback", "POST", ("request",), ()),
+    "OapiLiveQueryRequest": ("dingtalk.oapi.live.query", "POST", ("request",), ()),
+    "OapiMaterialArticleAddRequest": ("dingtalk.oapi.material.article.add", "POST", ("article", "unionid"), ()),
+    "OapiMaterialArticleDeleteRequest": ("dingtalk.oapi.material.article.delete", "POST", ("article_id", "unionid"), ()),
+    "OapiMaterialArticleGetRequest": ("dingtalk.oapi.material.article.get", "POST", ("article_id", "unionid"), ()),
+    "OapiMaterialArticleListRequest": ("dingtalk.oapi.material.article.list", "POST", ("page_size", "page_start", "unionid"), ()),
+    "OapiMaterialArticlePublishRequest": ("dingtalk.oapi.material.article.publish", "POST", ("article_id", "unionid"), ()),
+    "OapiMaterialArticleUpdateRequest": ("dingtalk.oapi.material.article.update", "POST", ("article", "unionid"), ()),
+    "OapiMaterialNewsAddRequest": ("dingtalk.oapi.material.news.add", "POST", ("articles", "unionid"), ()),
+    "OapiMaterialNewsDeleteRequest": ("dingtalk.oapi.material.news.delete", "POST", ("media_id", "unionid"), ()),
+    "OapiMaterialNewsGetRequest": ("dingtalk.oapi.material.news.get", "POST", ("media_id", "unionid"), ()),
+    "OapiMaterialNewsListRequest": ("dingtalk.oapi.material.news.list", "POST", ("page_size", "page_start", "unionid"), ()),
+    "OapiMaterialNewsUpdateRequest": ("dingtalk.oapi.material.news.update", "POST", ("articles", "media_id", "unionid"), ()),
+    "OapiMcsConferenceCreateRequest": ("dingtalk.oapi.mcs.conference.create", "POST", ("biz_key", "is_push_record", "preference_region", "room_valid_time", "title"), ()),
+    "OapiMedalCorpmedalGrantRequest": ("dingtalk.oapi.medal.corpmedal.grant", "POST", ("template_id", "userid"), ()),
+    "OapiMedalCorpmedalQueryRequest": ("dingtalk.oapi.medal.corpmedal.query", "POST", ("template_ids", "userid"), ()),
+    "OapiMedalCorpmedalRemoveRequest": ("dingtalk.oapi.medal.corpmedal.remove", "POST", ("template_id", "userid"), ()),
+    "OapiMedalCorpmedalWearRequest": ("dingtalk.oapi.medal.corpmedal.wear", "POST", ("operation", "template_id", "userid"), ()),
+    "OapiMediaUploadRequest": ("dingtalk.oapi.media.upload", "POST", ("media", "type"), ("media",)),
+    "OapiMessageCorpconversationAsyncsendRequest": ("dingtalk.oapi.message.corpconversation.asyncsend", "POST", ("agent_id", "dept_id_list", "msgcontent", "msgtype", "to_all_user", "userid_list"), ()),
+    "OapiMessageCorpconversationAsyncsendV2Request": ("dingtalk.oapi.message.corpconversation.asyncsend_v2", "POST", ("agent_id", "dept_id_list", "enable_id_trans", "msg", "to_all_user", "userid_list"), ()),
+    "OapiMessageCorpconversationAsyncsendbycodeRequest": ("dingtalk.oapi.message.corpconversation.asyncsendbycode", "POST", ("agent_id", "code", "dept_id_list", "msgcontent", "msgtype", "to_all_user", "user_id_list"), ()),
+    "OapiMessageCorpconversationGetsendprogressRequest": ("dingtalk.oapi.message.corpconversation.getsendprogress", "POST", ("agent_id", "task_id"), ()),
+    "OapiMessageCorpconversationGetsendresultRequest": ("dingtalk.oapi.message.corpconversation.getsendresult", "POST", ("agent_id", "task_id"), ()),
+    "OapiMessageCorpconversationRecallRequest": ("dingtalk.oapi.message.corpconversation.recall", "POST", ("agent_id", "msg_task_id"), ()),
+    "OapiMessageCorpconversationSendbytemplateRequest": ("dingtalk.oapi.message.corpconversation.sendbytemplate", "POST", ("agent_id", "data", "dept_id_list", "template_id", "userid_list"), ()),
+    "OapiMessageCorpconversationStatusBarUpdateRequest": ("dingtalk.oapi.message.corpconversation.status_bar.update", "POST", ("agent_id", "status_bg", "status_value", "task_id"), ()),
+    "OapiMessageMassRecallRequest": ("dingtalk.oapi.message.mass.recall", "POST", ("task_id", "unionid"), ()),
+    "OapiMessageMassSendRequest": ("dingtalk.oapi.message.mass.send", "POST", ("dep_id_list", "is_preview", "is_to_all", "media_id", "msg_body", "msg_type", "text_content", "unionid", "userid_list", "uuid"), ()),
+    "OapiMessageSendToConversationRequest": ("dingtalk.oapi.message.send_to_conversation", "POST", ("action_card", "cid", "file", "image", "link", "markdown", "msg", "msgtype", "oa", "sender", "text", "voice"), ()),
+    "OapiMessageSendToSingleConversationRequest": ("dingtalk.oapi.message.send_to_single_conversation", "POST", ("msg", "receiver_userid", "sender_userid"), ()),
+    "OapiMicroappAddwithuseridRequest": ("dingtalk.oapi.microapp.addwithuserid", "POST", ("agentId", "userids"), ()),
+    "OapiMicroappCheckuidRequest": ("dingtalk.oapi.microapp.checkuid", "POST", ("agentid", "userid"), ()),
+    "OapiMicroappCreateRequest": ("dingtalk.oapi.microapp.create", "POST", ("appDesc", "appIcon", "appName", "homepageUrl", "ompLink", "pcHomepageUrl"), ()),
+    "OapiMicroappCustomCreateRequest": ("dingtalk.oapi.microapp.custom.create", "POST", ("app_corp_id", "desc", "develop_type", "homepage_link", "icon", "ip_white_list", "name", "omp_link", "pc_homepage_link", "top_related_corp_id"), ()),
+    "OapiMicroappCustomDeleteRequest": ("dingtalk.oapi.microapp.custom.delete", "POST", ("agent_id", "app_corp_id"), ()),
+    "OapiMicroappCustomUpdateRequest": ("dingtalk.oapi.microapp.custom.update", "POST", ("agent_id", "app_corp_id", "desc", "homepage_link", "icon", "ip_white_list", "name", "omp_link", "pc_homepage_link", "top_related_corp_id"), ()),
+    "OapiMicroappDeleteRequest": ("dingtalk.oapi.microapp.delete", "POST", ("agentId",), ()),
+    "OapiMicroappDelwithuseridRequest": ("dingtalk.oapi.microapp.delwithuserid", "POST", ("agentId", "userids"), ()),
+    "OapiMicroappListByUseridRequest": ("dingtalk.oapi.microapp.list_by_userid", "GET", ("userid",), ()),
+    "OapiMicroappListRequest": ("dingtalk.oapi.microapp.list", "POST", (), ()),
+    "OapiMicroappListbypageRequest": ("dingtalk.oapi.microapp.listbypage", "POST", ("agentId", "offset", "size"), ()),
+    "OapiMicroappRuleDeleteRequest": ("dingtalk.oapi.microapp.rule.delete", "POST", ("agentId", "ruleId"), ()),
+    "OapiMicroappRuleGetRuleListRequest": ("dingtalk.oapi.microapp.rule.get_rule_list", "POST", ("agentId", "userid"), ()),
+    "OapiMicroappRuleGetUserTotalRequest": ("dingtalk.oapi.microapp.rule.get_user_total", "POST", ("agentId", "ruleIdList"), ()),
+    "OapiMicroappScopeAddRequest": ("dingtalk.oapi.microapp.scope.add", "POST", ("agentid", "userid_list"), ()),
+    "OapiMicroappScopeDeleteRequest": ("dingtalk.oapi.microapp.scope.delete", "POST", ("agentid", "userid_list"), ()),
+    "OapiMicroappSetVisibleScopesRequest": ("dingtalk.oapi.microapp.set_visible_scopes", "POST", ("agentId", "deptVisibleScopes", "isHidden", "userVisibleScopes"), ()),
+    "OapiMicroappUpdateRequest": ("dingtalk.oapi.microapp.update", "POST", ("agentId", "appDesc", "appIcon", "appName", "homepageUrl", "ompLink", "pcHomepageUrl"), ()),
+    "OapiMicroappVisibleScopesRequest": ("dingtalk.oapi.microapp.visible_scopes", "POST", ("agentId",), ()),
+    "OapiMiniappAppinfoQueryRequest": ("dingtalk.oapi.miniapp.appinfo.query", "POST", ("model_key",), ()),
+    "OapiMiniappAppversionQueryRequest": ("dingtalk.oapi.miniapp.appversion.query", "POST", ("model_key",), ()),
+    "OapiMiniappDeploypackageQueryRequest": ("dingtalk.oapi.miniapp.deploypackage.query", "POST", ("model_key",), ()),
+    "OapiMiniappDeploywindowQueryRequest": ("dingtalk.oapi.miniapp.deploywindow.query", "POST", ("model_key",), ()),
+    "OapiMiniappMiniappversionQueryRequest": ("dingtalk.oapi.miniapp.miniappversion.query", "POST", ("model_key",), ()),
+    "OapiMiniappPackageconfigQueryRequest": ("dingtalk.oapi.miniapp.packageconfig.query", "POST", ("model_key",), ()),
+    "OapiMpdevAccesskeyGetRequest": ("dingtalk.oapi.mpdev.accesskey.get", "POST", ("miniapp_id",), ()),
+    "OapiMpdevBuildCreateRequest": ("dingtalk.oapi.mpdev.build.create", "POST", ("enable_tabbar", "main_page", "miniapp_id", "package_key", "package_md5", "package_version", "plugin_refs"), ()),
+    "OapiMpdevBuildStatusGetRequest": ("dingtalk.oapi.mpdev.build.status.get", "POST", ("miniapp_id", "task_id"), ()),
+    "OapiMpdevPreviewbuildCreateRequest": ("dingtalk.oapi.mpdev.previewbuild.create", "POST", ("build_script_version", "corpid", "enable_tabbar", "ignore_http_req_permission", "ignore_webview_domain_check", "main_page", "miniapp_id", "package_key", "page", "plugin_package_key", "plugin_refs", "query", "sub_packages"), ()),
+    "OapiMpdevPreviewbuildStatusGetRequest": ("dingtalk.oapi.mpdev.previewbuild.status.get", "POST", ("miniapp_id", "task_id"), ()),
+    "OapiNewmanufacturerOrderGetRequest": ("dingtalk.oapi.newmanufacturer.order.get", "POST", ("number", "tenant_id"), ()),
+    "OapiNewretailQueryorginfoRequest": ("dingtalk.oapi.newretail.queryorginfo", "POST", (), ()),
+    "OapiOcrStructuredRecognizeRequest": ("dingtalk.oapi.ocr.structured.recognize", "POST", ("image_url", "type"), ()),
+    "OapiOpenencryptEncryptboxStatusUpdateRequest": ("dingtalk.oapi.openencrypt.encryptbox.status.update", "POST", ("top_encrypt_box_status",), ()),
+    "OapiOpenencryptHeartbeatRequest": ("dingtalk.oapi.openencrypt.heartbeat", "POST", ("appid", "extension"), ()),
+    "OapiOpenencryptRotateedkRequest": ("dingtalk.oapi.openencrypt.rotateedk", "POST", ("top_edk_rotate_manual",), ()),
+    "OapiOpenencryptUpdateconfigRequest": ("dingtalk.oapi.openencrypt.updateconfig", "POST", ("top_resource_kms_config",), ()),
+    "OapiOrgListshortcutRequest": ("dingtalk.oapi.org.listshortcut", "POST", (), ()),
+    "OapiOrgOpenencryptAuthappcloseRequest": ("dingtalk.oapi.org.openencrypt.authappclose", "POST", ("top_auth_micro_app_close",), ()),
+    "OapiOrgOpenencryptHeartbeatRequest": ("dingtalk.oapi.org.openencrypt.heartbeat", "POST", ("top_kms_heartbeat",), ()),
+    "OapiOrgOpenencryptRegistekmsRequest": ("dingtalk.oapi.org.openencrypt.registekms", "POST", ("top_kms_meta",), ()),
+    "OapiOrgSetoaurlRequest": ("dingtalk.oapi.org.setoaurl", "POST", ("oa_title", "oa_url"), ()),
+    "OapiOrgSetshortcutRequest": ("dingtalk.oapi.org.setshortcut", "POST", ("agentIds",), ()),
+    "OapiOrgUnionBranchGetRequest": ("dingtalk.oapi.org.union.branch.get", "POST", (), ()),
+    "OapiOrgUnionTrunkGetRequest": ("dingtalk.oapi.org.union.trunk.get", "POST", (), ()),
+    "OapiOrgUserteaminviteAcceptRequest": ("dingtalk.oapi.org.userteaminvite.accept", "POST", ("mobile", "state_code"), ()),
+    "OapiOrgpaasOrgInfoGetRequest": ("dingtalk.oapi.orgpaas.org.info.get", "POST", (), ()),
+    "OapiPbpEventDeleteRequest": ("dingtalk.oapi.pbp.event.delete", "POST", ("param",), ()),
+    "OapiPbpEventResultSyncRequest": ("dingtalk.oapi.pbp.event.result.sync", "POST", ("param",), ()),
+    "OapiPbpEventSyncRequest": ("dingtalk.oapi.pbp.event.sync", "POST", ("param",), ()),
+    "OapiPbpInstanceCreateRequest": ("dingtalk.oapi.pbp.instance.create", "POST", ("active", "biz_id", "end_time", "outer_id", "start_time"), ()),
+    "OapiPbpInstanceDisableRequest": ("dingtalk.oapi.pbp.instance.disable", "POST", ("biz_id", "biz_inst_id"), ()),
+    "OapiPbpInstanceEnableRequest": ("dingtalk.oapi.pbp.instance.enable", "POST", ("biz_id", "biz_inst_id"), ()),
+    "OapiPbpInstanceGroupCreateRequest": ("dingtalk.oapi.pbp.instance.group.create", "POST", ("group_param",), ()),
+    "OapiPbpInstanceGroupMemberListRequest": ("dingtalk.oapi.pbp.instance.group.member.list", "POST", ("biz_id", "cursor", "punch_group_id", "size"), ()),
+    "OapiPbpInstanceGroupMemberUpdateRequest": ("dingtalk.oapi.pbp.instance.group.member.update", "POST", ("sync_param",), ()),
+    "OapiPbpInstanceGroupPositionListRequest": ("dingtalk.oapi.pbp.instance.group.position.list", "POST", ("biz_id", "cursor", "punch_group_id", "size"), ()),
+    "OapiPbpInstanceGroupPositionUpdateRequest": ("dingtalk.oapi.pbp.instance.group.position.update", "POST", ("sync_param",), ()),
+    "OapiPbpInstancePositionListRequest": ("dingtalk.oapi.pbp.instance.position.list", "POST", ("biz_id", "biz_inst_id", "cursor", "size", "type"), ()),
+    "OapiPlanetomFeedsCreateRequest": ("dingtalk.oapi.planetom.feeds.create", "POST", ("anchor_id", "appoint_begin_time", "cover_url", "feed_type", "group_id_type", "group_ids", "introduction", "open_app_id", "pic_introduction_url", "pre_video_url", "title"), ()),
+    "OapiPlanetomFeedsInteractivedataGetRequest": ("dingtalk.oapi.planetom.feeds.interactivedata.get", "POST", ("anchor_id", "feed_id"), ()),
+    "OapiPlanetomFeedsStatisticGetRequest": ("dingtalk.oapi.planetom.feeds.statistic.get", "POST", ("anchor_id", "feed_id"), ()),
+    "OapiPlanetomFeedsTaskinfoRequest": ("dingtalk.oapi.planetom.feeds.taskinfo", "POST", ("task_id",), ()),
+    "OapiPlanetomFeedsUploadRequest": ("dingtalk.oapi.planetom.feeds.upload", "POST", ("feed_app_id", "feed_info_models", "user_phone"), ()),
+    "OapiPlanetomFeedsWatchdataGetRequest": ("dingtalk.oapi.planetom.feeds.watchdata.get", "POST", ("anchor_id", "chat_id", "feed_id", "index", "page_size"), ()),
+    "OapiPlatformTranslateRequest": ("dingtalk.oapi.platform.translate", "POST", ("query", "source_language", "target_language"), ()),
+    "OapiProcessActivityinfoGetRequest": ("dingtalk.oapi.process.activityinfo.get", "POST", ("request",), ()),
+    "OapiProcessApproversForecastRequest": ("dingtalk.oapi.process.approvers.forecast", "POST", ("request",), ()),
+    "OapiProcessBaseinfoListRequest": ("dingtalk.oapi.process.baseinfo.list", "POST", ("process_codes",), ()),
+    "OapiProcessBizsuiteGetRequest": ("dingtalk.oapi.process.bizsuite.get", "POST", ("request",), ()),
+    "OapiProcessCleanRequest": ("dingtalk.oapi.process.clean", "POST", ("corpid", "process_code"), ()),
+    "OapiProcessCopyRequest": ("dingtalk.oapi.process.copy", "POST", ("agent_id", "biz_category_id", "copy_type", "description", "process_code", "process_name"), ()),
+    "OapiProcessDeleteRequest": ("dingtalk.oapi.process.delete", "POST", ("request",), ()),
+    "OapiProcessDentryAuthRequest": ("dingtalk.oapi.process.dentry.auth", "POST", ("request",), ()),
+    "OapiProcessDirlistGetRequest": ("dingtalk.oapi.process.dirlist.get", "POST", ("request",), ()),
+    "OapiProcessFormConditionListRequest": ("dingtalk.oapi.process.form.condition.list", "POST", ("request",), ()),
+    "OapiProcessFormGetRequest": ("dingtalk.oapi.process.form.get", "POST", ("process_code",), ()),
+    "OapiProcessGetByNameRequest": ("dingtalk.oapi.process.get_by_name", "POST", ("name",), ()),
+    "OapiProcessGettodonumRequest": ("dingtalk.oapi.process.gettodonum", "POST", ("userid",), ()),
+    "OapiProcessInstanceCancelRequest": ("dingtalk.oapi.process.instance.cancel", "POST", ("request",), ()),
+    "OapiProcessInstanceCommentAddRequest": ("dingtalk.oapi.process.instance.comment.add", "POST", ("request",), ()),
+    "OapiProcessInstanceTerminateRequest": ("dingtalk.oapi.process.instance.terminate", "POST", ("request",), ()),
+    "OapiProcessListbyuseridRequest": ("dingtalk.oapi.process.listbyuserid", "POST", ("offset", "size", "userid"), ()),
+    "OapiProcessPrintTemplateSaveRequest": ("dingtalk.oapi.process.print.template.save", "POST", ("font", "open_customize_print", "process_code", "vm"), ()),
+    "OapiProcessPrinterInstanceGetRequest": ("dingtalk.oapi.process.printer.instance.get", "POST", ("request",), ()),
+    "OapiProcessPrinterTemplateDeleteRequest": ("dingtalk.oapi.process.printer.template.delete", "POST", ("request",), ()),
+    "OapiProcessProcmanagerGetRequest": ("dingtalk.oapi.process.procmanager.get", "POST", ("request",), ()),
+    "OapiProcessProcmanagerSaveRequest": ("dingtalk.oapi.process.procmanager.save", "POST", ("request",), ()),
+    "OapiProcessProcvisibleGetRequest": ("dingtalk.oapi.process.procvisible.get", "POST", ("request",), ()),
+    "OapiProcessProcvisibleSaveRequest": ("dingtalk.oapi.process.procvisible.save", "POST", ("request",), ()),
+    "OapiProcessPropertyUpdateRequest": ("dingtalk.oapi.process.property.update", "POST", ("component_id", "process_code", "props", "userid"), ()),
+    "OapiProcessQuerypayrelatedtemplateRequest": ("dingtalk.oapi.process.querypayrelatedtemplate", "POST", (), ()),
+    "OapiProcessSaveRequest": ("dingtalk.oapi.process.save", "POST", ("saveProcessRequest",), ()),
+    "OapiProcessSyncRequest": ("dingtalk.oapi.process.sync", "POST", ("agent_id", "biz_category_id", "process_name", "src_process_code", "target_process_code"), ()),
+    "OapiProcessTemplateListRequest": ("dingtalk.oapi.process.template.list", "POST", ("offset", "size", "userid"), ()),
+    "OapiProcessTemplateManageGetRequest": ("dingtalk.oapi.process.template.manage.get", "POST", ("userid",), ()),
+    "OapiProcessTemplateSaveRequest": ("dingtalk.oapi.process.template.save", "POST", ("font", "process_code", "vm"), ()),
+    "OapiProcessTemplateUpgradeRequest": ("dingtalk.oapi.process.template.upgrade", "POST", ("detail_component_id", "form_component_id", "process_code", "userid"), ()),
+    "OapiProcessTemplateUpgradeinfoQueryRequest": ("dingtalk.oapi.process.template.upgradeinfo.query", "POST", ("process_codes",), ()),
+    "OapiProcessWorkrecordBatchupdateRequest": ("dingtalk.oapi.process.workrecord.batchupdate", "POST", ("request",), ()),
+    "OapiProcessWorkrecordCreateRequest": ("dingtalk.oapi.process.workrecord.create", "POST", ("request",), ()),
+    "OapiProcessWorkrecordDeleteRequest": ("dingtalk.oapi.process.workrecord.delete", "POST", ("request",), ()),
+    "OapiProcessWorkrecordForwardCreateRequest": ("dingtalk.oapi.process.workrecord.forward.create", "POST", ("request",), ()),
+    "OapiProcessWorkrecordTaskCreateRequest": ("dingtalk.oapi.process.workrecord.task.create", "POST", ("request",), ()),
+    "OapiProcessWorkrecordTaskQueryRequest": ("dingtalk.oapi.process.workrecord.task.query", "POST", ("count", "offset", "status", "userid"), ()),
+    "OapiProcessWorkrecordTaskUpdateRequest": ("dingtalk.oapi.process.workrecord.task.update", "POST", ("request",), ()),
+    "OapiProcessWorkrecordTaskgroupCancelRequest": ("dingtalk.oapi.process.workrecord.taskgroup.cancel", "POST", ("request",), ()),
+    "OapiProcessWorkrecordUpdateRequest": ("dingtalk.oapi.process.workrecord.update", "POST", ("request",), ()),
+    "OapiProcessinstanceCreateRequest": ("dingtalk.oapi.processinstance.create", "POST", ("agent_id", "approvers", "approvers_v2", "cc_list", "cc_position", "dept_id", "form_component_values", "originator_user_id", "process_code"), ()),
+    "OapiProcessinstanceCspaceInfoRequest": ("dingtalk.oapi.processinstance.cspace.info", "POST", ("agent_id", "user_id"), ()),
+    "OapiProcessinstanceCspacePreviewRequest": ("dingtalk.oapi.processinstance.cspace.preview", "POST", ("request",), ()),
+    "OapiProcessinstanceExecuteRequest": ("dingtalk.oapi.processinstance.execute", "POST", ("actioner_userid", "process_instance_id", "remark", "result", "task_id"), ()),
+    "OapiProcessinstanceExecuteV2Request": ("dingtalk.oapi.process.instance.execute", "POST", ("request",), ()),
+    "OapiProcessinstanceFileDownloadRequest": ("dingtalk.oapi.processinstance.file.download", "POST", ("agent_id", "file_id", "process_instance_id"), ()),
+    "OapiProcessinstanceFileUploadRequest": ("dingtalk.oapi.processinstance.file.upload", "POST", ("agent_id", "process_instance_id"), ()),
+    "OapiProcessinstanceFileUrlGetRequest": ("dingtalk.oapi.processinstance.file.url.get", "POST", ("request",), ()),
+    "OapiProcessinstanceGetRequest": ("dingtalk.oapi.processinstance.get", "POST", ("process_instance_id",), ()),
+    "OapiProcessinstanceListRequest": ("dingtalk.oapi.processinstance.list", "POST", ("cursor", "end_time", "process_code", "size", "start_time", "userid_list"), ()),
+    "OapiProcessinstanceListidsRequest": ("dingtalk.oapi.processinstance.listids", "POST", ("cursor", "end_time", "process_code", "size", "start_time", "userid_list"), ()),
+    "OapiProcessinstanceVariableUpdateRequest": ("dingtalk.oapi.processinstance.variable.update", "POST", ("process_instance_id", "remark", "variables"), ()),
+    "OapiProjectInviteDataQueryRequest": ("dingtalk.oapi.project.invite.data.query", "POST", ("invite_data_query",), ()),
+    "OapiProjectInviteShareurlGetRequest": ("dingtalk.oapi.project.invite.shareurl.get", "POST", ("invite_info",), ()),
+    "OapiProjectPointAddRequest": ("dingtalk.oapi.project.point.add", "POST", ("action_time", "rule_code", "rule_name", "score", "tenant_id", "userid", "uuid"), ()),
+    "OapiProjectPointHistoryPageRequest": ("dingtalk.oapi.project.point.history.page", "POST", ("cursor", "page_size", "tenant_id", "userid"), ()),
+    "OapiProjectPointRuleListRequest": ("dingtalk.oapi.project.point.rule.list", "POST", ("tenant_id",), ()),
+    "OapiRelationRemarkModifyRequest": ("dingtalk.oapi.relation.remark.modify", "POST", ("markees", "markers"), ()),
+    "OapiReportCommentListRequest": ("dingtalk.oapi.report.comment.list", "POST", ("offset", "report_id", "size"), ()),
+    "OapiReportCreateRequest": ("dingtalk.oapi.report.create", "POST", ("create_report_param",), ()),
+    "OapiReportGetunreadcountRequest": ("dingtalk.oapi.report.getunreadcount", "POST", ("userid",), ()),
+    "OapiReportListRequest": ("dingtalk.oapi.report.list", "POST", ("cursor", "end_time", "modified_end_time", "modified_start_time", "size", "start_time", "template_name", "userid"), ()),
+    "OapiReportReceiverListRequest": ("dingtalk.oapi.report.receiver.list", "POST", ("offset", "report_id", "size"), ()),
+    "OapiReportSavecontentRequest": ("dingtalk.oapi.report.savecontent", "POST", ("create_report_param",), ()),
+    "OapiReportSimplelistRequest": ("dingtalk.oapi.report.simplelist", "POST", ("cursor", "end_time", "size", "start_time", "template_name", "userid"), ()),
+    "OapiReportStatisticsListbytypeRequest": ("dingtalk.oapi.report.statistics.listbytype", "POST", ("offset", "report_id", "size", "type"), ()),
+    "OapiReportStatisticsRequest": ("dingtalk.oapi.report.statistics", "POST", ("report_id",), ()),
+    "OapiReportTemplateGetbynameRequest": ("dingtalk.oapi.report.template.getbyname", "POST", ("template_name", "userid"), ()),
+    "OapiReportTemplateListbyuseridRequest": ("dingtalk.oapi.report.template.listbyuserid", "POST", ("offset", "size", "userid"), ()),
+    "OapiRetailSellerOrgCheckRequest": ("dingtalk.oapi.retail.seller.org.check", "POST", ("userid",), ()),
+    "OapiRetailSellerOrgdetailQueryRequest": ("dingtalk.oapi.retail.seller.orgdetail.query", "POST", ("userid",), ()),
+    "OapiRetailSellerQueryRequest": ("dingtalk.oapi.retail.seller.query", "POST", ("userid",), ()),
+    "OapiRetailSellerSyncRequest": ("dingtalk.oapi.retail.seller.sync", "POST", ("seller_param", "userid"), ()),
+    "OapiRetailUserBindapplyRequest": ("dingtalk.oapi.retail.user.bindapply", "POST", ("channel", "request"), ()),
+    "OapiRetailUserBindqueryRequest": ("dingtalk.oapi.retail.user.bindquery", "POST", ("associate_union_id", "channel"), ()),
+    "OapiRetailUserTokenCheckRequest": ("dingtalk.oapi.retail.user.token.check", "POST", ("channel", "token"), ()),
+    "OapiRetailUserTokenGenerateRequest": ("dingtalk.oapi.retail.user.token.generate", "POST", ("channel", "request"), ()),
+    "OapiRetailUserUnbindRequest": ("dingtalk.oapi.retail.user.unbind", "POST", ("associate_union_id", "channel", "outer_id", "sub_outer_id"), ()),
+    "OapiRetailUserUnionidqueryRequest": ("dingtalk.oapi.retail.user.unionidquery", "POST", ("channel", "outer_id", "sub_outer_id"), ()),
+    "OapiRhinoCooperationCarrierGetRequest": ("dingtalk.oapi.rhino.cooperation.carrier.get", "POST", ("carrier_id", "tenant_id", "userid"), ()),
+    "OapiRhinoDeviceUniquecodeGetRequest": ("dingtalk.oapi.rhino.device.uniquecode.get", "POST", ("unique_code", "userid"), ()),
+    "OapiRhinoHumanresCorpemployeeGetRequest": ("dingtalk.oapi.rhino.humanres.corpemployee.get", "POST", ("query_corp_employee_param",), ()),
+    "OapiRhinoHumanresEmployeeProcessBestdeviceQueryRequest": ("dingtalk.oapi.rhino.humanres.employee.process.bestdevice.query", "POST", ("available_device_models", "employee_process_capacity_units", "tenant_id", "userid"), ()),
+    "OapiRhinoHumanresEmployeeProcessCapacityQueryRequest": ("dingtalk.oapi.rhino.humanres.employee.process.capacity.query", "POST", ("category", "process_structural_cluster_id_list", "tenant_id", "userid", "work_nos"), ()),
+    "OapiRhinoHumanresEmployeeProductionteamListRequest": ("dingtalk.oapi.rhino.humanres.employee.productionteam.list", "POST", ("query_employee_production_team_param",), ()),
+    "OapiRhinoHumanresProcessStructuralClusterQueryRequest": ("dingtalk.oapi.rhino.humanres.process.structural.cluster.query", "POST", ("biz_id_process_list", "userid"), ()),
+    "OapiRhinoHumanresProductionteamQueryRequest": ("dingtalk.oapi.rhino.humanres.productionteam.query", "POST", ("query_production_team_param",), ()),
+    "OapiRhinoMosExecClothesBatchUnscrapRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.batch.unscrap", "POST", ("batch_clothes_perform_req",), ()),
+    "OapiRhinoMosExecClothesConditionGetRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.condition.get", "POST", ("get_clothes_condition_req",), ()),
+    "OapiRhinoMosExecClothesCountRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.count", "POST", ("request",), ()),
+    "OapiRhinoMosExecClothesCreateRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.create", "POST", ("additional_operations", "auto_start", "biz_type", "clothes", "entity_type", "order_id", "source", "tenant_id", "userid"), ()),
+    "OapiRhinoMosExecClothesFinishRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.finish", "POST", ("entity_ids", "order_id", "tenant_id", "userid"), ()),
+    "OapiRhinoMosExecClothesGetRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.get", "POST", ("entity_ids", "order_id", "tenant_id", "userid"), ()),
+    "OapiRhinoMosExecClothesGroupbyoperationCountRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.groupbyoperation.count", "POST", ("request",), ()),
+    "OapiRhinoMosExecClothesIdListbypageRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.id.listbypage", "POST", ("req",), ()),
+    "OapiRhinoMosExecClothesScrapRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.scrap", "POST", ("entity_ids", "ext_properties", "order_id", "tenant_id", "userid"), ()),
+    "OapiRhinoMosExecClothesSizeCountRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.size.count", "POST", ("req",), ()),
+    "OapiRhinoMosExecClothesSynccreateRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.synccreate", "POST", ("additional_operations", "auto_start", "biz_type", "clothes", "entity_type", "order_id", "source", "tenant_id", "userid"), ()),
+    "OapiRhinoMosExecClothesUnfinishRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.unfinish", "POST", ("req",), ()),
+    "OapiRhinoMosExecClothesUnperformedFilterRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.unperformed.filter", "POST", ("req",), ()),
+    "OapiRhinoMosExecClothesUnperformedGetRequest": ("dingtalk.oapi.rhino.mos.exec.clothes.unperformed.get", "POST", ("req",), ()),
+    "OapiRhinoMosExecOperationConditionGetRequest": ("dingtalk.oapi.rhino.mos.exec.operation.condition.get", "POST", ("get_clothes_condition_req",), ()),
+    "OapiRhinoMosExecOperationConditionInactiveRequest": ("dingtalk.oapi.rhino.mos.exec.operation.condition.inactive", "POST", ("inactive_operation_req",), ()),
+    "OapiRhinoMosExecPerformBatchCreateRequest": ("dingtalk.oapi.rhino.mos.exec.perform.batch.create", "POST", ("batch_create_operation_req",), ()),
+    "OapiRhinoMosExecPerformCancelRequest": ("dingtalk.oapi.rhino.mos.exec.perform.cancel", "POST", ("context", "operation_perform_record_ids", "order_id", "stop_schedule", "tenant_id", "userid"), ()),
+    "OapiRhinoMosExecPerformConditionalFinishRequest": ("dingtalk.oapi.rhino.mos.exec.perform.conditional.finish", "POST", ("device_ids", "entity_condition", "operation_uids", "order_id", "tenant_id", "userid", "work_nos"), ()),
+    "OapiRhinoMosExecPerformConditionalStartRequest": ("dingtalk.oapi.rhino.mos.exec.perform.conditional.start", "POST", ("device_ids", "entity_condition", "operation_uids", "order_id", "tenant_id", "userid", "work_nos"), ()),
+    "OapiRhinoMosExecPerformContextAddRequest": ("dingtalk.oapi.rhino.mos.exec.perform.context.add", "POST", ("context", "operation_record_ids", "order_id", "tenant_id", "userid"), ()),
+    "OapiRhinoMosExecPerformCreateRequest": ("dingtalk.oapi.rhino.mos.exec.perform.create", "POST", ("operations", "order_id", "tenant_id", "userid"), ()),
+    "OapiRhinoMosExecPerformFinishRequest": ("dingtalk.oapi.rhino.mos.exec.perform.finish", "POST", ("device_ids", "operation_perform_record_ids", "order_id", "process_cost_time", "tenant_id", "userid", "work_nos"), ()),
+    "OapiRhinoMosExecPerformInactiveRequest": ("dingtalk.oapi.rhino.mos.exec.perform.inactive", "POST", ("ids", "order_id", "tenant_id", "userid"), ()),
+    "OapiRhinoMosExecPerformInvalidbyentopRequest": ("dingtalk.oapi.rhino.mos.exec.perform.invalidbyentop", "POST", ("req",), ()),
+    "OapiRhinoMosExecPerformQueryRequest": ("dingtalk.oapi.rhino.mos.exec.perform.query", "POST", ("active_condition", "entity_ids", "entity_type", "operation_uids", "order_id", "perform_status_list", "tenant_id", "userid", "workstation_codes"), ()),
+    "OapiRhinoMosExecPerformReworkRequest": ("dingtalk.oapi.rhino.mos.exec.perform.rework", "POST", ("context", "order_id", "rework_start_id", "tenant_id", "to_inactive_ids", "userid"), ()),
+    "OapiRhinoMosExecPerformStartRequest": ("dingtalk.oapi.rhino.mos.exec.perform.start", "POST", ("device_ids", "operation_perform_record_ids", "order_id", "tenant_id", "userid", "work_nos"), ()),
+    "OapiRhinoMosExecTrackBindRequest": ("dingtalk.oapi.rhino.mos.exec.track.bind", "POST", ("entities", "entity_type", "order_id", "tenant_id", "track_id", "track_type", "userid", "workstation_code"), ()),
+    "OapiRhinoMosExecTrackEntityconditionListRequest": ("dingtalk.oapi.rhino.mos.exec.track.entitycondition.list", "POST", ("req",), ()),
+    "OapiRhinoMosExecTrackTrackconditionListRequest": ("dingtalk.oapi.rhino.mos.exec.track.trackcondition.list", "POST", ("req",), ()),
+    "OapiRhinoMosExecTrackTrackersUnbindRequest": ("dingtalk.oapi.rhino.mos.exec.track.trackers.unbind", "POST", ("req",), ()),
+    "OapiRhinoMosExecTrackUnbindRequest": ("dingtalk.oapi.rhino.mos.exec.track.unbind", "POST", ("entities", "entity_type", "order_id", "tenant_id", "track_id", "track_type", "userid", "workstation_code"), ()),
+    "OapiRhinoMosLayoutOperationdefActiveflowRequest": ("dingtalk.oapi.rhino.mos.layout.operationdef.activeflow", "POST", ("flow_version", "order_id", "tenant_id", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefGetRequest": ("dingtalk.oapi.rhino.mos.layout.operationdef.get", "POST", ("flow_version", "need_assign_info", "operation_external_id", "operation_uid", "order_id", "tenant_id", "tmp_save", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefGetflowRequest": ("dingtalk.oapi.rhino.mos.layout.operationdef.getflow", "POST", ("flow_version", "need_assign_info", "order_id", "tenant_id", "tmp_save", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefSaveflowRequest": ("dingtalk.oapi.rhino.mos.layout.operationdef.saveflow", "POST", ("active", "flow_version", "operation_defs", "order_id", "source", "tenant_id", "tmp_save", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefsEditassignRequest": ("dingtalk.oapi.rhino.mos.layout.operationdefs.editassign", "POST", ("assign_info_modify_items", "order_id", "tenant_id", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefsListRequest": ("dingtalk.oapi.rhino.mos.layout.operationdefs.list", "POST", ("flow_version", "need_assignInfo", "operation_uids", "order_id", "tenant_id", "tmp_save", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefsListsimpleRequest": ("dingtalk.oapi.rhino.mos.layout.operationdefs.listsimple", "POST", ("operation_uids", "order_id", "tenant_id", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefsNextRequest": ("dingtalk.oapi.rhino.mos.layout.operationdefs.next", "POST", ("flow_version", "need_assign_info", "operation_external_id", "operation_uid", "order_id", "tenant_id", "tmp_save", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefsPrevRequest": ("dingtalk.oapi.rhino.mos.layout.operationdefs.prev", "POST", ("flow_version", "need_assign_info", "operation_external_id", "operation_uid", "order_id", "tenant_id", "tmp_save", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefsSectionfirstRequest": ("dingtalk.oapi.rhino.mos.layout.operationdefs.sectionfirst", "POST", ("flow_version", "need_assign_info", "order_id", "section_code", "tenant_id", "tmp_save", "userid"), ()),
+    "OapiRhinoMosLayoutOperationdefsSectionlastRequest": ("dingtalk.oapi.rhino.mos.layout.operationdefs.sectionlast", "POST", ("flow_version", "need_assign_info", "order_id", "section_code", "tenant_id", "tmp_save", "userid"), ()),
+    "OapiRhinoMosSpaceDeviceCheckInListRequest": ("dingtalk.oapi.rhino.mos.space.device.check.in.list", "POST", ("request",), ()),
+    "OapiRhinoMosSpaceDeviceCheckInListbydeviceRequest": ("dingtalk.oapi.rhino.mos.space.device.check.in.listbydevice", "POST", ("request",), ()),
+    "OapiRhinoMosSpaceDeviceCheckInRequest": ("dingtalk.oapi.rhino.mos.space.device.check.in", "POST", ("request",), ()),
+    "OapiRhinoMosSpaceDeviceCheckOutRequest": ("dingtalk.oapi.rhino.mos.space.device.check.out", "POST", ("request",), ()),
+    "OapiRhinoMosSpacePoiGetRequest": ("dingtalk.oapi.rhino.mos.space.poi.get", "POST", ("request",), ()),
+    "OapiRhinoMosSpacePoiListRequest": ("dingtalk.oapi.rhino.mos.space.poi.list", "POST", ("request",), ()),
+    "OapiRhinoMosSpacePoiUpsertRequest": ("dingtalk.oapi.rhino.mos.space.poi.upsert", "POST", ("request",), ()),
+    "OapiRhinoMosSpaceWorkerCheckInListRequest": ("dingtalk.oapi.rhino.mos.space.worker.check.in.list", "POST", ("request",), ()),
+    "OapiRhinoMosSpaceWorkerCheckInRequest": ("dingtalk.oapi.rhino.mos.space.worker.check.in", "POST", ("request",), ()),
+    "OapiRhinoMosSpaceWorkerCheckOutRequest": ("dingtalk.oapi.rhino.mos.space.worker.check.out", "POST", ("request",), ()),
+    "OapiRhinoMosSpaceWorkstationGetRequest": ("dingtalk.oapi.rhino.mos.space.workstation.get", "POST", ("request",), ()),
+    "OapiRhinoMosSpaceWorkstationListRequest": ("dingtalk.oapi.rhino.mos.space.workstation.list", "POST", ("request",), ()),
+    "OapiRhinoMosSpaceWorkstationUpsertRequest": ("dingtalk.oapi.rhino.mos.space.workstation.upsert", "POST", ("request",), ()),
+    "OapiRhinoOpenserviceQueryRequest": ("dingtalk.oapi.rhino.openservice.query", "POST", ("code", "gmt_create", "id", "tenent_id", "userid"), ()),
+    "OapiRhinoOrderBatchGetRequest": ("dingtalk.oapi.rhino.order.batch.get", "POST", ("req",), ()),
+    "OapiRhinoOrderDetailGetRequest": ("dingtalk.oapi.rhino.order.detail.get", "POST", ("req",), ()),
+    "OapiRhinoOrderQueryRequest": ("dingtalk.oapi.rhino.order.query", "POST", ("req",), ()),
+    "OapiRhinoOrderTagGetRequest": ("dingtalk.oapi.rhino.order.tag.get", "POST", ("req",), ()),
+    "OapiRhinoSalesOrderCustomInfoQueryRequest": ("dingtalk.oapi.rhino.sales.order.custom.info.query", "POST", ("req",), ()),
+    "OapiRhinoSalesOrderCustomInfoStatusChangeRequest": ("dingtalk.oapi.rhino.sales.order.custom.info.status.change", "POST", ("sales_order_custom_info_change_req",), ()),
+    "OapiRhinoTransportMaplocationQueryRequest": ("dingtalk.oapi.rhino.transport.maplocation.query", "POST", ("include_config", "poi_code_list", "tenant_id", "userid"), ()),
+    "OapiRobotIntelligentMessageSendRequest": ("dingtalk.oapi.robot.intelligent.message.send", "POST", ("at_union_ids", "msg_key", "msg_param", "open_conversation_id", "receiver_union_ids"), ()),
+    "OapiRobotMessageGetpushidRequest": ("dingtalk.oapi.robot.message.getpushid", "POST", (), ()),
+    "OapiRobotMessageGrouptaskQueryRequest": ("dingtalk.oapi.robot.message.grouptask.query", "POST", ("process_query_key", "token"), ()),
+    "OapiRobotMessageOrggrouptaskQueryRequest": ("dingtalk.oapi.robot.message.orggrouptask.query", "POST", ("chatbot_id", "open_conversation_id", "process_query_key", "token"), ()),
+    "OapiRobotMessageOtotaskQueryRequest": ("dingtalk.oapi.robot.message.ototask.query", "POST", ("chatbot_id", "process_query_key"), ()),
+    "OapiRobotMessageSendgroupRequest": ("dingtalk.oapi.robot.message.sendgroup", "POST", ("msg_key", "msg_param", "token"), ()),
+    "OapiRobotMessageSendorggroupRequest": ("dingtalk.oapi.robot.message.sendorggroup", "POST", ("chatbot_id", "msg_key", "msg_param", "open_conversation_id", "token"), ()),
+    "OapiRobotMessageSendotoRequest": ("dingtalk.oapi.robot.message.sendoto", "POST", ("chatbot_id", "msg_key", "msg_param", "staff_id"), ()),
+    "OapiRobotMessageStatisticsListRequest": ("dingtalk.oapi.robot.message.statistics.list", "POST", ("page", "page_size", "push_ids"), ()),
+    "OapiRobotMessageStatisticsListbyconversationidRequest": ("dingtalk.oapi.robot.message.statistics.listbyconversationid", "POST", ("conversation_ids", "page", "page_size", "push_id", "read_status"), ()),
+    "OapiRobotMessageStatisticsListbypushidRequest": ("dingtalk.oapi.robot.message.statistics.listbypushid", "POST", ("conversation_ids", "page", "page_size", "push_id"), ()),
+    "OapiRobotOrgIntelligentMessageSendRequest": ("dingtalk.oapi.robot.org.intelligent.message.send", "POST", ("at_user_ids", "msg_key", "msg_param", "open_conversation_id", "receiver_user_ids"), ()),
+    "OapiRobotSendRequest": ("dingtalk.oapi.robot.send", "POST", ("actionCard", "at", "feedCard", "link", "markdown", "msgtype", "text"), ()),
+    "OapiRoleAddRoleRequest": ("dingtalk.oapi.role.add_role", "POST", ("groupId", "roleName"), ()),
+    "OapiRoleAddrolegroupRequest": ("dingtalk.oapi.role.addrolegroup", "POST", ("name",), ()),
+    "OapiRoleAddrolesforempsRequest": ("dingtalk.oapi.role.addrolesforemps", "POST", ("roleIds", "userIds"), ()),
+    "OapiRoleDeleteroleRequest": ("dingtalk.oapi.role.deleterole", "POST", ("role_id",), ()),
+    "OapiRoleGetroleRequest": ("dingtalk.oapi.role.getrole", "POST", ("roleId",), ()),
+    "OapiRoleGetrolegroupRequest": ("dingtalk.oapi.role.getrolegroup", "POST", ("group_id",), ()),
+    "OapiRoleListRequest": ("dingtalk.oapi.role.list", "POST", ("offset", "size"), ()),
+    "OapiRoleRemoverolesforempsRequest": ("dingtalk.oapi.role.removerolesforemps", "POST", ("roleIds", "userIds"), ()),
+    "OapiRoleScopeUpdateRequest": ("dingtalk.oapi.role.scope.update", "POST", ("dept_ids", "role_id", "userid"), ()),
+    "OapiRoleSimplelistRequest": ("dingtalk.oapi.role.simplelist", "POST", ("offset", "role_id", "size"), ()),
+    "OapiRoleUpdateRoleRequest": ("dingtalk.oapi.role.update_role", "POST", ("roleId", "roleName"), ()),
+    "OapiRoleVisibleDeleteRequest": ("dingtalk.oapi.role.visible.delete", "POST", ("role_id",), ()),
+    "OapiRoleVisibleGetRequest": ("dingtalk.oapi.role.visible.get", "POST", ("offset", "role_id", "size"), ()),
+    "OapiRoleVisibleSetRequest": ("dingtalk.oapi.role.visible.set", "POST", ("role_id", "visible_role_ids"), ()),
+    "OapiSceneservicegroupGroupCreateRequest": ("dingtalk.oapi.sceneservicegroup.group.create", "POST", ("bizid", "group_name", "group_tag_names", "group_tagids", "member_staffids", "open_groupsetid", "open_teamid", "owner_staffId"), ()),
+    "OapiSceneservicegroupGroupGetRequest": ("dingtalk.oapi.sceneservicegroup.group.get", "POST", ("open_conversationid",), ()),
+    "OapiSceneservicegroupGroupQueryRequest": ("dingtalk.oapi.sceneservicegroup.group.query", "POST", ("cursor", "group_name", "open_conversationid", "open_groupsetid", "open_teamid", "size"), ()),
+    "OapiSceneservicegroupGroupsetCreateRequest": ("dingtalk.oapi.sceneservicegroup.groupset.create", "POST", ("group_templateid", "groupset_name", "open_teamid"), ()),
+    "OapiSceneservicegroupMessageSendRequest": ("dingtalk.oapi.sceneservicegroup.message.send", "POST", ("at_dingtalkids", "at_mobiles", "at_unionids", "bizid", "btn_orientation", "btns", "content", "is_at_all", "message_type", "open_conversationid", "receiver_dingtalkids", "receiver_mobiles", "receiver_unionids", "title"), ()),
+    "OapiServiceActivateSuiteRequest": ("dingtalk.oapi.service.activate_suite", "POST", ("auth_corpid", "permanent_code", "suite_key"), ()),
+    "OapiServiceGetAgentRequest": ("dingtalk.oapi.service.get_agent", "POST", ("agentid", "auth_corpid", "permanent_code", "suite_key"), ()),
+    "OapiServiceGetAuthInfoRequest": ("dingtalk.oapi.service.get_auth_info", "POST", ("auth_corpid", "suite_key"), ()),
+    "OapiServiceGetCorpTokenRequest": ("dingtalk.oapi.service.get_corp_token", "POST", ("auth_corpid", "permanent_code"), ()),
+    "OapiServiceGetPermanentCodeRequest": ("dingtalk.oapi.service.get_permanent_code", "POST", ("tmp_auth_code",), ()),
+    "OapiServiceGetSuiteTokenRequest": ("dingtalk.oapi.service.get_suite_token", "POST", ("suite_key", "suite_secret", "suite_ticket"), ()),
+    "OapiServiceGetUnactiveCorpRequest": ("dingtalk.oapi.service.get_unactive_corp", "POST", ("app_id",), ()),
+    "OapiServiceReauthCorpRequest": ("dingtalk.oapi.service.reauth_corp", "POST", ("app_id", "corpid_list"), ()),
+    "OapiServiceSetCorpIpwhitelistRequest": ("dingtalk.oapi.service.set_corp_ipwhitelist", "POST", ("auth_corpid", "ip_whitelist"), ()),
+    "OapiServiceaccountAddRequest": ("dingtalk.oapi.serviceaccount.add", "POST", ("avatar_media_id", "brief", "desc", "name", "preview_media_id"), ()),
+    "OapiServiceaccountGetRequest": ("dingtalk.oapi.serviceaccount.get", "POST", ("unionid",), ()),
+    "OapiServiceaccountListRequest": ("dingtalk.oapi.serviceaccount.list", "POST", ("pageSize", "pageStart"), ()),
+    "OapiServiceaccountMenuGetRequest": ("dingtalk.oapi.serviceaccount.menu.get", "POST", ("unionid",), ()),
+    "OapiServiceaccountMenuUpdateRequest": ("dingtalk.oapi.serviceaccount.menu.update", "POST", ("menu", "unionid"), ()),
+    "OapiServiceaccountUpdateRequest": ("dingtalk.oapi.serviceaccount.update", "POST", ("avatar_media_id", "brief", "desc", "name", "preview_media_id", "status", "unionid"), ()),
+    "OapiServicegroupMessageSendRequest": ("dingtalk.oapi.servicegroup.message.send", "POST", ("conversation_message", "order_id"), ()),
+    "OapiSmartbotMsgPushRequest": ("dingtalk.oapi.smartbot.msg.push", "POST", ("chat_id_list", "msg", "to_all_user", "user_id_list"), ()),
+    "OapiSmartdeviceApplyoutidRequest": ("dingtalk.oapi.smartdevice.applyoutid", "POST", ("dev_serv_id", "sn"), ()),
+    "OapiSmartdeviceAtmachineGetByDeptidRequest": ("dingtalk.oapi.smartdevice.atmachine.get_by_deptid", "POST", ("param",), ()),
+    "OapiSmartdeviceAtmachineGetByUseridRequest": ("dingtalk.oapi.smartdevice.atmachine.get_by_userid", "POST", ("param",), ()),
+    "OapiSmartdeviceAtmachineUserUpdateRequest": ("dingtalk.oapi.smartdevice.atmachine.user.update", "POST", ("param",), ()),
+    "OapiSmartdeviceBatcheventPostRequest": ("dingtalk.oapi.smartdevice.batchevent.post", "POST", ("device_event_vos",), ()),
+    "OapiSmartdeviceBindCreateRequest": ("dingtalk.oapi.smartdevice.bind.create", "POST", ("device_bind_req_vo",), ()),
+    "OapiSmartdeviceDeviceQueryRequest": ("dingtalk.oapi.smartdevice.device.query", "POST", ("device_query_vo",), ()),
+    "OapiSmartdeviceDeviceQuerybyidRequest": ("dingtalk.oapi.smartdevice.device.querybyid", "POST", ("device_query_vo",), ()),
+    "OapiSmartdeviceDeviceQuerylistRequest": ("dingtalk.oapi.smartdevice.device.querylist", "POST", ("page_query_vo",), ()),
+    "OapiSmartdeviceDeviceUnbindRequest": ("dingtalk.oapi.smartdevice.device.unbind", "POST", ("device_unbind_vo",), ()),
+    "OapiSmartdeviceDeviceUpdatenickRequest": ("dingtalk.oapi.smartdevice.device.updatenick", "POST", ("device_nick_modify_vo",), ()),
+    "OapiSmartdeviceDevicememberListRequest": ("dingtalk.oapi.smartdevice.devicemember.list", "POST", ("cursor", "device_id", "size"), ()),
+    "OapiSmartdeviceDevicememberRemoveallRequest": ("dingtalk.oapi.smartdevice.devicemember.removeall", "POST", ("device_id",), ()),
+    "OapiSmartdeviceDevicememberSyncRequest": ("dingtalk.oapi.smartdevice.devicemember.sync", "POST", ("add_userids", "del_userids", "device_id"), ()),
+    "OapiSmartdeviceEventPostRequest": ("dingtalk.oapi.smartdevice.event.post", "POST", ("device_event_vo",), ()),
+    "OapiSmartdeviceExternalBindRequest": ("dingtalk.oapi.smartdevice.external.bind", "POST", ("device_bind_req_vo",), ()),
+    "OapiSmartdeviceFaceFeatureRequest": ("dingtalk.oapi.smartdevice.face.feature", "POST", ("model_type", "model_version", "userid_list"), ()),
+    "OapiSmartdeviceFacegroupCreateRequest": ("dingtalk.oapi.smartdevice.facegroup.create", "POST", ("bg_img_url", "biz_id", "end_time", "greeting_msg", "start_time", "status", "title"), ()),
+    "OapiSmartdeviceFacegroupDeviceListRequest": ("dingtalk.oapi.smartdevice.facegroup.device.list", "POST", ("biz_id", "cursor", "mode", "size", "type"), ()),
+    "OapiSmartdeviceFacegroupDeviceUpdateRequest": ("dingtalk.oapi.smartdevice.facegroup.device.update", "POST", ("add_device_ids", "biz_id", "del_device_ids"), ()),
+    "OapiSmartdeviceFacegroupEnableRequest": ("dingtalk.oapi.smartdevice.facegroup.enable", "POST", ("biz_id", "device_ids", "enable"), ()),
+    "OapiSmartdeviceFacegroupGetRequest": ("dingtalk.oapi.smartdevice.facegroup.get", "POST", ("biz_id",), ()),
+    "OapiSmartdeviceFacegroupMemberListRequest": ("dingtalk.oapi.smartdevice.facegroup.member.list", "POST", ("biz_id", "cursor", "size"), ()),
+    "OapiSmartdeviceFacegroupMemberUpdateRequest": ("dingtalk.oapi.smartdevice.facegroup.member.update", "POST", ("add_user_ids", "biz_id", "del_user_ids"), ()),
+    "OapiSmartdeviceFacegroupRemoveallRequest": ("dingtalk.oapi.smartdevice.facegroup.removeall", "POST", ("biz_id",), ()),
+    "OapiSmartdeviceFacegroupUpdateRequest": ("dingtalk.oapi.smartdevice.facegroup.update", "POST", ("bg_img_url", "biz_id", "end_time", "greeting_msg", "start_time", "status", "title"), ()),
+    "OapiSmartdeviceFacelevelGetRequest": ("dingtalk.oapi.smartdevice.facelevel.get", "POST", ("userid_list",), ()),
+    "OapiSmartdeviceFocusdetailGetRequest": ("dingtalk.oapi.smartdevice.focusdetail.get", "POST", ("cursor", "size"), ()),
+    "OapiSmartdeviceHasfaceRequest": ("dingtalk.oapi.smartdevice.hasface", "POST", ("userid_list",), ()),
+    "OapiSmartdeviceMeetingroomCheckinRequest": ("dingtalk.oapi.smartdevice.meetingroom.checkin", "POST", ("bookid", "userid"), ()),
+    "OapiSmartdeviceMeetingroomListRequest": ("dingtalk.oapi.smartdevice.meetingroom.list", "POST", ("cursor", "size"), ()),
+    "OapiSmartdeviceMeetingroomParticipantListRequest": ("dingtalk.oapi.smartdevice.meetingroom.participant.list", "POST", ("bookid", "cursor", "size"), ()),
+    "OapiSmartdevicePrintdetailGetRequest": ("dingtalk.oapi.smartdevice.printdetail.get", "POST", ("cursor", "size"), ()),
+    "OapiSmartdeviceQrQueryRequest": ("dingtalk.oapi.smartdevice.qr.query", "POST", ("qr_content",), ()),
+    "OapiSmartdeviceRemovefaceRequest": ("dingtalk.oapi.smartdevice.removeface", "POST", ("userid",), ()),
+    "OapiSmartdeviceVisitorAddvisitorRequest": ("dingtalk.oapi.smartdevice.visitor.addvisitor", "POST", ("visitor_vo",), ()),
+    "OapiSmartdeviceVisitorEditvisitorRequest": ("dingtalk.oapi.smartdevice.visitor.editvisitor", "POST", ("reservation_id", "visitor_vo"), ()),
+    "OapiSmartdeviceVisitorRemovevisitorRequest": ("dingtalk.oapi.smartdevice.visitor.removevisitor", "POST", ("reservation_id",), ()),
+    "OapiSmartdeviceVisitorSendnotifyRequest": ("dingtalk.oapi.smartdevice.visitor.sendnotify", "POST", ("reservation_id", "visitor_notify_vo"), ()),
+    "OapiSmartworkHrmEmployeeAddpreentryRequest": ("dingtalk.oapi.smartwork.hrm.employee.addpreentry", "POST", ("param",), ()),
+    "OapiSmartworkHrmEmployeeAttachmentUpdateRequest": ("dingtalk.oapi.smartwork.hrm.employee.attachment.update", "POST", ("agentid", "param"), ()),
+    "OapiSmartworkHrmEmployeeDismissionUpdateRequest": ("dingtalk.oapi.smartwork.hrm.employee.dismission.update", "POST", ("agentid", "param"), ()),
+    "OapiSmartworkHrmEmployeeFieldGrouplistRequest": ("dingtalk.oapi.smartwork.hrm.employee.field.grouplist", "POST", ("agentid",), ()),
+    "OapiSmartworkHrmEmployeeFieldListRequest": ("dingtalk.oapi.smartwork.hrm.employee.field.list", "POST", ("agentid",), ()),
+    "OapiSmartworkHrmEmployeeListRequest": ("dingtalk.oapi.smartwork.hrm.employee.list", "POST", ("agentid", "field_filter_list", "userid_list"), ()),
+    "OapiSmartworkHrmEmployeeListbycertRequest": ("dingtalk.oapi.smartwork.hrm.employee.listbycert", "POST", ("params",), ()),
+    "OapiSmartworkHrmEmployeeListcontactRequest": ("dingtalk.oapi.smartwork.hrm.employee.listcontact", "POST", ("userid_list",), ()),
+    "OapiSmartworkHrmEmployeeListdimissionRequest": ("dingtalk.oapi.smartwork.hrm.employee.listdimission", "POST", ("userid_list",), ()),
+    "OapiSmartworkHrmEmployeeOnjoblistQueryRequest": ("dingtalk.oapi.smartwork.hrm.employee.onjoblist.query", "POST", ("cursor", "search_param", "size", "status_list"), ()),
+    "OapiSmartworkHrmEmployeeQuerydimissionRequest": ("dingtalk.oapi.smartwork.hrm.employee.querydimission", "POST", ("offset", "size"), ()),
+    "OapiSmartworkHrmEmployeeQueryonjobRequest": ("dingtalk.oapi.smartwork.hrm.employee.queryonjob", "POST", ("offset", "size", "status_list"), ()),
+    "OapiSmartworkHrmEmployeeQuerypreentryRequest": ("dingtalk.oapi.smartwork.hrm.employee.querypreentry", "POST", ("offset", "size"), ()),
+    "OapiSmartworkHrmEmployeeUnionexportRequest": ("dingtalk.oapi.smartwork.hrm.employee.unionexport", "POST", ("param",), ()),
+    "OapiSmartworkHrmEmployeeUpdateRequest": ("dingtalk.oapi.smartwork.hrm.employee.update", "POST", ("agentid", "param"), ()),
+    "OapiSmartworkHrmEmployeeV2ListRequest": ("dingtalk.oapi.smartwork.hrm.employee.v2.list", "POST", ("agentid", "field_filter_list", "userid_list"), ()),
+    "OapiSmartworkHrmEmployeeV2UpdateRequest": ("dingtalk.oapi.smartwork.hrm.employee.v2.update", "POST", ("agentid", "param"), ()),
+    "OapiSmartworkHrmFlexibleApplytokenRequest": ("dingtalk.oapi.smartwork.hrm.flexible.applytoken", "POST", ("agentid", "opt_user_id"), ()),
+    "OapiSmartworkHrmMasterCheckRequest": ("dingtalk.oapi.smartwork.hrm.master.check", "POST", ("biz_uk", "tenantid"), ()),
+    "OapiSmartworkHrmMasterCorpconfigUpdateRequest": ("dingtalk.oapi.smartwork.hrm.master.corpconfig.update", "POST", ("scope_code", "status", "tenant_id"), ()),
+    "OapiSmartworkHrmMasterDeleteRequest": ("dingtalk.oapi.smartwork.hrm.master.delete", "POST", ("biz_data", "tenantid"), ()),
+    "OapiSmartworkHrmMasterSaveRequest": ("dingtalk.oapi.smartwork.hrm.master.save", "POST", ("biz_data", "tenant_id"), ()),
+    "OapiSmartworkHrmMasterdataSaveRequest": ("dingtalk.oapi.smartwork.hrm.masterdata.save", "POST", ("biz_data_fields", "outer_id", "scope_code", "userid"), ()),
+    "OapiSmartworkHrmNavigationbarConfigGetRequest": ("dingtalk.oapi.smartwork.hrm.navigationbar.config.get", "POST", ("change_param", "type", "userid"), ()),
+    "OapiSmartworkHrmOrganizationDeptGetRequest": ("dingtalk.oapi.smartwork.hrm.organization.dept.get", "POST", ("dept_id", "field_code_list"), ()),
+    "OapiSmartworkHrmOrganizationDeptMetaGetRequest": ("dingtalk.oapi.smartwork.hrm.organization.dept.meta.get", "POST", (), ()),
+    "OapiSmartworkHrmOrganizationDeptUpdateRequest": ("dingtalk.oapi.smartwork.hrm.organization.dept.update", "POST", ("attributeVOS", "dept_id"), ()),
+    "OapiSmartworkHrmRosterMetaGetRequest": ("dingtalk.oapi.smartwork.hrm.roster.meta.get", "POST", ("agentid",), ()),
+    "OapiSmartworkHrmSmsSendforpayslipRequest": ("dingtalk.oapi.smartwork.hrm.sms.sendforpayslip", "POST", ("param",), ()),
+    "OapiSnsConversationInfoRequest": ("dingtalk.oapi.sns.conversation.info", "POST", ("open_conversation_id",), ()),
+    "OapiSnsConversationMemberListRequest": ("dingtalk.oapi.sns.conversation.member.list", "POST", ("cursor", "open_conversation_id", "size"), ()),
+    "OapiSnsGetPersistentCodeRequest": ("dingtalk.oapi.sns.get_persistent_code", "POST", ("tmp_auth_code",), ()),
+    "OapiSnsGetSnsTokenRequest": ("dingtalk.oapi.sns.get_sns_token", "POST", ("openid", "persistent_code"), ()),
+    "OapiSnsGettokenRequest": ("dingtalk.oapi.sns.gettoken", "GET", ("appid", "appsecret"), ()),
+    "OapiSnsGetuserinfoBycodeRequest": ("dingtalk.oapi.sns.getuserinfo_bycode", "POST", ("tmp_auth_code",), ()),
+    "OapiSnsGetuserinfoRequest": ("dingtalk.oapi.sns.getuserinfo", "GET", ("sns_token",), ()),
+    "OapiSnsSendMsgRequest": ("dingtalk.oapi.sns.send_msg", "POST", ("code", "msg"), ()),
+    "OapiSnsVerifyMobileRequest": ("dingtalk.oapi.sns.verify_mobile", "POST", ("mobile",), ()),
+    "OapiSsoGettokenRequest": ("dingtalk.oapi.sso.gettoken", "GET", ("corpid", "corpsecret"), ()),
+    "OapiSsoGetuserinfoRequest": ("dingtalk.oapi.sso.getuserinfo", "GET", ("access_token", "code"), ()),
+    "OapiStatisticsDetailsRequest": ("dingtalk.oapi.statistics.details", "POST", ("type",), ()),
+    "OapiTdpProjectBasicCreateRequest": ("dingtalk.oapi.tdp.project.basic.create", "POST", ("microapp_agent_id", "operator_userid", "project"), ()),
+    "OapiTdpProjectBasicDeleteRequest": ("dingtalk.oapi.tdp.project.basic.delete", "POST", ("microapp_agent_id", "operator_userid", "project_id"), ()),
+    "OapiTdpProjectBasicGetRequest": ("dingtalk.oapi.tdp.project.basic.get", "POST", ("microapp_agent_id", "project_id"), ()),
+    "OapiTdpProjectBasicUpdateRequest": ("dingtalk.oapi.tdp.project.basic.update", "POST", ("microapp_agent_id", "operator_userid", "project", "project_id"), ()),
+    "OapiTdpProjectMemberAddRequest": ("dingtalk.oapi.tdp.project.member.add", "POST", ("microapp_agent_id", "operator_userid", "project_id", "userid"), ()),
+    "OapiTdpProjectMemberBatchaddRequest": ("dingtalk.oapi.tdp.project.member.batchadd", "POST", ("microapp_agent_id", "operator_userid", "project_id", "userids"), ()),
+    "OapiTdpProjectMemberBatchremoveRequest": ("dingtalk.oapi.tdp.project.member.batchremove", "POST", ("microapp_agent_id", "operator_userid", "project_id", "userids"), ()),
+    "OapiTdpProjectMemberGetbyprojectRequest": ("dingtalk.oapi.tdp.project.member.getbyproject", "POST", ("microapp_agent_id", "page_request", "project_id"), ()),
+    "OapiTdpProjectMemberRemoveRequest": ("dingtalk.oapi.tdp.project.member.remove", "POST", ("member_id", "microapp_agent_id", "operator_userid"), ()),
+    "OapiTdpProjectMemberRemovebyprojectRequest": ("dingtalk.oapi.tdp.project.member.removebyproject", "POST", ("microapp_agent_id", "operator_userid", "project_id"), ()),
+    "OapiTdpTaskBasicCreateRequest": ("dingtalk.oapi.tdp.task.basic.create", "POST", ("microapp_agent_id", "operator_userid", "task"), ()),
+    "OapiTdpTaskBasicDeleteRequest": ("dingtalk.oapi.tdp.task.basic.delete", "POST", ("microapp_agent_id", "operator_userid", "task_id"), ()),
+    "OapiTdpTaskBasicDeletebyprojectRequest": ("dingtalk.oapi.tdp.task.basic.deletebyproject", "POST", ("microapp_agent_id", "operator_userid", "project_id"), ()),
+    "OapiTdpTaskBasicGetRequest": ("dingtalk.oapi.tdp.task.basic.get", "POST", ("microapp_agent_id", "task_id"), ()),
+    "OapiTdpTaskBasicGetbysourceidRequest": ("dingtalk.oapi.tdp.task.basic.getbysourceid", "POST", ("agent_id", "source", "source_id"), ()),
+    "OapiTdpTaskBasicUpdateRequest": ("dingtalk.oapi.tdp.task.basic.update", "POST", ("microapp_agent_id", "operator_userid", "task", "task_id"), ()),
+    "OapiTdpTasklistAddbyprojectRequest": ("dingtalk.oapi.tdp.tasklist.addbyproject", "POST", ("microapp_agent_id", "operator_userid", "project_id", "userid"), ()),
+    "OapiTdpTasklistHiddenCancelRequest": ("dingtalk.oapi.tdp.tasklist.hidden.cancel", "POST", ("agentid", "operator_userid", "userid"), ()),
+    "OapiTdpTasklistHidebyorgRequest": ("dingtalk.oapi.tdp.tasklist.hidebyorg", "POST", ("microapp_agent_id", "operator_userid", "userid"), ()),
+    "OapiTdpTasklistHidebyprojectRequest": ("dingtalk.oapi.tdp.tasklist.hidebyproject", "POST", ("microapp_agent_id", "operator_userid", "project_id", "userid"), ()),
+    "OapiTrainingGroupinfoGetRequest": ("dingtalk.oapi.training.groupinfo.get", "POST", ("request",), ()),
+    "OapiUnionCooperateInfoListRequest": ("dingtalk.oapi.union.cooperate.info.list", "POST", ("status",), ()),
+    "OapiUnionCooperateJoinedListRequest": ("dingtalk.oapi.union.cooperate.joined.list", "POST", ("status",), ()),
+    "OapiUserAssociatedUnionidTransferRequest": ("dingtalk.oapi.user.associated_unionid.transfer", "POST", ("associated_unionid",), ()),
+    "OapiUserBatchdeleteRequest": ("dingtalk.oapi.user.batchdelete", "POST", ("useridlist",), ()),
+    "OapiUserCanAccessMicroappRequest": ("dingtalk.oapi.user.can_access_microapp", "GET", ("appId", "userId"), ()),
+    "OapiUserCorpinfoListRequest": ("dingtalk.oapi.user.corpinfo.list", "POST", ("corp_name", "mobile"), ()),
+    "OapiUserCountRequest": ("dingtalk.oapi.user.count", "POST", ("only_active",), ()),
+    "OapiUserCreateRequest": ("dingtalk.oapi.user.create", "POST", ("department", "email", "extattr", "hiredDate", "isHide", "isSenior", "jobnumber", "mobile", "name", "orderInDepts", "orgEmail", "position", "positionInDepts", "remark", "tel", "userid", "workPlace"), ()),
+    "OapiUserDeleteRequest": ("dingtalk.oapi.user.delete", "GET", ("userid",), ()),
+    "OapiUserGetAdminRequest": ("dingtalk.oapi.user.get_admin", "GET", (), ()),
+    "OapiUserGetAdminScopeRequest": ("dingtalk.oapi.user.get_admin_scope", "POST", ("userid",), ()),
+    "OapiUserGetByMobileRequest": ("dingtalk.oapi.user.get_by_mobile", "GET", ("mobile",), ()),
+    "OapiUserGetDeptMemberRequest": ("dingtalk.oapi.user.getDeptMember", "GET", ("deptId",), ()),
+    "OapiUserGetOrgUserCountRequest": ("dingtalk.oapi.user.get_org_user_count", "GET", ("onlyActive",), ()),
+    "OapiUserGetRequest": ("dingtalk.oapi.user.get", "GET", ("userid",), ()),
+    "OapiUserGetUseridByUnionidRequest": ("dingtalk.oapi.user.getUseridByUnionid", "GET", ("unionid",), ()),
+    "OapiUserGetbyunionidRequest": ("dingtalk.oapi.user.getbyunionid", "POST", ("unionid",), ()),
+    "OapiUserGetuserinfoRequest": ("dingtalk.oapi.user.getuserinfo", "GET", ("code",), ()),
+    "OapiUserListRequest": ("dingtalk.oapi.user.list", "GET", ("department_id", "lang", "offset", "order", "size"), ()),
+    "OapiUserListadminRequest": ("dingtalk.oapi.user.listadmin", "POST", (), ()),
+    "OapiUserListbypageRequest": ("dingtalk.oapi.user.listbypage", "GET", ("department_id", "lang", "offset", "order", "size"), ()),
+    "OapiUserListidRequest": ("dingtalk.oapi.user.listid", "POST", ("dept_id",), ()),
+    "OapiUserListsimpleRequest": ("dingtalk.oapi.user.listsimple", "POST", ("contain_access_limit", "cursor", "dept_id", "language", "order_field", "size"), ()),
+    "OapiUserSeniorSettingRequest": ("dingtalk.oapi.user.senior.setting", "POST", ("open", "permit_staffIds", "protect_scenes", "senior_staffId"), ()),
+    "OapiUserSeniorWhitelistSetRequest": ("dingtalk.oapi.user.senior.whitelist.set", "POST", ("senior_whitelist_request",), ()),
+    "OapiUserSimplelistRequest": ("dingtalk.oapi.user.simplelist", "GET", ("department_id", "lang", "offset", "order", "size"), ()),
+    "OapiUserTokenGetRequest": ("dingtalk.oapi.user.token.get", "POST", ("userid",), ()),
+    "OapiUserUpdateRequest": ("dingtalk.oapi.user.update", "POST", ("department", "email", "extattr", "hiredDate", "isHide", "isSenior", "jobnumber", "lang", "managerUserid", "mobile", "name", "orderInDepts", "orgEmail", "position", "positionInDepts", "remark", "tel", "userid", "workPlace"), ()),
+    "OapiV2DepartmentCreateRequest": ("dingtalk.oapi.v2.department.create", "POST", ("brief", "create_dept_group", "dept_permits", "extension", "hide_dept", "name", "order", "outer_dept", "outer_dept_only_self", "outer_permit_depts", "outer_permit_users", "parent_id", "source_identifier", "telephone", "user_permits"), ()),
+    "OapiV2DepartmentDeleteRequest": ("dingtalk.oapi.v2.department.delete", "POST", ("dept_id",), ()),
+    "OapiV2DepartmentGetRequest": ("dingtalk.oapi.v2.department.get", "POST", ("dept_id", "language"), ()),
+    "OapiV2DepartmentListparentbydeptRequest": ("dingtalk.oapi.v2.department.listparentbydept", "POST", ("dept_id",), ()),
+    "OapiV2DepartmentListparentbyuserRequest": ("dingtalk.oapi.v2.department.listparentbyuser", "POST", ("userid",), ()),
+    "OapiV2DepartmentListsubRequest": ("dingtalk.oapi.v2.department.listsub", "POST", ("dept_id", "language"), ()),
+    "OapiV2DepartmentListsubidRequest": ("dingtalk.oapi.v2.department.listsubid", "POST", ("dept_id",), ()),
+    "OapiV2DepartmentUpdateRequest": ("dingtalk.oapi.v2.department.update", "POST", ("auto_add_user", "brief", "create_dept_group", "dept_id", "dept_manager_userid_list", "dept_permits", "extension", "group_contain_hidden_dept", "group_contain_outer_dept", "group_contain_sub_dept", "hide_dept", "language", "name", "order", "org_dept_owner", "outer_dept", "outer_dept_only_self", "outer_permit_depts", "outer_permit_users", "parent_id", "source_identifier", "telephone", "user_permits"), ()),
+    "OapiV2SafeQuerystatusRequest": ("dingtalk.oapi.v2.safe.querystatus", "POST", ("userid",), ()),
+    "OapiV2SafeSetdisableRequest": ("dingtalk.oapi.v2.safe.setdisable", "POST", ("reason", "userid"), ()),
+    "OapiV2SafeSetenableRequest": ("dingtalk.oapi.v2.safe.setenable", "POST", ("userid",), ()),
+    "OapiV2UserCreateRequest": ("dingtalk.oapi.v2.user.create", "POST", ("dept_id_list", "dept_order_list", "dept_position_list", "dept_title_list", "email", "exclusive_account", "exclusive_account_type", "extension", "hide_mobile", "hired_date", "init_password", "job_number", "login_email", "login_id", "mobile", "name", "org_email", "remark", "senior_mode", "telephone", "title", "userid", "work_place"), ()),
+    "OapiV2UserDeleteRequest": ("dingtalk.oapi.v2.user.delete", "POST", ("userid",), ()),
+    "OapiV2UserGetRequest": ("dingtalk.oapi.v2.user.get", "POST", ("language", "userid"), ()),
+    "OapiV2UserGetbymobileRequest": ("dingtalk.oapi.v2.user.getbymobile", "POST", ("mobile", "support_exclusive_account_search"), ()),
+    "OapiV2UserGetuserinfoRequest": ("dingtalk.oapi.v2.user.getuserinfo", "POST", ("code",), ()),
+    "OapiV2UserListRequest": ("dingtalk.oapi.v2.user.list", "POST", ("contain_access_limit", "cursor", "dept_id", "language", "order_field", "size"), ()),
+    "OapiV2UserUpdateRequest": ("dingtalk.oapi.v2.user.update", "POST", ("dept_id_list", "dept_order_list", "dept_position_list", "dept_title_list", "email", "extension", "hide_mobile", "hired_date", "init_password", "job_number", "language", "loginId", "mobile", "name", "org_email", "remark", "senior_mode", "telephone", "title", "userid", "work_place"), ()),
+    "OapiVillageScreenGetRequest": ("dingtalk.oapi.village.screen.get", "POST", ("req",), ()),
+    "OapiWikiDocDetailRequest": ("dingtalk.oapi.wiki.doc.detail", "POST", ("agentid", "doc_id"), ()),
+    "OapiWikiDocListRequest": ("dingtalk.oapi.wiki.doc.list", "POST", ("agentid", "cursor", "repo_id", "size"), ()),
+    "OapiWikiDocPublicDetailRequest": ("dingtalk.oapi.wiki.doc.public.detail", "POST", ("agentid", "doc_id", "group_id"), ()),
+    "OapiWikiDocPublicListRequest": ("dingtalk.oapi.wiki.doc.public.list", "POST", ("agentid", "cursor", "group_id", "size"), ()),
+    "OapiWikiGroupListRequest": ("dingtalk.oapi.wiki.group.list", "POST", ("auth_code", "cursor", "group_type", "role_type", "size"), ()),
+    "OapiWikiGroupPublicListRequest": ("dingtalk.oapi.wiki.group.public.list", "POST", ("auth_code", "cursor", "role_type", "size"), ()),
+    "OapiWikiRepoListRequest": ("dingtalk.oapi.wiki.repo.list", "POST", ("agentid", "cursor", "group_id", "size"), ()),
+    "OapiWikiResourceAuthRequest": ("dingtalk.oapi.wiki.resource.auth", "POST", ("agentid", "auth_code", "is_public", "resource_list", "resource_type"), ()),
+    "OapiWorkbenchShortcutAddRequest": ("dingtalk.oapi.workbench.shortcut.add", "POST", ("app_id", "biz_no", "icon", "name", "pc_shortcut_uri", "shortcut_uri"), ()),
+    "OapiWorkbenchShortcutDeleteRequest": ("dingtalk.oapi.workbench.shortcut.delete", "POST", ("app_id", "biz_no"), ()),
+    "OapiWorkbenchShortcutGetguideuriRequest": ("dingtalk.oapi.workbench.shortcut.getguideuri", "POST", ("app_id",), ()),
+    "OapiWorkbenchShortcutListRequest": ("dingtalk.oapi.workbench.shortcut.list", "POST", ("app_id", "page_index", "page_size"), ()),
+    "OapiWorkbenchShortcutListbypagingRequest": ("dingtalk.oapi.workbench.shortcut.listbypaging", "POST", ("page_index", "page_size"), ()),
+    "OapiWorkbenchShortcutUpdateRequest": ("dingtalk.oapi.workbench.shortcut.update", "POST", ("app_id", "biz_no", "icon", "name", "pc_shortcut_uri", "shortcut_uri"), ()),
+    "OapiWorkrecordAddRequest": ("dingtalk.oapi.workrecord.add", "POST", ("biz_id", "create_time", "formItemList", "originator_user_id", "pcUrl", "pc_open_type", "source_name", "title", "url", "userid"), ()),
+    "OapiWorkrecordGetbyuseridRequest": ("dingtalk.oapi.workrecord.getbyuserid", "POST", ("limit", "offset", "status", "userid"), ()),
+    "OapiWorkrecordUpdateRequest": ("dingtalk.oapi.workrecord.update", "POST", ("record_id", "userid"), ()),
+    "OapiWorkspaceAuditlogListRequest": ("dingtalk.oapi.workspace.auditlog.list", "POST", ("end_date", "load_more_bizId", "load_more_gmt_create", "page_size", "start_date"), ()),
+    "OapiWorkspaceCirclePostCreateRequest": ("dingtalk.oapi.workspace.circle.post.create", "POST", ("req",), ()),
+    "OapiWorkspaceCircleTagCreateRequest": ("dingtalk.oapi.workspace.circle.tag.create", "POST", ("req",), ()),
+    "OapiWorkspaceCorpGroupBindRequest": ("dingtalk.oapi.workspace.corp.group.bind", "POST", ("chat_ids", "target_corp_id"), ()),
+    "OapiWorkspaceCorpGroupUnbindRequest": ("dingtalk.oapi.workspace.corp.group.unbind", "POST", ("chat_ids", "target_corp_id"), ()),
+    "OapiWorkspaceCorpMemberAddRequest": ("dingtalk.oapi.workspace.corp.member.add", "POST", ("member_add_dto_list", "target_corp_id"), ()),
+    "OapiWorkspaceCorpMemberGetuseridsRequest": ("dingtalk.oapi.workspace.corp.member.getuserids", "POST", ("source_corp_id", "userids"), ()),
+    "OapiWorkspaceCorpMemberRemoveRequest": ("dingtalk.oapi.workspace.corp.member.remove", "POST", ("target_corp_id", "userids"), ()),
+    "OapiWorkspaceCorpMemberSubcorpUserGetRequest": ("dingtalk.oapi.workspace.corp.member.subcorp.user.get", "POST", ("belong_org_userids", "target_corp_id"), ()),
+    "OapiWorkspaceProjectAssistantSendRequest": ("dingtalk.oapi.workspace.project.assistant.send", "POST", ("action_url", "content", "pic_url", "reciever_userids", "style", "title"), ()),
+    "OapiWorkspaceProjectCreateRequest": ("dingtalk.oapi.workspace.project.create", "POST", ("belong_corp_userid", "create_group", "desc", "name", "open_conversation_id", "outer_id", "template_id", "type", "userid"), ()),
+    "OapiWorkspaceProjectCreateV2Request": ("dingtalk.oapi.workspace.project.create.v2", "POST", ("belong_corp_userid", "create_group", "desc", "logo_media_id", "name", "open_conversation_id", "outer_id", "type"), ()),
+    "OapiWorkspaceProjectGrayCheckRequest": ("dingtalk.oapi.workspace.project.gray.check", "POST", (), ()),
+    "OapiWorkspaceProjectMemberAddRequest": ("dingtalk.oapi.workspace.project.member.add", "POST", ("members",), ()),
+    "OapiWorkspaceProjectMemberRemoveRequest": ("dingtalk.oapi.workspace.project.member.remove", "POST", ("operator_staff_id", "project_source_id", "source", "staff_id"), ()),
+    "OapiWorkspaceProjectNoticeSendRequest": ("dingtalk.oapi.workspace.project.notice.send", "POST", ("send_notice_req",), ()),
+    "OapiWorkspaceProjectQueryRequest": ("dingtalk.oapi.workspace.project.query", "POST", (), ()),
+    "OapiWorkspaceStatusUpdateRequest": ("dingtalk.oapi.workspace.status.update", "POST", ("update_status",), ()),
+    "OapiWorkspaceTaskCleanRequest": ("dingtalk.oapi.workspace.task.clean", "POST", ("agentid", "corp_id", "operator_userid"), ()),
+    "OapiWorkspaceTaskCreateRequest": ("dingtalk.oapi.workspace.task.create", "POST", ("microapp_agent_id", "operator_userid", "task"), ()),
+    "OapiWorkspaceTaskDeleteRequest": ("dingtalk.oapi.workspace.task.delete", "POST", ("microapp_agent_id", "operator_userid", "task_id"), ()),
+    "OapiWorkspaceTaskDeletebyprojectRequest": ("dingtalk.oapi.workspace.task.deletebyproject", "POST", ("microapp_agent_id", "operator_userid", "project_id"), ()),
+    "OapiWorkspaceTaskGetRequest": ("dingtalk.oapi.workspace.task.get", "POST", ("microapp_agent_id", "task_id"), ()),
+    "OapiWorkspaceTaskGetbysourceidRequest": ("dingtalk.oapi.workspace.task.getbysourceid", "POST", ("agent_id", "source", "source_id"), ()),
+    "OapiWorkspaceTaskMigrateRequest": ("dingtalk.oapi.workspace.task.migrate", "POST", ("agentid", "operator_userid", "task"), ()),
+    "OapiWorkspaceTaskUpdateRequest": ("dingtalk.oapi.workspace.task.update", "POST", ("microapp_agent_id", "operator_userid", "task", "task_id"), ()),
+    "OapiWorkspaceTasklistAddbyprojectRequest": ("dingtalk.oapi.workspace.tasklist.addbyproject", "POST", ("microapp_agent_id", "operator_userid", "project_id", "userid"), ()),
+    "OapiWorkspaceTasklistHiddenCancelRequest": ("dingtalk.oapi.workspace.tasklist.hidden.cancel", "POST", ("agentid", "operator_userid", "userid"), ()),
+    "OapiWorkspaceTasklistHidebyorgRequest": ("dingtalk.oapi.workspace.tasklist.hidebyorg", "POST", ("microapp_agent_id", "operator_userid", "userid"), ()),
+    "OapiWorkspaceTasklistHidebyprojectRequest": ("dingtalk.oapi.workspace.tasklist.hidebyproject", "POST", ("microapp_agent_id", "operator_userid", "project_id", "userid"), ()),
+    "OapiWorkspaceUpdateRequest": ("dingtalk.oapi.workspace.update", "POST", ("update_info",), ()),
+    "OapiXiaoqianApiTestRequest": ("dingtalk.oapi.xiaoqian.api.test", "POST", ("id",), ()),
+    "OapiXiaoxuanPreTest1Request": ("dingtalk.oapi.xiaoxuan.pre.test1", "POST", ("name", "systemData"), ()),
+    "OapiXiaoxuanTestRequest": ("dingtalk.oapi.xiaoxuan.test", "POST", ("normal_data", "system_data"), ()),
+    "SmartworkAttendsGetleaveapprovedurationRequest": ("dingtalk.smartwork.attends.getleaveapproveduration", "POST", ("from_date", "to_date", "userid"), ()),
+    "SmartworkAttendsGetsimplegroupsRequest": ("dingtalk.smartwork.attends.getsimplegroups", "POST", ("offset", "size"), ()),
+    "SmartworkAttendsGetusergroupRequest": ("dingtalk.smartwork.attends.getusergroup", "POST", ("userid",), ()),
+    "SmartworkAttendsListscheduleRequest": ("dingtalk.smartwork.attends.listschedule", "POST", ("offset", "size", "work_date"), ()),
+    "SmartworkBlackboardListtoptenRequest": ("dingtalk.smartwork.blackboard.listtopten", "POST", ("userid",), ()),
+    "SmartworkBpmsProcessGetbybiztypeRequest": ("dingtalk.smartwork.bpms.process.getbybiztype", "POST", ("biz_type",), ()),
+    "SmartworkBpmsProcessGetvisibleRequest": ("dingtalk.smartwork.bpms.process.getvisible", "POST", ("process_code_list", "userid"), ()),
+    "SmartworkBpmsProcessinstanceCreateRequest": ("dingtalk.smartwork.bpms.processinstance.create", "POST", ("agent_id", "approvers", "cc_list", "cc_position", "dept_id", "form_component_values", "originator_user_id", "process_code"), ()),
+    "SmartworkBpmsProcessinstanceExecuteRequest": ("dingtalk.smartwork.bpms.processinstance.execute", "POST", ("actioner_userid", "process_instance_id", "remark", "result", "task_id"), ()),
+    "SmartworkBpmsProcessinstanceGetRequest": ("dingtalk.smartwork.bpms.processinstance.get", "POST", ("process_instance_id",), ()),
+    "SmartworkBpmsProcessinstanceGetwithformRequest": ("dingtalk.smartwork.bpms.processinstance.getwithform", "POST", ("process_instance_id",), ()),
+    "SmartworkBpmsProcessinstanceListRequest": ("dingtalk.smartwork.bpms.processinstance.list", "POST", ("cursor", "end_time", "process_code", "size", "start_time", "userid_list"), ()),
+    "SmartworkBpmsProcessinstanceidListRequest": ("dingtalk.smartwork.bpms.processinstanceid.list", "POST", ("cursor", "end_time", "process_code", "size", "start_time", "userid_list"), ()),
+    "SmartworkCheckinRecordGetRequest": ("dingtalk.smartwork.checkin.record.get", "POST", ("cursor", "end_time", "size", "start_time", "userid_list"), ()),
+}
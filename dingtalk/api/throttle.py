@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+'''
+钉钉接口限流与重试
+
+RateLimiter 按应用、按接口维护令牌桶，请求发出前预约令牌并等待；
+RetryPolicy 对限流、临时性错误码以及 http 状态/网络异常做带随机抖动的指数退避重试；
+请求可能已被服务端处理的失败(读超时、连接中途断开等)只有接口声明为幂等时才重试，
+避免发送消息、创建用户之类的写接口被重复执行
+'''
+
+import collections
+import http.client
+import random
+import threading
+import time
+
+'''
+钉钉返回的限流错误码: 超过每秒/每分钟调用次数上限
+'''
+THROTTLE_ERRCODES = (90002, 90005, 90006, 90018, 90019)
+
+'''
+系统繁忙等临时性错误码
+'''
+TRANSIENT_ERRCODES = (-1,)
+
+'''
+总是可以重试的 http 状态: 限流、服务不可用，请求没有被处理
+'''
+SAFE_RETRY_STATUSES = (429, 503)
+
+'''
+网关错误等状态下请求可能已经被处理，只有幂等接口才重试
+'''
+RETRY_STATUSES = (500, 502, 504)
+
+
+class TokenBucket(object):
+    #===========================================================================
+    # 预约式令牌桶，reserve() 返回需要等待的秒数而不是自己阻塞，
+    # 同步与 asyncio 调用方可以各自选择 sleep 方式
+    #===========================================================================
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter(object):
+    #===========================================================================
+    # 按应用、按接口限流
+    # Args @param app_rate: 每个应用所有接口合计的每秒请求数，None 表示不限制
+    #      @param api_rate: 每个应用单个接口的每秒请求数，None 表示不限制
+    #===========================================================================
+
+    def __init__(self, app_rate=None, api_rate=None, burst=None):
+        self._app_rates = {}
+        self._api_rates = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._stats = collections.defaultdict(collections.Counter)
+        if app_rate is not None:
+            self.setAppRate(app_rate, burst)
+        if api_rate is not None:
+            self.setApiRate(api_rate, burst)
+
+    def setAppRate(self, rate, burst=None, app=None):
+        #=======================================================================
+        # app 为 None 时作为所有未单独配置的应用的默认值
+        #=======================================================================
+        with self._lock:
+            self._app_rates[app] = (rate, burst)
+            self._buckets.clear()
+
+    def setApiRate(self, rate, burst=None, api=None):
+        #=======================================================================
+        # api 为接口名(getapiname())，None 时作为所有未单独配置的接口的默认值
+        #=======================================================================
+        with self._lock:
+            self._api_rates[api] = (rate, burst)
+            self._buckets.clear()
+
+    def _getBucket(self, key, rates, name):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rule = rates.get(name, rates.get(None))
+            if rule is None or rule[0] is None:
+                return None
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(*rule))
+        return bucket
+
+    def reserve(self, app, api):
+        #=======================================================================
+        # 预约一次请求，返回发出请求前需要等待的秒数
+        #=======================================================================
+        wait = 0.0
+        for bucket in (
+            self._getBucket(("app", app), self._app_rates, app),
+            self._getBucket(("api", app, api), self._api_rates, api),
+        ):
+            if bucket is not None:
+                wait = max(wait, bucket.reserve())
+        with self._lock:
+            stats = self._stats[api]
+            stats["requests"] += 1
+            if wait > 0:
+                stats["throttled"] += 1
+                stats["wait_seconds"] += wait
+        return wait
+
+    def getStats(self):
+        #=======================================================================
+        # 按接口统计: requests/throttled/wait_seconds
+        #=======================================================================
+        with self._lock:
+            return {api: dict(stats) for api, stats in self._stats.items()}
+
+
+class RetryPolicy(object):
+    #===========================================================================
+    # 重试策略
+    # Args @param max_retries: 最多重试次数
+    #      @param base_delay: 临时性错误的退避基数(秒)
+    #      @param throttle_delay: 限流错误的退避基数(秒)
+    #      @param max_delay: 单次退避上限(秒)
+    #===========================================================================
+
+    def __init__(self, max_retries=3, base_delay=0.2, throttle_delay=1.0, max_delay=10.0,
+                 throttle_errcodes=THROTTLE_ERRCODES, transient_errcodes=TRANSIENT_ERRCODES,
+                 retry_statuses=RETRY_STATUSES, safe_retry_statuses=SAFE_RETRY_STATUSES):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.throttle_delay = throttle_delay
+        self.max_delay = max_delay
+        self.throttle_errcodes = frozenset(throttle_errcodes)
+        self.transient_errcodes = frozenset(transient_errcodes)
+        self.retry_statuses = frozenset(retry_statuses)
+        self.safe_retry_statuses = frozenset(safe_retry_statuses)
+        self._lock = threading.Lock()
+        self._stats = collections.defaultdict(collections.Counter)
+
+    def classify(self, error, idempotent=False):
+        #=======================================================================
+        # 返回 "throttle"、"transient" 或 None(不重试)
+        # 限流错误码、429/503 以及请求发出前的连接失败(request_sent 为 False)总是可以重试；
+        # 其它 5xx、错误码与网络异常时请求可能已经生效，只有 idempotent 时才重试
+        #=======================================================================
+        from dingtalk.api.base import RequestException, TopException
+
+        if isinstance(error, TopException):
+            if error.errcode in self.throttle_errcodes:
+                return "throttle"
+            if idempotent and error.errcode in self.transient_errcodes:
+                return "transient"
+            return None
+        if getattr(error, "request_sent", True) is False:
+            return "transient"
+        if isinstance(error, RequestException):
+            status = getattr(error, "status", None)
+            if status == 429:
+                return "throttle"
+            if status in self.safe_retry_statuses:
+                return "transient"
+            if idempotent and (status is None or status in self.retry_statuses):
+                return "transient"
+            return None
+        if idempotent and isinstance(error, (OSError, http.client.HTTPException)):
+            return "transient"
+        return None
+
+    def backoff(self, api, error, attempt, idempotent=False):
+        #=======================================================================
+        # 返回第 attempt 次重试前需要等待的秒数，不应重试时返回 None
+        #=======================================================================
+        kind = self.classify(error, idempotent)
+        if kind is None:
+            return None
+        with self._lock:
+            stats = self._stats[api]
+            stats[kind + "_errors"] += 1
+            if attempt >= self.max_retries:
+                stats["gave_up"] += 1
+                return None
+            stats["retries"] += 1
+        base = self.throttle_delay if kind == "throttle" else self.base_delay
+        return random.uniform(0, min(self.max_delay, base * 2 ** attempt))
+
+    def getStats(self):
+        #=======================================================================
+        # 按接口统计: retries/throttle_errors/transient_errors/gave_up
+        #=======================================================================
+        with self._lock:
+            return {api: dict(stats) for api, stats in self._stats.items()}
+
+
+_default_limiter = RateLimiter()
+_default_retry_policy = RetryPolicy()
+
+
+def getDefaultRateLimiter():
+    return _default_limiter
+
+
+def setDefaultRateLimiter(limiter):
+    global _default_limiter
+    _default_limiter = limiter
+
+
+def getDefaultRetryPolicy():
+    return _default_retry_policy
+
+
+def setDefaultRetryPolicy(policy):
+    global _default_retry_policy
+    _default_retry_policy = policy
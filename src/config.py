@@ -24,11 +24,46 @@ class Settings(BaseSettings):
     LDAP_PORT: int = 389
     LDAP_ADMIN: str
     LDAP_ADMIN_PASSWD: str
+    # 同步前把 ldap 中的用户与部门读入内存，减少查询次数
+    LDAP_PRELOAD: bool = False
+    # 大于 0 时批量写入 ldap，最多同时发出的写请求数；
+    # 查询 ldap 会等待在途的写请求完成，开启后总是同时开启 LDAP_PRELOAD
+    LDAP_PIPELINE: int = 0
+    # 连接池，LDAP_SERVER 可以是逗号分隔的多个副本
+    LDAP_POOL_SIZE: int = 1
+    LDAP_POOL_STRATEGY: str = "round_robin"
+    LDAP_PROBE_INTERVAL: float = 60
+    # 大于 0 时部门成员按部门合并写入，每次最多的成员数
+    LDAP_MEMBER_BATCH: int = 0
+    # schema 缓存目录；LDAP_LAZY_SCHEMA 为 True 时第一次用到 schema 时才读取
+    LDAP_SCHEMA_CACHE: Optional[str] = None
+    LDAP_LAZY_SCHEMA: bool = False
+    # 分页查询每页的条目数
+    LDAP_PAGE_SIZE: int = 500
     ROOT_DN: str = "dc=example,dc=org"
     DINGDING_APPKEY: str = "dingxcjnj8ek623nlx1a"
     DINGDING_APPSECRET: str = (
         "yPJQBOZ3s93qsR9OOmuq3wpkyeBWfUYsq4uK-BOQrjHWc0Ik2nszkfs1P8u1P3KR"
     )
+    DINGDING_QPS: Optional[float] = None
+    DINGDING_API_QPS: Optional[float] = 20
+    DINGDING_MAX_RETRIES: int = 3
+    DINGDING_HTTP2: bool = False
+    DINGDING_CONCURRENCY: int = 8
+    DINGDING_BUFFER_SIZE: int = 1000
+    DINGDING_TOKEN_STORE: str = "memory"
+    DINGDING_TOKEN_MARGIN: int = 300
+    DINGDING_CALLBACK_TOKEN: str = ""
+    DINGDING_CALLBACK_AES_KEY: str = ""
+    DINGDING_CALLBACK_KEY: Optional[str] = None
+    # 回调消息的 timestamp 与当前时间允许相差的秒数
+    DINGDING_CALLBACK_MAX_AGE: int = 300
+    EVENT_QUEUE_PATH: str = "events.db"
+    EVENT_MAX_ATTEMPTS: int = 5
+    EVENT_WORKERS: int = 4
+    EVENT_BUFFER_SIZE: int = 10000
+    # sync.py 把钉钉接口调用指标写入该文件，供 node_exporter 的 textfile collector 采集
+    METRICS_TEXTFILE: Optional[str] = None
     LOG_LEVEL: str = "info"
 
     class Config:
@@ -1,7 +1,46 @@
-from fastapi import FastAPI
+import logging
+from typing import Dict, Optional
+
+from fastapi import Body, FastAPI, HTTPException
 from pydantic import BaseModel
 
+from config import setting
+from utils.callback import CallbackCryptoError, DingCallbackCrypto
+from utils.events import EventDispatcher, EventQueue, EventRejected, normalize_event
+
 app = FastAPI()
+# 启动时才创建，导入本模块不会生成数据库文件
+events: Optional[EventQueue] = None
+dispatcher: Optional[EventDispatcher] = None
+crypto = (
+    DingCallbackCrypto(
+        setting.DINGDING_CALLBACK_TOKEN,
+        setting.DINGDING_CALLBACK_AES_KEY,
+        setting.DINGDING_CALLBACK_KEY or setting.DINGDING_APPKEY,
+        max_age=setting.DINGDING_CALLBACK_MAX_AGE,
+    )
+    if setting.DINGDING_CALLBACK_AES_KEY
+    else None
+)
+
+
+@app.on_event("startup")
+async def start_dispatcher():
+    global events, dispatcher
+    events = EventQueue(
+        setting.EVENT_QUEUE_PATH, max_attempts=setting.EVENT_MAX_ATTEMPTS
+    )
+    dispatcher = EventDispatcher(
+        events, workers=setting.EVENT_WORKERS, maxsize=setting.EVENT_BUFFER_SIZE
+    )
+    await dispatcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_dispatcher():
+    if dispatcher is not None:
+        await dispatcher.stop()
+
 
 @app.get("/")
 def root():
@@ -12,5 +51,24 @@ def root():
 
 
 @app.post('/provider/dingtalk/register/')
-def callback():
-    pass
\ No newline at end of file
+async def callback(signature: str, timestamp: str, nonce: str, body: Dict = Body(...)):
+    """
+    钉钉事件回调: 校验签名并解密，通讯录变更事件由 dispatcher 批量写入事件队列后才应答，
+    再由 `sync.py incremental` 应用到ldap
+    """
+    if crypto is None:
+        raise HTTPException(status_code=500, detail="callback is not configured")
+    try:
+        payload = crypto.get_decrypt_msg(signature, timestamp, nonce, body.get("encrypt", ""))
+    except CallbackCryptoError as e:
+        logging.warning("dingtalk callback rejected: {}.".format(e))
+        raise HTTPException(status_code=403, detail=str(e))
+    event = normalize_event(payload)
+    if event:
+        try:
+            await dispatcher.put(event)
+        except EventRejected as e:
+            # 应答失败的推送钉钉会重试，并记入推送失败列表供 backfill 补回
+            logging.warning("dingtalk callback rejected: {}.".format(e))
+            raise HTTPException(status_code=503, detail=str(e))
+    return crypto.get_encrypted_map("success")
\ No newline at end of file
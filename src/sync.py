@@ -1,38 +1,226 @@
-from utils import Dingding, Driver, Ldap, Provider, Paser
+import argparse
+import logging
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Dict
+
+from dingtalk.api import hooks, http2, throttle
+
+from utils import Dingding, Driver, Ldap, Provider, Paser, get_token_store
+from utils.diff import SyncPlan, compute_plan
+from utils.events import EventQueue, normalize_event
 from config import setting
 
 
 class Syncer:
-    def __init__(self, provider: Provider, driver: Driver) -> None:
+    def __init__(self, provider: Provider, driver: Driver, workers: int = 1) -> None:
+        """workers: 创建用户的线程数，driver 需要能在多个线程中同时使用"""
         self.driver = driver
         self.provider = provider
+        self.workers = workers
         self.pase = Paser("dd")
 
     def pull_dept(self):
         """从provider获取部门并创建ou"""
-        for p_dept in provider.get_dept_list():
+        for p_dept in self.provider.get_dept_list():
             l_dept = self.pase(p_dept)
             self.driver.create_dept(l_dept)
+        self.driver.flush()
 
     def pull_user(self):
         """从provider获取用户并创建cn"""
         # 遍历部门用户
-        for p_user in provider.get_user_all():
-            l_user = self.pase(p_user)
-            # 创建用户
-            self.driver.create_user(user=l_user)
+        users = (self.pase(p_user) for p_user in self.provider.get_user_all())
+        if self.workers > 1:
+            # 最多同时提交 2 * workers 个用户，不把整个生成器读入内存；出错时尽快抛出
+            with ThreadPoolExecutor(self.workers) as executor:
+                running = set()
+                for l_user in users:
+                    if len(running) >= 2 * self.workers:
+                        done, running = wait(running, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    running.add(executor.submit(self.driver.create_user, user=l_user))
+                done, _ = wait(running, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    future.result()
+        else:
+            for l_user in users:
+                # 创建用户
+                self.driver.create_user(user=l_user)
+        self.driver.flush()
+
+    def plan(self) -> SyncPlan:
+        """读取钉钉与ldap的全量快照，计算需要执行的变更"""
+        depts = [self.pase(p_dept) for p_dept in self.provider.get_dept_list()]
+        users = [self.pase(p_user) for p_user in self.provider.get_user_all()]
+        return compute_plan(
+            depts,
+            users,
+            self.driver.load_depts(),
+            self.driver.load_users(),
+            dept_base_dn=self.driver.dept_base_dn,
+            user_base_dn=self.driver.user_base_dn,
+            prefix=self.pase.prefix,
+        )
+
+    def apply_event(self, event: Dict) -> None:
+        """
+        把一个通讯录变更事件应用到ldap
+        事件只用来确定涉及的部门与用户，按钉钉当前数据更新，重复或乱序的事件不影响结果
+        """
+        for dept_id in event["dept_ids"]:
+            p_dept = self.provider.get_dept_detail(dept_id, missing_ok=True)
+            if p_dept is None:
+                self.driver.delete_dept(self.pase.convert_id(dept_id))
+            else:
+                self.driver.update_dept(self.pase(p_dept))
+        for user_id in event["user_ids"]:
+            p_user = self.provider.get_user_detail(user_id)
+            if p_user is None:
+                self.driver.delete_user(self.pase.convert_id(user_id))
+            else:
+                self.driver.update_user(self.pase(p_user))
+
+    def sync_events(self, queue: EventQueue, batch_size: int = 100) -> int:
+        """应用队列中所有可处理的事件，返回成功应用的事件数"""
+        applied = 0
+        while True:
+            batch = queue.claim(batch_size)
+            if not batch:
+                return applied
+            renewed = time.monotonic()
+            for i, (event_id, event) in enumerate(batch):
+                # 处理超过半个 lease 时延长剩余事件的 lease，避免被其它消费者再次取出
+                if time.monotonic() - renewed > queue.lease / 2:
+                    queue.renew([item[0] for item in batch[i:]])
+                    renewed = time.monotonic()
+                try:
+                    self.apply_event(event)
+                    self.driver.flush()
+                except Exception as e:
+                    logging.error("apply event {} error: {}.".format(event, e))
+                    queue.fail(event_id, e)
+                else:
+                    queue.ack(event_id)
+                    applied += 1
+
+    def backfill_events(self, queue: EventQueue) -> int:
+        """把钉钉推送失败的事件补充到队列，返回补充的事件数"""
+        count = 0
+        for record in self.provider.get_failed_events():
+            event = normalize_event(record)
+            if event:
+                queue.put(event)
+                count += 1
+        return count
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="同步钉钉通讯录到ldap")
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        choices=["full", "incremental", "diff"],
+        default="full",
+        help="full: 全量遍历; incremental: 只应用通讯录变更事件; diff: 对比两侧快照，只写入差异",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="diff 模式下只输出变更统计，不写入ldap",
+    )
+    parser.add_argument(
+        "--follow",
+        type=float,
+        metavar="SECONDS",
+        help="incremental 模式下持续运行，每隔 SECONDS 秒处理一次新事件",
+    )
+    args = parser.parse_args()
+
+    throttle.getDefaultRetryPolicy().max_retries = setting.DINGDING_MAX_RETRIES
+    if setting.DINGDING_HTTP2:
+        http2.enableHttp2()
     provider = Dingding(
-        appkey=setting.DINGDING_APPKEY, appsecret=setting.DINGDING_APPSECRET
+        appkey=setting.DINGDING_APPKEY,
+        appsecret=setting.DINGDING_APPSECRET,
+        qps=setting.DINGDING_QPS,
+        api_qps=setting.DINGDING_API_QPS,
+        concurrency=setting.DINGDING_CONCURRENCY,
+        buffer_size=setting.DINGDING_BUFFER_SIZE,
+        token_store=get_token_store(setting.DINGDING_TOKEN_STORE),
+        token_margin=setting.DINGDING_TOKEN_MARGIN,
+    )
+    metrics = hooks.addRequestHook(
+        hooks.MetricsHook(
+            limiter=provider.limiter, retryPolicy=throttle.getDefaultRetryPolicy()
+        )
     )
     driver = Ldap(
         server=setting.LDAP_SERVER,
         user=setting.LDAP_ADMIN,
         password=setting.LDAP_ADMIN_PASSWD,
+        preload=setting.LDAP_PRELOAD,
+        pipeline=setting.LDAP_PIPELINE,
+        pool_size=setting.LDAP_POOL_SIZE,
+        pool_strategy=setting.LDAP_POOL_STRATEGY,
+        probe_interval=setting.LDAP_PROBE_INTERVAL,
+        member_batch=setting.LDAP_MEMBER_BATCH,
+        schema_cache=setting.LDAP_SCHEMA_CACHE,
+        lazy_schema=setting.LDAP_LAZY_SCHEMA,
+        page_size=setting.LDAP_PAGE_SIZE,
+    )
+
+    syncer = Syncer(
+        provider=provider,
+        driver=driver,
+        workers=1 if setting.LDAP_PIPELINE else setting.LDAP_POOL_SIZE,
     )
+    if args.mode == "full":
+        syncer.pull_dept()
+        syncer.pull_user()
+    elif args.mode == "diff":
+        plan = syncer.plan()
+        logging.info("diff sync plan: {}.".format(plan.summary()))
+        if not args.dry_run:
+            logging.info("diff sync result: {}.".format(driver.apply_plan(plan)))
+    else:
+        queue = EventQueue(
+            setting.EVENT_QUEUE_PATH, max_attempts=setting.EVENT_MAX_ATTEMPTS
+        )
+        while True:
+            backfilled = syncer.backfill_events(queue)
+            applied = syncer.sync_events(queue)
+            logging.info(
+                "incremental sync: backfilled {} events, applied {} events, queue: {}.".format(
+                    backfilled, applied, queue.stats()
+                )
+            )
+            if args.follow is None:
+                break
+            if setting.METRICS_TEXTFILE:
+                metrics.writeTextfile(setting.METRICS_TEXTFILE)
+            time.sleep(args.follow)
 
-    syncer = Syncer(provider=provider, driver=driver)
-    syncer.pull_dept()
-    syncer.pull_user()
+    if driver.write_errors:
+        logging.warning("{} ldap writes failed.".format(len(driver.write_errors)))
+    for stats in driver.pool.stats():
+        logging.info("ldap connection: {}".format(stats))
+    for api, stats in metrics.getStats().items():
+        logging.info(
+            "{}: {} requests, {:.2f}s, {} bytes in, {} retries, {} errors".format(
+                api,
+                stats["requests"],
+                stats["seconds"],
+                stats["response_bytes"],
+                stats["retries"],
+                stats["errors"],
+            )
+        )
+    if setting.METRICS_TEXTFILE:
+        metrics.writeTextfile(setting.METRICS_TEXTFILE)
@@ -2,6 +2,13 @@ from .provider import Provider, Dingding
 from .paser import Paser
 from .driver import Driver, Ldap
 from .schemas import Dept, DeptInDingtalk, DeptInLdap, User, UserInDingtalk, UserInLdap
+from .tokenstore import (
+    FileTokenStore,
+    MemoryTokenStore,
+    SqliteTokenStore,
+    TokenStore,
+    get_token_store,
+)
 
 # from __future__ import absolute_import
 # from . import dingtalk
@@ -18,4 +25,9 @@ __all__ = [
     User,
     UserInDingtalk,
     UserInLdap,
+    TokenStore,
+    MemoryTokenStore,
+    FileTokenStore,
+    SqliteTokenStore,
+    get_token_store,
 ]
@@ -0,0 +1,119 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import random
+import string
+import struct
+import time
+from typing import Dict, Optional
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+"""
+钉钉事件回调的加解密与签名校验
+
+消息体为 AES-256-CBC 加密的 random(16) + 消息长度(4 字节网络序) + 消息 + key，
+key 为企业内部应用的 appkey(或第三方应用的 suitekey、corpid)，
+签名为 token、timestamp、nonce、密文排序后拼接的 sha1，
+timestamp(毫秒)与当前时间相差超过 max_age 秒的消息拒绝处理，防止旧消息被重放
+"""
+
+# 钉钉使用 32 字节为块长度的 PKCS#7 填充
+BLOCK_SIZE = 32
+
+
+class CallbackCryptoError(Exception):
+    pass
+
+
+class DingCallbackCrypto:
+    def __init__(
+        self, token: str, aes_key: str, key: str, max_age: Optional[float] = 300
+    ) -> None:
+        """
+        token、aes_key: 开发者后台事件订阅中配置的签名 token 与加密 aes_key(43 位)
+        key: 企业内部应用的 appkey
+        max_age: 消息 timestamp 与当前时间允许相差的秒数，None 时不检查
+        """
+        if len(aes_key) != 43:
+            raise CallbackCryptoError("aes_key must be 43 characters")
+        self.token = token
+        self.aes_key = base64.b64decode(aes_key + "=")
+        self.key = key
+        self.max_age = max_age
+
+    def _cipher(self) -> Cipher:
+        return Cipher(
+            algorithms.AES(self.aes_key),
+            modes.CBC(self.aes_key[:16]),
+            backend=default_backend(),
+        )
+
+    def signature(self, timestamp: str, nonce: str, encrypt: str) -> str:
+        data = "".join(sorted([self.token, str(timestamp), str(nonce), encrypt]))
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    def encrypt(self, msg: str) -> str:
+        msg_bytes = msg.encode("utf-8")
+        data = (
+            os.urandom(16)
+            + struct.pack(">I", len(msg_bytes))
+            + msg_bytes
+            + self.key.encode("utf-8")
+        )
+        pad = BLOCK_SIZE - len(data) % BLOCK_SIZE
+        data += bytes([pad]) * pad
+        encryptor = self._cipher().encryptor()
+        return base64.b64encode(encryptor.update(data) + encryptor.finalize()).decode()
+
+    def decrypt(self, encrypt: str) -> str:
+        try:
+            decryptor = self._cipher().decryptor()
+            data = decryptor.update(base64.b64decode(encrypt)) + decryptor.finalize()
+            pad = data[-1]
+            if not 1 <= pad <= BLOCK_SIZE:
+                raise ValueError("invalid padding")
+            data = data[:-pad]
+            (length,) = struct.unpack(">I", data[16:20])
+            msg, key = data[20 : 20 + length], data[20 + length :]
+        except (ValueError, TypeError, IndexError, struct.error) as e:
+            raise CallbackCryptoError("decrypt error: {}".format(e))
+        if key.decode("utf-8", "replace") != self.key:
+            raise CallbackCryptoError("key of message does not match")
+        return msg.decode("utf-8")
+
+    def get_decrypt_msg(
+        self, signature: str, timestamp: str, nonce: str, encrypt: str
+    ) -> Dict:
+        """校验签名与时间并解密回调消息"""
+        expected = self.signature(timestamp, nonce, encrypt)
+        if not hmac.compare_digest(expected.encode(), str(signature).encode()):
+            raise CallbackCryptoError("signature does not match")
+        if self.max_age is not None:
+            try:
+                age = abs(time.time() - int(timestamp) / 1000)
+            except (TypeError, ValueError):
+                raise CallbackCryptoError("invalid timestamp: {}".format(timestamp))
+            if age > self.max_age:
+                raise CallbackCryptoError("timestamp expired: {}".format(timestamp))
+        return json.loads(self.decrypt(encrypt))
+
+    def get_encrypted_map(
+        self,
+        msg: str = "success",
+        timestamp: Optional[str] = None,
+        nonce: Optional[str] = None,
+    ) -> Dict:
+        """回调的应答，默认加密 "success" """
+        timestamp = timestamp or str(int(time.time() * 1000))
+        nonce = nonce or "".join(random.choices(string.ascii_letters + string.digits, k=16))
+        encrypt = self.encrypt(msg)
+        return {
+            "msg_signature": self.signature(timestamp, nonce, encrypt),
+            "timeStamp": timestamp,
+            "nonce": nonce,
+            "encrypt": encrypt,
+        }
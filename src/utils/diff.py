@@ -0,0 +1,174 @@
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from .driver import USER_SYNC_ATTRS
+from .schemas import DeptInLdap, UserInLdap
+
+"""
+provider 与 ldap 的快照对比
+
+两侧各读取一次全量数据，按 departmentNumber / uniqueIdentifier 建立索引，
+一次遍历得到新增、修改、移动与删除，生成 SyncPlan 后由 Ldap.apply_plan 执行，
+ldap 的写操作次数只与实际差异的数量有关
+"""
+
+
+class Change(BaseModel):
+    action: str  # add / modify / move / delete
+    kind: str  # dept / user
+    key: str
+    dn: Optional[str] = None  # 当前 dn，新增时为空
+    new_dn: Optional[str] = None  # 新增或移动后的 dn
+    changes: Dict[str, List[str]] = {}  # 需要替换的属性
+    old_depts: List[str] = []  # 用户原来所属的部门
+    # UserInLdap 需要在前，否则用户会按字段校验成 DeptInLdap
+    entry: Optional[Union[UserInLdap, DeptInLdap]] = None
+
+
+class SyncPlan:
+    def __init__(self, dept_dns: Dict[str, str]) -> None:
+        # 对比完成后每个部门的 dn，添加部门成员时使用
+        self.dept_dns = dept_dns
+        self.depts: List[Change] = []
+        self.users: List[Change] = []
+        self.dept_deletes: List[Change] = []
+
+    def __iter__(self) -> Iterator[Change]:
+        """执行顺序: 部门新增与移动(父部门在前)、用户、部门删除(子部门在前)"""
+        yield from self.depts
+        yield from self.users
+        yield from self.dept_deletes
+
+    def __len__(self) -> int:
+        return len(self.depts) + len(self.users) + len(self.dept_deletes)
+
+    def summary(self) -> Dict[str, int]:
+        result: Dict[str, int] = {}
+        for change in self:
+            name = "{}_{}".format(change.kind, change.action)
+            result[name] = result.get(name, 0) + 1
+        return result
+
+
+def normalize(value) -> List[str]:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    return sorted(str(i) for i in value if i is not None and i != "")
+
+
+def same_dn(a: str, b: str) -> bool:
+    return a.lower() == b.lower()
+
+
+def rebase_dn(dn: str, moves: List[Tuple[str, str]]) -> str:
+    """上级部门移动后，下级条目的 dn 随之改变；moves 中后发生的移动在前"""
+    for old, new in moves:
+        if same_dn(dn, old):
+            return new
+        if dn.lower().endswith("," + old.lower()):
+            return dn[: len(dn) - len(old)] + new
+    return dn
+
+
+def compute_plan(
+    provider_depts: List[DeptInLdap],
+    provider_users: List[UserInLdap],
+    ldap_depts: Dict[str, Dict],
+    ldap_users: Dict[str, Dict],
+    dept_base_dn: str,
+    user_base_dn: str,
+    prefix: str = "dd_",
+) -> SyncPlan:
+    """
+    provider_depts 需要父部门在前(get_dept_list 的顺序)；
+    ldap_depts / ldap_users 为 Ldap.load_depts / load_users 的结果，key 不以 prefix 开头的条目不由同步管理
+    Change.dn 为执行到该变更时条目所在的 dn，已考虑之前的部门移动
+    """
+    dept_dns: Dict[str, str] = {"1": dept_base_dn}
+    moves: List[Tuple[str, str]] = []
+    plan = SyncPlan(dept_dns)
+    ldap_depts = dict(ldap_depts)
+    ldap_users = dict(ldap_users)
+
+    for dept in provider_depts:
+        key = dept.departmentNumber[0]
+        if key == "1":
+            ldap_depts.pop(key, None)
+            continue
+        parent_dn = dept_dns.get(str(dept.parent_id), dept_base_dn)
+        new_dn = "ou={},{}".format(dept.ou, parent_dn)
+        dept_dns[key] = new_dn
+        old = ldap_depts.pop(key, None)
+        if old is None:
+            plan.depts.append(Change(action="add", kind="dept", key=key, new_dn=new_dn, entry=dept))
+            continue
+        dn = rebase_dn(old["dn"], moves)
+        if not same_dn(dn, new_dn):
+            plan.depts.append(
+                Change(action="move", kind="dept", key=key, dn=dn, new_dn=new_dn, entry=dept)
+            )
+            moves.insert(0, (dn, new_dn))
+
+    for key, old in ldap_depts.items():
+        if key.startswith(prefix):
+            plan.dept_deletes.append(
+                Change(action="delete", kind="dept", key=key, dn=rebase_dn(old["dn"], moves))
+            )
+    # 子部门先删除
+    plan.dept_deletes.sort(key=lambda change: change.dn.count(","), reverse=True)
+
+    for user in provider_users:
+        key = user.uniqueIdentifier[0]
+        new_dn = "cn={},{}".format(user.cn, user_base_dn)
+        old = ldap_users.pop(key, None)
+        if old is None:
+            plan.users.append(Change(action="add", kind="user", key=key, new_dn=new_dn, entry=user))
+            continue
+        changes = {}
+        for attr in USER_SYNC_ATTRS:
+            value = normalize(getattr(user, attr))
+            if value != normalize(old.get(attr)):
+                changes[attr] = value
+        old_depts = normalize(old.get("departmentNumber"))
+        if not same_dn(old["dn"], new_dn):
+            plan.users.append(
+                Change(
+                    action="move",
+                    kind="user",
+                    key=key,
+                    dn=old["dn"],
+                    new_dn=new_dn,
+                    changes=changes,
+                    old_depts=old_depts,
+                    entry=user,
+                )
+            )
+        elif changes:
+            plan.users.append(
+                Change(
+                    action="modify",
+                    kind="user",
+                    key=key,
+                    dn=old["dn"],
+                    new_dn=new_dn,
+                    changes=changes,
+                    old_depts=old_depts,
+                    entry=user,
+                )
+            )
+
+    for key, old in ldap_users.items():
+        if key.startswith(prefix):
+            plan.users.append(
+                Change(
+                    action="delete",
+                    kind="user",
+                    key=key,
+                    dn=old["dn"],
+                    old_depts=normalize(old.get("departmentNumber")),
+                )
+            )
+    return plan
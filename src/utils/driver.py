@@ -1,23 +1,29 @@
 import logging
-from typing import Dict, List, Optional, Union
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Union
 
 from ldap3 import (
-    ALL,
+    ASYNC,
+    BASE,
+    LEVEL,
     HASHED_SALTED_SHA,
     HASHED_SHA,
     MODIFY_ADD,
+    MODIFY_DELETE,
     MODIFY_REPLACE,
     AttrDef,
-    Connection,
     Entry,
     ObjectDef,
     Reader,
-    Server,
     Writer,
 )
+from ldap3.core.exceptions import LDAPException
 from ldap3.utils.hashed import hashed
 from pypinyin import NORMAL, pinyin
 
+from .index import EntryIndex
+from .ldappool import LdapPool
 from .schemas import DeptInLdap as Dept
 from .schemas import UserInLdap as User
 
@@ -25,6 +31,9 @@ from .schemas import UserInLdap as User
 操作ldap服务器数据
 """
 
+# 更新用户时与钉钉保持一致的属性
+USER_SYNC_ATTRS = ("email", "mobile", "title", "employeeNumber", "departmentNumber")
+
 
 class NameTools:
     @staticmethod
@@ -50,10 +59,21 @@ class NameTools:
         raise Exception("Not Chinese")
 
 
+class WriteResult(NamedTuple):
+    operation: str  # add / modify / rename / delete
+    dn: str
+    source: Any  # 发起写操作的 UserInLdap、DeptInLdap 等对象
+    result: bool
+    description: str
+
+
 class Driver:
     def __init__(self, *args, **kwargs) -> None:
         self.type = None
 
+    def flush(self) -> List[WriteResult]:
+        return []
+
     def create_dept(self):
         pass
 
@@ -66,6 +86,18 @@ class Driver:
     def search_user(self):
         pass
 
+    def update_dept(self):
+        pass
+
+    def delete_dept(self):
+        pass
+
+    def update_user(self):
+        pass
+
+    def delete_user(self):
+        pass
+
 
 # server = Server('ldap://156.234.201.236',get_info=ALL)
 # conn = Connection(server=server, user='cn=admin,dc=example,dc=org',password='adminpassword',auto_bind=True)
@@ -76,20 +108,53 @@ class Ldap(Driver):
         user: str,
         password: str,
         base_dn: str = "dc=example,dc=org",
+        preload: bool = False,
+        pipeline: int = 0,
+        pool_size: int = 1,
+        pool_strategy: str = "round_robin",
+        probe_interval: float = 60,
+        member_batch: int = 0,
+        schema_cache: Optional[str] = None,
+        lazy_schema: bool = False,
+        page_size: int = 500,
         *args,
         **kwargs
     ) -> None:
+        """
+        server: ldap 服务器地址，多个副本以逗号分隔
+        preload: 启动时把用户与部门读入内存索引，查询不再访问 ldap 服务器
+        pipeline: 大于 0 时写操作使用单独的 ASYNC 连接，最多 pipeline 个请求同时在途，
+            写操作发出后立即返回 True(只表示已发出)，结果在 flush 时收集，
+            失败记录在 write_errors 中；把用户加入部门的修改等到新增用户成功后才发出，
+            新增失败时不再发出并同样记为失败；
+            访问 ldap 服务器的查询要先等待在途的写操作完成，所以 pipeline 总是同时开启 preload
+        pool_size、pool_strategy、probe_interval: 见 LdapPool，
+            pool_size 大于 1 时可以在多个线程中同时调用(pipeline 模式除外)
+        member_batch: 大于 0 时部门成员的修改先记录下来，flush 时与现有成员对比后
+            按部门合并写入，每个 modify 最多 member_batch 个值
+        schema_cache: 缓存 schema 的目录，schema 未修改时启动不再下载
+        lazy_schema: 启动时不读取 schema，第一次用到(Reader 查询)时再读取；
+            开启 preload 后查询都由索引完成，一般不需要 schema
+        page_size: 分页查询每页的条目数
+        """
         super().__init__(*args, **kwargs)
         self.type = "ldap"
-        self.server = Server(server, get_info=ALL)
-        self.conn = Connection(
-            server=self.server, user=user, password=password, auto_bind=True
+        self.pool = LdapPool(
+            server,
+            user,
+            password,
+            size=pool_size,
+            strategy=pool_strategy,
+            probe_dn=base_dn,
+            probe_interval=probe_interval,
+            schema_cache=schema_cache,
         )
+        if not lazy_schema:
+            self.pool.schema
         self.base_dn = base_dn
+        self.page_size = page_size
         self.base_ou_object_class = ["organizationalUnit", "top", "extensibleObject"]
-        self.base_ou_object_def = ObjectDef(
-            object_class=self.base_ou_object_class, schema=self.conn
-        )
+        self.object_defs: Dict[str, ObjectDef] = {}
         self.base_ou = {
             "user": {
                 "sub_item_object_class": [
@@ -112,9 +177,44 @@ class Ldap(Driver):
             "group": {"sub_item_object_class": [], "sub_item_extra_attr": []},
         }
 
+        self.index: Dict[str, EntryIndex] = {}
+        self.write_errors: List[WriteResult] = []
+        self.member_batch = member_batch
+        # dept dn(小写) -> (dept dn, {user dn(小写): (user dn, source)} 加入, 移出)
+        self.member_changes: Dict[str, tuple] = {}
+        # 多个线程写入时保护索引与 write_errors
+        self.lock = threading.RLock()
+        self.pipeline = pipeline
+        self.writer = None
+        # message_id -> (operation, dn, source, undo, busy)
+        # busy 为新增、改名、删除涉及的 dn，依赖它们的写操作需要等待
+        self.pending: "OrderedDict[int, tuple]" = OrderedDict()
+        # 新增的 dn(小写) -> 等待新增成功后才发出的写操作
+        self.deferred: Dict[str, List[tuple]] = {}
+        # 依赖的新增已经成功、可以发出的写操作
+        self.ready: List[tuple] = []
         self.__create_base_ou()
+        if pipeline > 0:
+            self.writer = self.pool.connect(client_strategy=ASYNC)
+        if preload or pipeline > 0:
+            self.preload()
 
     def __create_base_ou(self):
+        # 一次查询确认全部 base ou 是否存在，不需要 schema
+        def search(conn):
+            conn.search(
+                self.base_dn,
+                "(|{})".format("".join("(ou={})".format(i) for i in self.base_ou)),
+                search_scope=LEVEL,
+                attributes=["ou"],
+            )
+            return set(
+                item["dn"].lower()
+                for item in conn.response or []
+                if item.get("type") == "searchResEntry"
+            )
+
+        exist = self.pool.run(search)
         for base_ou_name, sub_item_conf in self.base_ou.items():
 
             # set base ou dn
@@ -133,21 +233,7 @@ class Ldap(Driver):
                 object_class,
             )
 
-            # set base ou sub item object def
-            obj_def = ObjectDef(sub_item_conf["sub_item_object_class"], self.conn)
-            for extra_attr in sub_item_conf["sub_item_extra_attr"]:
-                obj_def += extra_attr["attr"]
-            setattr(
-                self,
-                "{}_object_def".format(base_ou_name),
-                obj_def,
-            )
-
-            if not self.search_entry(
-                object_def=self.base_ou_object_def,
-                base=self.base_dn,
-                query="(ou={})".format(base_ou_name),
-            ):
+            if dn.lower() not in exist:
                 attributes = {}
                 for item in sub_item_conf["sub_item_extra_attr"]:
                     attributes[item["attr"]] = item["value"]
@@ -155,14 +241,56 @@ class Ldap(Driver):
                     dn=dn, object_class=self.base_ou_object_class, attributes=attributes
                 )
 
+    def get_object_def(self, name: str) -> ObjectDef:
+        """base ou 下条目的 ObjectDef，第一次使用时按 schema 创建"""
+        if name not in self.object_defs:
+            if name == "base_ou":
+                object_class, extra_attrs = self.base_ou_object_class, []
+            else:
+                object_class = self.base_ou[name]["sub_item_object_class"]
+                extra_attrs = self.base_ou[name]["sub_item_extra_attr"]
+            obj_def = ObjectDef(object_class, self.pool.schema)
+            for extra_attr in extra_attrs:
+                obj_def += extra_attr["attr"]
+            self.object_defs[name] = obj_def
+        return self.object_defs[name]
+
+    @property
+    def base_ou_object_def(self) -> ObjectDef:
+        return self.get_object_def("base_ou")
+
+    @property
+    def user_object_def(self) -> ObjectDef:
+        return self.get_object_def("user")
+
+    @property
+    def dept_object_def(self) -> ObjectDef:
+        return self.get_object_def("dept")
+
+    @property
+    def group_object_def(self) -> ObjectDef:
+        return self.get_object_def("group")
+
     def create_entry(
-        self, dn: str, object_class: Union[str, List[str]], attributes: Dict = {}
+        self,
+        dn: str,
+        object_class: Union[str, List[str]],
+        attributes: Dict = {},
+        source: Any = None,
     ) -> bool:
-        result = False
-        result = self.conn.add(
-            dn=dn,
-            object_class=object_class,
-            attributes={k: v for k, v in attributes.items() if v},
+        index = self.index_of(dn)
+        result = self._write(
+            "add",
+            dn,
+            lambda conn: conn.add(
+                dn=dn,
+                object_class=object_class,
+                attributes={k: v for k, v in attributes.items() if v},
+            ),
+            source=source,
+            apply=(lambda: index.add(dn, attributes)) if index is not None else None,
+            undo=(lambda: index.remove(dn)) if index is not None else None,
+            busy=[dn],
         )
         logging.debug(
             "create entry {} with dn: {}, object_class: {}, attribuets: {}".format(
@@ -171,17 +299,374 @@ class Ldap(Driver):
         )
         return result
 
+    def modify_entry(
+        self, dn: str, changes: Dict, source: Any = None, requires: Optional[str] = None
+    ) -> bool:
+        index = self.index_of(dn)
+        entry = index.get(dn) if index is not None else None
+        return self._write(
+            "modify",
+            dn,
+            lambda conn: conn.modify(dn=dn, changes=changes),
+            source=source,
+            apply=(lambda: index.modify(dn, changes)) if index is not None else None,
+            undo=self._restore(index, entry),
+            requires=requires,
+        )
+
+    def rename_entry(
+        self,
+        dn: str,
+        new_rdn: str,
+        new_superior: Optional[str] = None,
+        source: Any = None,
+    ) -> bool:
+        if self._members_under(dn):
+            self.flush_members()
+        new_dn = "{},{}".format(new_rdn, new_superior or dn.split(",", 1)[1])
+        index = self.index_of(dn)
+        return self._write(
+            "rename",
+            dn,
+            lambda conn: conn.modify_dn(dn, new_rdn, new_superior=new_superior),
+            source=source,
+            apply=(lambda: index.rename(dn, new_dn)) if index is not None else None,
+            undo=(lambda: index.rename(new_dn, dn)) if index is not None else None,
+            busy=[dn, new_dn],
+        )
+
+    def delete_entry(self, dn: str, source: Any = None) -> bool:
+        if self._members_under(dn):
+            self.flush_members()
+        index = self.index_of(dn)
+        entry = index.get(dn) if index is not None else None
+        return self._write(
+            "delete",
+            dn,
+            lambda conn: conn.delete(dn),
+            source=source,
+            apply=(lambda: index.remove(dn)) if index is not None else None,
+            undo=self._restore(index, entry),
+            busy=[dn],
+        )
+
+    @staticmethod
+    def _restore(index: Optional[EntryIndex], entry) -> Optional[Callable]:
+        """写操作失败时把索引中的条目恢复为写之前的属性"""
+        if index is None or entry is None:
+            return None
+        dn = entry.entry_dn
+        attributes = {k: list(v) for k, v in entry.entry_attributes_as_dict.items()}
+        return lambda: index.add(dn, attributes)
+
+    def _write(
+        self,
+        operation: str,
+        dn: str,
+        call: Callable,
+        source: Any = None,
+        apply: Optional[Callable] = None,
+        undo: Optional[Callable] = None,
+        busy: List[str] = [],
+        requires: Optional[str] = None,
+    ) -> bool:
+        """
+        同步模式下执行写操作，成功后更新索引；
+        pipeline 模式下发出请求后立即更新索引并返回 True，失败时在收集结果时用 undo 恢复索引；
+        requires 为正在新增的 dn 时写操作先保留，新增成功后才发出，失败则记为失败
+        """
+        if self.writer is None:
+            result, ldap_result = self.pool.run(lambda conn: (call(conn), conn.result))
+            if result and apply:
+                with self.lock:
+                    apply()
+            self._record(operation, dn, source, result, ldap_result)
+            return result
+
+        if requires and self._adding(requires):
+            self.deferred.setdefault(requires.lower(), []).append(
+                (operation, dn, call, source, apply, undo, busy)
+            )
+            return True
+        if self._conflicts(dn, busy):
+            self._drain()
+        if self.writer.conn.closed:
+            # 连接断开后在途请求的结果已无法取得，全部记为失败后重新连接
+            self._drain()
+            self.writer.connect()
+        self.writer.stats["requests"] += 1
+        message_id = call(self.writer.conn)
+        if apply:
+            apply()
+        self.pending[message_id] = (
+            operation,
+            dn,
+            source,
+            undo,
+            [i.lower() for i in busy],
+        )
+        if len(self.pending) >= self.pipeline:
+            self._collect(next(iter(self.pending)))
+        self._release()
+        return True
+
+    def _adding(self, dn: str) -> bool:
+        dn = dn.lower()
+        return any(
+            operation == "add" and pending_dn.lower() == dn
+            for operation, pending_dn, _, _, _ in self.pending.values()
+        )
+
+    def _release(self) -> None:
+        """发出依赖的新增已经成功的写操作"""
+        ready, self.ready = self.ready, []
+        for operation, dn, call, source, apply, undo, busy in ready:
+            self._write(operation, dn, call, source, apply, undo, busy)
+
+    def _conflicts(self, dn: str, busy: List[str]) -> bool:
+        """
+        条目或其上级正在新增、改名、删除时需要先等待在途的请求完成；
+        新增、改名、删除还需要等待条目及其下级上在途的修改
+        """
+        targets = [i.lower() for i in [dn, *busy]]
+        structural = [i.lower() for i in busy]
+        for _, pending_dn, _, _, pending_busy in self.pending.values():
+            for b in pending_busy:
+                for t in targets:
+                    if t == b or t.split(",", 1)[-1] == b:
+                        return True
+                for t in structural:
+                    if b.endswith("," + t):
+                        return True
+            if not pending_busy:
+                pending_dn = pending_dn.lower()
+                for t in structural:
+                    if pending_dn == t or pending_dn.endswith("," + t):
+                        return True
+        return False
+
+    def _collect(self, message_id: int) -> WriteResult:
+        operation, dn, source, undo, _ = self.pending.pop(message_id)
+        try:
+            _, result = self.writer.conn.get_response(message_id)
+        except LDAPException as e:
+            result = {"result": -1, "description": str(e)}
+        success = result is not None and result.get("result") == 0
+        if not success:
+            self.writer.stats["errors"] += 1
+            if undo:
+                undo()
+        if operation == "add":
+            self._resolve(dn, success)
+        return self._record(operation, dn, source, success, result)
+
+    def _resolve(self, dn: str, success: bool) -> None:
+        """新增完成后放行等待它的写操作；新增失败时丢弃它们以及合并中的加入部门"""
+        deferred = self.deferred.pop(dn.lower(), [])
+        if success:
+            self.ready.extend(deferred)
+            return
+        skipped = {"result": -1, "description": "{} was not added".format(dn)}
+        for operation, target, _, source, _, _, _ in deferred:
+            self._record(operation, target, source, False, skipped)
+        with self.lock:
+            for dept_dn, add, _ in self.member_changes.values():
+                member = add.pop(dn.lower(), None)
+                if member:
+                    self._record("modify", dept_dn, member[1], False, skipped)
+
+    def _record(
+        self, operation: str, dn: str, source: Any, success: bool, result: Optional[Dict]
+    ) -> WriteResult:
+        description = (result or {}).get("description", "")
+        write_result = WriteResult(operation, dn, source, bool(success), description)
+        if not success:
+            with self.lock:
+                self.write_errors.append(write_result)
+            logging.debug("{} {} failed: {}".format(operation, dn, description))
+        return write_result
+
+    def _drain(self) -> List[WriteResult]:
+        """等待全部在途(包括等待新增完成)的写操作完成，返回它们的结果"""
+        results = []
+        while self.pending or self.ready:
+            results.extend(self._collect(i) for i in list(self.pending))
+            self._release()
+        return results
+
+    def flush(self) -> List[WriteResult]:
+        """写入合并的部门成员修改，再等待全部在途的写操作完成，返回在途写操作的结果"""
+        results = self._drain()
+        self.flush_members()
+        return results + self._drain()
+
+    def modify_member(
+        self, dept_dn: str, user_dn: str, operation=MODIFY_ADD, source: Any = None
+    ) -> bool:
+        """
+        把用户加入(MODIFY_ADD)或移出(MODIFY_DELETE)部门
+        开启 member_batch 时只记录修改并返回 True，flush_members 时按部门合并写入
+        """
+        if not self.member_batch:
+            return self.modify_entry(
+                dn=dept_dn,
+                changes={"member": [(operation, [user_dn])]},
+                source=source,
+                requires=user_dn if operation == MODIFY_ADD else None,
+            )
+        with self.lock:
+            _, add, delete = self.member_changes.setdefault(
+                dept_dn.lower(), (dept_dn, {}, {})
+            )
+            target, other = (add, delete) if operation == MODIFY_ADD else (delete, add)
+            # 同一成员先加入后移出(或相反)时以最后一次为准
+            other.pop(user_dn.lower(), None)
+            target[user_dn.lower()] = (user_dn, source)
+        return True
+
+    def _read_members(self, dns: List[str]) -> Dict[str, set]:
+        """读取部门现有的成员，部门较少时逐个读取，否则分页读取整个部门子树"""
+        if len(dns) > 20:
+            entries = self.paged_entries(
+                self.dept_base_dn, "(objectClass=organizationalUnit)", ["member"]
+            )
+        else:
+            self._drain()
+
+            def read(conn, dn):
+                conn.search(dn, "(objectClass=*)", search_scope=BASE, attributes=["member"])
+                for item in conn.response or []:
+                    if item.get("type") == "searchResEntry":
+                        return item["attributes"].get("member", [])
+                return []
+
+            entries = [
+                (dn, {"member": self.pool.run(lambda conn: read(conn, dn))})
+                for dn in dns
+            ]
+        return {
+            dn.lower(): set(i.lower() for i in attributes.get("member", []))
+            for dn, attributes in entries
+        }
+
+    def flush_members(self) -> int:
+        """
+        把记录的部门成员修改按部门合并写入，跳过已经是(或已经不是)成员的用户，
+        每个 modify 最多包含 member_batch 个值，返回发出的 modify 数量
+        """
+        # 先收集在途的新增，新增失败的用户不再加入部门
+        self._drain()
+        with self.lock:
+            member_changes, self.member_changes = self.member_changes, {}
+        if not member_changes:
+            return 0
+        existing = self._read_members([dn for dn, _, _ in member_changes.values()])
+        requests = 0
+        for key, (dn, add, delete) in member_changes.items():
+            current = existing.get(key, set())
+            for operation, values in (
+                (MODIFY_DELETE, [v for k, v in delete.items() if k in current]),
+                (MODIFY_ADD, [v for k, v in add.items() if k not in current]),
+            ):
+                for i in range(0, len(values), self.member_batch):
+                    chunk = values[i : i + self.member_batch]
+                    self.modify_entry(
+                        dn=dn,
+                        changes={"member": [(operation, [v[0] for v in chunk])]},
+                        source=[v[1] for v in chunk],
+                    )
+                    requests += 1
+        logging.debug(
+            "flush members of {} depts with {} requests".format(
+                len(member_changes), requests
+            )
+        )
+        return requests
+
+    def _members_under(self, dn: str) -> bool:
+        dn = dn.lower()
+        return any(
+            key == dn or key.endswith("," + dn) for key in list(self.member_changes)
+        )
+
+    def paged_entries(
+        self,
+        base: str,
+        query: str,
+        attributes: List[str],
+        page_size: Optional[int] = None,
+    ) -> Iterator[tuple]:
+        """分页读取 base 下的全部条目，生成 (dn, {attr: [values]})，不需要 schema"""
+        self._drain()
+        with self.pool.acquire() as conn:
+            for item in conn.extend.standard.paged_search(
+                search_base=base,
+                search_filter=query,
+                attributes=attributes,
+                paged_size=page_size or self.page_size,
+                generator=True,
+            ):
+                if item.get("type") != "searchResEntry":
+                    continue
+                yield item["dn"], {
+                    attr: value if isinstance(value, list) else [value]
+                    for attr, value in item["attributes"].items()
+                }
+
+    def preload(self) -> None:
+        """用户与部门各一次分页查询读入内存索引"""
+        self.index = {
+            "dept": EntryIndex(
+                self.dept_base_dn,
+                attributes=["ou", "departmentNumber"],
+                keys=["ou", "departmentNumber"],
+            ),
+            "user": EntryIndex(
+                self.user_base_dn,
+                attributes=["cn", "uniqueIdentifier", *USER_SYNC_ATTRS],
+                keys=["uniqueIdentifier", "cn", "email", "mobile"],
+            ),
+        }
+        for index, query in (
+            (self.index["dept"], "(objectClass=organizationalUnit)"),
+            (self.index["user"], "(objectClass=inetOrgPerson)"),
+        ):
+            for dn, attributes in self.paged_entries(
+                index.base, query, list(index.attributes.values())
+            ):
+                index.add(dn, attributes)
+        logging.debug(
+            "preload {} depts, {} users".format(
+                len(self.index["dept"]), len(self.index["user"])
+            )
+        )
+
+    def index_of(self, dn: str) -> Optional[EntryIndex]:
+        for index in self.index.values():
+            if index.covers(dn):
+                return index
+        return None
+
     def search_entry(
-        self, object_def: ObjectDef, base: str, query: Optional[str] = ""
+        self,
+        object_def: ObjectDef,
+        base: str,
+        query: Optional[str] = "",
+        attributes: Optional[List[str]] = None,
     ) -> List[Entry]:
-        r = Reader(
-            connection=self.conn,
-            object_def=object_def,
-            base=base,
-            query=query,
-        )
+        self._drain()
         try:
-            result = r.search()
+            result = self.pool.run(
+                lambda conn: list(
+                    Reader(
+                        connection=conn,
+                        object_def=object_def,
+                        base=base,
+                        query=query,
+                        attributes=attributes,
+                    ).search_paged(self.page_size, paged_criticality=False)
+                )
+            )
             logging.debug(
                 "query:{}, result:{}".format(
                     query, [entry.entry_dn for entry in result]
@@ -189,9 +674,35 @@ class Ldap(Driver):
             )
             return result
         except Exception as e:
-            logging.error("query:{}".format(query), e)
+            logging.error("query:{}, error: {}".format(query, e))
             return []
 
+    def search_entry_paged(
+        self,
+        object_def: ObjectDef,
+        base: str,
+        query: Optional[str] = "",
+        attributes: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Entry]:
+        """
+        search_entry 的生成器版本，使用分页查询(RFC 2696)边读取边生成条目，
+        每页 page_size(默认为 Ldap 的 page_size)个；attributes 为只读取的属性，默认为 object_def 的全部属性
+        迭代期间占用连接池中的一个连接，中途遇到网络错误时不会重试
+        """
+        self._drain()
+        with self.pool.acquire() as conn:
+            reader = Reader(
+                connection=conn,
+                object_def=object_def,
+                base=base,
+                query=query,
+                attributes=attributes,
+            )
+            yield from reader.search_paged(
+                page_size or self.page_size, paged_criticality=False
+            )
+
     def search_dept(
         self,
         dept: Optional[Dept] = None,
@@ -215,6 +726,14 @@ class Ldap(Driver):
             else:
                 dept_id_list = [dept_id]
 
+        if "dept" in self.index:
+            if dept_id_list == ["1"]:
+                policy = "any"
+            with self.lock:
+                return self.index["dept"].search(
+                    {"ou": dept_name, "departmentNumber": dept_id_list}, policy=policy
+                )
+
         s_tmp = ""
         for id in dept_id_list:
             s_tmp += "(departmentNumber={})".format(id)
@@ -258,7 +777,10 @@ class Ldap(Driver):
             attributes["cn"] = dept.ou
 
             result = self.create_entry(
-                dn=dn, object_class=self.dept_object_class, attributes=attributes
+                dn=dn,
+                object_class=self.dept_object_class,
+                attributes=attributes,
+                source=dept,
             )
 
         logging.debug(
@@ -271,10 +793,15 @@ class Ldap(Driver):
         return result
 
     def search_user(self, user: User, policy="any"):
-        query_list = []
-        for k, v in user.dict(
+        criteria = user.dict(
             include={"uniqueIdentifier": ..., "cn": ..., "email": ..., "mobile": ...}
-        ).items():
+        )
+        if "user" in self.index:
+            with self.lock:
+                return self.index["user"].search(criteria, policy=policy)
+
+        query_list = []
+        for k, v in criteria.items():
             query_str4_attr_k = ""
             if isinstance(v, list):
                 list_tmp = []
@@ -294,9 +821,7 @@ class Ldap(Driver):
             object_def=self.user_object_def, base=self.user_base_dn, query=query
         )
 
-    def create_user(self, user: User):
-        # TODO: POSIX 账号集成
-        dn = "cn={},{}".format(user.cn, self.user_base_dn)
+    def user_attributes(self, user: User) -> Dict:
         attributes = user.dict(
             include={
                 "uniqueIdentifier": ...,
@@ -313,24 +838,34 @@ class Ldap(Driver):
             attributes["uid"] = NameTools.get_name_pinyin(user.cn)
         else:
             attributes["uid"] = user.cn
+        return attributes
+
+    @staticmethod
+    def default_password(attributes: Dict) -> str:
+        defualt_passwd = (
+            NameTools.get_name_pinyin(attributes["cn"]) + str(attributes["mobile"])[-4:]
+        )
+        return hashed(HASHED_SALTED_SHA, value=defualt_passwd)
+
+    def create_user(self, user: User):
+        # TODO: POSIX 账号集成
+        dn = "cn={},{}".format(user.cn, self.user_base_dn)
+        attributes = self.user_attributes(user)
 
         msg = ""
         if self.search_user(user=user, policy="exact"):
             result = False
             msg = "already exist"
         else:
-            defualt_passwd = (
-                NameTools.get_name_pinyin(attributes["cn"])
-                + str(attributes["mobile"])[-4:]
-            )
-            hashed_password = hashed(HASHED_SALTED_SHA, value=defualt_passwd)
-            attributes["userPassword"] = hashed_password
+            attributes["userPassword"] = self.default_password(attributes)
             result = self.create_entry(
                 dn=dn,
                 object_class=self.user_object_class,
                 attributes=attributes,
+                source=user,
             )
 
+        # pipeline 模式下 result 只表示已发出，加入部门的修改会等新增成功后才发出
         if result and user.departmentNumber:
             self.add_user2dept(user)
 
@@ -344,18 +879,302 @@ class Ldap(Driver):
         return result
 
     def add_user2dept(self, user: User):
+        user_dn = "cn=" + user.cn + "," + self.user_base_dn
         for departmentNumber in user.departmentNumber:
-            r_dept = self.search_dept(dept_id=departmentNumber, policy="exact")
-            if r_dept:
-                dept = r_dept[0]
-                dn = dept.entry_dn
-                user_dn = "cn=" + user.cn + "," + self.user_base_dn
-                result = self.conn.modify(
-                    dn=dept.entry_dn,
-                    changes={"member": [(MODIFY_ADD, [user_dn])]},
+            self.update_member(departmentNumber, user_dn, MODIFY_ADD, source=user)
+
+    def update_member(
+        self, dept_id: str, user_dn: str, operation=MODIFY_ADD, source: Any = None
+    ) -> bool:
+        """把用户加入(MODIFY_ADD)或移出(MODIFY_DELETE)部门"""
+        r_dept = self.search_dept(dept_id=dept_id, policy="exact")
+        if not r_dept:
+            return False
+        result = self.modify_member(r_dept[0].entry_dn, user_dn, operation, source)
+        logging.debug(
+            "{} {} member {} {}".format(
+                r_dept[0].entry_dn,
+                "add" if operation == MODIFY_ADD else "delete",
+                user_dn,
+                "success" if result else "failed",
+            )
+        )
+        return result
+
+    def get_user_entry(self, unique_identifier: str) -> Optional[Entry]:
+        if "user" in self.index:
+            with self.lock:
+                entries = self.index["user"].search(
+                    {"uniqueIdentifier": unique_identifier}
                 )
+            return entries[0] if entries else None
+        # email 等属性不在 inetOrgPerson 中，需要显式指定才能读到
+        self._drain()
+
+        def search(conn) -> Optional[Entry]:
+            conn.search(
+                search_base=self.user_base_dn,
+                search_filter="(uniqueIdentifier={})".format(unique_identifier),
+                attributes=["cn", *USER_SYNC_ATTRS],
+            )
+            return conn.entries[0] if conn.entries else None
+
+        return self.pool.run(search)
+
+    def update_user(self, user: User) -> bool:
+        """按 uniqueIdentifier 更新用户，不存在时创建；同步属性、姓名与所属部门"""
+        entry = self.get_user_entry(user.uniqueIdentifier[0])
+        if entry is None:
+            return self.create_user(user)
+
+        dn = entry.entry_dn
+        current = entry.entry_attributes_as_dict
+        changes = {}
+        for attr in USER_SYNC_ATTRS:
+            value = getattr(user, attr)
+            if value is None:
+                value = []
+            elif not isinstance(value, list):
+                value = [value]
+            value = [str(i) for i in value]
+            if sorted(value) != sorted(str(i) for i in current.get(attr, [])):
+                changes[attr] = [(MODIFY_REPLACE, value)]
+        result = True
+        if changes:
+            result = self.modify_entry(dn=dn, changes=changes, source=user)
+
+        old_depts = set(str(i) for i in current.get("departmentNumber", []))
+        new_depts = set(user.departmentNumber or [])
+        if user.cn not in current.get("cn", []):
+            # 改名后部门中的成员 dn 需要整体替换
+            result = (
+                self.rename_entry(dn, "cn={}".format(user.cn), source=user) and result
+            )
+            for dept_id in old_depts:
+                self.update_member(dept_id, dn, MODIFY_DELETE, source=user)
+            dn = "cn={},{}".format(user.cn, self.user_base_dn)
+            old_depts = set()
+        for dept_id in old_depts - new_depts:
+            self.update_member(dept_id, dn, MODIFY_DELETE, source=user)
+        for dept_id in new_depts - old_depts:
+            self.update_member(dept_id, dn, MODIFY_ADD, source=user)
+
+        logging.debug(
+            "update user {} {}, changes: {}".format(
+                user.cn, "success" if result else "failed", list(changes)
+            )
+        )
+        return result
+
+    def delete_user(self, unique_identifier: str) -> bool:
+        """删除用户并从所属部门中移除"""
+        entry = self.get_user_entry(unique_identifier)
+        if entry is None:
+            return False
+        dn = entry.entry_dn
+        for dept_id in entry.entry_attributes_as_dict.get("departmentNumber", []):
+            self.update_member(dept_id, dn, MODIFY_DELETE, source=unique_identifier)
+        result = self.delete_entry(dn, source=unique_identifier)
+        logging.debug("delete user {} {}".format(dn, "success" if result else "failed"))
+        return result
+
+    def update_dept(self, dept: Dept) -> bool:
+        """按 departmentNumber 更新部门，不存在时创建；部门改名或移动时修改 dn"""
+        r_dept = self.search_dept(dept_id=dept.departmentNumber, policy="exact")
+        if not r_dept:
+            return self.create_dept(dept)
+
+        dn = r_dept[0].entry_dn
+        if dn == self.dept_base_dn:
+            return True
+        parent_dn = self.dept_base_dn
+        if dept.parent_id:
+            parent_dept = self.search_dept(dept_id=dept.parent_id)
+            if parent_dept:
+                parent_dn = parent_dept[0].entry_dn
+
+        rdn, current_parent_dn = dn.split(",", 1)
+        new_rdn = "ou={}".format(dept.ou)
+        result = True
+        if new_rdn != rdn or parent_dn.lower() != current_parent_dn.lower():
+            result = self.rename_entry(
+                dn,
+                new_rdn,
+                new_superior=parent_dn
+                if parent_dn.lower() != current_parent_dn.lower()
+                else None,
+                source=dept,
+            )
+            if result and new_rdn != rdn:
+                result = self.modify_entry(
+                    dn="{},{}".format(new_rdn, parent_dn),
+                    changes={"cn": [(MODIFY_REPLACE, [dept.ou])]},
+                    source=dept,
+                )
+        logging.debug(
+            "update dept {} {}".format(dept.ou, "success" if result else "failed")
+        )
+        return result
+
+    def delete_dept(self, dept_id: str) -> bool:
+        """删除部门，钉钉只允许删除没有子部门与成员的部门"""
+        r_dept = self.search_dept(dept_id=dept_id, policy="exact")
+        if not r_dept or r_dept[0].entry_dn == self.dept_base_dn:
+            return False
+        result = self.delete_entry(r_dept[0].entry_dn, source=dept_id)
+        logging.debug(
+            "delete dept {} {}".format(
+                r_dept[0].entry_dn, "success" if result else "failed"
+            )
+        )
+        return result
+
+    def load_entries(
+        self, base: str, query: str, attributes: List[str], key_attr: str
+    ) -> Dict[str, Dict]:
+        """
+        分页读取 base 下的全部条目(开启 preload 时直接使用内存索引)，按 key_attr 的每个值建立索引
+        返回 {key: {"dn": dn, attr: [values]}}，没有 key_attr 的条目忽略
+        """
+        result = {}
+        index = self.index_of(base)
+        if index is not None:
+            entries = (
+                (entry.entry_dn, entry.entry_attributes_as_dict)
+                for entry in index.entries.values()
+            )
+        else:
+            entries = self.paged_entries(base, query, attributes)
+        for dn, values in entries:
+            record = {"dn": dn, **values}
+            for key in record.get(key_attr, []):
+                result[str(key)] = record
+        logging.debug("load {} entries from {}".format(len(result), base))
+        return result
+
+    def load_depts(self) -> Dict[str, Dict]:
+        return self.load_entries(
+            self.dept_base_dn,
+            "(objectClass=organizationalUnit)",
+            ["ou", "departmentNumber"],
+            "departmentNumber",
+        )
+
+    def load_users(self) -> Dict[str, Dict]:
+        return self.load_entries(
+            self.user_base_dn,
+            "(objectClass=inetOrgPerson)",
+            ["cn", "uniqueIdentifier", *USER_SYNC_ATTRS],
+            "uniqueIdentifier",
+        )
+
+    def apply_plan(self, plan) -> Dict[str, int]:
+        """
+        执行 diff.compute_plan 生成的 SyncPlan，返回成功与失败的数量
+        一个变更的任一写操作(包括部门成员)失败即计为失败，写操作的 source 为对应的 Change
+        """
+
+        def modify_member(dept_ids, user_dn: str, operation, change) -> None:
+            for dept_id in dept_ids:
+                dept_dn = plan.dept_dns.get(str(dept_id))
+                # 已被删除的部门不需要移除成员
+                if dept_dn:
+                    self.modify_member(dept_dn, user_dn, operation, source=change)
+
+        errors = len(self.write_errors)
+        results = []
+        for change in plan:
+            dn = change.dn
+            result = False
+            if change.kind == "dept" and change.action == "add":
+                attributes = change.entry.dict(exclude={"parent_id": ...})
+                attributes["cn"] = change.entry.ou
+                result = self.create_entry(
+                    dn=change.new_dn,
+                    object_class=self.dept_object_class,
+                    attributes=attributes,
+                    source=change,
+                )
+            elif change.kind == "dept" and change.action == "move":
+                rdn, parent_dn = dn.split(",", 1)
+                new_rdn, new_parent_dn = change.new_dn.split(",", 1)
+                result = self.rename_entry(
+                    dn,
+                    new_rdn,
+                    new_superior=new_parent_dn
+                    if parent_dn.lower() != new_parent_dn.lower()
+                    else None,
+                    source=change,
+                )
+                if result and rdn != new_rdn:
+                    result = self.modify_entry(
+                        dn=change.new_dn,
+                        changes={"cn": [(MODIFY_REPLACE, [change.entry.ou])]},
+                        source=change,
+                    )
+            elif change.kind == "dept" and change.action == "delete":
+                result = self.delete_entry(dn, source=change)
+            elif change.kind == "user" and change.action == "add":
+                attributes = self.user_attributes(change.entry)
+                attributes["userPassword"] = self.default_password(attributes)
+                result = self.create_entry(
+                    dn=change.new_dn,
+                    object_class=self.user_object_class,
+                    attributes=attributes,
+                    source=change,
+                )
+                if result:
+                    modify_member(
+                        change.entry.departmentNumber or [],
+                        change.new_dn,
+                        MODIFY_ADD,
+                        change,
+                    )
+            elif change.kind == "user" and change.action in ("modify", "move"):
+                new_depts = set(str(i) for i in change.entry.departmentNumber or [])
+                old_depts = set(change.old_depts)
+                result = True
+                if change.action == "move":
+                    result = self.rename_entry(
+                        dn, change.new_dn.split(",", 1)[0], source=change
+                    )
+                    # 改名后部门中的成员 dn 需要整体替换
+                    modify_member(old_depts, dn, MODIFY_DELETE, change)
+                    old_depts = set()
+                if result and change.changes:
+                    result = self.modify_entry(
+                        dn=change.new_dn,
+                        changes={
+                            attr: [(MODIFY_REPLACE, value)]
+                            for attr, value in change.changes.items()
+                        },
+                        source=change,
+                    )
+                modify_member(
+                    old_depts - new_depts, change.new_dn, MODIFY_DELETE, change
+                )
+                modify_member(new_depts - old_depts, change.new_dn, MODIFY_ADD, change)
+            elif change.kind == "user" and change.action == "delete":
+                modify_member(change.old_depts, dn, MODIFY_DELETE, change)
+                result = self.delete_entry(dn, source=change)
+            results.append((change, result))
+
+        self.flush()
+        failed = set()
+        for error in self.write_errors[errors:]:
+            # 合并写入的部门成员修改的 source 为各个成员的 source
+            sources = error.source if isinstance(error.source, list) else [error.source]
+            failed.update(id(source) for source in sources)
+        stats = {"success": 0, "failed": 0}
+        for change, result in results:
+            result = result and id(change) not in failed
+            stats["success" if result else "failed"] += 1
             logging.debug(
-                "{} add member {} {}".format(
-                    dn, user_dn, "success" if result else "failed"
+                "{} {} {} {}".format(
+                    change.action,
+                    change.kind,
+                    change.new_dn or change.dn,
+                    "success" if result else "failed",
                 )
             )
+        return stats
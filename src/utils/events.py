@@ -0,0 +1,307 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+"""
+钉钉通讯录变更事件
+
+normalize_event 把回调消息与推送失败记录转换为统一格式，
+EventQueue 以 SQLite 持久化待处理事件，进程重启或应用失败后事件不会丢失，
+EventDispatcher 在 asyncio 中缓冲回调收到的事件，由多个 worker 批量写入 EventQueue，
+事件写入后回调才应答钉钉
+"""
+
+USER_EVENTS = frozenset(
+    ["user_add_org", "user_modify_org", "user_leave_org", "user_active_org"]
+)
+DEPT_EVENTS = frozenset(["org_dept_create", "org_dept_modify", "org_dept_remove"])
+SUPPORTED_EVENTS = USER_EVENTS | DEPT_EVENTS
+
+
+def normalize_event(payload: Dict) -> Optional[Dict]:
+    """
+    回调消息: {"EventType": "user_add_org", "UserId": [...], "TimeStamp": "..."}
+    推送失败记录: {"call_back_tag": "user_add_org", "user_add_org": {"userid": [...]}, "event_time": ...}
+    统一为 {"type", "user_ids", "dept_ids", "time"}，不关心的事件返回 None
+    """
+    if "EventType" in payload:
+        event_type = payload["EventType"]
+        data = payload
+        event_time = payload.get("TimeStamp")
+    else:
+        event_type = payload.get("call_back_tag")
+        data = payload.get(event_type) or {}
+        event_time = payload.get("event_time")
+    if event_type not in SUPPORTED_EVENTS:
+        return None
+
+    def ids(*keys: str) -> List:
+        for key in keys:
+            value = data.get(key)
+            if value is not None:
+                return value if isinstance(value, list) else [value]
+        return []
+
+    return {
+        "type": event_type,
+        "user_ids": [str(i) for i in ids("UserId", "userid", "userId")],
+        "dept_ids": [int(i) for i in ids("DeptId", "deptid", "deptId")],
+        "time": int(event_time) if event_time else int(time.time() * 1000),
+    }
+
+
+class EventRejected(Exception):
+    pass
+
+
+class EventQueue:
+    """
+    SQLite 持久化的事件队列，可由多个进程同时写入与消费
+    claim 取出的事件在 lease 秒内不会被其它消费者取到，处理成功后 ack 删除，
+    失败后 fail 按指数退避重新排队，超过 max_attempts 次后标记为 dead 保留待人工处理
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = 5,
+        retry_delay: float = 30,
+        lease: float = 300,
+        timeout: float = 30,
+    ) -> None:
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lease = lease
+        self.timeout = timeout
+        self._local = threading.local()
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS event ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "type TEXT NOT NULL, "
+            "payload TEXT NOT NULL, "
+            "created REAL NOT NULL, "
+            "available_at REAL NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, "
+            "dead INTEGER NOT NULL DEFAULT 0, "
+            "last_error TEXT)"
+        )
+        self._conn().execute(
+            "CREATE INDEX IF NOT EXISTS event_available ON event (dead, available_at)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 连接不能跨线程使用，每个线程一个连接
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def put(self, event: Dict) -> int:
+        now = time.time()
+        cursor = self._conn().execute(
+            "INSERT INTO event (type, payload, created, available_at) VALUES (?, ?, ?, ?)",
+            (event["type"], json.dumps(event), now, now),
+        )
+        return cursor.lastrowid
+
+    def put_many(self, events: List[Dict]) -> None:
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO event (type, payload, created, available_at) VALUES (?, ?, ?, ?)",
+                [(event["type"], json.dumps(event), now, now) for event in events],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def claim(self, limit: int = 100) -> List[Tuple[int, Dict]]:
+        """按写入顺序取出最多 limit 个可处理的事件，返回 [(id, event)]"""
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT id, payload FROM event WHERE dead = 0 AND available_at <= ? "
+                "ORDER BY id LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE event SET available_at = ? WHERE id = ?",
+                [(now + self.lease, row[0]) for row in rows],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            # COMMIT 失败(如 SQLITE_BUSY)时事务仍未结束
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return [(row[0], json.loads(row[1])) for row in rows]
+
+    def renew(self, event_ids: List[int]) -> None:
+        """处理时间较长时延长已取出事件的 lease"""
+        self._conn().executemany(
+            "UPDATE event SET available_at = ? WHERE id = ? AND dead = 0",
+            [(time.time() + self.lease, event_id) for event_id in event_ids],
+        )
+
+    def ack(self, event_id: int) -> None:
+        self._conn().execute("DELETE FROM event WHERE id = ?", (event_id,))
+
+    def fail(self, event_id: int, error: Exception) -> None:
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT attempts FROM event WHERE id = ?", (event_id,)
+        ).fetchone()
+        if row is None:
+            return
+        attempts = row[0] + 1
+        dead = attempts >= self.max_attempts
+        conn.execute(
+            "UPDATE event SET attempts = ?, dead = ?, available_at = ?, last_error = ? WHERE id = ?",
+            (
+                attempts,
+                int(dead),
+                time.time() + self.retry_delay * 2 ** (attempts - 1),
+                repr(error),
+                event_id,
+            ),
+        )
+        if dead:
+            logging.error(
+                "event {} failed {} times, giving up: {!r}.".format(
+                    event_id, attempts, error
+                )
+            )
+
+    def stats(self) -> Dict:
+        pending, dead = self._conn().execute(
+            "SELECT COALESCE(SUM(dead = 0), 0), COALESCE(SUM(dead = 1), 0) FROM event"
+        ).fetchone()
+        return {"pending": pending, "dead": dead}
+
+
+class EventDispatcher:
+    """
+    回调处理函数把事件放入内存队列，worker 在线程池中批量写入 EventQueue，
+    写入 SQLite 不会阻塞事件循环，并发到达的事件合并为一次事务；
+    put 在事件写入后返回，队列已满或写入失败时抛出 EventRejected，
+    由调用方拒绝本次推送让钉钉重试，已应答的事件不会丢失
+    """
+
+    def __init__(
+        self,
+        queue: EventQueue,
+        workers: int = 4,
+        maxsize: int = 10000,
+        batch_size: int = 100,
+        max_attempts: int = 3,
+    ) -> None:
+        """max_attempts: 数据库被锁住时每批事件最多尝试写入的次数"""
+        self.queue = queue
+        self.workers = workers
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.stats = {
+            "received": 0,
+            "persisted": 0,
+            "rejected": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+        self._buffer: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._buffer = asyncio.Queue(self.maxsize)
+        self._tasks = [
+            asyncio.ensure_future(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """等待内存中的事件全部写入后停止 worker"""
+        if self._buffer is None:
+            return
+        await self._buffer.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, event: Dict) -> Optional[asyncio.Future]:
+        """放入内存队列，返回写入完成的 Future；队列已满时返回 None"""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._buffer.put_nowait((event, future))
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            return None
+        self.stats["received"] += 1
+        return future
+
+    async def put(self, event: Dict) -> None:
+        """等待事件写入 EventQueue"""
+        future = self.submit(event)
+        if future is None:
+            raise EventRejected("event queue is full")
+        try:
+            await future
+        except Exception as e:
+            raise EventRejected("persist event error: {}".format(e))
+
+    def pending(self) -> int:
+        return self._buffer.qsize() if self._buffer is not None else 0
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = [await self._buffer.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._buffer.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            events = [event for event, _ in batch]
+            try:
+                attempt = 1
+                while True:
+                    try:
+                        await loop.run_in_executor(None, self.queue.put_many, events)
+                        break
+                    except sqlite3.OperationalError as e:
+                        # 数据库被其它进程锁住时稍后重试，回调一直等待写入结果
+                        if attempt >= self.max_attempts:
+                            raise
+                        attempt += 1
+                        logging.warning("persist events error: {}, retrying.".format(e))
+                        await asyncio.sleep(1)
+                self.stats["persisted"] += len(batch)
+                self.stats["batches"] += 1
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+            except Exception as e:
+                # 回调以失败应答，钉钉会重新推送这些事件
+                logging.exception(
+                    "persist events error, rejected {} events.".format(len(batch))
+                )
+                self.stats["failed"] += len(batch)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._buffer.task_done()
@@ -0,0 +1,171 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+from ldap3 import MODIFY_ADD, MODIFY_DELETE, MODIFY_REPLACE
+
+"""
+ldap 条目的内存索引
+
+Ldap 开启 preload 后，ou=user、ou=dept 两棵子树各用一次分页查询读入内存，
+按常用的查询属性建立哈希索引，存在性与上级部门的查询不再访问 ldap 服务器；
+driver 自己的写操作成功后同步更新索引，其它客户端的修改不会反映到索引中
+"""
+
+
+def _values(value) -> List[str]:
+    if value is None:
+        return []
+    if not isinstance(value, (list, tuple, set)):
+        value = [value]
+    return [str(i) for i in value if i is not None and i != ""]
+
+
+class IndexedEntry:
+    """提供与 ldap3 Entry 相同的 entry_dn 与 entry_attributes_as_dict"""
+
+    __slots__ = ("entry_dn", "entry_attributes_as_dict")
+
+    def __init__(self, dn: str, attributes: Dict[str, List[str]]) -> None:
+        self.entry_dn = dn
+        self.entry_attributes_as_dict = attributes
+
+    def __repr__(self) -> str:
+        return "IndexedEntry({!r})".format(self.entry_dn)
+
+
+class EntryIndex:
+    def __init__(self, base: str, attributes: Iterable[str], keys: Iterable[str]) -> None:
+        """
+        base: 子树的 dn
+        attributes: 保存在内存中的属性
+        keys: 建立索引的属性，匹配时不区分大小写
+        """
+        self.base = base
+        self.attributes = {attr.lower(): attr for attr in attributes}
+        self.keys = list(keys)
+        self.entries: Dict[str, IndexedEntry] = {}
+        self.indexes: Dict[str, Dict[str, Set[str]]] = {key: {} for key in self.keys}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, dn: str) -> bool:
+        return dn.lower() in self.entries
+
+    def covers(self, dn: str) -> bool:
+        dn, base = dn.lower(), self.base.lower()
+        return dn == base or dn.endswith("," + base)
+
+    def get(self, dn: str) -> Optional[IndexedEntry]:
+        return self.entries.get(dn.lower())
+
+    def _link(self, entry: IndexedEntry) -> None:
+        dn = entry.entry_dn.lower()
+        for key in self.keys:
+            for value in entry.entry_attributes_as_dict.get(key, []):
+                self.indexes[key].setdefault(value.lower(), set()).add(dn)
+
+    def _unlink(self, entry: IndexedEntry) -> None:
+        dn = entry.entry_dn.lower()
+        for key in self.keys:
+            index = self.indexes[key]
+            for value in entry.entry_attributes_as_dict.get(key, []):
+                dns = index.get(value.lower())
+                if dns is not None:
+                    dns.discard(dn)
+                    if not dns:
+                        del index[value.lower()]
+
+    def add(self, dn: str, attributes: Dict) -> None:
+        self.remove(dn)
+        values = {}
+        for attr, value in attributes.items():
+            name = self.attributes.get(attr.lower())
+            if name and _values(value):
+                values[name] = _values(value)
+        entry = IndexedEntry(dn, values)
+        self.entries[dn.lower()] = entry
+        self._link(entry)
+
+    def remove(self, dn: str) -> None:
+        entry = self.entries.pop(dn.lower(), None)
+        if entry is not None:
+            self._unlink(entry)
+
+    def modify(self, dn: str, changes: Dict) -> None:
+        """changes 与 ldap3 Connection.modify 的参数相同"""
+        entry = self.get(dn)
+        if entry is None:
+            return
+        self._unlink(entry)
+        attributes = entry.entry_attributes_as_dict
+        for attr, operations in changes.items():
+            name = self.attributes.get(attr.lower())
+            if not name:
+                continue
+            for operation, value in operations:
+                current = attributes.get(name, [])
+                if operation == MODIFY_REPLACE:
+                    current = _values(value)
+                elif operation == MODIFY_ADD:
+                    current = current + [i for i in _values(value) if i not in current]
+                elif operation == MODIFY_DELETE:
+                    removed = _values(value)
+                    current = [i for i in current if removed and i not in removed]
+                if current:
+                    attributes[name] = current
+                else:
+                    attributes.pop(name, None)
+        self._link(entry)
+
+    def rename(self, dn: str, new_dn: str) -> None:
+        """修改 dn，下级条目的 dn 随之改变；rdn 的属性值同时替换"""
+        old_suffix = "," + dn.lower()
+        for key in [key for key in self.entries if key.endswith(old_suffix)]:
+            entry = self.entries.pop(key)
+            self._unlink(entry)
+            entry.entry_dn = entry.entry_dn[: -len(dn)] + new_dn
+            self.entries[entry.entry_dn.lower()] = entry
+            self._link(entry)
+
+        entry = self.entries.pop(dn.lower(), None)
+        if entry is None:
+            return
+        self._unlink(entry)
+        old_attr, old_value = dn.split(",", 1)[0].split("=", 1)
+        new_attr, new_value = new_dn.split(",", 1)[0].split("=", 1)
+        attributes = entry.entry_attributes_as_dict
+        for attr, value, add in ((old_attr, old_value, False), (new_attr, new_value, True)):
+            name = self.attributes.get(attr.lower())
+            if not name:
+                continue
+            current = [i for i in attributes.get(name, []) if i.lower() != value.lower()]
+            if add:
+                current.append(value)
+            if current:
+                attributes[name] = current
+            else:
+                attributes.pop(name, None)
+        entry.entry_dn = new_dn
+        self.entries[new_dn.lower()] = entry
+        self._link(entry)
+
+    def search(self, criteria: Dict, policy: str = "any") -> List[IndexedEntry]:
+        """
+        criteria: {属性: 值或值的列表}，值为空的属性忽略
+        policy: any 匹配任一属性，exact 需要匹配全部属性；同一属性的多个值之间为或
+        """
+        matched: Optional[Set[str]] = None
+        for attr, value in criteria.items():
+            values = _values(value)
+            if not values:
+                continue
+            dns: Set[str] = set()
+            for v in values:
+                dns |= self.indexes[attr].get(v.lower(), set())
+            if matched is None:
+                matched = dns
+            elif policy == "exact":
+                matched = matched & dns
+            else:
+                matched = matched | dns
+        return [self.entries[dn] for dn in sorted(matched or ())]
@@ -0,0 +1,315 @@
+import hashlib
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from ldap3 import (
+    ALL,
+    BASE,
+    FIRST,
+    NONE,
+    ROUND_ROBIN,
+    SYNC,
+    Connection,
+    DsaInfo,
+    SchemaInfo,
+    Server,
+    ServerPool,
+)
+from ldap3.core.exceptions import LDAPCommunicationError
+
+"""
+ldap 连接池
+
+多个 ldap 副本组成 ldap3 的 ServerPool，按 round_robin 或 first(优先第一个可用)选择服务器，
+不可用的服务器暂时跳过；每个连接只被一个线程同时使用，多个线程可以并行写入。
+连接空闲超过 probe_interval 秒后在取出时探测一次，
+探测失败或执行中遇到网络错误(服务器重启、空闲超时断开)时重新建立连接并绑定，再重试操作。
+绑定时不读取 schema，第一次用到时读取一次，可以按服务器与 schema 的修改时间缓存到磁盘
+"""
+
+POOL_STRATEGIES = {"round_robin": ROUND_ROBIN, "first": FIRST}
+
+
+class PooledConnection:
+    """连接池中的一个连接及其统计"""
+
+    def __init__(self, pool: "LdapPool", client_strategy=SYNC) -> None:
+        self.pool = pool
+        self.client_strategy = client_strategy
+        self.conn: Optional[Connection] = None
+        self.last_used = 0.0
+        self.stats = {
+            "server": None,
+            "requests": 0,
+            "errors": 0,
+            "rebinds": 0,
+            "probes": 0,
+            "seconds": 0.0,
+        }
+        self.connect()
+
+    def connect(self) -> None:
+        if self.conn is not None:
+            try:
+                self.conn.unbind()
+            except Exception:
+                pass
+            self.stats["rebinds"] += 1
+        self.conn = Connection(
+            server=self.pool.server_pool,
+            user=self.pool.user,
+            password=self.pool.password,
+            client_strategy=self.client_strategy,
+            receive_timeout=self.pool.receive_timeout,
+            auto_bind=True,
+        )
+        self.stats["server"] = self.conn.server.host
+        self.last_used = time.monotonic()
+
+    def probe(self) -> bool:
+        """对 probe_dn 做一次 base 查询，确认连接可用"""
+        self.stats["probes"] += 1
+        try:
+            return not self.conn.closed and self.conn.search(
+                self.pool.probe_dn, "(objectClass=*)", search_scope=BASE, attributes=["1.1"]
+            )
+        except LDAPCommunicationError:
+            return False
+
+    def ensure(self) -> None:
+        if self.conn.closed or (
+            time.monotonic() - self.last_used > self.pool.probe_interval
+            and not self.probe()
+        ):
+            logging.warning(
+                "ldap connection to {} is not alive, reconnecting.".format(
+                    self.stats["server"]
+                )
+            )
+            self.connect()
+
+
+class LdapPool:
+    def __init__(
+        self,
+        servers: Union[str, List[str]],
+        user: str,
+        password: str,
+        size: int = 1,
+        strategy: str = "round_robin",
+        probe_dn: str = "",
+        probe_interval: float = 60,
+        max_retries: int = 2,
+        active: int = 3,
+        exhaust: int = 60,
+        connect_timeout: Optional[float] = 10,
+        receive_timeout: Optional[float] = 60,
+        schema_cache: Optional[str] = None,
+    ) -> None:
+        """
+        servers: 服务器地址的列表，或以逗号分隔的字符串
+        size: 连接数，同时执行 ldap 操作的线程数不超过 size
+        strategy: round_robin 轮流使用各个服务器，first 优先使用第一个可用的服务器
+        probe_dn: 探测连接时查询的条目
+        active: 建立连接时轮询全部服务器的次数，都不可用时抛出 LDAPServerPoolExhaustedError
+        exhaust: 不可用的服务器在 exhaust 秒内不再尝试
+        schema_cache: 缓存 schema 的目录，为空时不缓存
+        """
+        if isinstance(servers, str):
+            servers = [i.strip() for i in servers.split(",") if i.strip()]
+        if strategy not in POOL_STRATEGIES:
+            raise ValueError("unknown pool strategy: {}".format(strategy))
+        self.server_pool = ServerPool(
+            [Server(i, get_info=NONE, connect_timeout=connect_timeout) for i in servers],
+            POOL_STRATEGIES[strategy],
+            active=active,
+            exhaust=exhaust,
+        )
+        self.user = user
+        self.password = password
+        self.size = size
+        self.probe_dn = probe_dn
+        self.probe_interval = probe_interval
+        self.max_retries = max_retries
+        self.receive_timeout = receive_timeout
+        self.schema_cache = schema_cache
+        self._schema: Optional[SchemaInfo] = None
+        self._schema_lock = threading.Lock()
+        self.connections: List[PooledConnection] = []
+        self._pooled = 0
+        self._idle: "queue.LifoQueue[PooledConnection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        # 先建立一个连接，服务器不可用时在启动时就报错
+        self._reserve()
+        self._idle.put(self._new())
+
+    def _new(self, client_strategy=SYNC) -> PooledConnection:
+        connection = PooledConnection(self, client_strategy)
+        with self._lock:
+            self.connections.append(connection)
+        return connection
+
+    def _reserve(self) -> bool:
+        """还可以新建池中的连接时占用一个名额"""
+        with self._lock:
+            if self._pooled >= self.size:
+                return False
+            self._pooled += 1
+            return True
+
+    @property
+    def schema(self) -> Optional[SchemaInfo]:
+        """第一次访问时读取 schema(优先使用磁盘缓存)，并设置到池中的所有服务器上"""
+        if self._schema is None:
+            with self._schema_lock:
+                if self._schema is None:
+                    self._schema = self.run(self._load_schema)
+        return self._schema
+
+    def _schema_timestamp(self, conn: Connection) -> Optional[str]:
+        """subschema 条目的修改时间，schema 变化后缓存随之失效"""
+        conn.search(
+            "", "(objectClass=*)", search_scope=BASE, attributes=["subschemaSubentry"]
+        )
+        entry = conn.response[0]["attributes"] if conn.response else {}
+        subschema = entry.get("subschemaSubentry")
+        if isinstance(subschema, list):
+            subschema = subschema[0] if subschema else None
+        if not subschema:
+            return None
+        conn.search(
+            subschema,
+            "(objectClass=*)",
+            search_scope=BASE,
+            attributes=["modifyTimestamp", "createTimestamp"],
+        )
+        entry = conn.response[0]["attributes"] if conn.response else {}
+        timestamp = entry.get("modifyTimestamp") or entry.get("createTimestamp")
+        if isinstance(timestamp, list):
+            timestamp = timestamp[0] if timestamp else None
+        return str(timestamp) if timestamp else None
+
+    def _load_schema(self, conn: Connection) -> Optional[SchemaInfo]:
+        server = conn.server
+        if server.schema is None:
+            path = timestamp = None
+            if self.schema_cache:
+                timestamp = self._schema_timestamp(conn)
+                path = os.path.join(
+                    self.schema_cache,
+                    "schema-{}.json".format(
+                        hashlib.sha1(
+                            "{}:{}".format(server.host, server.port).encode()
+                        ).hexdigest()
+                    ),
+                )
+            cached = None
+            if path and timestamp:
+                try:
+                    with open(path) as f:
+                        cached = json.load(f)
+                except (OSError, ValueError):
+                    cached = None
+            if cached and cached.get("timestamp") == timestamp:
+                server.attach_dsa_info(DsaInfo.from_json(cached["info"]))
+                server.attach_schema_info(SchemaInfo.from_json(cached["schema"]))
+                logging.debug("load ldap schema of {} from {}".format(server.host, path))
+            else:
+                get_info, server.get_info = server.get_info, ALL
+                try:
+                    server.get_info_from_server(conn)
+                finally:
+                    server.get_info = get_info
+                if path and timestamp and server.schema is not None:
+                    self._save_schema(path, timestamp, server)
+        # 副本的 schema 相同，其它服务器直接使用
+        for other in self.server_pool.servers:
+            if other.schema is None:
+                other.attach_schema_info(server.schema)
+                other.attach_dsa_info(server.info)
+        return server.schema
+
+    @staticmethod
+    def _save_schema(path: str, timestamp: str, server: Server) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "timestamp": timestamp,
+                        "info": server.info.to_json(),
+                        "schema": server.schema.to_json(),
+                    },
+                    f,
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @contextmanager
+    def lease(self) -> Iterator[PooledConnection]:
+        """取出一个可用的连接，用完后放回；没有空闲连接且已达到 size 时等待"""
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._new() if self._reserve() else self._idle.get()
+        try:
+            connection.ensure()
+            yield connection
+        finally:
+            connection.last_used = time.monotonic()
+            self._idle.put(connection)
+
+    @contextmanager
+    def acquire(self) -> Iterator[Connection]:
+        with self.lease() as connection:
+            yield connection.conn
+
+    def run(self, operation: Callable[[Connection], object]):
+        """
+        在一个连接上执行 operation(conn)，遇到网络错误时重新连接并重试，最多 max_retries 次
+        重试的写操作可能已经在服务器上生效，会返回 entryAlreadyExists 之类的错误
+        """
+        with self.lease() as connection:
+            attempt = 0
+            while True:
+                start = time.perf_counter()
+                connection.stats["requests"] += 1
+                try:
+                    return operation(connection.conn)
+                except LDAPCommunicationError as e:
+                    connection.stats["errors"] += 1
+                    if attempt >= self.max_retries:
+                        raise
+                    attempt += 1
+                    logging.warning(
+                        "ldap operation on {} failed: {}, reconnecting ({}/{}).".format(
+                            connection.stats["server"], e, attempt, self.max_retries
+                        )
+                    )
+                    connection.connect()
+                finally:
+                    connection.stats["seconds"] += time.perf_counter() - start
+
+    def connect(self, client_strategy=SYNC) -> PooledConnection:
+        """建立一个不放入池中的连接(如 ASYNC 写连接)，统计同样计入 stats"""
+        return self._new(client_strategy)
+
+    def stats(self) -> List[Dict]:
+        return [dict(connection.stats) for connection in self.connections]
+
+    def close(self) -> None:
+        for connection in self.connections:
+            try:
+                connection.conn.unbind()
+            except Exception:
+                pass
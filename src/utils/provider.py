@@ -1,11 +1,21 @@
 import logging
+import queue
+import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 from dingtalk import api as dingtalk_api
+from dingtalk.api import throttle
+from dingtalk.api.base import TopException
 from pydantic import BaseModel
 
 from .schemas import DeptInDingtalk as Dept, UserInDingtalk as User
+from .tokenstore import MemoryTokenStore, TokenStore
+
+# 用户、部门不存在(已删除)时钉钉返回的错误码
+USER_NOT_FOUND_ERRCODES = (60121,)
+DEPT_NOT_FOUND_ERRCODES = (60003,)
 
 
 class Provider:
@@ -17,56 +27,93 @@ class Dingding(Provider):
     """
     通过钉钉接口获取、操作用户与组织关系数据"""
 
-    def __init__(self, appkey: str, appsecret: str) -> None:
+    def __init__(
+        self,
+        appkey: str,
+        appsecret: str,
+        qps: Optional[float] = None,
+        api_qps: Optional[float] = None,
+        concurrency: int = 8,
+        buffer_size: int = 1000,
+        token_store: Optional[TokenStore] = None,
+        token_margin: float = 300,
+    ) -> None:
+        """
+        qps: 该应用所有接口合计的每秒请求数上限
+        api_qps: 该应用单个接口的每秒请求数上限，两者都只作用于本客户端的请求
+        concurrency: 遍历部门时并发请求的线程数
+        buffer_size: get_user_all 在后台预先获取并缓存的用户数上限
+        token_store: access_token 的缓存，默认只在当前进程内缓存
+        token_margin: access_token 剩余有效期不足该秒数时提前刷新
+        """
         self.appkey = appkey
         self.appsecret = appsecret
-        self.__token_cache: Optional(Dict) = None
+        self.concurrency = concurrency
+        self.buffer_size = buffer_size
+        self.duplicate_records = 0
+        self.dept_user_stats: Dict = {}
+        self.token_store = token_store or MemoryTokenStore()
+        self.token_margin = token_margin
+        self.limiter = throttle.RateLimiter(
+            app_rate=qps or None, api_rate=api_qps or None
+        )
         logging.debug(
             "provider dingding initialized, appkey: {}, appsecret: {}".format(
                 appkey, appsecret
             )
         )
 
+    def _request(self, request_class: Callable, url: str, idempotent: bool = True):
+        """
+        创建使用本客户端限流器的请求
+        idempotent: 只读接口可以在读超时等请求可能已生效的失败后重试
+        """
+        req = request_class(url)
+        req.setRateLimiter(self.limiter)
+        req.setIdempotent(idempotent)
+        return req
+
     @property
     def access_token(self) -> str:
-        if self.__token_cache:
-            if self.__token_cache.get("expire_time") > time.time():
-                return self.__token_cache.get("access_token")
-        req = dingtalk_api.OapiGettokenRequest("https://oapi.dingtalk.com/gettoken")
+        return self.token_store.get_token(
+            self.appkey, self._fetch_token, self.token_margin
+        )
+
+    def _fetch_token(self) -> Tuple[str, float]:
+        req = self._request(
+            dingtalk_api.OapiGettokenRequest,
+            "https://oapi.dingtalk.com/gettoken",
+        )
         req.appkey = self.appkey
         req.appsecret = self.appsecret
         try:
-            resp = req.getResponse()
-            resp["expire_time"] = time.time() + resp.get("expires_in")
-            self.__token_cache = resp
-            logging.debug(
-                "provider dingding get and cached new token: {}, expire time: {}.".format(
-                    resp["access_token"],
-                    time.asctime(time.localtime(resp["expire_time"])),
-                )
-            )
-            return resp.get("access_token")
+            resp = req.getResponse(app=self.appkey)
+            logging.debug("provider dingding get new token of appkey {}.".format(self.appkey))
+            return resp["access_token"], resp["expires_in"]
         except Exception as e:
-            print(e)
+            logging.error("provider dingding get token error: {}.".format(e))
+            raise
 
     def get_sub_dept_list(self, parent_dept_id: int = 1) -> List[Dept]:
         """获取子部门列表"""
-        req = dingtalk_api.OapiV2DepartmentListsubRequest(
-            "https://oapi.dingtalk.com/topapi/v2/department/listsub"
+        req = self._request(
+            dingtalk_api.OapiV2DepartmentListsubRequest,
+            "https://oapi.dingtalk.com/topapi/v2/department/listsub",
         )
         req.dept_id = parent_dept_id
         try:
-            resp = req.getResponse(self.access_token)
+            resp = req.getResponse(self.access_token, app=self.appkey)
             sub_dept_list = [Dept.parse_obj(i) for i in resp.get("result")]
             logging.debug(
-                "provider dingding get sub dept list of dept_id {}, sub dept lsit: {}.".format(
-                    parent_dept_id, sub_dept_list
-                )
+                "provider dingding get sub dept list of dept_id %s, sub dept lsit: %s.",
+                parent_dept_id,
+                sub_dept_list,
             )
             return sub_dept_list
 
         except Exception as e:
             logging.error("provider dingding error: {}.".format(e))
+            raise
 
         #     [
         #            {
@@ -86,37 +133,81 @@ class Dingding(Provider):
         #         }
         # ]
 
-    def get_dept_list(self, parent_dept_id: int = 1) -> List[Dept]:
-        """递归获取所有部门"""
-        dept_list = [self.get_dept_detail(dep_id=parent_dept_id)]
-        for dept in self.get_sub_dept_list(parent_dept_id=parent_dept_id):
-            sub_list = self.get_dept_list(parent_dept_id=dept.dept_id)
-            if sub_list:
-                dept_list.extend(sub_list)
-        return dept_list
-
-    def get_dept_detail(self, dep_id: int = 1) -> Dept:
-        """获取部门详情"""
-        req = dingtalk_api.OapiV2DepartmentGetRequest(
-            "https://oapi.dingtalk.com/topapi/v2/department/get"
+    def get_dept_list(
+        self, parent_dept_id: int = 1, concurrency: Optional[int] = None
+    ) -> Iterator[Dept]:
+        """
+        获取所有部门
+        逐层并发请求同一层的子部门，耗时取决于部门树深度而不是部门数量；
+        子部门直接使用 listsub 的返回内容，只有起始部门需要获取部门详情。
+        返回顺序与逐个递归获取时相同: 父部门在前，子部门按钉钉返回的顺序排列
+        """
+        # 先取一次 token，避免各线程同时刷新
+        self.access_token
+        depts: Dict = {}
+        children: Dict = {}
+        seen = {str(parent_dept_id)}
+        level = [parent_dept_id]
+        with ThreadPoolExecutor(max_workers=concurrency or self.concurrency) as executor:
+            detail = executor.submit(self.get_dept_detail, parent_dept_id)
+            while level:
+                sub_futures = [
+                    executor.submit(self.get_sub_dept_list, dept_id) for dept_id in level
+                ]
+                next_level = []
+                for dept_id, sub in zip(level, sub_futures):
+                    children[dept_id] = []
+                    for dept in sub.result():
+                        if dept.dept_id not in seen:
+                            seen.add(dept.dept_id)
+                            depts[dept.dept_id] = dept
+                            children[dept_id].append(dept.dept_id)
+                    next_level.extend(children[dept_id])
+                level = next_level
+                logging.debug(
+                    "provider dingding: crawled {} depts, next level {}.".format(
+                        len(depts) + 1, len(level)
+                    )
+                )
+            depts[parent_dept_id] = detail.result()
+
+        stack = [parent_dept_id]
+        while stack:
+            dept_id = stack.pop()
+            yield depts.pop(dept_id)
+            stack.extend(reversed(children.pop(dept_id)))
+
+    def get_dept_detail(self, dep_id: int = 1, missing_ok: bool = False) -> Optional[Dept]:
+        """获取部门详情，missing_ok 时部门不存在返回 None"""
+        req = self._request(
+            dingtalk_api.OapiV2DepartmentGetRequest,
+            "https://oapi.dingtalk.com/topapi/v2/department/get",
         )
         req.dept_id = dep_id
         try:
-            resp = req.getResponse(self.access_token)
+            resp = req.getResponse(self.access_token, app=self.appkey)
             return Dept.parse_obj(resp.get("result"))
+        except TopException as e:
+            if missing_ok and e.errcode in DEPT_NOT_FOUND_ERRCODES:
+                return None
+            logging.error("provider dingding error: {}.".format(e))
+            raise
         except Exception as e:
             logging.error("provider dingding error: {}.".format(e))
+            raise
 
     def get_dept_userid_list(self, dept_id: int = 1) -> List:
-        req = dingtalk_api.OapiUserListidRequest(
-            "https://oapi.dingtalk.com/topapi/user/listid"
+        req = self._request(
+            dingtalk_api.OapiUserListidRequest,
+            "https://oapi.dingtalk.com/topapi/user/listid",
         )
         req.dept_id = dept_id
         try:
-            resp = req.getResponse(self.access_token)
+            resp = req.getResponse(self.access_token, app=self.appkey)
             return resp.get("result").get("userid_list")
         except Exception as e:
             logging.error("provider dingding error: {}.".format(e))
+            raise
 
         # [
         #     "usxxx",
@@ -126,34 +217,39 @@ class Dingding(Provider):
         # ]
 
     def get_dept_user_list(
-        self, dept_id: int = 1, cursor: int = 0, size: int = 50
-    ) -> List[User]:
-        user_list = []
-        while True:
-            req = dingtalk_api.OapiV2UserListRequest(
-                "https://oapi.dingtalk.com/topapi/v2/user/list"
+        self, dept_id: int = 1, cursor: int = 0, size: int = 100
+    ) -> Iterator[User]:
+        """
+        逐页获取部门用户，处理当前页时后台已在获取下一页
+        每个部门的页数、用户数与耗时记录在 dept_user_stats
+        """
+
+        def fetch(cursor: int, size: int) -> Dict:
+            req = self._request(
+                dingtalk_api.OapiV2UserListRequest,
+                "https://oapi.dingtalk.com/topapi/v2/user/list",
             )
             req.dept_id = dept_id
             req.cursor = cursor
             req.size = size
             try:
-                resp = req.getResponse(self.access_token)
-                user_list.extend(
-                    [User.parse_obj(user) for user in resp["result"]["list"]]
-                )
-                if resp["result"]["has_more"]:
-                    cursor = resp["next_cursor"]
-                else:
-                    break
+                return req.getResponse(self.access_token, app=self.appkey)["result"]
             except Exception as e:
                 logging.error("provider dingding error: {}.".format(e))
-                break
+                raise
+
+        paginator = Paginator(fetch, size=size, cursor=cursor)
+        for page in paginator.pages():
+            for user in page:
+                yield User.parse_obj(user)
+        stats = self.dept_user_stats[dept_id] = paginator.stats()
         logging.debug(
-            "provider dingding: get user list of dept_id {}, user list: {}.".format(
-                dept_id, user_list
-            )
+            "provider dingding: get %s users of dept_id %s in %s pages, %.3fs.",
+            stats["items"],
+            dept_id,
+            stats["pages"],
+            stats["elapsed"],
         )
-        return user_list
 
         # [
         #     {
@@ -187,25 +283,48 @@ class Dingding(Provider):
         #     }
         # ]
 
-    def get_user_all(self) -> List[User]:
-        user_list = [
-            user
-            for dept in self.get_dept_list()
-            for user in self.get_dept_user_list(dept.dept_id)
-        ]
-        logging.debug("provider dingding: get all user list {}.".format(user_list))
-        return user_list
-
-    def get_user_detail(self, user_id: int) -> Dict:
-        req = dingtalk_api.OapiV2UserGetRequest(
-            "https://oapi.dingtalk.com/topapi/v2/user/get"
+    def get_user_all(self) -> Iterator[User]:
+        """
+        遍历所有部门获取用户
+        后台线程预先获取，调用方处理已返回的用户时后续页面仍在获取，最多缓存 buffer_size 个用户；
+        同一用户在多个部门中只返回第一次出现的记录，跳过的重复记录数保存在 duplicate_records；
+        钉钉没有排除已获取用户的接口，每个部门的用户列表仍然全部获取，去重减少的是下游的 ldap 写入
+        """
+        return buffered(self._iter_user_all(), self.buffer_size)
+
+    def _iter_user_all(self) -> Iterator[User]:
+        seen = set()
+        self.duplicate_records = 0
+        for dept in self.get_dept_list():
+            for user in self.get_dept_user_list(dept.dept_id):
+                if merge_user_dept(seen, user, int(dept.dept_id)):
+                    yield user
+                else:
+                    self.duplicate_records += 1
+        logging.info(
+            "provider dingding: got {} users, skipped {} duplicate records.".format(
+                len(seen), self.duplicate_records
+            )
+        )
+
+    def get_user_detail(self, user_id: str) -> Optional[User]:
+        """获取用户详情，用户不存在(已离职)返回 None"""
+        req = self._request(
+            dingtalk_api.OapiV2UserGetRequest,
+            "https://oapi.dingtalk.com/topapi/v2/user/get",
         )
         req.userid = user_id
         try:
-            resp = req.getResponse(self.access_token)
-            return resp.get("userid_list")
+            resp = req.getResponse(self.access_token, app=self.appkey)
+            return User.parse_obj(resp.get("result"))
+        except TopException as e:
+            if e.errcode in USER_NOT_FOUND_ERRCODES:
+                return None
+            logging.error("provider dingding error: {}.".format(e))
+            raise
         except Exception as e:
             logging.error("provider dingding error: {}.".format(e))
+            raise
 
         # {
         #     "extension": '{"爱好":"旅游","年龄":"24"}',
@@ -250,3 +369,156 @@ class Dingding(Provider):
         #     "name": "杨xxx",
         #     "state_code": "86",
         # }
+
+    def get_failed_events(self) -> Iterator[Dict]:
+        """
+        拉取推送失败的回调事件
+        钉钉返回后即删除这些记录，调用方需要先持久化再处理
+        """
+        while True:
+            # 返回的记录随即被删除，重复请求会丢失事件
+            req = self._request(
+                dingtalk_api.OapiCallBackGetCallBackFailedResultRequest,
+                "https://oapi.dingtalk.com/call_back/get_call_back_failed_result",
+                idempotent=False,
+            )
+            try:
+                resp = req.getResponse(self.access_token, app=self.appkey)
+            except Exception as e:
+                logging.error("provider dingding error: {}.".format(e))
+                raise
+            yield from resp.get("failed_list") or []
+            if not resp.get("has_more"):
+                break
+
+
+class Paginator:
+    """
+    钉钉分页接口的分页器
+    fetch(cursor, size) 返回响应中的 result；游标分页时下一页游标取 result.next_cursor，
+    offset=True 时按偏移量分页，下一页为 cursor + size。
+    prefetch 为后台预先获取的页数，0 表示不预取
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int, int], Dict],
+        size: int = 100,
+        cursor: int = 0,
+        offset: bool = False,
+        list_key: str = "list",
+        prefetch: int = 1,
+    ) -> None:
+        self.fetch = fetch
+        self.size = size
+        self.cursor = cursor
+        self.offset = offset
+        self.list_key = list_key
+        self.prefetch = prefetch
+        self.pages_fetched = 0
+        self.items = 0
+        self.fetch_seconds = 0.0
+        self.elapsed = 0.0
+
+    def _iter_pages(self) -> Iterator[List]:
+        cursor = self.cursor
+        while True:
+            start = time.monotonic()
+            result = self.fetch(cursor, self.size)
+            self.fetch_seconds += time.monotonic() - start
+            page = result.get(self.list_key) or []
+            self.pages_fetched += 1
+            self.items += len(page)
+            yield page
+            if not (result.get("has_more") or result.get("hasMore")):
+                return
+            if self.offset:
+                cursor += self.size
+            else:
+                cursor = result.get("next_cursor")
+                if cursor is None:
+                    raise ValueError("has_more is set but result has no next_cursor")
+
+    def pages(self) -> Iterator[List]:
+        """逐页返回列表"""
+        start = time.monotonic()
+        pages = self._iter_pages()
+        if self.prefetch:
+            pages = buffered(pages, self.prefetch)
+        try:
+            yield from pages
+        finally:
+            self.elapsed = time.monotonic() - start
+
+    def __iter__(self) -> Iterator:
+        for page in self.pages():
+            yield from page
+
+    def stats(self) -> Dict:
+        return {
+            "pages": self.pages_fetched,
+            "items": self.items,
+            "fetch_seconds": self.fetch_seconds,
+            "elapsed": self.elapsed,
+        }
+
+
+def merge_user_dept(seen: set, user: User, dept_id: int) -> bool:
+    """
+    按 userid 去重，返回是否第一次出现
+    第一次出现时把当前部门并入 dept_id_list，钉钉返回的 dept_id_list 已包含用户的其它部门
+    """
+    if user.userid in seen:
+        return False
+    seen.add(user.userid)
+    dept_id_list = user.dept_id_list
+    if dept_id_list is None:
+        dept_id_list = []
+    elif not isinstance(dept_id_list, list):
+        dept_id_list = [dept_id_list]
+    if dept_id not in dept_id_list:
+        dept_id_list = dept_id_list + [dept_id]
+    user.dept_id_list = dept_id_list
+    return True
+
+
+T = TypeVar("T")
+
+
+def buffered(iterable: Iterable[T], maxsize: int) -> Iterator[T]:
+    """
+    在后台线程中迭代 iterable，最多缓存 maxsize 个元素
+    后台线程的异常在调用方迭代到该位置时抛出，调用方提前结束迭代时后台线程随之停止
+    """
+    items: queue.Queue = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((True, item)):
+                    return
+            put((False, None))
+        except BaseException as e:
+            put((False, e))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            ok, item = items.get()
+            if not ok:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,243 @@
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Dict, Iterator, Optional, Tuple
+
+"""
+access_token 的共享缓存
+
+同一应用的 token 可以在线程、进程(多个 uvicorn worker、定时任务)之间共享，
+刷新时加锁保证同一时刻只有一个调用方请求 gettoken，其余调用方等待后直接使用新 token
+"""
+
+
+class TokenStore(ABC):
+    """token 存储的基类，按 key(一般为 appkey)保存 {"access_token", "expire_time"}"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, token: Dict) -> None:
+        pass
+
+    @abstractmethod
+    def lock(self, key: str, blocking: bool = True) -> ContextManager[bool]:
+        """
+        刷新 token 时的互斥锁，上下文管理器返回是否拿到锁；
+        blocking=False 时拿不到锁立即返回 False，一般用 @contextmanager 实现
+        """
+
+    def get_token(
+        self,
+        key: str,
+        fetch: Callable[[], Tuple[str, float]],
+        margin: float = 300,
+    ) -> str:
+        """
+        获取 token，fetch 返回 (access_token, expires_in)
+        剩余有效期不足 margin 秒时提前刷新: 已过期则等待刷新，未过期时由拿到锁的调用方刷新，其余调用方继续使用旧 token
+        """
+        token = self.get(key)
+        now = time.time()
+        if token and token["expire_time"] - margin > now:
+            return token["access_token"]
+        expired = not token or token["expire_time"] <= now
+        with self.lock(key, blocking=expired) as locked:
+            if not locked:
+                return token["access_token"]
+            # 等锁期间可能已经由其它调用方刷新
+            token = self.get(key)
+            if token and token["expire_time"] - margin > time.time():
+                return token["access_token"]
+            access_token, expires_in = fetch()
+            token = {"access_token": access_token, "expire_time": time.time() + expires_in}
+            self.set(key, token)
+            logging.debug(
+                "token store: refreshed token of {}, expire time: {}.".format(
+                    key, time.asctime(time.localtime(token["expire_time"]))
+                )
+            )
+            return access_token
+
+
+class MemoryTokenStore(TokenStore):
+    """进程内缓存"""
+
+    def __init__(self) -> None:
+        self._tokens: Dict[str, Dict] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self._tokens.get(key)
+
+    def set(self, key: str, token: Dict) -> None:
+        self._tokens[key] = token
+
+    @contextmanager
+    def lock(self, key: str, blocking: bool = True) -> Iterator[bool]:
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        locked = lock.acquire(blocking)
+        try:
+            yield locked
+        finally:
+            if locked:
+                lock.release()
+
+
+class FileTokenStore(TokenStore):
+    """
+    JSON 文件缓存，使用 fcntl 文件锁在同一主机的多个进程间共享
+    文件整体替换写入，读取不需要加锁
+    """
+
+    def __init__(self, path: str) -> None:
+        import fcntl
+
+        self._fcntl = fcntl
+        self.path = path
+        self.lock_path = path + ".lock"
+        self._memory = MemoryTokenStore()
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self._load().get(key)
+
+    def set(self, key: str, token: Dict) -> None:
+        tokens = self._load()
+        tokens[key] = token
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(tokens, f)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @contextmanager
+    def lock(self, key: str, blocking: bool = True) -> Iterator[bool]:
+        # 先拿进程内的锁，同一进程的线程不必各自打开锁文件
+        with self._memory.lock(key, blocking) as locked:
+            if not locked:
+                yield False
+                return
+            with open(self.lock_path, "a") as f:
+                flags = self._fcntl.LOCK_EX | (0 if blocking else self._fcntl.LOCK_NB)
+                try:
+                    self._fcntl.flock(f, flags)
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    yield True
+                finally:
+                    self._fcntl.flock(f, self._fcntl.LOCK_UN)
+
+
+class SqliteTokenStore(TokenStore):
+    """
+    SQLite 缓存，供同一主机的多个进程共享
+    刷新时以 BEGIN IMMEDIATE 事务作为跨进程锁
+    """
+
+    def __init__(self, path: str, timeout: float = 30) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS access_token ("
+                "key TEXT PRIMARY KEY, access_token TEXT NOT NULL, expire_time REAL NOT NULL)"
+            )
+
+    def _connect(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self.path,
+            timeout=self.timeout if timeout is None else timeout,
+            isolation_level=None,
+        )
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        # 持有锁的线程复用锁所在的连接
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT access_token, expire_time FROM access_token WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"access_token": row[0], "expire_time": row[1]}
+
+    def set(self, key: str, token: Dict) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO access_token (key, access_token, expire_time) VALUES (?, ?, ?)",
+                (key, token["access_token"], token["expire_time"]),
+            )
+
+    @contextmanager
+    def lock(self, key: str, blocking: bool = True) -> Iterator[bool]:
+        conn = self._connect(None if blocking else 0)
+        try:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError:
+                if blocking:
+                    raise
+                yield False
+                return
+            self._local.conn = conn
+            try:
+                yield True
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+            finally:
+                self._local.conn = None
+        finally:
+            conn.close()
+
+
+def get_token_store(url: str) -> TokenStore:
+    """
+    按配置创建 token 存储
+    memory、file:<路径>、sqlite:<路径>
+    """
+    scheme, _, path = url.partition(":")
+    if scheme == "memory":
+        return MemoryTokenStore()
+    if scheme == "file" and path:
+        return FileTokenStore(path)
+    if scheme == "sqlite" and path:
+        return SqliteTokenStore(path)
+    raise ValueError("unsupported token store: {}".format(url))
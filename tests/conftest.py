@@ -0,0 +1,54 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "src")]
+
+import pytest
+
+
+@pytest.fixture
+def make_ldap(monkeypatch):
+    """
+    创建连接 ldap3 mock 服务器的 Ldap，同一个测试中的连接共享同一份数据
+    mock 服务器不能探测可用性，ServerPool 不做 active 检查
+    """
+    import ldap3
+    from ldap3 import ASYNC, MOCK_ASYNC, MOCK_SYNC, OFFLINE_SLAPD_2_4
+
+    from utils import driver, ldappool
+
+    servers = {}
+
+    def server(host, get_info=None, **kw):
+        if host not in servers:
+            servers[host] = ldap3.Server(host, get_info=OFFLINE_SLAPD_2_4, **kw)
+        return servers[host]
+
+    def connection(server, user=None, password=None, auto_bind=False, **kw):
+        mock = MOCK_ASYNC if kw.get("client_strategy") == ASYNC else MOCK_SYNC
+        kw["client_strategy"] = mock
+        conn = ldap3.Connection(server, user=user, password=password, **kw)
+        conn.strategy.add_entry(user, {"userPassword": password, "sn": "admin"})
+        conn.strategy.add_entry(
+            "dc=example,dc=org", {"objectClass": ["top", "domain"], "dc": "example"}
+        )
+        conn.bind()
+        return conn
+
+    monkeypatch.setattr(ldappool, "Server", server)
+    monkeypatch.setattr(ldappool, "Connection", connection)
+    monkeypatch.setattr(
+        ldappool,
+        "ServerPool",
+        lambda servers, strategy, active=True, exhaust=None: ldap3.ServerPool(
+            servers, strategy, active=False
+        ),
+    )
+
+    def make(**kw):
+        return driver.Ldap(
+            server="mock", user="cn=admin,dc=example,dc=org", password="pw", **kw
+        )
+
+    return make
@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from dingtalk.api import aio
+from dingtalk.api.base import RequestException, RestApi, TopException
+from dingtalk.api.throttle import RetryPolicy
+
+
+class PostApi(RestApi):
+    def getHttpMethod(self):
+        return "POST"
+
+
+def run(request, handler):
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        aio.setDefaultAsyncClient(client)
+        try:
+            return await request.getResponseAsync("token")
+        finally:
+            await aio.closeDefaultAsyncClient()
+
+    return asyncio.run(main())
+
+
+def test_get_response_async():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"errcode": 0, "result": {"userid": "u1"}})
+
+    request = PostApi("https://oapi.dingtalk.com/topapi/v2/user/get")
+    request.userid = "u1"
+    assert run(request, handler)["result"] == {"userid": "u1"}
+    assert seen[0].method == "POST"
+    assert seen[0].url.path == "/topapi/v2/user/get"
+    assert seen[0].url.params["access_token"] == "token"
+    assert json.loads(seen[0].content)["userid"] == "u1"
+
+
+def test_get_response_async_errcode():
+    def handler(request):
+        return httpx.Response(200, json={"errcode": 60121, "errmsg": "not found"})
+
+    with pytest.raises(TopException) as info:
+        run(PostApi("https://oapi.dingtalk.com/topapi/v2/user/get"), handler)
+    assert info.value.errcode == 60121
+
+
+def test_connect_error_is_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"errcode": 0})
+
+    request = PostApi("https://oapi.dingtalk.com/topapi/message/send")
+    request.setRetryPolicy(RetryPolicy(base_delay=0))
+    assert run(request, handler) == {"errcode": 0}
+    assert len(calls) == 2
+
+
+def test_read_timeout_of_post_is_not_resent():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    request = PostApi("https://oapi.dingtalk.com/topapi/message/send")
+    request.setRetryPolicy(RetryPolicy(base_delay=0))
+    with pytest.raises(RequestException):
+        run(request, handler)
+    assert len(calls) == 1
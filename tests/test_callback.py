@@ -0,0 +1,192 @@
+import asyncio
+import base64
+import json
+import os
+import sqlite3
+import time
+
+import pytest
+
+from utils.callback import CallbackCryptoError, DingCallbackCrypto
+from utils.events import EventDispatcher, EventQueue, EventRejected, normalize_event
+
+AES_KEY = base64.b64encode(b"k" * 32).decode()[:43]
+
+
+def make_crypto(**kw):
+    return DingCallbackCrypto("token", AES_KEY, "appkey", **kw)
+
+
+def signed(crypto, payload, timestamp=None):
+    timestamp = timestamp or str(int(time.time() * 1000))
+    encrypt = crypto.encrypt(json.dumps(payload))
+    return crypto.signature(timestamp, "nonce", encrypt), timestamp, "nonce", encrypt
+
+
+def test_round_trip():
+    crypto = make_crypto()
+    payload = {"EventType": "user_add_org", "UserId": ["u1"]}
+    assert crypto.get_decrypt_msg(*signed(crypto, payload)) == payload
+    answer = crypto.get_encrypted_map()
+    assert crypto.decrypt(answer["encrypt"]) == "success"
+
+
+def test_bad_signature():
+    crypto = make_crypto()
+    signature, timestamp, nonce, encrypt = signed(crypto, {"EventType": "check_url"})
+    with pytest.raises(CallbackCryptoError, match="signature"):
+        crypto.get_decrypt_msg("0" * 40, timestamp, nonce, encrypt)
+    with pytest.raises(CallbackCryptoError, match="signature"):
+        crypto.get_decrypt_msg("签名", timestamp, nonce, encrypt)
+
+
+def test_stale_timestamp():
+    crypto = make_crypto(max_age=60)
+    old = str(int((time.time() - 3600) * 1000))
+    with pytest.raises(CallbackCryptoError, match="expired"):
+        crypto.get_decrypt_msg(*signed(crypto, {"EventType": "check_url"}, old))
+    with pytest.raises(CallbackCryptoError, match="invalid timestamp"):
+        crypto.get_decrypt_msg(*signed(crypto, {"EventType": "check_url"}, "now"))
+    assert make_crypto(max_age=None).get_decrypt_msg(
+        *signed(crypto, {"EventType": "check_url"}, old)
+    )
+
+
+def test_wrong_key():
+    other = DingCallbackCrypto("token", AES_KEY, "otherkey")
+    with pytest.raises(CallbackCryptoError, match="key"):
+        make_crypto().decrypt(other.encrypt("{}"))
+
+
+def test_normalize_event():
+    assert normalize_event({"EventType": "check_url"}) is None
+    event = normalize_event(
+        {
+            "call_back_tag": "org_dept_create",
+            "org_dept_create": {"deptid": [2, "3"]},
+            "event_time": 1,
+        }
+    )
+    assert event == {
+        "type": "org_dept_create",
+        "user_ids": [],
+        "dept_ids": [2, 3],
+        "time": 1,
+    }
+
+
+def test_event_queue_retry_and_dead(tmp_path):
+    queue = EventQueue(str(tmp_path / "events.db"), max_attempts=2, retry_delay=0)
+    queue.put({"type": "user_add_org"})
+    [(event_id, _)] = queue.claim()
+    assert queue.claim() == []
+    queue.fail(event_id, ValueError("boom"))
+    [(event_id, _)] = queue.claim()
+    queue.fail(event_id, ValueError("boom"))
+    assert queue.claim() == []
+    assert queue.stats() == {"pending": 0, "dead": 1}
+
+
+def test_put_many_rolls_back_failed_commit(tmp_path):
+    queue = EventQueue(str(tmp_path / "events.db"))
+    conn = queue._conn()
+
+    class FailingCommit:
+        def execute(self, sql, *args):
+            if sql == "COMMIT":
+                raise sqlite3.OperationalError("database is locked")
+            return conn.execute(sql, *args)
+
+        def __getattr__(self, name):
+            return getattr(conn, name)
+
+    queue._local.conn = FailingCommit()
+    with pytest.raises(sqlite3.OperationalError):
+        queue.put_many([{"type": "user_add_org"}])
+    assert not conn.in_transaction
+    queue._local.conn = conn
+    assert queue.stats() == {"pending": 0, "dead": 0}
+
+
+def test_dispatcher_acknowledges_after_persisting(tmp_path):
+    queue = EventQueue(str(tmp_path / "events.db"))
+
+    async def run():
+        dispatcher = EventDispatcher(queue, workers=2)
+        await dispatcher.start()
+        await asyncio.gather(
+            *(dispatcher.put({"type": "user_add_org", "n": i}) for i in range(50))
+        )
+        # put 返回时事件已经写入
+        assert queue.stats()["pending"] == 50
+        await dispatcher.stop()
+        return dispatcher.stats
+
+    stats = asyncio.run(run())
+    assert stats["persisted"] == 50
+    assert stats["batches"] < 50
+
+
+def test_dispatcher_rejects_failed_writes(tmp_path):
+    queue = EventQueue(str(tmp_path / "events.db"))
+
+    def locked(events):
+        raise sqlite3.OperationalError("database is locked")
+
+    queue.put_many = locked
+
+    async def run():
+        dispatcher = EventDispatcher(queue, workers=1, max_attempts=1)
+        await dispatcher.start()
+        with pytest.raises(EventRejected):
+            await dispatcher.put({"type": "user_add_org"})
+        await dispatcher.stop()
+        return dispatcher.stats
+
+    assert asyncio.run(run())["failed"] == 1
+
+
+def test_callback_handler(tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.chdir(tmp_path)
+    for name in ("LDAP_SERVER", "LDAP_ADMIN", "LDAP_ADMIN_PASSWD"):
+        monkeypatch.setenv(name, "unused")
+    monkeypatch.setenv("DINGDING_CALLBACK_TOKEN", "token")
+    monkeypatch.setenv("DINGDING_CALLBACK_AES_KEY", AES_KEY)
+    monkeypatch.setenv("DINGDING_CALLBACK_KEY", "appkey")
+    monkeypatch.setenv("EVENT_QUEUE_PATH", str(tmp_path / "events.db"))
+    import importlib
+
+    import config
+    import main
+
+    importlib.reload(config)
+    main = importlib.reload(main)
+    # 导入时不创建数据库
+    assert not os.listdir(tmp_path)
+
+    crypto = make_crypto()
+    url = "/provider/dingtalk/register/"
+
+    def post(payload, signature=None):
+        sig, timestamp, nonce, encrypt = signed(crypto, payload)
+        params = {"signature": signature or sig, "timestamp": timestamp, "nonce": nonce}
+        return client.post(url, params=params, json={"encrypt": encrypt})
+
+    with TestClient(main.app) as client:
+        response = post({"EventType": "user_add_org", "UserId": ["u1"]})
+        assert response.status_code == 200
+        assert crypto.decrypt(response.json()["encrypt"]) == "success"
+        assert main.events.stats()["pending"] == 1
+
+        response = post({"EventType": "user_add_org"}, signature="0" * 40)
+        assert response.status_code == 403
+
+        def fail(events):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        main.events.put_many = fail
+        main.dispatcher.max_attempts = 1
+        assert post({"EventType": "user_add_org", "UserId": ["u2"]}).status_code == 503
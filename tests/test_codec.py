@@ -0,0 +1,112 @@
+import io
+import json
+
+import pytest
+
+from dingtalk.api import codec
+from dingtalk.api.base import RestApi, TopException
+
+BODY = {
+    "errcode": 0,
+    "errmsg": "ok",
+    "result": {
+        "has_more": True,
+        "list": [
+            {"userid": "u1", "name": "张三", "title": "[a, \"b\"] }{"},
+            {"userid": "u2", "dept_id_list": [1, 22, 333]},
+            12345,
+            -1.5e3,
+            "字符串",
+            None,
+            [],
+        ],
+        "next_cursor": 100,
+    },
+}
+
+
+def split(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1 << 20])
+def test_list_decoder_chunk_sizes(size):
+    data = json.dumps(BODY, ensure_ascii=False).encode("utf-8")
+    decoder = codec.JsonListDecoder(split(data, size))
+    assert list(decoder) == BODY["result"]["list"]
+    assert decoder.envelope == dict(BODY, result=dict(BODY["result"], list=[]))
+
+
+def test_list_decoder_path():
+    data = b'{"list": [9], "page": {"items": [1, 2], "list": [3]}}'
+    decoder = codec.JsonListDecoder(split(data, 1), path=("page", "items"))
+    assert list(decoder) == [1, 2]
+    assert decoder.envelope == {"list": [9], "page": {"items": [], "list": [3]}}
+
+
+def test_list_decoder_missing_list():
+    decoder = codec.JsonListDecoder([b'{"errcode": 60011, "errmsg": "no"}'])
+    assert list(decoder) == []
+    assert decoder.envelope == {"errcode": 60011, "errmsg": "no"}
+
+
+def test_list_decoder_truncated_body():
+    with pytest.raises(ValueError):
+        list(codec.JsonListDecoder([b'{"result": {"list": [{"userid": "u']))
+
+
+def test_set_default_decoder():
+    decoder = codec.getDefaultDecoder()
+    codec.setDefaultDecoder(lambda data: "custom")
+    try:
+        assert codec.loads(b"{}") == "custom"
+    finally:
+        codec.setDefaultDecoder(decoder)
+    assert codec.loads(b'{"a": 1}') == {"a": 1}
+
+
+class Response(object):
+    status = 200
+
+    def __init__(self, body):
+        self._body = io.BytesIO(body)
+        self.released = False
+
+    def read(self, size=-1):
+        return self._body.read(size)
+
+    def getheader(self, name, default=None):
+        return default
+
+    def release(self):
+        self.released = True
+
+
+def stream(body):
+    response = Response(json.dumps(body).encode("utf-8"))
+
+    class Pool(object):
+        def urlopen(self, key, method, url, body=None, headers=None, timeout=30):
+            return response
+
+    class Request(RestApi):
+        def getConnectionPool(self):
+            return Pool()
+
+    request = Request("https://oapi.dingtalk.com/topapi/v2/user/list")
+    return request.getResponseStream("token", chunk_size=5), response
+
+
+def test_response_stream():
+    items, response = stream(BODY)
+    assert list(items) == BODY["result"]["list"]
+    assert items.envelope["result"]["next_cursor"] == 100
+    assert response.released
+
+
+def test_response_stream_errcode():
+    items, response = stream({"errcode": 60011, "errmsg": "no permission"})
+    with pytest.raises(TopException) as info:
+        list(items)
+    assert info.value.errcode == 60011
+    assert response.released
@@ -0,0 +1,137 @@
+from utils.diff import compute_plan, rebase_dn
+from utils.schemas import DeptInLdap, UserInLdap
+
+DEPT_BASE = "ou=dept,dc=example,dc=org"
+USER_BASE = "ou=user,dc=example,dc=org"
+
+
+def dept(dept_id, name, parent_id="1"):
+    return DeptInLdap(dept_id=dept_id, name=name, parent_id=parent_id)
+
+
+def user(userid, name, depts):
+    return UserInLdap(
+        userid=userid,
+        name=name,
+        mobile=13800000000,
+        email=userid[3:] + "@example.com",
+        dept_id_list=depts,
+    )
+
+
+def ldap_user(name, userid, depts):
+    return {
+        "dn": "cn={},{}".format(name, USER_BASE),
+        "email": [userid[3:] + "@example.com"],
+        "mobile": ["13800000000"],
+        "departmentNumber": depts,
+    }
+
+
+def test_rebase_dn():
+    moves = [("ou=b,ou=x,dc=o", "ou=b,ou=y,dc=o"), ("ou=a,dc=o", "ou=a,ou=z,dc=o")]
+    assert rebase_dn("ou=c,ou=B,ou=x,dc=o", moves) == "ou=c,ou=b,ou=y,dc=o"
+    assert rebase_dn("ou=a,dc=o", moves) == "ou=a,ou=z,dc=o"
+    assert rebase_dn("ou=ba,ou=x,dc=o", moves) == "ou=ba,ou=x,dc=o"
+
+
+def test_dept_changes():
+    provider = [
+        dept("1", "公司", None),
+        dept("dd_3", "产品"),
+        dept("dd_2", "研发", "dd_3"),
+        dept("dd_4", "后端", "dd_2"),
+        dept("dd_5", "前端", "dd_4"),
+    ]
+    ldap = {
+        "1": {"dn": DEPT_BASE},
+        "dd_2": {"dn": "ou=研发," + DEPT_BASE},
+        "dd_4": {"dn": "ou=后端,ou=研发," + DEPT_BASE},
+        "dd_9": {"dn": "ou=旧," + DEPT_BASE},
+        "dd_10": {"dn": "ou=旧子,ou=旧," + DEPT_BASE},
+        "local": {"dn": "ou=手工," + DEPT_BASE},
+    }
+    plan = compute_plan(provider, [], ldap, {}, DEPT_BASE, USER_BASE)
+    assert [(c.action, c.key, c.dn, c.new_dn) for c in plan] == [
+        ("add", "dd_3", None, "ou=产品," + DEPT_BASE),
+        ("move", "dd_2", "ou=研发," + DEPT_BASE, "ou=研发,ou=产品," + DEPT_BASE),
+        # 上级移动后 dd_4 已经在新位置，不需要再移动
+        ("add", "dd_5", None, "ou=前端,ou=后端,ou=研发,ou=产品," + DEPT_BASE),
+        # 子部门先删除，不带前缀的部门不由同步管理
+        ("delete", "dd_10", "ou=旧子,ou=旧," + DEPT_BASE, None),
+        ("delete", "dd_9", "ou=旧," + DEPT_BASE, None),
+    ]
+    assert plan.dept_dns["dd_4"] == "ou=后端,ou=研发,ou=产品," + DEPT_BASE
+
+
+def test_dept_delete_under_moved_parent():
+    provider = [dept("dd_3", "产品"), dept("dd_2", "研发", "dd_3")]
+    ldap = {
+        "dd_2": {"dn": "ou=研发," + DEPT_BASE},
+        "dd_3": {"dn": "ou=产品," + DEPT_BASE},
+        "dd_7": {"dn": "ou=测试,ou=研发," + DEPT_BASE},
+    }
+    plan = compute_plan(provider, [], ldap, {}, DEPT_BASE, USER_BASE)
+    assert [(c.action, c.dn) for c in plan] == [
+        ("move", "ou=研发," + DEPT_BASE),
+        ("delete", "ou=测试,ou=研发,ou=产品," + DEPT_BASE),
+    ]
+
+
+def test_user_changes():
+    provider = [
+        user("dd_u1", "张三", ["dd_2"]),
+        user("dd_u2", "李四", ["dd_2", "dd_4"]),
+        user("dd_u3", "新名字", ["dd_2"]),
+        user("dd_u4", "赵六", ["dd_2"]),
+    ]
+    ldap = {
+        "dd_u1": ldap_user("张三", "dd_u1", ["dd_2"]),
+        "dd_u2": ldap_user("李四", "dd_u2", ["dd_2"]),
+        "dd_u3": ldap_user("王五", "dd_u3", ["dd_2"]),
+        "dd_u9": ldap_user("离职", "dd_u9", ["dd_2"]),
+        "admin": ldap_user("管理员", "admin", []),
+    }
+    plan = compute_plan([], provider, {}, ldap, DEPT_BASE, USER_BASE)
+    assert [(c.action, c.key, c.changes) for c in plan] == [
+        ("modify", "dd_u2", {"departmentNumber": ["dd_2", "dd_4"]}),
+        ("move", "dd_u3", {}),
+        ("add", "dd_u4", {}),
+        ("delete", "dd_u9", {}),
+    ]
+    changes = {c.key: c for c in plan}
+    assert changes["dd_u2"].old_depts == ["dd_2"]
+    assert changes["dd_u3"].new_dn == "cn=新名字," + USER_BASE
+    assert changes["dd_u9"].old_depts == ["dd_2"]
+    assert plan.summary() == {
+        "user_modify": 1,
+        "user_move": 1,
+        "user_add": 1,
+        "user_delete": 1,
+    }
+
+
+def test_apply_plan_converges(make_ldap):
+    ldap = make_ldap(pipeline=4, member_batch=10)
+    depts = [dept("1", "公司", None), dept("dd_2", "研发"), dept("dd_4", "后端", "dd_2")]
+    users = [user("dd_u1", "张三", ["dd_2"]), user("dd_u2", "李四", ["dd_2", "dd_4"])]
+
+    def plan():
+        return compute_plan(
+            depts,
+            users,
+            ldap.load_depts(),
+            ldap.load_users(),
+            ldap.dept_base_dn,
+            ldap.user_base_dn,
+        )
+
+    assert ldap.apply_plan(plan()) == {"success": 4, "failed": 0}
+    assert len(plan()) == 0
+
+    users = [user("dd_u2", "李四", ["dd_4"])]
+    assert plan().summary() == {"user_modify": 1, "user_delete": 1}
+    assert ldap.apply_plan(plan()) == {"success": 2, "failed": 0}
+    assert len(plan()) == 0
+    members = dict(ldap.paged_entries(ldap.dept_base_dn, "(ou=*)", ["member"]))
+    assert members["ou=研发," + ldap.dept_base_dn].get("member", []) == []
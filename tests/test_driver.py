@@ -0,0 +1,159 @@
+import pytest
+from ldap3 import MODIFY_ADD, MODIFY_DELETE
+
+from utils.schemas import DeptInLdap, UserInLdap
+
+
+def dept(dept_id, name, parent_id="1"):
+    return DeptInLdap(dept_id="dd_" + dept_id, name=name, parent_id=parent_id)
+
+
+def user(userid, name, depts):
+    return UserInLdap(
+        userid="dd_" + userid,
+        name=name,
+        mobile=13800000000,
+        email=userid + "@example.com",
+        dept_id_list=["dd_" + d for d in depts],
+    )
+
+
+def members(ldap, dn):
+    entries = dict(ldap.paged_entries(dn, "(objectClass=*)", ["member"]))
+    return sorted(entries[dn].get("member", []))
+
+
+@pytest.mark.parametrize("options", [{}, {"member_batch": 10}])
+def test_add_user_skips_missing_dept(make_ldap, options):
+    ldap = make_ldap(**options)
+    ldap.create_dept(dept("2", "研发"))
+    # 第一个部门不存在
+    assert ldap.create_user(user("u1", "张三", ["404", "2"]))
+    ldap.flush()
+    assert members(ldap, "ou=研发," + ldap.dept_base_dn) == [
+        "cn=张三," + ldap.user_base_dn
+    ]
+
+
+@pytest.mark.parametrize("options", [{}, {"member_batch": 10}])
+def test_pipeline_adds_member_after_user_created(make_ldap, options):
+    # pipeline 总是开启 preload，查询由索引完成，不会等待在途的写操作
+    ldap = make_ldap(pipeline=4, **options)
+    assert ldap.index
+    ldap.create_dept(dept("2", "研发"))
+    ldap.flush()
+    assert ldap.create_user(user("u1", "张三", ["2"]))
+    user_dn = "cn=张三," + ldap.user_base_dn
+    assert [i[1] for i in ldap.pending.values()] == [user_dn]
+    assert ldap.flush() and not ldap.write_errors
+    assert members(ldap, "ou=研发," + ldap.dept_base_dn) == [user_dn]
+
+
+@pytest.mark.parametrize("options", [{}, {"member_batch": 10}])
+def test_pipeline_skips_member_of_failed_add(make_ldap, options):
+    ldap = make_ldap(pipeline=4, **options)
+    ldap.create_dept(dept("2", "研发"))
+    ldap.flush()
+    dept_dn = "ou=研发," + ldap.dept_base_dn
+    user_dn = "cn=张三," + ldap.user_base_dn
+    # 条目已经存在(不在索引中)，新增会失败
+    ldap.pool.run(lambda conn: conn.add(user_dn, "person", {"sn": "张"}))
+    assert ldap.create_entry(user_dn, ldap.user_object_class, {"sn": "张"}, "u1")
+    assert ldap.modify_member(dept_dn, user_dn, source="u1")
+    ldap.flush()
+    assert sorted((i.operation, i.dn, i.source) for i in ldap.write_errors) == [
+        ("add", user_dn, "u1"),
+        ("modify", dept_dn, "u1"),
+    ]
+    assert members(ldap, dept_dn) == []
+
+
+def test_preload_answers_searches_from_index(make_ldap):
+    ldap = make_ldap()
+    ldap.create_dept(dept("2", "研发"))
+    ldap.create_user(user("u1", "张三", ["2"]))
+
+    ldap = make_ldap(preload=True)
+    assert len(ldap.index["dept"]) == 2 and len(ldap.index["user"]) == 1
+    assert ldap.search_user(user("u1", "张三", []), policy="exact")
+    # 其它客户端的修改不会反映到索引中，说明查询没有访问服务器
+    ldap.pool.run(lambda conn: conn.delete("cn=张三," + ldap.user_base_dn))
+    assert ldap.search_user(user("u1", "张三", []), policy="exact")
+    # 自己的写操作同步更新索引
+    assert ldap.create_dept(dept("3", "产品"))
+    assert ldap.search_dept(dept_id="dd_3", policy="exact")
+
+
+def test_lazy_schema(make_ldap, monkeypatch):
+    from utils.ldappool import LdapPool
+
+    loads = []
+    load_schema = LdapPool._load_schema
+    monkeypatch.setattr(
+        LdapPool,
+        "_load_schema",
+        lambda pool, conn: loads.append(1) or load_schema(pool, conn),
+    )
+    ldap = make_ldap(lazy_schema=True, preload=True)
+    # 开启 preload 后查询由索引完成，不需要 schema
+    assert ldap.create_dept(dept("2", "研发"))
+    assert ldap.search_dept(dept_id="dd_2", policy="exact")
+    assert loads == []
+    assert ldap.dept_object_def is not None
+    assert loads == [1]
+
+
+def test_search_entry_paged(make_ldap):
+    ldap = make_ldap(page_size=2)
+    for i in range(2, 7):
+        ldap.create_dept(dept(str(i), "部门%d" % i))
+    entries = ldap.search_entry_paged(
+        ldap.dept_object_def, ldap.dept_base_dn, "departmentNumber: dd_*"
+    )
+    assert next(entries).entry_dn.endswith(ldap.dept_base_dn)
+    # 迭代期间占用一个连接，结束后放回连接池
+    assert ldap.pool._idle.empty()
+    rest = list(entries)
+    assert len(rest) == 4
+    assert not ldap.pool._idle.empty()
+
+    entries = ldap.search_entry_paged(
+        ldap.dept_object_def, ldap.dept_base_dn, attributes=["ou"], page_size=3
+    )
+    next(entries)
+    entries.close()
+    assert not ldap.pool._idle.empty()
+
+
+def test_member_batch_merges_changes_per_dept(make_ldap):
+    ldap = make_ldap(member_batch=2)
+    ldap.create_dept(dept("2", "研发"))
+    dept_dn = "ou=研发," + ldap.dept_base_dn
+    dns = ["cn=u%d,%s" % (i, ldap.user_base_dn) for i in range(5)]
+    ldap.modify_entry(dept_dn, {"member": [(MODIFY_ADD, [dns[0]])]})
+    for dn in dns:
+        assert ldap.modify_member(dept_dn, dn, MODIFY_ADD, source=dn)
+    # 后一次修改覆盖前一次
+    ldap.modify_member(dept_dn, dns[4], MODIFY_DELETE)
+    ldap.modify_member(dept_dn, dns[4], MODIFY_ADD)
+    assert members(ldap, dept_dn) == [dns[0]]
+    # dns[0] 已经是成员，其余 4 个分两次写入
+    assert ldap.flush_members() == 2
+    assert members(ldap, dept_dn) == sorted(dns)
+
+    for dn in dns[:3] + ["cn=missing," + ldap.user_base_dn]:
+        ldap.modify_member(dept_dn, dn, MODIFY_DELETE)
+    assert ldap.flush_members() == 2
+    assert members(ldap, dept_dn) == sorted(dns[3:])
+    assert ldap.flush_members() == 0
+
+
+def test_member_batch_flushes_before_rename(make_ldap):
+    ldap = make_ldap(member_batch=10)
+    ldap.create_dept(dept("2", "研发"))
+    dept_dn = "ou=研发," + ldap.dept_base_dn
+    user_dn = "cn=u1," + ldap.user_base_dn
+    ldap.modify_member(dept_dn, user_dn)
+    assert ldap.rename_entry(dept_dn, "ou=技术")
+    assert ldap.member_changes == {}
+    assert members(ldap, "ou=技术," + ldap.dept_base_dn) == [user_dn]
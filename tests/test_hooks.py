@@ -0,0 +1,142 @@
+import io
+import json
+
+import pytest
+
+from dingtalk.api import hooks
+from dingtalk.api.base import RestApi, TopException
+from dingtalk.api.throttle import RateLimiter, RetryPolicy
+
+
+class Response(object):
+    def __init__(self, status, body):
+        self.status = status
+        self._body = io.BytesIO(json.dumps(body).encode("utf-8"))
+
+    def read(self, size=-1):
+        return self._body.read(size)
+
+    def getheader(self, name, default=None):
+        return default
+
+    def release(self):
+        pass
+
+
+def make_request(*responses):
+    responses = list(responses)
+
+    class Pool(object):
+        def urlopen(self, key, method, url, body=None, headers=None, timeout=30):
+            return responses.pop(0)
+
+    class Request(RestApi):
+        def getapiname(self):
+            return "dingtalk.oapi.v2.user.get"
+
+        def getConnectionPool(self):
+            return Pool()
+
+    request = Request("https://oapi.dingtalk.com/topapi/v2/user/get")
+    request.setRetryPolicy(RetryPolicy(base_delay=0))
+    return request
+
+
+@pytest.fixture
+def metrics():
+    hook = hooks.addRequestHook(hooks.MetricsHook(buckets=(0.5, 10)))
+    yield hook
+    hooks.removeRequestHook(hook)
+
+
+def test_hooks_are_notified():
+    events = []
+
+    class Hook(hooks.RequestHook):
+        def beforeRequest(self, context):
+            events.append(("before", context.path))
+
+        def afterResponse(self, context):
+            events.append(("after", context.status))
+
+        def onError(self, context):
+            events.append(("error", context.errcode))
+
+    hook = hooks.addRequestHook(Hook())
+    try:
+        make_request(Response(200, {"errcode": 0})).getResponse("secret-token")
+        with pytest.raises(TopException):
+            error = Response(200, {"errcode": 40014, "errmsg": "bad"})
+            make_request(error).getResponse()
+    finally:
+        hooks.removeRequestHook(hook)
+    # path 不包含 access_token
+    assert events == [
+        ("before", "/topapi/v2/user/get"),
+        ("after", 200),
+        ("before", "/topapi/v2/user/get"),
+        ("error", 40014),
+    ]
+
+
+def test_failing_hook_does_not_break_request():
+    class Hook(hooks.RequestHook):
+        def beforeRequest(self, context):
+            raise RuntimeError("broken hook")
+
+    hook = hooks.addRequestHook(Hook())
+    try:
+        assert make_request(Response(200, {"errcode": 0})).getResponse() == {
+            "errcode": 0
+        }
+    finally:
+        hooks.removeRequestHook(hook)
+
+
+def test_metrics_count_retries_and_errors(metrics):
+    make_request(Response(503, {}), Response(200, {"errcode": 0})).getResponse()
+    with pytest.raises(TopException):
+        make_request(Response(200, {"errcode": 60121, "errmsg": "no"})).getResponse()
+    stats = metrics.getStats()["dingtalk.oapi.v2.user.get"]
+    assert stats["requests"] == 2
+    assert stats["retries"] == 1
+    assert stats["errors"] == 1
+    assert stats["buckets"] == [2, 2]
+    assert stats["response_bytes"] > 0
+
+
+def test_metrics_exposition(metrics):
+    make_request(Response(200, {"errcode": 0})).getResponse()
+    with pytest.raises(TopException):
+        make_request(Response(200, {"errcode": 60121, "errmsg": "no"})).getResponse()
+    lines = metrics.exposition().splitlines()
+    api = 'api="dingtalk.oapi.v2.user.get"'
+    assert "# TYPE dingtalk_request_duration_seconds histogram" in lines
+    assert 'dingtalk_request_duration_seconds_bucket{%s,le="+Inf"} 2' % api in lines
+    assert "dingtalk_request_duration_seconds_count{%s} 2" % api in lines
+    assert "dingtalk_request_retries_total{%s} 0" % api in lines
+    assert 'dingtalk_request_errors_total{%s,errcode="60121"} 1' % api in lines
+
+
+def test_metrics_export_limiter_and_retry_stats(tmp_path):
+    limiter, policy = RateLimiter(app_rate=20, burst=1), RetryPolicy(base_delay=0)
+    metrics = hooks.addRequestHook(
+        hooks.MetricsHook(limiter=limiter, retryPolicy=policy)
+    )
+    try:
+        for _ in range(2):
+            request = make_request(Response(503, {}), Response(200, {"errcode": 0}))
+            request.setRateLimiter(limiter)
+            request.setRetryPolicy(policy)
+            request.getResponse()
+    finally:
+        hooks.removeRequestHook(metrics)
+    path = tmp_path / "dingtalk.prom"
+    metrics.writeTextfile(str(path))
+    lines = path.read_text().splitlines()
+    api = 'api="dingtalk.oapi.v2.user.get"'
+    assert "dingtalk_request_duration_seconds_count{%s} 2" % api in lines
+    assert "dingtalk_throttled_requests_total{%s} 3.0" % api in lines
+    assert "dingtalk_retry_transient_errors_total{%s} 2.0" % api in lines
+    assert "dingtalk_retry_gave_up_total{%s} 0.0" % api in lines
+    assert [p.name for p in tmp_path.iterdir()] == ["dingtalk.prom"]
@@ -0,0 +1,78 @@
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from dingtalk.api.base import RequestException, RestApi
+from dingtalk.api.http2 import Http2ConnectionPool
+from dingtalk.api.throttle import RetryPolicy
+
+
+def make_pool(handler):
+    pool = Http2ConnectionPool()
+    pool._client.close()
+    pool._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return pool
+
+
+def make_request(pool):
+    class Request(RestApi):
+        def getConnectionPool(self):
+            return pool
+
+    return Request("https://oapi.dingtalk.com/topapi/v2/department/listsub")
+
+
+def test_get_response_over_http2_pool():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"errcode": 0, "result": [{"dept_id": 2}]})
+
+    pool = make_pool(handler)
+    assert make_request(pool).getResponse("token")["result"] == [{"dept_id": 2}]
+    url = seen[0].url
+    assert (url.scheme, url.host, url.path) == (
+        "https",
+        "oapi.dingtalk.com",
+        "/topapi/v2/department/listsub",
+    )
+    assert url.params["access_token"] == "token"
+    assert pool.getStats()["requests"] == 1
+
+
+def test_http2_response_read_in_chunks():
+    pool = make_pool(lambda request: httpx.Response(200, content=b"0123456789"))
+    response = pool.urlopen(("oapi.dingtalk.com", 443), "GET", "/")
+    assert response.status == 200
+    assert response.read(4) == b"0123"
+    assert response.read(4) == b"4567"
+    assert response.read() == b"89"
+    assert response.read() == b""
+
+
+def test_connect_error_is_marked_not_sent():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    pool = make_pool(handler)
+    with pytest.raises(RequestException) as info:
+        pool.urlopen(("oapi.dingtalk.com", 443), "POST", "/topapi/message/send", "{}")
+    assert info.value.request_sent is False
+
+
+def test_read_error_is_translated():
+    class Body(httpx.SyncByteStream):
+        def __iter__(self):
+            yield b'{"errcode": 0, '
+            raise httpx.ReadError("connection lost")
+
+    pool = make_pool(lambda request: httpx.Response(200, stream=Body()))
+    response = pool.urlopen(("oapi.dingtalk.com", 443), "GET", "/topapi/v2/user/get")
+    with pytest.raises(RequestException) as info:
+        response.read()
+    assert getattr(info.value, "request_sent", True) is True
+    policy = RetryPolicy()
+    assert policy.classify(info.value) is None
+    assert policy.classify(info.value, idempotent=True) == "transient"
@@ -0,0 +1,71 @@
+from ldap3 import MODIFY_ADD, MODIFY_DELETE, MODIFY_REPLACE
+
+from utils.index import EntryIndex
+
+BASE = "ou=dept,dc=example,dc=org"
+
+
+def make_index():
+    index = EntryIndex(BASE, ["ou", "departmentNumber"], ["ou", "departmentNumber"])
+    index.add("ou=研发," + BASE, {"ou": "研发", "departmentNumber": ["dd_2"]})
+    index.add("ou=后端,ou=研发," + BASE, {"ou": ["后端"], "departmentNumber": "dd_4"})
+    index.add("ou=Sales," + BASE, {"ou": "Sales", "objectClass": ["top"]})
+    return index
+
+
+def dns(entries):
+    return [entry.entry_dn for entry in entries]
+
+
+def test_add_and_search():
+    index = make_index()
+    assert len(index) == 3
+    assert "OU=sales," + BASE in index
+    assert index.covers("ou=x," + BASE)
+    assert not index.covers("ou=user,dc=example,dc=org")
+    # 不在 attributes 中的属性不保存
+    assert index.get("ou=sales," + BASE).entry_attributes_as_dict == {"ou": ["Sales"]}
+    assert dns(index.search({"ou": "sales"})) == ["ou=Sales," + BASE]
+    assert dns(index.search({"departmentNumber": ["dd_2", "dd_4"]})) == [
+        "ou=后端,ou=研发," + BASE,
+        "ou=研发," + BASE,
+    ]
+    assert dns(index.search({"ou": "研发", "departmentNumber": "dd_4"})) == [
+        "ou=后端,ou=研发," + BASE,
+        "ou=研发," + BASE,
+    ]
+    assert index.search({"ou": "研发", "departmentNumber": "dd_4"}, "exact") == []
+    assert index.search({"ou": None}) == []
+
+
+def test_modify():
+    index = make_index()
+    dn = "ou=研发," + BASE
+    index.modify(dn, {"departmentNumber": [(MODIFY_ADD, ["dd_3"])]})
+    assert dns(index.search({"departmentNumber": "dd_3"})) == [dn]
+    index.modify(dn, {"departmentNumber": [(MODIFY_DELETE, ["dd_2"])]})
+    assert index.search({"departmentNumber": "dd_2"}) == []
+    index.modify(dn, {"departmentNumber": [(MODIFY_REPLACE, [])], "member": [(0, "x")]})
+    assert index.get(dn).entry_attributes_as_dict == {"ou": ["研发"]}
+    assert index.search({"departmentNumber": "dd_3"}) == []
+
+
+def test_rename_moves_children():
+    index = make_index()
+    new_dn = "ou=技术,ou=Sales," + BASE
+    index.rename("ou=研发," + BASE, new_dn)
+    assert dns(index.search({"ou": "技术"})) == [new_dn]
+    assert index.search({"ou": "研发"}) == []
+    assert index.get("ou=后端," + new_dn) is not None
+    assert dns(index.search({"departmentNumber": "dd_4"})) == ["ou=后端," + new_dn]
+
+
+def test_remove():
+    index = make_index()
+    index.remove("ou=研发," + BASE)
+    index.remove("ou=missing," + BASE)
+    assert len(index) == 2
+    assert index.search({"ou": "研发"}) == []
+    assert index.indexes["departmentNumber"] == {
+        "dd_4": {"ou=后端,ou=研发," + BASE.lower()}
+    }
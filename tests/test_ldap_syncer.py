@@ -1,5 +1,12 @@
-from ldap_syncer import __version__
+import os
+import re
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 def test_version():
-    assert __version__ == '0.1.0'
+    # 项目没有 ldap_syncer 包，版本号只记录在 pyproject.toml 的 [tool.poetry] 中
+    with open(os.path.join(ROOT, "pyproject.toml"), encoding="utf-8") as f:
+        poetry = f.read().split("[tool.poetry]\n", 1)[1].split("\n[", 1)[0]
+    assert re.search(r'^name = "(.*)"$', poetry, re.M).group(1) == "ldap-syncer"
+    assert re.search(r'^version = "(.*)"$', poetry, re.M).group(1) == "0.1.0"
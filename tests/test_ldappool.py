@@ -0,0 +1,156 @@
+import threading
+
+import pytest
+from ldap3.core.exceptions import LDAPCommunicationError, LDAPSocketSendError
+
+from utils.ldappool import LdapPool
+
+
+@pytest.fixture
+def make_pool(make_ldap):
+    """make_ldap 已把 ldappool 的 Server/Connection 换成 mock"""
+
+    def make(servers="mock", **kw):
+        return LdapPool(
+            servers,
+            "cn=admin,dc=example,dc=org",
+            "pw",
+            probe_dn="dc=example,dc=org",
+            **kw
+        )
+
+    return make
+
+
+def test_servers_and_strategy(make_pool):
+    pool = make_pool(" mock, ", strategy="first")
+    assert [s.host for s in pool.server_pool.servers] == ["mock"]
+    with pytest.raises(ValueError):
+        make_pool(strategy="random")
+
+
+def test_run_reconnects_on_communication_error(make_pool):
+    pool = make_pool()
+    conns = []
+
+    def operation(conn):
+        conns.append(conn)
+        if len(conns) == 1:
+            raise LDAPSocketSendError("connection reset")
+        return conn.search("dc=example,dc=org", "(objectClass=*)")
+
+    assert pool.run(operation)
+    assert conns[0] is not conns[1]
+    stats = pool.stats()[0]
+    assert (stats["requests"], stats["errors"], stats["rebinds"]) == (2, 1, 1)
+
+
+def test_run_gives_up_after_max_retries(make_pool):
+    pool = make_pool(max_retries=1)
+
+    def operation(conn):
+        raise LDAPSocketSendError("connection reset")
+
+    with pytest.raises(LDAPCommunicationError):
+        pool.run(operation)
+    assert pool.stats()[0]["errors"] == 2
+
+
+def test_idle_connection_is_probed(make_pool):
+    pool = make_pool(probe_interval=0)
+    pool.run(lambda conn: None)
+    assert pool.stats()[0]["probes"] == 1
+    # 连接已断开时不需要探测，直接重新连接
+    pool.connections[0].conn.unbind()
+    pool.run(lambda conn: None)
+    assert pool.stats()[0]["probes"] == 1
+    assert pool.stats()[0]["rebinds"] == 1
+
+
+def test_lease_grows_up_to_size(make_pool):
+    pool = make_pool(size=2)
+    leased = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.lease():
+            leased.set()
+            release.wait(2)
+
+    with pool.lease() as first:
+        thread = threading.Thread(target=hold)
+        thread.start()
+        assert leased.wait(2)
+        assert len(pool.connections) == 2
+        waiter = threading.Thread(target=lambda: pool.run(lambda conn: None))
+        waiter.start()
+        waiter.join(0.2)
+        # 已达到 size，第三个调用方等待空闲连接
+        assert waiter.is_alive()
+        release.set()
+        thread.join()
+        waiter.join(2)
+        assert not waiter.is_alive()
+    assert len(pool.connections) == 2
+    assert first in pool.connections
+
+
+@pytest.fixture
+def schema_server(make_pool, monkeypatch):
+    """
+    服务器不带 schema，get_info_from_server 时附上 ldap3 自带的 OpenLDAP schema；
+    返回读取 schema 的次数与 subschema 的修改时间
+    """
+    import ldap3
+
+    from utils import ldappool
+
+    offline = ldap3.Server("offline", get_info=ldap3.OFFLINE_SLAPD_2_4)
+    state = {"fetches": 0, "timestamp": "20240101000000Z"}
+
+    def fetch(server, conn):
+        # 绑定时也会调用，只有 LdapPool 读取 schema 时 get_info 为 ALL
+        if server.get_info != ldap3.ALL:
+            return
+        state["fetches"] += 1
+        server.attach_dsa_info(offline.info)
+        server.attach_schema_info(offline.schema)
+
+    monkeypatch.setattr(
+        ldappool,
+        "Server",
+        lambda host, get_info=None, **kw: ldap3.Server(host, get_info=ldap3.NONE, **kw),
+    )
+    monkeypatch.setattr(ldap3.Server, "get_info_from_server", fetch)
+    monkeypatch.setattr(
+        LdapPool, "_schema_timestamp", lambda pool, conn: state["timestamp"]
+    )
+    return state
+
+
+def test_schema_is_loaded_on_first_use(make_pool, schema_server):
+    pool = make_pool()
+    assert schema_server["fetches"] == 0
+    assert "inetOrgPerson" in pool.schema.object_classes
+    assert pool.schema is pool.schema
+    assert schema_server["fetches"] == 1
+
+
+def test_schema_cache(make_pool, schema_server, tmp_path):
+    assert make_pool(schema_cache=str(tmp_path)).schema is not None
+    assert len(list(tmp_path.iterdir())) == 1
+    assert make_pool(schema_cache=str(tmp_path)).schema is not None
+    assert schema_server["fetches"] == 1
+    # subschema 修改后重新读取并更新缓存
+    schema_server["timestamp"] = "20240202000000Z"
+    assert make_pool(schema_cache=str(tmp_path)).schema is not None
+    assert make_pool(schema_cache=str(tmp_path)).schema is not None
+    assert schema_server["fetches"] == 2
+
+
+def test_corrupt_schema_cache_is_ignored(make_pool, schema_server, tmp_path):
+    make_pool(schema_cache=str(tmp_path)).schema
+    for path in tmp_path.iterdir():
+        path.write_text("{")
+    assert make_pool(schema_cache=str(tmp_path)).schema is not None
+    assert schema_server["fetches"] == 2
@@ -0,0 +1,78 @@
+import io
+
+import pytest
+
+from dingtalk.api.base import MultiPartForm
+
+
+class Reader(object):
+    """只有 read 方法的文件对象，例如管道或 socket"""
+
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+
+class Pipe(Reader):
+    def seekable(self):
+        return False
+
+
+def build(content):
+    form = MultiPartForm()
+    form.chunk_size = 4
+    form.add_field("media_type", "file")
+    form.add_file("media", "测试.txt", content)
+    return form
+
+
+def file_content(form):
+    body = bytes(form)
+    start = body.index(b"binary\r\n\r\n") + len(b"binary\r\n\r\n")
+    return body[start : body.rindex(b"\r\n--")]
+
+
+@pytest.mark.parametrize(
+    "make, expected",
+    [
+        (lambda tmp: b"\x00\xffbytes", b"\x00\xffbytes"),
+        (lambda tmp: bytearray(b"array"), b"array"),
+        (lambda tmp: "文本", "文本".encode("utf-8")),
+        (lambda tmp: io.BytesIO(b"0123456789"), b"0123456789"),
+        (lambda tmp: Reader(b"no seekable attribute"), b"no seekable attribute"),
+        (lambda tmp: Pipe(b"not seekable"), b"not seekable"),
+        (lambda tmp: io.StringIO("字符串"), "字符串".encode("utf-8")),
+        (lambda tmp: open(tmp, "rb"), "中文内容".encode("utf-8") * 3),
+        (lambda tmp: open(tmp, encoding="utf-8"), "中文内容".encode("utf-8") * 3),
+    ],
+)
+def test_content_length_matches_body(tmp_path, make, expected):
+    path = tmp_path / "data.txt"
+    path.write_bytes("中文内容".encode("utf-8") * 3)
+    content = make(str(path))
+    form = build(content)
+    assert form.get_content_length() == len(bytes(form))
+    assert file_content(form) == expected
+    if hasattr(content, "close"):
+        content.close()
+
+
+def test_seekable_file_starts_at_current_position():
+    handle = io.BytesIO(b"skip:payload")
+    handle.seek(5)
+    form = build(handle)
+    assert form.get_content_length() == len(bytes(form))
+    # 重试时重新发送同样的内容
+    assert file_content(form) == b"payload"
+    assert file_content(form) == b"payload"
+
+
+def test_body_is_streamed_in_chunks():
+    form = build(io.BytesIO(b"x" * 10))
+    chunks = list(form)
+    assert all(isinstance(chunk, (bytes, memoryview)) for chunk in chunks)
+    data = [bytes(chunk) for chunk in chunks if set(bytes(chunk)) == {ord("x")}]
+    assert data == [b"xxxx", b"xxxx", b"xx"]
+    assert form.boundary in form.get_content_type()
@@ -0,0 +1,101 @@
+import http.server
+import socket
+import struct
+import threading
+
+import pytest
+
+from dingtalk.api.pool import ConnectionPool
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.clients.append(self.client_address)
+        body = b'{"errcode": 0}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # 不发送 Connection: close 就关闭连接，客户端复用时才会发现连接已失效
+        self.close_connection = self.path == "/close"
+
+    def do_POST(self):
+        self.server.clients.append(self.client_address)
+        self.server.posts += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        # 请求已经处理，不发送响应就重置连接
+        linger = struct.pack("ii", 1, 0)
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, linger)
+        self.connection.close()
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.clients = []
+    server.posts = 0
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(pool, server, path="/"):
+    key = ("127.0.0.1:%d" % server.server_address[1], 80)
+    response = pool.urlopen(key, "GET", path)
+    assert response.status == 200
+    return response.read()
+
+
+def test_keep_alive_connection_is_reused(server):
+    pool = ConnectionPool()
+    for _ in range(3):
+        assert get(pool, server) == b'{"errcode": 0}'
+    assert len(set(server.clients)) == 1
+    stats = pool.getStats()
+    assert (stats["misses"], stats["hits"], stats["idle"]) == (1, 2, 1)
+
+
+def test_unread_response_is_not_reused(server):
+    pool = ConnectionPool()
+    key = ("127.0.0.1:%d" % server.server_address[1], 80)
+    pool.urlopen(key, "GET", "/").release()
+    assert get(pool, server)
+    assert len(set(server.clients)) == 2
+    assert pool.getStats()["hits"] == 0
+
+
+def test_stale_connection_is_retried(server):
+    pool = ConnectionPool()
+    get(pool, server, "/close")
+    assert get(pool, server) == b'{"errcode": 0}'
+    stats = pool.getStats()
+    assert (stats["hits"], stats["retries"]) == (1, 1)
+    assert len(set(server.clients)) == 2
+
+
+def test_idle_timeout_evicts_connection(server):
+    pool = ConnectionPool(idle_timeout=0)
+    get(pool, server)
+    get(pool, server)
+    stats = pool.getStats()
+    assert (stats["hits"], stats["evicted"]) == (0, 1)
+
+
+def test_reset_after_request_is_not_resent(server):
+    pool = ConnectionPool()
+    get(pool, server)
+    key = ("127.0.0.1:%d" % server.server_address[1], 80)
+    with pytest.raises(ConnectionResetError):
+        pool.urlopen(key, "POST", "/", body="{}")
+    assert server.posts == 1
+    assert pool.getStats()["retries"] == 0
@@ -0,0 +1,213 @@
+import collections
+import threading
+import time
+
+import pytest
+
+from dingtalk.api.base import RestApi
+from utils.provider import Dingding, Paginator, buffered, merge_user_dept
+from utils.schemas import UserInDingtalk
+
+
+class FakeDingtalk:
+    """按接口名应答的钉钉通讯录，calls 记录每个接口的调用次数"""
+
+    def __init__(self, depts, users):
+        # depts: {dept_id: parent_id}，users: {userid: [dept_id, ...]}
+        self.depts = depts
+        self.users = users
+        self.calls = collections.Counter()
+
+    def dept(self, dept_id):
+        return {
+            "dept_id": dept_id,
+            "name": "dept%d" % dept_id,
+            "parent_id": self.depts.get(dept_id),
+        }
+
+    def user(self, userid):
+        return {
+            "userid": userid,
+            "name": "name-" + userid,
+            "mobile": 13800000000,
+            "dept_id_list": self.users[userid],
+        }
+
+    def __call__(self, request):
+        api = request.getapiname().rsplit(".oapi.", 1)[-1]
+        self.calls[api] += 1
+        dept_id = getattr(request, "dept_id", None)
+        dept_id = int(dept_id) if dept_id is not None else None
+        if api == "gettoken":
+            return {"access_token": "token", "expires_in": 7200}
+        if api == "v2.department.listsub":
+            subs = [d for d, p in self.depts.items() if p == dept_id]
+            return {"result": [self.dept(d) for d in subs]}
+        if api == "v2.department.get":
+            return {"result": self.dept(dept_id)}
+        members = [u for u, depts in self.users.items() if dept_id in depts]
+        if api == "user.listid":
+            return {"result": {"userid_list": members}}
+        if api == "v2.user.list":
+            page = members[request.cursor : request.cursor + request.size]
+            more = request.cursor + request.size < len(members)
+            result = {"list": [self.user(u) for u in page], "has_more": more}
+            if more:
+                result["next_cursor"] = request.cursor + request.size
+            return {"result": result}
+        if api == "v2.user.get":
+            return {"result": self.user(request.userid)}
+        raise AssertionError("unexpected api " + api)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeDingtalk(
+        depts={1: None, 2: 1, 3: 1, 4: 2, 5: 2, 6: 3},
+        users={
+            "u1": [1],
+            "u2": [2, 4],
+            "u3": [4, 5, 6],
+            "u4": [6],
+            "u5": [3],
+        },
+    )
+    monkeypatch.setattr(
+        RestApi, "getResponse", lambda request, *args, **kw: fake(request)
+    )
+    return fake
+
+
+def test_dept_list_uses_listsub_only(fake):
+    depts = list(Dingding("key", "secret").get_dept_list())
+    assert [d.dept_id for d in depts] == ["1", "2", "4", "5", "3", "6"]
+    assert depts[2].parent_id == 2
+    assert fake.calls["v2.department.get"] == 1
+    assert fake.calls["v2.department.listsub"] == 6
+
+
+def test_user_all_skips_duplicate_records(fake):
+    provider = Dingding("key", "secret")
+    users = list(provider.get_user_all())
+    assert sorted(u.userid for u in users) == ["u1", "u2", "u3", "u4", "u5"]
+    assert provider.duplicate_records == 3
+    u3 = next(u for u in users if u.userid == "u3")
+    assert sorted(u3.dept_id_list) == [4, 5, 6]
+    # 每个部门的用户列表仍然获取一次
+    assert fake.calls["v2.user.list"] == 6
+
+
+def test_merge_user_dept():
+    seen = set()
+    user = UserInDingtalk(userid="u1", name="n", mobile=1, dept_id_list=2)
+    assert merge_user_dept(seen, user, 3)
+    assert user.dept_id_list == [2, 3]
+    assert not merge_user_dept(seen, user, 4)
+    assert user.dept_id_list == [2, 3]
+
+
+def pages_of(items, size, cursor):
+    page = items[cursor : cursor + size]
+    result = {"list": page, "has_more": cursor + size < len(items)}
+    if result["has_more"]:
+        result["next_cursor"] = cursor + size
+    return result
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_paginator_follows_next_cursor(prefetch):
+    calls = []
+
+    def fetch(cursor, size):
+        calls.append((cursor, size))
+        return pages_of(list(range(7)), size, cursor)
+
+    paginator = Paginator(fetch, size=3, prefetch=prefetch)
+    assert list(paginator) == list(range(7))
+    assert calls == [(0, 3), (3, 3), (6, 3)]
+    stats = paginator.stats()
+    assert (stats["pages"], stats["items"]) == (3, 7)
+
+
+def test_paginator_offset_and_list_key():
+    def fetch(offset, size):
+        items = ["u%d" % i for i in range(5)][offset : offset + size]
+        return {"userid_list": items, "hasMore": offset + size < 5}
+
+    paginator = Paginator(fetch, size=2, offset=True, list_key="userid_list")
+    assert list(paginator.pages()) == [["u0", "u1"], ["u2", "u3"], ["u4"]]
+
+
+def test_paginator_requires_next_cursor():
+    paginator = Paginator(lambda cursor, size: {"list": [1], "has_more": True})
+    with pytest.raises(ValueError):
+        list(paginator)
+
+
+def test_dept_user_list_pages(fake):
+    provider = Dingding("key", "secret")
+    users = list(provider.get_dept_user_list(4, size=1))
+    assert [u.userid for u in users] == ["u2", "u3"]
+    assert fake.calls["v2.user.list"] == 2
+    assert provider.dept_user_stats[4]["pages"] == 2
+
+
+def test_buffered_keeps_order_and_bounds_read_ahead():
+    produced = []
+
+    def items():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    result = buffered(items(), 2)
+    assert next(result) == 0
+    time.sleep(0.2)
+    # 已取出 1 个，队列中 2 个，后台线程最多再持有 1 个等待放入
+    assert len(produced) <= 4
+    assert list(result) == list(range(1, 10))
+
+
+def test_buffered_raises_producer_error():
+    def items():
+        yield 1
+        raise RuntimeError("fetch failed")
+
+    result = buffered(items(), 10)
+    assert next(result) == 1
+    with pytest.raises(RuntimeError):
+        next(result)
+
+
+def test_buffered_stops_producer_when_closed():
+    stopped = threading.Event()
+
+    def items():
+        try:
+            i = 0
+            while True:
+                yield i
+                i += 1
+        finally:
+            stopped.set()
+
+    result = buffered(items(), 1)
+    assert next(result) == 0
+    result.close()
+    assert stopped.wait(2)
+
+
+def test_dept_list_crawls_each_level_concurrently(fake, monkeypatch):
+    # 第二层的 2、3 两个部门同时请求子部门时 barrier 才能通过
+    barrier = threading.Barrier(2, timeout=2)
+
+    def respond(request, *args, **kw):
+        api = request.getapiname()
+        if api.endswith("listsub") and fake.depts.get(int(request.dept_id)) == 1:
+            barrier.wait()
+        return fake(request)
+
+    monkeypatch.setattr(RestApi, "getResponse", respond)
+    depts = list(Dingding("key", "secret", concurrency=4).get_dept_list())
+    assert [d.dept_id for d in depts] == ["1", "2", "4", "5", "3", "6"]
+    assert not barrier.broken
@@ -0,0 +1,107 @@
+import json
+import os
+import subprocess
+import sys
+
+from dingtalk import api
+from dingtalk.api import rest
+from dingtalk.api.base import FileItem, MultiPartForm, RestApi
+
+URL = "https://oapi.dingtalk.com/topapi/v2/user/list"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_is_lazy():
+    probe = """
+import sys
+from dingtalk import api
+before = [name for name in api.rest.__all__ if name in vars(api.rest)]
+api.OapiV2UserListRequest
+after = [name for name in api.rest.__all__ if name in vars(api.rest)]
+print(before, after, "httpx" in sys.modules, "dingtalk.api.aio" in sys.modules)
+"""
+    out = subprocess.check_output([sys.executable, "-c", probe], cwd=ROOT)
+    assert out.decode().split() == ["[]", "['OapiV2UserListRequest']", "False", "False"]
+
+
+def test_request_classes_are_built_once():
+    cls = api.OapiV2UserListRequest
+    assert cls is rest.OapiV2UserListRequest
+    from dingtalk.api.rest.OapiV2UserListRequest import OapiV2UserListRequest
+
+    assert OapiV2UserListRequest is cls
+    assert rest.OapiV2UserListRequest is cls
+    assert cls.__name__ in dir(api)
+
+
+def test_declared_parameters():
+    request = api.OapiV2UserListRequest(URL)
+    assert request.getapiname() == "dingtalk.oapi.v2.user.list"
+    assert request.getHttpMethod() == "POST"
+    request.dept_id = 1
+    request.cursor = 0
+    assert request.getApplicationParameters() == {"dept_id": 1, "cursor": 0}
+
+
+def test_undeclared_parameters_are_sent():
+    request = api.OapiV2UserListRequest(URL)
+    request.dept_id = 1
+    request.new_field = "x"
+    assert request.getApplicationParameters() == {"dept_id": 1, "new_field": "x"}
+    method, path, body, header = request._buildRequest("token", "", "", "", "")
+    assert json.loads(body) == {"dept_id": 1, "new_field": "x"}
+    assert path.endswith("?access_token=token")
+
+
+def test_multipart_fields_are_not_parameters():
+    request = api.OapiMediaUploadRequest("https://oapi.dingtalk.com/media/upload")
+    request.type = "file"
+    request.media = FileItem("a.txt", b"content")
+    assert request.getApplicationParameters() == {"type": "file"}
+    method, path, body, header = request._buildRequest("token", "", "", "", "")
+    assert isinstance(body, MultiPartForm)
+    assert header["Content-Length"] == str(len(bytes(body)))
+
+
+class LegacyRequest(RestApi):
+    """auto_sdk 生成的旧式请求类"""
+
+    def __init__(self, url=None):
+        RestApi.__init__(self, url)
+        self._from = None
+        self.userid = None
+
+    def getHttpMethod(self):
+        return "GET"
+
+    def getTranslateParas(self):
+        return {"from": "from_user"}
+
+
+def test_legacy_subclass_parameters():
+    request = LegacyRequest("https://oapi.dingtalk.com/user/get")
+    request._from = "a"
+    request.userid = "u1"
+    assert request.getApplicationParameters() == {"from_user": "a", "userid": "u1"}
+    method, path, body, header = request._buildRequest("token", "", "", "", "")
+    assert body is None
+    assert "from_user=a" in path and "userid=u1" in path
+
+
+def test_parameter_plan_is_built_once_per_class():
+    calls = []
+
+    class Request(LegacyRequest):
+        def getTranslateParas(self):
+            calls.append(self)
+            return {"from": "from_user"}
+
+    first, second = Request(URL), Request(URL)
+    first._from = "a"
+    second.userid = "u2"
+    assert first.getApplicationParameters() == {"from_user": "a"}
+    assert second.getApplicationParameters() == {"userid": "u2"}
+    # 实例之后新增的属性同样按计划解析
+    second._extra = 1
+    assert second.getApplicationParameters() == {"userid": "u2", "extra": 1}
+    assert len(calls) == 1
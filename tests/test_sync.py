@@ -0,0 +1,234 @@
+import importlib
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from dingtalk.api.base import RestApi, TopException
+from utils.events import EventQueue
+from utils.provider import Dingding
+
+from .test_provider import FakeDingtalk
+
+
+def not_found(errcode):
+    error = TopException()
+    error.errcode = errcode
+    error.errmsg = "not found"
+    return error
+
+
+class FakeAddressBook(FakeDingtalk):
+    """用户为中文姓名，支持查询已删除的部门、离职的用户与推送失败的事件"""
+
+    NAMES = {"u1": "张三", "u2": "李四", "u3": "王五"}
+
+    def __init__(self, depts, users):
+        super().__init__(depts, users)
+        self.failed = []
+
+    def user(self, userid):
+        return dict(super().user(userid), name=self.NAMES[userid])
+
+    def __call__(self, request):
+        api = request.getapiname().rsplit(".oapi.", 1)[-1]
+        if api == "call_back.get_call_back_failed_result":
+            failed, self.failed = self.failed, []
+            return {"failed_list": failed, "has_more": False}
+        if api == "v2.department.get" and int(request.dept_id) not in self.depts:
+            raise not_found(60003)
+        if api == "v2.user.get" and request.userid not in self.users:
+            raise not_found(60121)
+        return super().__call__(request)
+
+
+@pytest.fixture
+def sync(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    for name in ("LDAP_SERVER", "LDAP_ADMIN", "LDAP_ADMIN_PASSWD"):
+        monkeypatch.setenv(name, "unused")
+    import config
+
+    importlib.reload(config)
+    import sync
+
+    return importlib.reload(sync)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeAddressBook(
+        depts={1: None, 2: 1, 3: 1, 4: 2},
+        users={"u1": [1], "u2": [2, 4], "u3": [4]},
+    )
+    monkeypatch.setattr(
+        RestApi, "getResponse", lambda request, *args, **kw: fake(request)
+    )
+    return fake
+
+
+def snapshot(ldap):
+    depts = {key: entry["dn"] for key, entry in ldap.load_depts().items()}
+    users = {
+        key: sorted(entry.get("departmentNumber", []))
+        for key, entry in ldap.load_users().items()
+    }
+    return depts, users
+
+
+@pytest.mark.parametrize("options", [{}, {"pipeline": 4, "member_batch": 10}])
+def test_full_then_incremental_sync(sync, fake, make_ldap, tmp_path, options):
+    ldap = make_ldap(preload=True, **options)
+    syncer = sync.Syncer(Dingding("key", "secret"), ldap)
+    syncer.pull_dept()
+    syncer.pull_user()
+    base = ldap.dept_base_dn
+    assert snapshot(ldap) == (
+        {
+            "1": base,
+            "dd_2": "ou=dept2," + base,
+            "dd_3": "ou=dept3," + base,
+            "dd_4": "ou=dept4,ou=dept2," + base,
+        },
+        {"dd_u1": ["1"], "dd_u2": ["dd_2", "dd_4"], "dd_u3": ["dd_4"]},
+    )
+
+    # u1 调到部门 2，u3 离职，新建部门 5，删除部门 3
+    fake.users["u1"] = [2]
+    del fake.users["u3"]
+    fake.depts[5] = 2
+    del fake.depts[3]
+    queue = EventQueue(str(tmp_path / "events.db"))
+    queue.put({"type": "user_modify_org", "user_ids": ["u1", "u3"], "dept_ids": []})
+    queue.put({"type": "org_dept_create", "user_ids": [], "dept_ids": [5, 3]})
+    # 推送失败的事件由 backfill 补充，重复的事件不影响结果
+    fake.failed = [
+        {"call_back_tag": "user_leave_org", "user_leave_org": {"userid": ["u3"]}}
+    ]
+    assert syncer.backfill_events(queue) == 1
+    assert syncer.sync_events(queue) == 3
+    assert queue.stats()["pending"] == 0
+    assert snapshot(ldap) == (
+        {
+            "1": base,
+            "dd_2": "ou=dept2," + base,
+            "dd_4": "ou=dept4,ou=dept2," + base,
+            "dd_5": "ou=dept5,ou=dept2," + base,
+        },
+        {"dd_u1": ["dd_2"], "dd_u2": ["dd_2", "dd_4"]},
+    )
+    assert not ldap.write_errors
+
+
+def test_failed_event_is_retried(sync, fake, make_ldap, tmp_path):
+    ldap = make_ldap()
+    syncer = sync.Syncer(Dingding("key", "secret"), ldap)
+    queue = EventQueue(str(tmp_path / "events.db"), max_attempts=2, retry_delay=0)
+    queue.put({"type": "user_add_org", "user_ids": ["u1"], "dept_ids": []})
+    fake.users["u1"] = "not a list"
+    # 失败的事件重新排队，超过 max_attempts 次后标记为 dead
+    assert syncer.sync_events(queue) == 0
+    assert queue.stats() == {"pending": 0, "dead": 1}
+
+
+class NullDriver:
+    def flush(self):
+        pass
+
+
+class FailingCommit:
+    """COMMIT 时抛出 SQLITE_BUSY 的连接"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql, *args):
+        if sql == "COMMIT":
+            raise sqlite3.OperationalError("database is locked")
+        return self.conn.execute(sql, *args)
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+
+def test_claim_rolls_back_failed_commit(tmp_path):
+    queue = EventQueue(str(tmp_path / "events.db"))
+    queue.put({"type": "user_add_org", "user_ids": ["u1"], "dept_ids": []})
+    conn = queue._conn()
+    queue._local.conn = FailingCommit(conn)
+    with pytest.raises(sqlite3.OperationalError):
+        queue.claim()
+    assert not conn.in_transaction
+    queue._local.conn = conn
+    assert [event["user_ids"] for _, event in queue.claim()] == [["u1"]]
+
+
+def test_sync_events_renews_lease(sync, tmp_path):
+    path = str(tmp_path / "events.db")
+    queue, other = EventQueue(path, lease=0.2), EventQueue(path)
+    for userid in ("u1", "u2"):
+        queue.put({"type": "user_add_org", "user_ids": [userid], "dept_ids": []})
+    stolen = []
+
+    class Syncer(sync.Syncer):
+        def apply_event(self, event):
+            time.sleep(0.15)
+            # 第二个事件处理时已超过最初的 lease，没有延长时会被其它消费者取出
+            stolen.extend(other.claim())
+
+    assert Syncer(None, NullDriver()).sync_events(queue) == 2
+    assert stolen == []
+
+
+class Numbers:
+    """get_user_all 返回 0..count-1，consumed 记录已经读取的数量"""
+
+    def __init__(self, count):
+        self.count = count
+        self.consumed = 0
+
+    def get_user_all(self):
+        for i in range(self.count):
+            self.consumed += 1
+            yield i
+
+
+class SlowDriver:
+    def __init__(self, fail=None):
+        self.release = threading.Event()
+        self.fail = fail
+        self.created = []
+
+    def create_user(self, user):
+        if user == self.fail:
+            raise ValueError(user)
+        self.release.wait(2)
+        self.created.append(user)
+
+    def flush(self):
+        pass
+
+
+def test_pull_user_submits_a_bounded_window(sync):
+    provider, driver = Numbers(100), SlowDriver()
+    syncer = sync.Syncer(provider, driver, workers=2)
+    syncer.pase = lambda user: user
+    thread = threading.Thread(target=syncer.pull_user)
+    thread.start()
+    time.sleep(0.2)
+    # 最多 2 * workers 个用户在处理中，再多读取一个等待提交
+    assert provider.consumed <= 5
+    driver.release.set()
+    thread.join(2)
+    assert sorted(driver.created) == list(range(100))
+
+
+def test_pull_user_raises_first_failure(sync):
+    provider, driver = Numbers(100), SlowDriver(fail=0)
+    driver.release.set()
+    syncer = sync.Syncer(provider, driver, workers=2)
+    syncer.pase = lambda user: user
+    with pytest.raises(ValueError):
+        syncer.pull_user()
+    assert provider.consumed < 100
@@ -0,0 +1,177 @@
+import socket
+
+import pytest
+
+from dingtalk.api.base import RequestException, RestApi, TopException
+from dingtalk.api.pool import ConnectionPool
+from dingtalk.api.throttle import RateLimiter, RetryPolicy, TokenBucket
+
+
+def top_error(errcode):
+    error = TopException()
+    error.errcode = errcode
+    return error
+
+
+def status_error(status):
+    error = RequestException("invalid http status %d" % status)
+    error.status = status
+    return error
+
+
+def test_token_bucket_burst_then_wait():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_rate_limiter_counts_throttled_requests():
+    limiter = RateLimiter(app_rate=1, burst=1)
+    assert limiter.reserve("app", "api") == 0
+    assert limiter.reserve("app", "api") > 0
+    assert limiter.reserve("other", "api") == 0
+    stats = limiter.getStats()["api"]
+    assert stats["requests"] == 3
+    assert stats["throttled"] == 1
+
+
+@pytest.mark.parametrize(
+    "error, kind",
+    [
+        (top_error(90018), "throttle"),
+        (status_error(429), "throttle"),
+        (status_error(503), "transient"),
+        (status_error(400), None),
+        (top_error(60121), None),
+    ],
+)
+def test_classify_safe_errors(error, kind):
+    policy = RetryPolicy()
+    assert policy.classify(error) == kind
+    assert policy.classify(error, idempotent=True) == kind
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        socket.timeout("timed out"),
+        ConnectionResetError(),
+        RequestException("request failed: ReadTimeout"),
+        status_error(502),
+        status_error(504),
+        top_error(-1),
+    ],
+)
+def test_classify_ambiguous_errors_need_idempotent(error):
+    policy = RetryPolicy()
+    assert policy.classify(error) is None
+    assert policy.classify(error, idempotent=True) == "transient"
+
+
+def test_classify_request_not_sent():
+    error = ConnectionRefusedError()
+    error.request_sent = False
+    assert RetryPolicy().classify(error) == "transient"
+
+
+def test_backoff_gives_up_after_max_retries():
+    policy = RetryPolicy(max_retries=2, base_delay=0.01)
+    error = status_error(503)
+    assert policy.backoff("api", error, 0) is not None
+    assert policy.backoff("api", error, 1) is not None
+    assert policy.backoff("api", error, 2) is None
+    assert policy.backoff("api", socket.timeout(), 0) is None
+    stats = policy.getStats()["api"]
+    assert stats["retries"] == 2
+    assert stats["gave_up"] == 1
+
+
+class PostApi(RestApi):
+    def getHttpMethod(self):
+        return "POST"
+
+
+def test_idempotent_defaults_to_get():
+    assert RestApi("https://oapi.dingtalk.com/gettoken").isIdempotent()
+    request = PostApi("https://oapi.dingtalk.com/topapi/v2/user/list")
+    assert not request.isIdempotent()
+    request.setIdempotent(True)
+    assert request.isIdempotent()
+
+
+def test_request_limiter_overrides_default():
+    request = PostApi("https://oapi.dingtalk.com/topapi/v2/user/list")
+    limiter = RateLimiter()
+    request.setRateLimiter(limiter)
+    assert request.getRateLimiter() is limiter
+    assert "rateLimiter" not in str(request.getApplicationParameters())
+
+
+def test_post_read_timeout_is_not_resent():
+    sent = []
+
+    class TimeoutPool(object):
+        def urlopen(self, key, method, url, body=None, headers=None, timeout=30):
+            sent.append(body)
+            raise socket.timeout("timed out")
+
+    class Request(PostApi):
+        def getConnectionPool(self):
+            return TimeoutPool()
+
+    request = Request("https://oapi.dingtalk.com/topapi/message/send")
+    request.setRetryPolicy(RetryPolicy(base_delay=0))
+    with pytest.raises(socket.timeout):
+        request.getResponse("token")
+    assert len(sent) == 1
+
+    request.setIdempotent(True)
+    with pytest.raises(socket.timeout):
+        request.getResponse("token")
+    assert len(sent) == 1 + 4
+
+
+def test_post_bad_gateway_is_not_resent():
+    sent = []
+
+    class Response(object):
+        status = 502
+
+        def read(self, size=-1):
+            return b"bad gateway"
+
+        def getheader(self, name, default=None):
+            return default
+
+        def release(self):
+            pass
+
+    class BadGatewayPool(object):
+        def urlopen(self, key, method, url, body=None, headers=None, timeout=30):
+            sent.append(body)
+            return Response()
+
+    class Request(PostApi):
+        def getConnectionPool(self):
+            return BadGatewayPool()
+
+    request = Request(
+        "https://oapi.dingtalk.com/topapi/call_back/get_call_back_failed_result"
+    )
+    request.setRetryPolicy(RetryPolicy(base_delay=0))
+    with pytest.raises(RequestException) as info:
+        request.getResponse("token")
+    assert info.value.status == 502
+    assert len(sent) == 1
+
+
+def test_pool_marks_connect_failure_as_not_sent():
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+    pool = ConnectionPool()
+    with pytest.raises(OSError) as info:
+        pool.urlopen(("127.0.0.1:%d" % port, 80), "POST", "/", body="{}")
+    assert info.value.request_sent is False
+    assert RetryPolicy().classify(info.value) == "transient"
@@ -0,0 +1,123 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from utils.tokenstore import (
+    FileTokenStore,
+    MemoryTokenStore,
+    SqliteTokenStore,
+    TokenStore,
+    get_token_store,
+)
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryTokenStore()
+    if request.param == "file":
+        return FileTokenStore(str(tmp_path / "token.json"))
+    return SqliteTokenStore(str(tmp_path / "token.db"))
+
+
+def test_token_store_is_abstract():
+    with pytest.raises(TypeError):
+        TokenStore()
+
+
+def test_get_token_caches(store):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return "token%d" % len(calls), 7200
+
+    assert store.get_token("app", fetch) == "token1"
+    assert store.get_token("app", fetch) == "token1"
+    assert store.get("app")["access_token"] == "token1"
+    assert len(calls) == 1
+
+
+def test_get_token_single_flight(store):
+    calls = []
+    start = threading.Barrier(8)
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return "fresh", 7200
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(store.get_token("app", fetch))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["fresh"] * 8
+    assert len(calls) == 1
+
+
+def test_refresh_before_expiry_does_not_block(store):
+    store.set("app", {"access_token": "old", "expire_time": time.time() + 60})
+    refreshing = threading.Event()
+    release = threading.Event()
+
+    def slow_fetch():
+        refreshing.set()
+        release.wait(5)
+        return "new", 7200
+
+    thread = threading.Thread(target=store.get_token, args=("app", slow_fetch))
+    thread.start()
+    assert refreshing.wait(5)
+    # 刷新进行中，旧 token 还没过期，其它调用方直接使用旧 token
+    assert store.get_token("app", lambda: pytest.fail("fetched twice")) == "old"
+    release.set()
+    thread.join()
+    assert store.get_token("app", lambda: pytest.fail("fetched again")) == "new"
+
+
+def test_get_token_store(tmp_path):
+    assert isinstance(get_token_store("memory"), MemoryTokenStore)
+    store = get_token_store("file:" + str(tmp_path / "t.json"))
+    assert isinstance(store, FileTokenStore)
+    store = get_token_store("sqlite:" + str(tmp_path / "t.db"))
+    assert isinstance(store, SqliteTokenStore)
+    with pytest.raises(ValueError):
+        get_token_store("redis://localhost")
+
+
+def fetch_in_process(url, counter):
+    def fetch():
+        with open(counter, "a") as f:
+            f.write("x")
+        time.sleep(0.3)
+        return "shared", 7200
+
+    os._exit(0 if get_token_store(url).get_token("app", fetch) == "shared" else 1)
+
+
+@pytest.mark.parametrize("scheme", ["file", "sqlite"])
+def test_get_token_single_flight_across_processes(tmp_path, scheme):
+    url = "{}:{}".format(scheme, tmp_path / "token")
+    counter = str(tmp_path / "fetches")
+    get_token_store(url)
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=fetch_in_process, args=(url, counter)) for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0] * 4
+    with open(counter) as f:
+        assert f.read() == "x"